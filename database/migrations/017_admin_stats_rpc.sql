@@ -0,0 +1,320 @@
+-- Migration: Server-side aggregation for admin dashboards
+-- Description: Views and RPC functions behind the admin analytics, signal
+--              stats, dashboard stats and lead stats endpoints, so they return
+--              aggregates instead of pulling whole tables into Python
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. INDEXES FOR DATE-WINDOWED AGGREGATES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_reddit_signals_created_at ON reddit_signals(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_calculator_submissions_submitted_at ON calculator_submissions(submitted_at DESC);
+
+-- ============================================================================
+-- 2. NORMALIZED SIGNAL FACTS
+-- ============================================================================
+-- One row per signal from scraped signals and reddit_signals, with the same
+-- scoring/conversion rules the admin endpoints apply:
+--   scraped: score = pain_score, converted = status 'contacted', hot = score >= 70
+--   reddit:  score = total_score, converted = alerted, hot = ai_tier 'hot' or score >= 70
+
+CREATE OR REPLACE VIEW admin_signal_facts AS
+SELECT
+    COALESCE(s.source, 'scraped') AS source,
+    FALSE AS is_reddit,
+    s.created_at::TIMESTAMPTZ AS created_at,
+    COALESCE(s.pain_score, 0)::NUMERIC AS score,
+    COALESCE(s.pain_score, 0)::NUMERIC AS ai_score,
+    (s.status = 'contacted') AS converted,
+    (COALESCE(s.pain_score, 0) >= 70) AS hot,
+    CASE
+        WHEN COALESCE(s.pain_score, 0) >= 70 THEN 'hot'
+        WHEN COALESCE(s.pain_score, 0) >= 50 THEN 'warm'
+        ELSE 'cold'
+    END AS tier,
+    COALESCE(s.signal_type, 'business_signal') AS intent,
+    NULL::VARCHAR AS sentiment
+FROM signals s
+UNION ALL
+SELECT
+    'reddit' AS source,
+    TRUE AS is_reddit,
+    r.created_at::TIMESTAMPTZ AS created_at,
+    COALESCE(r.total_score, 0)::NUMERIC AS score,
+    NULLIF(r.ai_total_score, 0)::NUMERIC AS ai_score,
+    COALESCE(r.alerted, FALSE) AS converted,
+    (r.ai_tier = 'hot' OR COALESCE(r.total_score, 0) >= 70) AS hot,
+    COALESCE(r.ai_tier, 'unknown') AS tier,
+    r.intent AS intent,
+    r.sentiment AS sentiment
+FROM reddit_signals r;
+
+-- ============================================================================
+-- 3. ADMIN ANALYTICS (admin/analytics_api.py)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_source_performance(days_back INTEGER DEFAULT 30)
+RETURNS JSONB AS $$
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_agg(row_to_json(t) ORDER BY t.avg_score DESC)
+        FROM (
+            SELECT
+                source,
+                COUNT(*) AS total_signals,
+                ROUND(AVG(score), 2) AS avg_score,
+                COUNT(*) FILTER (WHERE converted) AS converted_count,
+                ROUND(COUNT(*) FILTER (WHERE converted)::NUMERIC / COUNT(*) * 100, 2) AS conversion_rate,
+                COUNT(*) FILTER (WHERE hot) AS top_tier_count
+            FROM admin_signal_facts
+            WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+            GROUP BY source
+        ) t
+    ), '[]'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+CREATE OR REPLACE FUNCTION get_signal_trends(days_back INTEGER DEFAULT 30)
+RETURNS JSONB AS $$
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_agg(row_to_json(t) ORDER BY t.date DESC)
+        FROM (
+            SELECT
+                TO_CHAR(DATE(created_at), 'YYYY-MM-DD') AS date,
+                COUNT(*) AS total_signals,
+                ROUND(AVG(score), 2) AS avg_score,
+                COUNT(*) FILTER (WHERE hot) AS hot_leads,
+                COUNT(*) FILTER (WHERE converted) AS converted
+            FROM admin_signal_facts
+            WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+            GROUP BY DATE(created_at)
+        ) t
+    ), '[]'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+CREATE OR REPLACE FUNCTION get_analytics_summary(days_back INTEGER DEFAULT 7)
+RETURNS JSONB AS $$
+DECLARE
+    totals RECORD;
+    sources JSONB;
+    intents JSONB;
+BEGIN
+    SELECT
+        COUNT(*) AS total,
+        COALESCE(ROUND(AVG(score), 2), 0) AS avg_score,
+        COUNT(*) FILTER (WHERE converted) AS converted,
+        COUNT(*) FILTER (WHERE hot) AS hot
+    INTO totals
+    FROM admin_signal_facts
+    WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL;
+
+    SELECT COALESCE(jsonb_object_agg(source, n), '{}'::jsonb) INTO sources
+    FROM (
+        SELECT source, COUNT(*) AS n
+        FROM admin_signal_facts
+        WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+        GROUP BY source
+    ) s;
+
+    SELECT COALESCE(jsonb_object_agg(intent, n), '{}'::jsonb) INTO intents
+    FROM (
+        SELECT intent, COUNT(*) AS n
+        FROM admin_signal_facts
+        WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+            AND intent IS NOT NULL
+        GROUP BY intent
+    ) i;
+
+    RETURN jsonb_build_object(
+        'total_signals', totals.total,
+        'avg_score', totals.avg_score,
+        'conversion_rate', CASE WHEN totals.total > 0
+            THEN ROUND(totals.converted::NUMERIC / totals.total * 100, 2) ELSE 0 END,
+        'converted_count', totals.converted,
+        'hot_leads', totals.hot,
+        'top_source', (SELECT key FROM jsonb_each(sources) ORDER BY value::BIGINT DESC LIMIT 1),
+        'top_intent', (SELECT key FROM jsonb_each(intents) ORDER BY value::BIGINT DESC LIMIT 1),
+        'sources_breakdown', sources,
+        'intents_breakdown', intents
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+CREATE OR REPLACE FUNCTION get_score_correlation(days_back INTEGER DEFAULT 30)
+RETURNS JSONB AS $$
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_agg(row_to_json(t) ORDER BY t.range_order)
+        FROM (
+            SELECT
+                CASE
+                    WHEN combined_score < 50 THEN '0-49'
+                    WHEN combined_score < 70 THEN '50-69'
+                    WHEN combined_score < 85 THEN '70-84'
+                    ELSE '85-100'
+                END AS score_range,
+                MIN(combined_score) AS range_order,
+                COUNT(*) AS count,
+                ROUND(AVG(keyword_total), 2) AS avg_keyword_score,
+                ROUND(AVG(ai_total), 2) AS avg_ai_score,
+                ROUND(COUNT(*) FILTER (WHERE converted_to_lead)::NUMERIC / COUNT(*) * 100, 2) AS conversion_rate
+            FROM unified_signals_with_ai
+            WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+                AND ai_total IS NOT NULL
+            GROUP BY 1
+        ) t
+    ), '[]'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+CREATE OR REPLACE FUNCTION get_intent_analysis(days_back INTEGER DEFAULT 30)
+RETURNS JSONB AS $$
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_agg(row_to_json(t) ORDER BY t.count DESC)
+        FROM (
+            SELECT
+                intent,
+                COUNT(*) AS count,
+                ROUND(AVG(combined_score), 2) AS avg_score,
+                ROUND(COUNT(*) FILTER (WHERE converted_to_lead)::NUMERIC / COUNT(*) * 100, 2) AS conversion_rate,
+                COALESCE(MODE() WITHIN GROUP (ORDER BY sentiment), 'unknown') AS top_sentiment
+            FROM unified_signals_with_ai
+            WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+                AND intent IS NOT NULL
+            GROUP BY intent
+        ) t
+    ), '[]'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- 4. SIGNAL STATS (admin/signals_api.py /stats)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_signal_stats(days_back INTEGER DEFAULT 7)
+RETURNS JSONB AS $$
+DECLARE
+    totals RECORD;
+BEGIN
+    SELECT
+        COUNT(*) AS total,
+        COALESCE(ROUND(AVG(score), 2), 0) AS avg_keyword,
+        COALESCE(ROUND(AVG(ai_score), 2), 0) AS avg_ai,
+        COUNT(*) FILTER (WHERE score >= 50) AS high_value,
+        COUNT(*) FILTER (WHERE converted) AS alerted
+    INTO totals
+    FROM admin_signal_facts
+    WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL;
+
+    RETURN jsonb_build_object(
+        'total_signals', totals.total,
+        'by_source', (
+            SELECT COALESCE(jsonb_object_agg(source, n), '{}'::jsonb) FROM (
+                SELECT source, COUNT(*) AS n FROM admin_signal_facts
+                WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+                GROUP BY source
+            ) x
+        ),
+        'by_tier', (
+            SELECT COALESCE(jsonb_object_agg(tier, n), '{}'::jsonb) FROM (
+                SELECT tier, COUNT(*) AS n FROM admin_signal_facts
+                WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+                GROUP BY tier
+            ) x
+        ),
+        'by_intent', (
+            SELECT COALESCE(jsonb_object_agg(intent, n), '{}'::jsonb) FROM (
+                SELECT intent, COUNT(*) AS n FROM admin_signal_facts
+                WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+                    AND intent IS NOT NULL
+                GROUP BY intent
+            ) x
+        ),
+        'by_sentiment', (
+            SELECT COALESCE(jsonb_object_agg(sentiment, n), '{}'::jsonb) FROM (
+                SELECT sentiment, COUNT(*) AS n FROM admin_signal_facts
+                WHERE created_at >= NOW() - (days_back || ' days')::INTERVAL
+                    AND sentiment IS NOT NULL
+                GROUP BY sentiment
+            ) x
+        ),
+        'avg_keyword_score', totals.avg_keyword,
+        'avg_ai_score', totals.avg_ai,
+        'high_value_count', totals.high_value,
+        'alerted_count', totals.alerted,
+        'pending_count', totals.total - totals.alerted
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- 5. CALCULATOR DASHBOARD (admin/api.py /dashboard/stats)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_dashboard_stats()
+RETURNS JSONB AS $$
+BEGIN
+    RETURN (
+        SELECT jsonb_build_object(
+            'total_leads', COUNT(*),
+            'hot_leads', COUNT(*) FILTER (WHERE lead_tier = 'Hot'),
+            'warm_leads', COUNT(*) FILTER (WHERE lead_tier = 'Warm'),
+            'qualified_leads', COUNT(*) FILTER (WHERE lead_tier = 'Qualified'),
+            'total_potential_revenue', COALESCE(SUM(annual_loss), 0),
+            'avg_monthly_loss', COALESCE(AVG(COALESCE(monthly_loss, 0)), 0),
+            'conversion_rate', CASE WHEN COUNT(*) > 0
+                THEN ROUND(COUNT(*) FILTER (WHERE clicked_cta)::NUMERIC / COUNT(*) * 100, 2) ELSE 0 END,
+            'email_open_rate', CASE WHEN COUNT(*) FILTER (WHERE email IS NOT NULL AND email <> '') > 0
+                THEN ROUND(
+                    COUNT(*) FILTER (WHERE email IS NOT NULL AND email <> '' AND email_opened)::NUMERIC
+                    / COUNT(*) FILTER (WHERE email IS NOT NULL AND email <> '') * 100, 2)
+                ELSE 0 END,
+            'pdf_download_rate', CASE WHEN COUNT(*) > 0
+                THEN ROUND(COUNT(*) FILTER (WHERE downloaded_pdf)::NUMERIC / COUNT(*) * 100, 2) ELSE 0 END,
+            'leads_last_7_days', COUNT(*) FILTER (WHERE submitted_at > NOW() - INTERVAL '7 days'),
+            'leads_last_30_days', COUNT(*) FILTER (WHERE submitted_at > NOW() - INTERVAL '30 days')
+        )
+        FROM calculator_submissions
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- 6. LEAD STATS (calculator/storage.py get_lead_stats)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_lead_stats()
+RETURNS JSONB AS $$
+BEGIN
+    RETURN jsonb_build_object(
+        'total_leads', (SELECT COUNT(*) FROM leads),
+        'by_tier', (
+            SELECT COALESCE(jsonb_object_agg(tier, n), '{}'::jsonb) FROM (
+                SELECT COALESCE(lead_tier, 'Unknown') AS tier, COUNT(*) AS n
+                FROM leads GROUP BY 1
+            ) x
+        ),
+        'avg_score', (SELECT COALESCE(ROUND(AVG(COALESCE(lead_score, 0))::NUMERIC, 1), 0) FROM leads),
+        'total_potential_revenue', (SELECT COALESCE(ROUND(SUM(monthly_loss * 12)::NUMERIC, 2), 0) FROM leads)
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- GRANTS
+-- ============================================================================
+
+GRANT SELECT ON admin_signal_facts TO authenticated;
+GRANT EXECUTE ON FUNCTION get_source_performance(INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_signal_trends(INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_analytics_summary(INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_score_correlation(INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_intent_analysis(INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_signal_stats(INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_dashboard_stats() TO authenticated;
+GRANT EXECUTE ON FUNCTION get_lead_stats() TO authenticated;
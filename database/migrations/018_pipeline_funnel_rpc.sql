@@ -0,0 +1,182 @@
+-- Migration: Single-query CRM pipeline funnel and board
+-- Description: Grouped stage counts and RPC functions behind the pipeline
+--              conversion funnel, board and stats endpoints, replacing one
+--              count query per stage plus separate list queries
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_leads_status ON leads(status);
+CREATE INDEX IF NOT EXISTS idx_signals_status ON signals(status);
+
+-- ============================================================================
+-- 2. STAGE COUNTS
+-- ============================================================================
+-- One row per active stage with its lead count and score aggregates, from a
+-- single GROUP BY over leads. Leads map to stages the same way as
+-- lead_pipeline_view: status = lower(name) with spaces as underscores.
+
+CREATE OR REPLACE VIEW pipeline_stage_counts AS
+SELECT
+    ps.id,
+    ps.name,
+    ps.color,
+    ps.position,
+    COALESCE(lc.lead_count, 0) AS lead_count,
+    COALESCE(lc.total_score, 0) AS total_score
+FROM pipeline_stages ps
+LEFT JOIN (
+    SELECT status, COUNT(*) AS lead_count, SUM(COALESCE(lead_score, 0)) AS total_score
+    FROM leads
+    GROUP BY status
+) lc ON lc.status = LOWER(REPLACE(ps.name, ' ', '_'))
+WHERE ps.is_active;
+
+-- ============================================================================
+-- 3. CONVERSION FUNNEL
+-- ============================================================================
+-- Ordered stages with counts and stage-to-next-stage conversion rate
+-- (the last stage has no conversion_rate, matching the API contract)
+
+CREATE OR REPLACE FUNCTION get_conversion_funnel()
+RETURNS JSONB AS $$
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_agg(
+            jsonb_strip_nulls(jsonb_build_object(
+                'stage', name,
+                'count', lead_count,
+                'color', color,
+                'position', position,
+                'conversion_rate', CASE
+                    WHEN next_count IS NULL THEN NULL
+                    WHEN lead_count > 0 THEN ROUND(next_count::NUMERIC / lead_count * 100, 1)
+                    ELSE 0
+                END
+            ))
+            ORDER BY position
+        )
+        FROM (
+            SELECT name, color, position, lead_count,
+                   LEAD(lead_count) OVER (ORDER BY position) AS next_count
+            FROM pipeline_stage_counts
+        ) f
+    ), '[]'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- 4. PIPELINE BOARD
+-- ============================================================================
+-- Leads from lead_pipeline_view plus scraped signals (mapped by status), in
+-- one query, grouped by stage name: {"New": [...], "Contacted": [...], ...}
+-- Within a stage, CRM leads come first by score, then signals newest first.
+
+CREATE OR REPLACE FUNCTION get_pipeline_board(
+    p_stage TEXT DEFAULT NULL,
+    p_search TEXT DEFAULT NULL,
+    p_limit_per_stage INTEGER DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    pattern TEXT := '%' || COALESCE(p_search, '') || '%';
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_object_agg(stage_name, leads)
+        FROM (
+            SELECT stage_name, jsonb_agg(item ORDER BY src, stage_position, lead_score DESC, created_at DESC) AS leads
+            FROM (
+                SELECT
+                    stage_name, item, src, stage_position, lead_score, created_at,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY stage_name
+                        ORDER BY src, stage_position, lead_score DESC, created_at DESC
+                    ) AS rn
+                FROM (
+                    SELECT
+                        COALESCE(v.stage_name, 'New') AS stage_name,
+                        to_jsonb(v) AS item,
+                        0 AS src,
+                        v.stage_position,
+                        COALESCE(v.lead_score, 0)::NUMERIC AS lead_score,
+                        v.created_at::TIMESTAMPTZ AS created_at
+                    FROM lead_pipeline_view v
+                    WHERE (p_stage IS NULL OR v.stage_name = p_stage)
+                      AND (p_search IS NULL
+                           OR v.business_name ILIKE pattern
+                           OR v.contact_name ILIKE pattern
+                           OR v.email ILIKE pattern)
+                    UNION ALL
+                    SELECT
+                        m.stage_name,
+                        jsonb_build_object(
+                            'id', s.id,
+                            'business_name', s.business_name,
+                            'contact_name', s.business_name,
+                            'email', s.email,
+                            'phone', s.phone,
+                            'lead_score', COALESCE(s.pain_score, 0),
+                            'stage_name', m.stage_name,
+                            'city', s.city,
+                            'state', s.state,
+                            'source', s.source,
+                            'created_at', s.created_at
+                        ),
+                        1,
+                        NULL,
+                        0,
+                        s.created_at::TIMESTAMPTZ
+                    FROM signals s
+                    CROSS JOIN LATERAL (
+                        SELECT CASE
+                            WHEN s.status IN ('new', 'contacted', 'qualified', 'proposal', 'negotiation', 'won', 'lost')
+                            THEN INITCAP(s.status)
+                            ELSE 'New'
+                        END AS stage_name
+                    ) m
+                    WHERE (p_stage IS NULL OR m.stage_name = p_stage)
+                      AND (p_search IS NULL
+                           OR s.business_name ILIKE pattern
+                           OR s.phone ILIKE pattern)
+                ) items
+            ) ranked
+            WHERE p_limit_per_stage IS NULL OR rn <= p_limit_per_stage
+            GROUP BY stage_name
+        ) grouped
+    ), '{}'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- 5. PIPELINE STATS
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_pipeline_stats()
+RETURNS JSONB AS $$
+BEGIN
+    RETURN COALESCE((
+        SELECT jsonb_object_agg(stage, jsonb_build_object(
+            'count', n,
+            'total_score', total_score,
+            'avg_score', ROUND(total_score::NUMERIC / n, 1)
+        ))
+        FROM (
+            SELECT COALESCE(stage_name, 'New') AS stage, COUNT(*) AS n,
+                   SUM(COALESCE(lead_score, 0)) AS total_score
+            FROM lead_pipeline_view
+            GROUP BY 1
+        ) s
+    ), '{}'::jsonb);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- GRANTS
+-- ============================================================================
+
+GRANT SELECT ON pipeline_stage_counts TO authenticated;
+GRANT EXECUTE ON FUNCTION get_conversion_funnel() TO authenticated;
+GRANT EXECUTE ON FUNCTION get_pipeline_board(TEXT, TEXT, INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_pipeline_stats() TO authenticated;
@@ -0,0 +1,97 @@
+-- Migration: Unified CRM contacts view
+-- Description: One view over contacts and business_contacts so the contacts
+--              API can page with keyset cursors in a single query instead
+--              of merging both tables in Python with exact counts per page
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. CONTACT COLUMNS
+-- ============================================================================
+-- The contacts API reads and writes website and is_primary (as in
+-- demand-engine/database/crm_schema.sql); 002_crm_schema.sql has
+-- website_url and no is_primary. Add them where missing so the view below
+-- can be created on either schema.
+
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS website TEXT;
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS is_primary BOOLEAN DEFAULT FALSE;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'contacts' AND column_name = 'website_url'
+    ) THEN
+        UPDATE contacts SET website = website_url WHERE website IS NULL AND website_url IS NOT NULL;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- 2. KEYSET INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_contacts_created_at_id ON contacts(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_business_contacts_created_at_id ON business_contacts(created_at DESC, id DESC);
+
+-- ============================================================================
+-- 3. UNIFIED VIEW
+-- ============================================================================
+-- uid is unique across both sources and, with created_at, gives a total
+-- order for cursors. created_at is never NULL so DESC ordering stays stable.
+-- business_contacts rows keep the contacts-shaped columns the API returned
+-- before (first/last name split from business_name).
+
+CREATE OR REPLACE VIEW crm_contacts_unified AS
+SELECT
+    'contacts:' || c.id::TEXT AS uid,
+    c.id::TEXT AS id,
+    c.first_name,
+    c.last_name,
+    c.email,
+    c.phone,
+    c.mobile,
+    c.company_name,
+    c.job_title,
+    c.address,
+    c.city,
+    c.state,
+    c.zip_code,
+    c.website,
+    c.lead_id::TEXT AS lead_id,
+    c.is_primary,
+    c.email_subscribed,
+    c.sms_subscribed,
+    c.tags,
+    c.notes,
+    COALESCE(c.created_at, 'epoch'::TIMESTAMPTZ) AS created_at,
+    'contacts'::TEXT AS source,
+    NULL::INTEGER AS signal_id
+FROM contacts c
+WHERE c.deleted_at IS NULL
+UNION ALL
+SELECT
+    'business_contacts:' || b.id::TEXT AS uid,
+    b.id::TEXT AS id,
+    NULLIF(split_part(b.business_name, ' ', 1), '') AS first_name,
+    NULLIF(substr(b.business_name, length(split_part(b.business_name, ' ', 1)) + 2), '') AS last_name,
+    b.email,
+    b.phone,
+    NULL AS mobile,
+    b.business_name AS company_name,
+    NULL AS job_title,
+    b.address,
+    b.city,
+    b.state,
+    b.zip_code,
+    b.website,
+    NULL AS lead_id,
+    NULL::BOOLEAN AS is_primary,
+    NULL::BOOLEAN AS email_subscribed,
+    NULL::BOOLEAN AS sms_subscribed,
+    NULL::TEXT[] AS tags,
+    b.notes,
+    COALESCE(b.created_at::TIMESTAMPTZ, 'epoch'::TIMESTAMPTZ) AS created_at,
+    'business_contacts'::TEXT AS source,
+    b.signal_id
+FROM business_contacts b;
+
+GRANT SELECT ON crm_contacts_unified TO authenticated;
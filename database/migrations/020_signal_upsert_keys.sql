@@ -0,0 +1,50 @@
+-- Migration: Unique keys for batched signal upserts
+-- Description: Content-hash unique indexes so scrapers can write signals
+--              with multi-row INSERT ... ON CONFLICT instead of checking
+--              and inserting one row at a time
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. SCRAPED SIGNALS
+-- ============================================================================
+-- Scrapers (reddit.py among them) already write content_hash here, and
+-- nothing kept it unique, so clear the hash on all but the earliest row of
+-- each duplicate before creating the index. Those rows are kept; rows
+-- without a hash never conflict.
+
+ALTER TABLE signals ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+UPDATE signals s
+SET content_hash = NULL
+FROM (
+    SELECT id, ROW_NUMBER() OVER (PARTITION BY content_hash ORDER BY created_at, id) AS copy
+    FROM signals
+    WHERE content_hash IS NOT NULL
+) duplicates
+WHERE s.id = duplicates.id AND duplicates.copy > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_signals_content_hash_unique ON signals(content_hash);
+
+-- ============================================================================
+-- 2. BUSINESS CONTACTS
+-- ============================================================================
+-- Upserts conflict on the table's natural key, UNIQUE(business_name, phone),
+-- which existing rows already satisfy. The hash is only a lookup column: a
+-- unique hash would reject the same business scraped with its phone number
+-- formatted differently.
+
+ALTER TABLE business_contacts ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+DROP INDEX IF EXISTS idx_business_contacts_content_hash_unique;
+CREATE INDEX IF NOT EXISTS idx_business_contacts_content_hash ON business_contacts(content_hash);
+
+-- ============================================================================
+-- 3. JOB BOARD / LICENSING SIGNALS
+-- ============================================================================
+-- Hashes are derived from job_id / license_number, which are already
+-- unique, so existing data cannot violate these.
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_job_board_content_hash_unique ON job_board_signals(content_hash);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_licensing_content_hash_unique ON licensing_signals(content_hash);
+
+-- reddit_signals keeps content_hash non-unique on purpose (the same text
+-- may be saved again after the dedup window); writers conflict on post_id.
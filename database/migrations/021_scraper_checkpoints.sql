@@ -0,0 +1,22 @@
+-- Migration: Scraper checkpoints
+-- Description: Per-source high-water marks (last seen item id / timestamp)
+--              so scheduled scrapers only fetch items newer than the
+--              previous run
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. SCRAPER CHECKPOINTS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS scraper_checkpoints (
+    source VARCHAR(50) NOT NULL,       -- reddit_monitor, reddit_local, job_board_monitor
+    cursor_key VARCHAR(255) NOT NULL,  -- subreddit, or platform:title:location
+    last_seen_id VARCHAR(255),
+    last_seen_at TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (source, cursor_key)
+);
+
+COMMENT ON TABLE scraper_checkpoints IS 'Incremental scraping cursors (newest item already processed per source query)';
+
+GRANT SELECT, INSERT, UPDATE ON scraper_checkpoints TO authenticated;
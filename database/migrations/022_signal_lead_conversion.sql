@@ -0,0 +1,178 @@
+-- Migration: Set-based signal to lead conversion
+-- Description: Converts every qualifying pain signal to a calculator lead in
+--              one statement, with a unique (signal_source, signal_id) key
+--              so overlapping runs can't create duplicate leads
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. LEAD COLUMNS / IDEMPOTENCY KEY
+-- ============================================================================
+-- The converter has always written these lead fields; ADD IF NOT EXISTS
+-- keeps this safe on databases that already have them.
+
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS company_name VARCHAR(255);
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS city VARCHAR(100);
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS state VARCHAR(50);
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS source VARCHAR(100);
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS lead_quality VARCHAR(20);
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS notes TEXT;
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+
+-- Which signal a lead came from (NULL for leads from the calculator itself)
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS signal_source VARCHAR(20);
+ALTER TABLE calculator_submissions ADD COLUMN IF NOT EXISTS signal_id UUID;
+
+-- Backfill from leads converted before this migration
+UPDATE calculator_submissions cs SET signal_source = 'reddit', signal_id = s.id
+FROM reddit_signals s WHERE s.lead_id = cs.id AND cs.signal_id IS NULL;
+
+UPDATE calculator_submissions cs SET signal_source = 'job_board', signal_id = s.id
+FROM job_board_signals s WHERE s.lead_id = cs.id AND cs.signal_id IS NULL;
+
+UPDATE calculator_submissions cs SET signal_source = 'licensing', signal_id = s.id
+FROM licensing_signals s WHERE s.lead_id = cs.id AND cs.signal_id IS NULL;
+
+UPDATE calculator_submissions cs SET signal_source = 'facebook', signal_id = s.id
+FROM facebook_signals s WHERE s.lead_id = cs.id AND cs.signal_id IS NULL;
+
+-- One lead per signal (NULLs never conflict, so calculator leads are unaffected)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_calculator_submissions_signal_unique
+    ON calculator_submissions(signal_source, signal_id);
+
+-- ============================================================================
+-- 2. SET-BASED CONVERSION
+-- ============================================================================
+-- Selects the top pending signals, inserts their leads and marks the source
+-- rows converted in a single statement. Leads that already exist for a
+-- candidate (e.g. written by an overlapping run) are skipped by the unique
+-- key and only linked back to their signal. Lead fields mirror
+-- LeadConverter.extract_lead_data().
+
+CREATE OR REPLACE FUNCTION convert_high_value_signals(
+    min_score INTEGER DEFAULT 70,
+    max_results INTEGER DEFAULT 50
+)
+RETURNS SETOF calculator_submissions AS $$
+BEGIN
+    RETURN QUERY
+    WITH candidates AS (
+        SELECT
+            s.id,
+            s.source,
+            s.content,
+            s.location,
+            s.company_mentioned,
+            s.keyword_total,
+            s.ai_total,
+            COALESCE(NULLIF(s.combined_score, 0), s.keyword_total, 0) AS lead_score,
+            s.sentiment,
+            s.intent,
+            s.ai_reasoning,
+            s.key_indicators,
+            s.recommended_action
+        FROM unified_signals_with_ai s
+        WHERE s.combined_score >= min_score
+            AND s.converted_to_lead = FALSE
+            AND s.processed = TRUE
+        ORDER BY s.combined_score DESC, s.created_at DESC
+        LIMIT max_results
+    ),
+    inserted AS (
+        INSERT INTO calculator_submissions (
+            session_id, company_name, city, state, source, lead_quality, notes,
+            signal_source, signal_id, created_at, updated_at
+        )
+        SELECT
+            'signal_' || LEFT(c.id::TEXT, 8) || '_' || EXTRACT(EPOCH FROM NOW())::BIGINT,
+            COALESCE(NULLIF(c.company_mentioned, ''), 'Unknown Company'),
+            BTRIM(SPLIT_PART(COALESCE(c.location, ''), ',', 1)),
+            BTRIM(SPLIT_PART(COALESCE(c.location, ''), ',', 2)),
+            CASE c.source
+                WHEN 'reddit' THEN 'Reddit Pain Signal'
+                WHEN 'job_board' THEN 'Job Board Signal'
+                WHEN 'licensing' THEN 'Licensing Board Signal'
+                WHEN 'facebook' THEN 'Facebook Signal'
+                ELSE 'Pain Signal'
+            END,
+            CASE
+                WHEN c.lead_score >= 85 THEN 'hot'
+                WHEN c.lead_score >= 70 THEN 'warm'
+                WHEN c.lead_score >= 50 THEN 'qualified'
+                ELSE 'cold'
+            END,
+            CONCAT_WS(E'\n',
+                CASE WHEN COALESCE(c.content, '') <> '' THEN
+                    E'Signal Content:\n'
+                    || CASE WHEN LENGTH(c.content) > 500 THEN LEFT(c.content, 500) || '...' ELSE c.content END
+                    || E'\n'
+                END,
+                CASE WHEN COALESCE(c.ai_reasoning, '') <> '' THEN E'AI Analysis:\n' || c.ai_reasoning || E'\n' END,
+                -- key_indicators is JSONB (a JSON array of strings when set); the
+                -- nested CASE keeps jsonb_array_length off scalars, as AND
+                -- doesn't guarantee evaluation order
+                CASE WHEN CASE WHEN jsonb_typeof(c.key_indicators) = 'array'
+                        THEN jsonb_array_length(c.key_indicators) ELSE 0 END > 0 THEN
+                    'Key Indicators: '
+                    || (SELECT string_agg(value, ', ') FROM jsonb_array_elements_text(c.key_indicators))
+                    || E'\n'
+                END,
+                CASE WHEN COALESCE(c.sentiment, '') <> '' THEN 'Sentiment: ' || c.sentiment END,
+                CASE WHEN COALESCE(c.intent, '') <> '' THEN 'Intent: ' || REPLACE(c.intent, '_', ' ') END,
+                CASE WHEN COALESCE(c.recommended_action, '') <> '' THEN
+                    'Recommended Action: ' || REPLACE(c.recommended_action, '_', ' ')
+                END,
+                CASE WHEN COALESCE(c.ai_total, 0) <> 0
+                    THEN E'\nScores: Keyword=' || COALESCE(c.keyword_total, 0) || ', AI=' || ROUND(c.ai_total)
+                    ELSE E'\nScore: ' || COALESCE(c.keyword_total, 0) || ' (keyword only)'
+                END
+            ),
+            c.source,
+            c.id,
+            NOW(),
+            NOW()
+        FROM candidates c
+        ON CONFLICT (signal_source, signal_id) DO NOTHING
+        RETURNING *
+    ),
+    linked AS (
+        SELECT i.id AS lead_id, i.signal_source, i.signal_id FROM inserted i
+        UNION ALL
+        SELECT cs.id, cs.signal_source, cs.signal_id
+        FROM calculator_submissions cs
+        JOIN candidates c ON cs.signal_source = c.source AND cs.signal_id = c.id
+    ),
+    reddit_marked AS (
+        UPDATE reddit_signals t
+        SET converted_to_lead = TRUE, lead_id = l.lead_id, conversion_date = NOW()
+        FROM linked l
+        WHERE l.signal_source = 'reddit' AND t.id = l.signal_id
+    ),
+    job_board_marked AS (
+        UPDATE job_board_signals t
+        SET converted_to_lead = TRUE, lead_id = l.lead_id, conversion_date = NOW()
+        FROM linked l
+        WHERE l.signal_source = 'job_board' AND t.id = l.signal_id
+    ),
+    licensing_marked AS (
+        UPDATE licensing_signals t
+        SET converted_to_lead = TRUE, lead_id = l.lead_id, conversion_date = NOW()
+        FROM linked l
+        WHERE l.signal_source = 'licensing' AND t.id = l.signal_id
+    ),
+    facebook_marked AS (
+        UPDATE facebook_signals t
+        SET converted_to_lead = TRUE, lead_id = l.lead_id, conversion_date = NOW()
+        FROM linked l
+        WHERE l.signal_source = 'facebook' AND t.id = l.signal_id
+    )
+    SELECT * FROM inserted;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION convert_high_value_signals IS 'Convert the top pending signals to calculator leads in one idempotent statement; returns the new leads';
+
+-- ============================================================================
+-- 3. GRANTS
+-- ============================================================================
+
+GRANT EXECUTE ON FUNCTION convert_high_value_signals(INTEGER, INTEGER) TO authenticated;
@@ -0,0 +1,89 @@
+-- Migration: Twilio call mirror
+-- Description: Local copy of Twilio call records, synced incrementally by
+--              start-time cursor, so the insights dashboards query Postgres
+--              instead of paging through Twilio's list API per request
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. CALL RECORDS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS twilio_call_records (
+    call_sid VARCHAR(64) PRIMARY KEY,
+    parent_call_sid VARCHAR(64),
+    from_number VARCHAR(50),
+    from_formatted VARCHAR(50),
+    to_number VARCHAR(50),
+    to_formatted VARCHAR(50),
+    status VARCHAR(20) NOT NULL,       -- queued, ringing, in-progress, completed, busy, failed, no-answer, canceled
+    direction VARCHAR(30),
+    answered_by VARCHAR(30),
+    duration INTEGER DEFAULT 0,        -- seconds
+    price NUMERIC(10, 5),              -- as reported by Twilio (negative = charge)
+    price_unit VARCHAR(10),
+    start_time TIMESTAMPTZ,
+    end_time TIMESTAMPTZ,
+    date_updated TIMESTAMPTZ,
+    synced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE twilio_call_records IS 'Mirror of Twilio call records for insights queries (synced from the Calls API)';
+
+-- Call history / cost / uptime windows, optionally per number
+CREATE INDEX IF NOT EXISTS idx_twilio_call_records_start ON twilio_call_records(start_time DESC);
+CREATE INDEX IF NOT EXISTS idx_twilio_call_records_to_start ON twilio_call_records(to_number, start_time DESC);
+
+-- Offline incidents (failed, canceled, no-answer) per number
+CREATE INDEX IF NOT EXISTS idx_twilio_call_records_unanswered
+    ON twilio_call_records(to_number, start_time DESC)
+    WHERE status IN ('failed', 'canceled', 'no-answer');
+
+-- The sync cursor lives in scraper_checkpoints (source = 'twilio_calls')
+
+-- ============================================================================
+-- 2. AGGREGATES
+-- ============================================================================
+-- One row of volume, cost and outcome counts for a time window, so cost and
+-- uptime summaries don't transfer every call to the API.
+
+CREATE OR REPLACE FUNCTION twilio_call_stats(
+    start_at TIMESTAMPTZ,
+    end_at TIMESTAMPTZ,
+    phone TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    total_calls BIGINT,
+    total_duration BIGINT,
+    total_cost NUMERIC,
+    currency VARCHAR,
+    completed_calls BIGINT,
+    failed_calls BIGINT,
+    busy_calls BIGINT,
+    no_answer_calls BIGINT,
+    average_completed_seconds DOUBLE PRECISION
+) AS $$
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(duration), 0),
+        COALESCE(SUM(ABS(price)), 0),
+        COALESCE(MAX(price_unit), 'USD'),
+        COUNT(*) FILTER (WHERE status = 'completed'),
+        COUNT(*) FILTER (WHERE status IN ('failed', 'canceled')),
+        COUNT(*) FILTER (WHERE status = 'busy'),
+        COUNT(*) FILTER (WHERE status = 'no-answer'),
+        COALESCE(AVG(EXTRACT(EPOCH FROM end_time - start_time))
+            FILTER (WHERE status = 'completed' AND end_time IS NOT NULL), 0)
+    FROM twilio_call_records
+    WHERE start_time >= start_at
+        AND start_time <= end_at
+        AND (phone IS NULL OR to_number = phone);
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION twilio_call_stats IS 'Call volume, cost and outcome counts for a window, optionally for one number';
+
+-- ============================================================================
+-- 3. GRANTS
+-- ============================================================================
+
+GRANT SELECT, INSERT, UPDATE ON twilio_call_records TO authenticated;
+GRANT EXECUTE ON FUNCTION twilio_call_stats(TIMESTAMPTZ, TIMESTAMPTZ, TEXT) TO authenticated;
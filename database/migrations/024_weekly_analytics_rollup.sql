@@ -0,0 +1,279 @@
+-- Migration: Weekly analytics rollup
+-- Description: Rebuilds weekly_analytics as a rollup of call logs,
+--              appointments and pain signals, refreshed incrementally by
+--              refresh_weekly_analytics() so weekly reports and digests read
+--              one row instead of scanning the raw tables
+-- Created: 2026-10-19
+
+-- ============================================================================
+-- 1. ROLLUP TABLE
+-- ============================================================================
+-- weekly_analytics only ever held derived counts, and earlier migrations
+-- created it with different shapes (integer vs UUID tenant, week_start_date
+-- vs week_start). The per-row trigger from 005 also counted every UPDATE of
+-- a call as a new call. Drop both and rebuild from the source tables; the
+-- first refresh_weekly_analytics() call backfills every week.
+
+DROP TRIGGER IF EXISTS trigger_update_weekly_analytics ON call_logs;
+DROP FUNCTION IF EXISTS update_weekly_analytics();
+DROP TABLE IF EXISTS weekly_analytics CASCADE;
+
+CREATE TABLE weekly_analytics (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    tenant_id UUID REFERENCES tenants(id) ON DELETE CASCADE,  -- NULL = all tenants
+    week_start DATE NOT NULL,          -- Monday
+    week_end DATE NOT NULL,            -- Sunday
+
+    -- Call metrics (call_logs)
+    total_calls INTEGER DEFAULT 0,
+    answered_calls INTEGER DEFAULT 0,
+    missed_calls INTEGER DEFAULT 0,
+    dropped_calls INTEGER DEFAULT 0,
+    after_hours_calls INTEGER DEFAULT 0,
+    total_duration_seconds INTEGER DEFAULT 0,
+    avg_duration_seconds INTEGER DEFAULT 0,
+    ai_handled_calls INTEGER DEFAULT 0,
+    human_transferred_calls INTEGER DEFAULT 0,
+    ac_issues INTEGER DEFAULT 0,
+    heating_issues INTEGER DEFAULT 0,
+    maintenance_issues INTEGER DEFAULT 0,
+    emergency_issues INTEGER DEFAULT 0,
+    busiest_hours JSONB DEFAULT '[]'::jsonb,  -- [{"hour": 10, "calls": 8}, ...] top 3
+    avg_sentiment_score FLOAT,                -- positive = 1, neutral = 0.5, negative = 0
+
+    -- Appointment metrics (appointments, by booking week)
+    appointments_booked INTEGER DEFAULT 0,
+    appointments_completed INTEGER DEFAULT 0,
+    appointments_cancelled INTEGER DEFAULT 0,
+    appointments_no_show INTEGER DEFAULT 0,
+
+    -- Pain signal metrics (all-tenant row only)
+    signals_detected INTEGER DEFAULT 0,
+    high_score_signals INTEGER DEFAULT 0,
+    signals_converted INTEGER DEFAULT 0,
+
+    refreshed_at TIMESTAMPTZ DEFAULT NOW(),
+
+    UNIQUE NULLS NOT DISTINCT (tenant_id, week_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_weekly_analytics_week ON weekly_analytics(week_start DESC);
+
+COMMENT ON TABLE weekly_analytics IS 'Weekly rollup of calls, appointments and signals per tenant (NULL tenant = all tenants); maintained by refresh_weekly_analytics()';
+
+-- Source lookups by time for the refresh: change detection...
+CREATE INDEX IF NOT EXISTS idx_call_logs_created_at ON call_logs(created_at);
+CREATE INDEX IF NOT EXISTS idx_call_logs_ended_at ON call_logs(ended_at);
+CREATE INDEX IF NOT EXISTS idx_appointments_updated_at ON appointments(updated_at);
+
+-- ...and the per-week range reads of the touched weeks (reddit_signals is
+-- already indexed by 017)
+CREATE INDEX IF NOT EXISTS idx_call_logs_call_time ON call_logs((COALESCE(started_at, created_at)));
+CREATE INDEX IF NOT EXISTS idx_appointments_created_at ON appointments(created_at);
+CREATE INDEX IF NOT EXISTS idx_facebook_signals_created_at ON facebook_signals(created_at);
+CREATE INDEX IF NOT EXISTS idx_job_board_signals_created_at ON job_board_signals(created_at);
+CREATE INDEX IF NOT EXISTS idx_licensing_signals_created_at ON licensing_signals(created_at);
+
+-- ============================================================================
+-- 2. INCREMENTAL REFRESH
+-- ============================================================================
+-- Recomputes every (tenant, week) touched by a call, appointment or signal
+-- changed since `since` (everything when NULL), plus the current and
+-- previous week so late status changes (e.g. signal conversions) land.
+-- Weeks are recomputed from their source rows, so reruns are idempotent.
+-- Each source is read by joining the touched weeks as [Monday, Monday + 7)
+-- ranges on its timestamp (indexed above), so an hourly refresh reads only
+-- those weeks' rows rather than scanning every table.
+-- Returns the number of rollup rows written.
+
+CREATE OR REPLACE FUNCTION refresh_weekly_analytics(since TIMESTAMPTZ DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    refreshed INTEGER;
+BEGIN
+    WITH touched AS (
+        SELECT DATE_TRUNC('week', COALESCE(started_at, created_at))::DATE AS week_start
+        FROM call_logs
+        WHERE since IS NULL OR created_at >= since OR ended_at >= since
+        UNION
+        SELECT DATE_TRUNC('week', created_at)::DATE
+        FROM appointments
+        WHERE since IS NULL OR created_at >= since OR updated_at >= since
+        UNION
+        SELECT DATE_TRUNC('week', created_at)::DATE
+        FROM unified_signals_with_ai
+        WHERE since IS NULL OR created_at >= since
+        UNION
+        SELECT DATE_TRUNC('week', NOW())::DATE
+        UNION
+        SELECT DATE_TRUNC('week', NOW() - INTERVAL '7 days')::DATE
+    ),
+    calls AS (
+        SELECT
+            c.*,
+            t.week_start,
+            EXTRACT(HOUR FROM COALESCE(c.started_at, c.created_at))::INTEGER AS call_hour
+        FROM touched t
+        JOIN call_logs c
+            ON COALESCE(c.started_at, c.created_at) >= t.week_start
+            AND COALESCE(c.started_at, c.created_at) < t.week_start + 7
+    ),
+    -- One set of groups per tenant plus the all-tenant total (tenant_id NULL)
+    call_groups AS (
+        SELECT tenant_id, week_start, call_hour, status, is_missed, is_dropped, is_after_hours,
+               transferred, duration, service_requested, urgency_level, sentiment
+        FROM calls WHERE tenant_id IS NOT NULL
+        UNION ALL
+        SELECT NULL, week_start, call_hour, status, is_missed, is_dropped, is_after_hours,
+               transferred, duration, service_requested, urgency_level, sentiment
+        FROM calls
+    ),
+    call_stats AS (
+        SELECT
+            tenant_id,
+            week_start,
+            COUNT(*) AS total_calls,
+            COUNT(*) FILTER (WHERE status = 'completed' AND NOT COALESCE(is_missed, FALSE)) AS answered_calls,
+            COUNT(*) FILTER (WHERE is_missed) AS missed_calls,
+            COUNT(*) FILTER (WHERE is_dropped) AS dropped_calls,
+            COUNT(*) FILTER (WHERE is_after_hours) AS after_hours_calls,
+            COALESCE(SUM(duration), 0) AS total_duration_seconds,
+            COALESCE(ROUND(AVG(duration)), 0) AS avg_duration_seconds,
+            COUNT(*) FILTER (WHERE status = 'completed' AND NOT COALESCE(transferred, FALSE)) AS ai_handled_calls,
+            COUNT(*) FILTER (WHERE transferred) AS human_transferred_calls,
+            COUNT(*) FILTER (WHERE service_requested ~* '\m(ac|a/c|air condition\w*|cooling)\M') AS ac_issues,
+            COUNT(*) FILTER (WHERE service_requested ~* '\m(heat\w*|furnace|boiler)\M') AS heating_issues,
+            COUNT(*) FILTER (WHERE service_requested ~* '\m(maintenance|tune[- ]?up|inspection)\M') AS maintenance_issues,
+            COUNT(*) FILTER (WHERE urgency_level = 'emergency') AS emergency_issues,
+            AVG(CASE sentiment WHEN 'positive' THEN 1.0 WHEN 'neutral' THEN 0.5 WHEN 'negative' THEN 0.0 END) AS avg_sentiment_score
+        FROM call_groups
+        GROUP BY tenant_id, week_start
+    ),
+    hour_ranks AS (
+        SELECT
+            tenant_id, week_start, call_hour, COUNT(*) AS calls,
+            ROW_NUMBER() OVER (PARTITION BY tenant_id, week_start ORDER BY COUNT(*) DESC, call_hour) AS hour_rank
+        FROM call_groups
+        WHERE call_hour IS NOT NULL
+        GROUP BY tenant_id, week_start, call_hour
+    ),
+    busiest AS (
+        SELECT tenant_id, week_start,
+               jsonb_agg(jsonb_build_object('hour', call_hour, 'calls', calls) ORDER BY hour_rank) AS busiest_hours
+        FROM hour_ranks
+        WHERE hour_rank <= 3
+        GROUP BY tenant_id, week_start
+    ),
+    bookings AS (
+        SELECT a.tenant_id, t.week_start, a.status
+        FROM touched t
+        JOIN appointments a ON a.created_at >= t.week_start AND a.created_at < t.week_start + 7
+    ),
+    appointment_stats AS (
+        SELECT
+            tenant_id,
+            week_start,
+            COUNT(*) AS appointments_booked,
+            COUNT(*) FILTER (WHERE status = 'completed') AS appointments_completed,
+            COUNT(*) FILTER (WHERE status = 'cancelled') AS appointments_cancelled,
+            COUNT(*) FILTER (WHERE status = 'no_show') AS appointments_no_show
+        FROM (
+            SELECT * FROM bookings WHERE tenant_id IS NOT NULL
+            UNION ALL
+            SELECT NULL, week_start, status FROM bookings
+        ) b
+        GROUP BY tenant_id, week_start
+    ),
+    signal_stats AS (
+        SELECT
+            NULL::UUID AS tenant_id,
+            t.week_start,
+            COUNT(*) AS signals_detected,
+            COUNT(*) FILTER (WHERE s.combined_score >= 70) AS high_score_signals,
+            COUNT(*) FILTER (WHERE s.converted_to_lead) AS signals_converted
+        FROM touched t
+        -- The view is a UNION ALL over the signal tables; the range is pushed
+        -- down to each table's created_at index
+        JOIN unified_signals_with_ai s ON s.created_at >= t.week_start AND s.created_at < t.week_start + 7
+        GROUP BY t.week_start
+    ),
+    -- Every touched week gets an all-tenant row, even if it had no activity
+    rollup_keys AS (
+        SELECT NULL::UUID AS tenant_id, week_start FROM touched
+        UNION SELECT tenant_id, week_start FROM call_stats
+        UNION SELECT tenant_id, week_start FROM appointment_stats
+    ),
+    upserted AS (
+        INSERT INTO weekly_analytics (
+            tenant_id, week_start, week_end,
+            total_calls, answered_calls, missed_calls, dropped_calls, after_hours_calls,
+            total_duration_seconds, avg_duration_seconds, ai_handled_calls, human_transferred_calls,
+            ac_issues, heating_issues, maintenance_issues, emergency_issues,
+            busiest_hours, avg_sentiment_score,
+            appointments_booked, appointments_completed, appointments_cancelled, appointments_no_show,
+            signals_detected, high_score_signals, signals_converted,
+            refreshed_at
+        )
+        SELECT
+            k.tenant_id, k.week_start, k.week_start + 6,
+            COALESCE(c.total_calls, 0), COALESCE(c.answered_calls, 0), COALESCE(c.missed_calls, 0),
+            COALESCE(c.dropped_calls, 0), COALESCE(c.after_hours_calls, 0),
+            COALESCE(c.total_duration_seconds, 0), COALESCE(c.avg_duration_seconds, 0),
+            COALESCE(c.ai_handled_calls, 0), COALESCE(c.human_transferred_calls, 0),
+            COALESCE(c.ac_issues, 0), COALESCE(c.heating_issues, 0),
+            COALESCE(c.maintenance_issues, 0), COALESCE(c.emergency_issues, 0),
+            COALESCE(b.busiest_hours, '[]'::jsonb), c.avg_sentiment_score,
+            COALESCE(a.appointments_booked, 0), COALESCE(a.appointments_completed, 0),
+            COALESCE(a.appointments_cancelled, 0), COALESCE(a.appointments_no_show, 0),
+            COALESCE(s.signals_detected, 0), COALESCE(s.high_score_signals, 0), COALESCE(s.signals_converted, 0),
+            NOW()
+        FROM rollup_keys k
+        LEFT JOIN call_stats c ON c.tenant_id IS NOT DISTINCT FROM k.tenant_id AND c.week_start = k.week_start
+        LEFT JOIN busiest b ON b.tenant_id IS NOT DISTINCT FROM k.tenant_id AND b.week_start = k.week_start
+        LEFT JOIN appointment_stats a ON a.tenant_id IS NOT DISTINCT FROM k.tenant_id AND a.week_start = k.week_start
+        LEFT JOIN signal_stats s ON s.tenant_id IS NOT DISTINCT FROM k.tenant_id AND s.week_start = k.week_start
+        ON CONFLICT (tenant_id, week_start) DO UPDATE SET
+            total_calls = EXCLUDED.total_calls,
+            answered_calls = EXCLUDED.answered_calls,
+            missed_calls = EXCLUDED.missed_calls,
+            dropped_calls = EXCLUDED.dropped_calls,
+            after_hours_calls = EXCLUDED.after_hours_calls,
+            total_duration_seconds = EXCLUDED.total_duration_seconds,
+            avg_duration_seconds = EXCLUDED.avg_duration_seconds,
+            ai_handled_calls = EXCLUDED.ai_handled_calls,
+            human_transferred_calls = EXCLUDED.human_transferred_calls,
+            ac_issues = EXCLUDED.ac_issues,
+            heating_issues = EXCLUDED.heating_issues,
+            maintenance_issues = EXCLUDED.maintenance_issues,
+            emergency_issues = EXCLUDED.emergency_issues,
+            busiest_hours = EXCLUDED.busiest_hours,
+            avg_sentiment_score = EXCLUDED.avg_sentiment_score,
+            appointments_booked = EXCLUDED.appointments_booked,
+            appointments_completed = EXCLUDED.appointments_completed,
+            appointments_cancelled = EXCLUDED.appointments_cancelled,
+            appointments_no_show = EXCLUDED.appointments_no_show,
+            signals_detected = EXCLUDED.signals_detected,
+            high_score_signals = EXCLUDED.high_score_signals,
+            signals_converted = EXCLUDED.signals_converted,
+            refreshed_at = EXCLUDED.refreshed_at
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO refreshed FROM upserted;
+
+    RETURN refreshed;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION refresh_weekly_analytics IS 'Recompute weekly_analytics rows for weeks with activity since the given time (all weeks when NULL)';
+
+-- ============================================================================
+-- 3. GRANTS
+-- ============================================================================
+
+GRANT SELECT ON weekly_analytics TO authenticated;
+
+-- The refresh is only run by the hourly job under the service role. Functions
+-- are executable by PUBLIC by default (and Supabase grants anon/authenticated
+-- on new functions), so take that away explicitly.
+REVOKE EXECUTE ON FUNCTION refresh_weekly_analytics(TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_weekly_analytics(TIMESTAMPTZ) TO service_role;
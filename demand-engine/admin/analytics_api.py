@@ -12,7 +12,8 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.supabase_config import get_supabase
+from config.supabase_config import get_supabase, call_rpc
+from utils.response_cache import ttl_cache
 
 router = APIRouter(prefix="/api/admin/analytics", tags=["Analytics"])
 
@@ -48,11 +49,17 @@ class TrendData(BaseModel):
 
 
 @router.get("/source-performance")
+@ttl_cache()
 async def get_source_performance(days: int = 30):
     """
     Get performance metrics by signal source from both signals and reddit_signals tables
     """
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        rows = call_rpc("get_source_performance", {"days_back": days})
+        if rows is not None:
+            return [SourcePerformance(**row) for row in rows]
+        
         supabase = get_supabase()
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
@@ -60,9 +67,9 @@ async def get_source_performance(days: int = 30):
         
         # Try to get from signals table (scraped business data)
         try:
-            signals_response = supabase.table("signals").select("*").gte(
-                "created_at", cutoff_date
-            ).execute()
+            signals_response = supabase.table("signals").select(
+                "source, pain_score, status"
+            ).gte("created_at", cutoff_date).execute()
             
             for signal in signals_response.data or []:
                 source = signal.get("source", "scraped")
@@ -81,9 +88,9 @@ async def get_source_performance(days: int = 30):
         
         # Try to get from reddit_signals table
         try:
-            reddit_response = supabase.table("reddit_signals").select("*").gte(
-                "created_at", cutoff_date
-            ).execute()
+            reddit_response = supabase.table("reddit_signals").select(
+                "total_score, ai_tier, alerted"
+            ).gte("created_at", cutoff_date).execute()
             
             for signal in reddit_response.data or []:
                 source = "reddit"
@@ -122,6 +129,7 @@ async def get_source_performance(days: int = 30):
 
 
 @router.get("/score-correlation")
+@ttl_cache()
 async def get_score_correlation(days: int = 30):
     """
     Analyze correlation between keyword and AI scores
@@ -133,6 +141,11 @@ async def get_score_correlation(days: int = 30):
         Score correlation data by ranges
     """
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        rows = call_rpc("get_score_correlation", {"days_back": days})
+        if rows is not None:
+            return [ScoreCorrelation(**row) for row in rows]
+        
         supabase = get_supabase()
         
         # Get signals with both keyword and AI scores
@@ -190,6 +203,7 @@ async def get_score_correlation(days: int = 30):
 
 
 @router.get("/intent-analysis")
+@ttl_cache()
 async def get_intent_analysis(days: int = 30):
     """
     Analyze signals by intent type
@@ -201,6 +215,11 @@ async def get_intent_analysis(days: int = 30):
         Intent analysis with conversion rates
     """
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        rows = call_rpc("get_intent_analysis", {"days_back": days})
+        if rows is not None:
+            return [IntentAnalysis(**row) for row in rows]
+        
         supabase = get_supabase()
         
         response = supabase.table("unified_signals_with_ai").select(
@@ -254,11 +273,17 @@ async def get_intent_analysis(days: int = 30):
 
 
 @router.get("/trends")
+@ttl_cache()
 async def get_trends(days: int = 30):
     """
     Get daily trends for signals and conversions from both signals and reddit_signals tables
     """
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        rows = call_rpc("get_signal_trends", {"days_back": days})
+        if rows is not None:
+            return [TrendData(**row) for row in rows]
+        
         supabase = get_supabase()
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
@@ -325,11 +350,17 @@ async def get_trends(days: int = 30):
 
 
 @router.get("/summary")
+@ttl_cache()
 async def get_analytics_summary(days: int = 7):
     """
     Get comprehensive analytics summary from both signals and reddit_signals tables
     """
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        summary = call_rpc("get_analytics_summary", {"days_back": days})
+        if summary is not None:
+            return summary
+        
         supabase = get_supabase()
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
@@ -341,9 +372,9 @@ async def get_analytics_summary(days: int = 7):
         
         # Get from signals table (scraped business data)
         try:
-            signals_response = supabase.table("signals").select("*").gte(
-                "created_at", cutoff_date
-            ).execute()
+            signals_response = supabase.table("signals").select(
+                "source, pain_score, signal_type, status"
+            ).gte("created_at", cutoff_date).execute()
             
             for signal in signals_response.data or []:
                 pain_score = signal.get("pain_score", 0)
@@ -364,9 +395,9 @@ async def get_analytics_summary(days: int = 7):
         
         # Get from reddit_signals table
         try:
-            reddit_response = supabase.table("reddit_signals").select("*").gte(
-                "created_at", cutoff_date
-            ).execute()
+            reddit_response = supabase.table("reddit_signals").select(
+                "total_score, intent, ai_tier, alerted"
+            ).gte("created_at", cutoff_date).execute()
             
             for signal in reddit_response.data or []:
                 score = signal.get("total_score", 0)
@@ -3,12 +3,21 @@ Admin API for Kestrel Calculator Lead Management
 Provides endpoints for viewing, filtering, and managing calculator submissions
 """
 
-from typing import Optional, List
+import csv
+import io
+import logging
+import os
+from typing import Iterator, Optional, List
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from config.supabase_config import get_supabase
+from config.supabase_config import get_supabase, call_rpc
+from utils.response_cache import ttl_cache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
@@ -76,6 +85,7 @@ class LeadDetail(BaseModel):
 # API Endpoints
 
 @router.get("/dashboard/stats", response_model=DashboardStats)
+@ttl_cache()
 async def get_dashboard_stats():
     """
     Get high-level dashboard statistics
@@ -87,10 +97,18 @@ async def get_dashboard_stats():
         - Recent activity
     """
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        stats = call_rpc("get_dashboard_stats")
+        if stats:
+            return DashboardStats(**stats)
+        
         supabase = get_supabase()
         
         # Get all leads
-        response = supabase.table("calculator_submissions").select("*").execute()
+        response = supabase.table("calculator_submissions").select(
+            "lead_tier, annual_loss, monthly_loss, email, email_opened, "
+            "downloaded_pdf, clicked_cta, submitted_at"
+        ).execute()
         leads = response.data
         
         if not leads:
@@ -381,50 +399,55 @@ async def get_source_analytics():
         raise HTTPException(status_code=500, detail=f"Failed to fetch source analytics: {str(e)}")
 
 
-@router.get("/export/csv")
-async def export_leads_csv(
-    tier: Optional[str] = Query(None),
-    days: Optional[int] = Query(None)
-):
-    """
-    Export leads to CSV format
+CSV_EXPORT_PAGE_SIZE = int(os.getenv("CSV_EXPORT_PAGE_SIZE", "1000"))
+
+CSV_EXPORT_HEADER = [
+    'Session ID', 'Email', 'Phone', 'Company Name', 'Business Type',
+    'Monthly Loss', 'Annual Loss', 'Lead Tier', 'Lead Score',
+    'Submitted At', 'Email Opened', 'PDF Downloaded', 'CTA Clicked',
+    'PDF URL'
+]
+
+CSV_EXPORT_COLUMNS = (
+    "id, session_id, email, phone, company_name, business_type, monthly_loss, "
+    "annual_loss, lead_tier, lead_score, submitted_at, email_opened, "
+    "downloaded_pdf, clicked_cta, pdf_url"
+)
+
+
+def _fetch_export_page(tier: Optional[str], days: Optional[int], after_id: Optional[str]) -> List[dict]:
+    """Fetch one page of leads for export, keyset-paginated on id"""
+    supabase = get_supabase()
     
-    Returns CSV string for download
-    """
-    try:
-        supabase = get_supabase()
-        
-        # Build query
-        query = supabase.table("calculator_submissions").select("*")
-        
-        if tier:
-            query = query.eq("lead_tier", tier)
-        
-        if days:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.gte("submitted_at", cutoff.isoformat())
-        
-        response = query.execute()
-        leads = response.data
-        
-        # Generate CSV
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            'Session ID', 'Email', 'Phone', 'Company Name', 'Business Type',
-            'Monthly Loss', 'Annual Loss', 'Lead Tier', 'Lead Score',
-            'Submitted At', 'Email Opened', 'PDF Downloaded', 'CTA Clicked',
-            'PDF URL'
-        ])
-        
-        # Data rows
-        for lead in leads:
-            writer.writerow([
+    query = supabase.table("calculator_submissions").select(CSV_EXPORT_COLUMNS)
+    
+    if tier:
+        query = query.eq("lead_tier", tier)
+    
+    if days:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        query = query.gte("submitted_at", cutoff.isoformat())
+    
+    if after_id:
+        query = query.gt("id", after_id)
+    
+    return query.order("id").limit(CSV_EXPORT_PAGE_SIZE).execute().data or []
+
+
+def _csv_chunk(rows: List[list]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def _iter_leads_csv(tier: Optional[str], days: Optional[int], first_page: List[dict]) -> Iterator[str]:
+    """Yield the CSV header, then one chunk per page of leads"""
+    yield _csv_chunk([CSV_EXPORT_HEADER])
+    
+    page = first_page
+    while page:
+        yield _csv_chunk([
+            [
                 lead['session_id'],
                 lead.get('email', ''),
                 lead.get('phone', ''),
@@ -439,14 +462,38 @@ async def export_leads_csv(
                 lead.get('downloaded_pdf', False),
                 lead.get('clicked_cta', False),
                 lead.get('pdf_url', '')
-            ])
+            ]
+            for lead in page
+        ])
         
-        csv_content = output.getvalue()
-        output.close()
+        if len(page) < CSV_EXPORT_PAGE_SIZE:
+            break
+        try:
+            page = _fetch_export_page(tier, days, page[-1]['id'])
+        except Exception:
+            # Headers are already sent; re-raise so the chunked response is
+            # aborted instead of ending like a complete (truncated) file
+            logger.exception("CSV export aborted after partial output")
+            raise
+
+
+@router.get("/export/csv")
+async def export_leads_csv(
+    tier: Optional[str] = Query(None),
+    days: Optional[int] = Query(None)
+):
+    """
+    Export leads to CSV format
+    
+    Streams the CSV as it pages through calculator_submissions, so large
+    exports start downloading immediately and use constant memory.
+    """
+    try:
+        # Fetch the first page up front so query errors still return a 500
+        first_page = await run_in_threadpool(_fetch_export_page, tier, days, None)
         
-        from fastapi.responses import Response
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            _iter_leads_csv(tier, days, first_page),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=kestrel_leads_{datetime.now().strftime('%Y%m%d')}.csv"
@@ -8,7 +8,8 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
-from config.supabase_config import get_supabase
+from config.supabase_config import get_supabase, call_rpc
+from utils.response_cache import ttl_cache
 
 router = APIRouter(prefix="/api/admin/signals", tags=["Pain Signals"])
 
@@ -90,33 +91,30 @@ class SignalStats(BaseModel):
 
 
 @router.get("/stats", response_model=SignalStats)
+@ttl_cache()
 async def get_signal_stats(
     days: int = Query(7, description="Number of days to analyze")
 ):
     """Get pain signal statistics from both reddit_signals and signals tables"""
     try:
+        # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+        stats = call_rpc('get_signal_stats', {'days_back': days})
+        if isinstance(stats, list):
+            stats = stats[0] if stats else None
+        if stats:
+            return stats
+        
+        # RPC might not exist, fall back to manual
         supabase = get_supabase()
         cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
         
-        # Try to get from unified view first
-        try:
-            result = supabase.rpc(
-                'get_signal_stats',
-                {'days_back': days}
-            ).execute()
-            
-            if result.data:
-                return result.data[0]
-        except:
-            pass  # RPC might not exist, fall back to manual
-        
         # Get signals from both tables
         reddit_signals = []
         scraped_signals = []
         
         try:
             reddit_result = supabase.table("reddit_signals")\
-                .select("*")\
+                .select("total_score, ai_total_score, ai_tier, intent, sentiment, alerted")\
                 .gte("created_at", cutoff_date)\
                 .execute()
             reddit_signals = reddit_result.data or []
@@ -125,7 +123,7 @@ async def get_signal_stats(
         
         try:
             scraped_result = supabase.table("signals")\
-                .select("*")\
+                .select("source, pain_score, signal_type, status")\
                 .gte("created_at", cutoff_date)\
                 .execute()
             scraped_signals = scraped_result.data or []
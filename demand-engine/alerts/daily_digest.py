@@ -3,7 +3,7 @@ Daily digest alert system for high-score signals
 Runs on Modal as scheduled job
 """
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta, timezone
 import modal
 from sendgrid import SendGridAPIClient
@@ -12,10 +12,21 @@ from sendgrid.helpers.mail import Mail, Email, To, Content
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.modal_config import app, scraper_image, secrets
+from services.weekly_analytics import get_weekly_analytics, week_bounds
 
 
-def generate_html_email(signals: List[Dict]) -> str:
-    """Generate HTML email for daily digest"""
+def get_week_to_date(client) -> Optional[Dict]:
+    """This week's all-tenant weekly_analytics row (None if unavailable)"""
+    try:
+        week_start, _ = week_bounds()
+        return get_weekly_analytics(client, week_start)
+    except Exception as e:
+        print(f"⚠️  Weekly analytics unavailable: {e}")
+        return None
+
+
+def generate_html_email(signals: List[Dict], weekly: Optional[Dict] = None) -> str:
+    """Generate HTML email for daily digest (with week-to-date totals if given)"""
     
     html = """
     <!DOCTYPE html>
@@ -43,6 +54,14 @@ def generate_html_email(signals: List[Dict]) -> str:
             <p><strong>Found {count} qualified signals</strong> ready for review.</p>
     """.format(count=len(signals))
     
+    if weekly:
+        html += f"""
+            <p class="meta"><strong>This week so far:</strong>
+                {weekly.get('signals_detected', 0)} signals,
+                {weekly.get('high_score_signals', 0)} high score,
+                {weekly.get('signals_converted', 0)} converted to leads</p>
+        """
+    
     for signal in signals:
         score = signal.get("classified_score", 0)
         score_class = "high" if score >= 85 else ""
@@ -79,8 +98,8 @@ def generate_html_email(signals: List[Dict]) -> str:
     return html
 
 
-def generate_text_email(signals: List[Dict]) -> str:
-    """Generate plain text email for daily digest"""
+def generate_text_email(signals: List[Dict], weekly: Optional[Dict] = None) -> str:
+    """Generate plain text email for daily digest (with week-to-date totals if given)"""
     
     text = f"""
 DAILY LEAD SIGNALS DIGEST
@@ -90,6 +109,13 @@ Found {len(signals)} qualified signals from the last 24 hours.
 
 """
     
+    if weekly:
+        text += (
+            f"This week so far: {weekly.get('signals_detected', 0)} signals, "
+            f"{weekly.get('high_score_signals', 0)} high score, "
+            f"{weekly.get('signals_converted', 0)} converted to leads\n\n"
+        )
+    
     for i, signal in enumerate(signals, 1):
         score = signal.get("classified_score", 0)
         text += f"""
@@ -157,8 +183,9 @@ def send_daily_digest(
     print(f"📧 Preparing digest with {len(signals)} signals")
     
     # Generate email content
-    html_content = generate_html_email(signals)
-    text_content = generate_text_email(signals)
+    weekly = get_week_to_date(client)
+    html_content = generate_html_email(signals, weekly)
+    text_content = generate_text_email(signals, weekly)
     
     # Send via SendGrid
     sendgrid_key = os.getenv("SENDGRID_API_KEY")
@@ -13,7 +13,7 @@ from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail, Email, To, Content
 
 # Import shared logic
-from alerts.daily_digest import generate_html_email, generate_text_email
+from alerts.daily_digest import generate_html_email, generate_text_email, get_week_to_date
 
 
 def send_daily_digest_local(
@@ -47,8 +47,9 @@ def send_daily_digest_local(
     print(f"📧 Preparing digest with {len(signals)} signals")
     
     # Generate email content
-    html_content = generate_html_email(signals)
-    text_content = generate_text_email(signals)
+    weekly = get_week_to_date(client)
+    html_content = generate_html_email(signals, weekly)
+    text_content = generate_text_email(signals, weekly)
     
     # Send via SendGrid
     sendgrid_key = os.getenv("SENDGRID_API_KEY")
@@ -5,11 +5,12 @@ Sends email alerts for high-value signals detected
 
 import os
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 
 from config.supabase_config import get_supabase
 from email_service.resend_client import ResendEmailClient
+from services.weekly_analytics import get_weekly_analytics, week_bounds
 
 logger = logging.getLogger(__name__)
 
@@ -94,13 +95,29 @@ class SignalDigest:
             logger.error(f"Error fetching daily stats: {str(e)}")
             return {}
     
-    def generate_digest_html(self, signals: List[Dict], stats: Dict) -> str:
+    def get_weekly_stats(self) -> Dict:
+        """
+        Get week-to-date totals from the weekly_analytics rollup
+        
+        Returns:
+            The all-tenant rollup row for this week (empty if not rolled up yet)
+        """
+        try:
+            week_start, _ = week_bounds()
+            return get_weekly_analytics(self.supabase, week_start) or {}
+            
+        except Exception as e:
+            logger.error(f"Error fetching weekly stats: {str(e)}")
+            return {}
+    
+    def generate_digest_html(self, signals: List[Dict], stats: Dict, weekly: Optional[Dict] = None) -> str:
         """
         Generate HTML email for daily digest
         
         Args:
             signals: List of high-score signals
             stats: Daily processing statistics
+            weekly: Week-to-date rollup row (optional)
             
         Returns:
             HTML string
@@ -131,6 +148,19 @@ class SignalDigest:
             </tr>
             """
         
+        weekly_summary = ""
+        if weekly:
+            weekly_summary = f"""
+        <div style="padding: 16px 20px; border-bottom: 1px solid #e5e7eb; font-size: 13px; color: #374151; text-align: center;">
+            <strong>This week:</strong>
+            {weekly.get('signals_detected', 0)} signals •
+            {weekly.get('high_score_signals', 0)} high score •
+            {weekly.get('signals_converted', 0)} converted to leads •
+            {weekly.get('total_calls', 0)} calls ({weekly.get('missed_calls', 0)} missed) •
+            {weekly.get('appointments_booked', 0)} appointments booked
+        </div>
+            """
+        
         html = f"""
 <!DOCTYPE html>
 <html>
@@ -179,7 +209,7 @@ class SignalDigest:
                 </div>
             </div>
         </div>
-        
+        {weekly_summary}
         <!-- Signals Table -->
         <div style="padding: 30px 20px;">
             <h2 style="font-size: 20px; color: #111827; margin: 0 0 20px 0;">
@@ -262,7 +292,8 @@ class SignalDigest:
                 }
             
             # Generate HTML
-            html_content = self.generate_digest_html(signals, stats)
+            weekly = self.get_weekly_stats()
+            html_content = self.generate_digest_html(signals, stats, weekly)
             
             # Send email
             subject = f"🔥 Kestrel Daily Digest: {len(signals)} New High-Value Signals"
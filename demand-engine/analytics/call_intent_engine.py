@@ -9,8 +9,23 @@ Why: Needed for revenue modeling, conversion tracking, and report generation
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
+import hashlib
 import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# LLM batching: several short transcripts share one request
+INTENT_LLM_MODEL = os.getenv("INTENT_LLM_MODEL", "gpt-4o-mini")
+INTENT_LLM_BATCH_SIZE = int(os.getenv("INTENT_LLM_BATCH_SIZE", "8"))
+INTENT_LLM_BATCH_CHARS = int(os.getenv("INTENT_LLM_BATCH_CHARS", "12000"))
+INTENT_LLM_MAX_CONCURRENCY = int(os.getenv("INTENT_LLM_MAX_CONCURRENCY", "4"))
+INTENT_CACHE_MAX_ENTRIES = int(os.getenv("INTENT_CACHE_MAX_ENTRIES", "20000"))
 
 
 class CallIntent(str, Enum):
@@ -79,10 +94,31 @@ class CallIntentEngine:
     
     def __init__(self, llm_client=None):
         """
-        Initialize with optional LLM client.
+        Initialize with optional LLM client (OpenAI-compatible).
         Falls back to rule-based classification if no LLM available.
         """
         self.llm_client = llm_client
+        
+        # Classifications by transcript hash, shared across calls and batches
+        self._cache: Dict[str, CallClassification] = {}
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def transcript_hash(transcript: str) -> str:
+        """Cache key for a transcript (whitespace and case insensitive)"""
+        normalized = " ".join(transcript.lower().split())
+        return hashlib.sha256(normalized.encode()).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[CallClassification]:
+        with self._cache_lock:
+            return self._cache.get(key)
+    
+    def _cache_set(self, key: str, classification: CallClassification) -> None:
+        with self._cache_lock:
+            if len(self._cache) >= INTENT_CACHE_MAX_ENTRIES:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = classification
     
     def classify_call(
         self,
@@ -111,14 +147,28 @@ class CallIntentEngine:
         Use LLM for classification (OpenAI/Anthropic with structured output).
         This is the preferred method for accuracy.
         """
+        return self.batch_classify([{"call_id": call_id, "transcript": transcript}])[0]
+    
+    def _llm_classify_batch(self, transcripts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Classify several transcripts in one LLM request.
+        
+        Returns one result dict per transcript (None where the model's
+        answer was missing or unusable).
+        """
+        numbered = "\n\n".join(
+            f"[{i}]\n{transcript}" for i, transcript in enumerate(transcripts)
+        )
         prompt = f"""
-        Analyze this HVAC service call transcript and classify it.
+        Analyze each numbered HVAC service call transcript and classify it.
         
-        Transcript:
-        {transcript}
+        Transcripts:
+        {numbered}
         
-        Provide classification in JSON format:
+        Respond with a JSON object {{"results": [...]}} containing one entry per
+        transcript, in the same order, each in this format:
         {{
+            "index": 0,
             "intent": "emergency_repair|routine_repair|maintenance|installation_quote|general_inquiry|billing|follow_up",
             "urgency_level": "emergency|priority|routine",
             "high_intent": true|false,
@@ -137,12 +187,51 @@ class CallIntentEngine:
         - high_intent: likely to book (specific problem, ready to schedule)
         """
         
-        # Call LLM (placeholder - implement with your LLM client)
-        # response = self.llm_client.complete(prompt, response_format="json")
-        # result = json.loads(response)
+        try:
+            response = self.llm_client.chat.completions.create(
+                model=INTENT_LLM_MODEL,
+                messages=[
+                    {"role": "system", "content": "You classify HVAC service calls. Respond only with JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0,
+                response_format={"type": "json_object"}
+            )
+            items = json.loads(response.choices[0].message.content).get("results", [])
+        except Exception as e:
+            logger.error(f"LLM classification failed for batch of {len(transcripts)}: {str(e)}")
+            return [None] * len(transcripts)
         
-        # For now, fall back to rules
-        return self._classify_with_rules(call_id, transcript)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transcripts)
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            index = item.get("index", position)
+            if isinstance(index, int) and 0 <= index < len(transcripts):
+                results[index] = item
+        return results
+    
+    def _build_llm_classification(
+        self,
+        call_id: str,
+        transcript: str,
+        result: Dict[str, Any]
+    ) -> CallClassification:
+        """Validate one LLM result into a CallClassification"""
+        return CallClassification(
+            call_id=call_id,
+            transcript=transcript,
+            intent=CallIntent(result.get("intent", "unknown")),
+            urgency_level=UrgencyLevel(result.get("urgency_level", "routine")),
+            high_intent=bool(result.get("high_intent", False)),
+            intent_keywords=result.get("intent_keywords") or [],
+            urgency_keywords=result.get("urgency_keywords") or [],
+            confidence_score=min(1.0, max(0.0, float(result.get("confidence_score", 0.5)))),
+            classification_method="llm",
+            equipment_mentioned=result.get("equipment_mentioned"),
+            problem_description=result.get("problem_description"),
+            customer_sentiment=result.get("customer_sentiment")
+        )
     
     def _classify_with_rules(self, call_id: str, transcript: str) -> CallClassification:
         """
@@ -224,22 +313,99 @@ class CallIntentEngine:
     
     def batch_classify(
         self,
-        calls: List[Dict[str, str]]
+        calls: List[Dict[str, str]],
+        use_llm: bool = True
     ) -> List[CallClassification]:
         """
         Classify multiple calls in batch.
-        More efficient for large datasets.
+        
+        Identical transcripts are classified once and results are cached by
+        transcript hash. Confident rule-based results skip the LLM; the rest
+        are packed several per request and sent through a bounded worker pool.
         """
-        results = []
-        for call in calls:
-            classification = self.classify_call(
-                call_id=call['call_id'],
-                transcript=call['transcript']
-            )
-            results.append(classification)
+        results: List[Optional[CallClassification]] = [None] * len(calls)
+        needs_llm: Dict[str, List[int]] = {}
+        
+        for i, call in enumerate(calls):
+            transcript = call.get('transcript') or ""
+            key = self.transcript_hash(transcript)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached.model_copy(update={"call_id": call['call_id'], "transcript": transcript})
+                continue
+            if key in needs_llm:
+                needs_llm[key].append(i)
+                continue
+            
+            # Zero-cost fast path
+            classification = self._classify_with_rules(call['call_id'], transcript)
+            if not (use_llm and self.llm_client) or self._rules_matched(classification):
+                self._cache_set(key, classification)
+                results[i] = classification
+                continue
+            needs_llm[key] = [i]
+        
+        if needs_llm:
+            self._classify_pending_with_llm(calls, needs_llm, results)
         
         return results
     
+    @staticmethod
+    def _rules_matched(classification: CallClassification) -> bool:
+        """True when a keyword rule fired (general inquiry is the no-match fallback)"""
+        return classification.intent != CallIntent.GENERAL_INQUIRY
+    
+    def _classify_pending_with_llm(
+        self,
+        calls: List[Dict[str, str]],
+        needs_llm: Dict[str, List[int]],
+        results: List[Optional[CallClassification]]
+    ) -> None:
+        """Pack uncached transcripts into LLM requests and fill in results"""
+        # Pack by count and size so long transcripts don't share a request
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_chars = 0
+        for key, indexes in needs_llm.items():
+            length = len(calls[indexes[0]].get('transcript') or "")
+            if batch and (len(batch) >= INTENT_LLM_BATCH_SIZE or batch_chars + length > INTENT_LLM_BATCH_CHARS):
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(key)
+            batch_chars += length
+        if batch:
+            batches.append(batch)
+        
+        def run_batch(keys: List[str]) -> None:
+            transcripts = [calls[needs_llm[key][0]].get('transcript') or "" for key in keys]
+            llm_results = self._llm_classify_batch(transcripts)
+            
+            for key, transcript, llm_result in zip(keys, transcripts, llm_results):
+                first = needs_llm[key][0]
+                classification = None
+                if llm_result is not None:
+                    try:
+                        classification = self._build_llm_classification(
+                            calls[first]['call_id'], transcript, llm_result
+                        )
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"Invalid LLM classification for {calls[first]['call_id']}: {str(e)}")
+                if classification is None:
+                    # Don't cache fallbacks, so a later run can retry the LLM
+                    classification = self._classify_with_rules(calls[first]['call_id'], transcript)
+                else:
+                    self._cache_set(key, classification)
+                
+                for i in needs_llm[key]:
+                    results[i] = classification if i == first else classification.model_copy(
+                        update={"call_id": calls[i]['call_id']}
+                    )
+        
+        logger.info(f"Classifying {len(needs_llm)} transcripts with LLM in {len(batches)} requests")
+        with ThreadPoolExecutor(max_workers=max(1, INTENT_LLM_MAX_CONCURRENCY)) as executor:
+            for future in [executor.submit(run_batch, keys) for keys in batches]:
+                future.result()
+    
     def get_classification_summary(
         self,
         classifications: List[CallClassification]
@@ -250,29 +416,37 @@ class CallIntentEngine:
         """
         total = len(classifications)
         
+        # Single pass over classifications
+        intent_counts = Counter()
+        urgency_counts = Counter()
+        high_intent_count = 0
+        confidence_total = 0.0
+        for c in classifications:
+            intent_counts[c.intent] += 1
+            urgency_counts[c.urgency_level] += 1
+            high_intent_count += c.high_intent
+            confidence_total += c.confidence_score
+        
         # Count by intent
-        by_intent = {}
-        for intent in CallIntent:
-            count = sum(1 for c in classifications if c.intent == intent)
-            by_intent[intent.value] = {
-                "count": count,
-                "percentage": count / total if total > 0 else 0
+        by_intent = {
+            intent.value: {
+                "count": intent_counts[intent],
+                "percentage": intent_counts[intent] / total if total > 0 else 0
             }
+            for intent in CallIntent
+        }
         
         # Count by urgency
-        by_urgency = {}
-        for urgency in UrgencyLevel:
-            count = sum(1 for c in classifications if c.urgency_level == urgency)
-            by_urgency[urgency.value] = {
-                "count": count,
-                "percentage": count / total if total > 0 else 0
+        by_urgency = {
+            urgency.value: {
+                "count": urgency_counts[urgency],
+                "percentage": urgency_counts[urgency] / total if total > 0 else 0
             }
-        
-        # High-intent calls
-        high_intent_count = sum(1 for c in classifications if c.high_intent)
+            for urgency in UrgencyLevel
+        }
         
         # Average confidence
-        avg_confidence = sum(c.confidence_score for c in classifications) / total if total > 0 else 0
+        avg_confidence = confidence_total / total if total > 0 else 0
         
         return {
             "total_calls": total,
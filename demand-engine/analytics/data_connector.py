@@ -1,16 +1,43 @@
 """
 Data Connector for Analytics Engines
 Fetches real call data from Supabase for report generation
+
+Sources are fetched concurrently (one worker per table), paged with keyset
+pagination on id so rows past the API page cap are not dropped, and only
+the columns the engines read are selected. Pages are aggregated as they
+arrive instead of materializing every row first.
 """
 
 import os
-from typing import List, Dict, Optional, Any
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple
 from datetime import datetime, timedelta
 from supabase import create_client, Client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows per request; keep at or below the PostgREST max-rows cap (1000 by default)
+ANALYTICS_PAGE_SIZE = int(os.getenv("ANALYTICS_PAGE_SIZE", "1000"))
+
+# Source tables and the only columns the analytics engines read
+SOURCE_TABLES = {
+    "call_logs": (
+        "call_logs",
+        "id,call_sid,status,duration,transcript,started_at,ended_at,created_at",
+    ),
+    "appointments": (
+        "appointments",
+        "id,scheduled_date,scheduled_time,created_at",
+    ),
+    "ai_demo_logs": (
+        "ai_demo_call_logs",
+        "id,full_transcript,recording_duration_seconds,created_at,updated_at",
+    ),
+}
+
 
 class AnalyticsDataConnector:
     """Connects analytics engines to real Supabase call data"""
@@ -55,21 +82,9 @@ class AnalyticsDataConnector:
             start_date = end_date - timedelta(days=30)
         
         try:
-            # Fetch call logs
-            call_logs = self._fetch_call_logs(start_date, end_date)
-            
-            # Fetch appointments/bookings
-            appointments = self._fetch_appointments(start_date, end_date)
-            
-            # Fetch AI demo call logs (if available)
-            ai_demo_logs = self._fetch_ai_demo_logs(start_date, end_date)
-            
-            # Combine and structure data
             return self._structure_pilot_data(
                 pilot_id=pilot_id,
-                call_logs=call_logs,
-                appointments=appointments,
-                ai_demo_logs=ai_demo_logs,
+                pages=self._stream_sources(start_date, end_date),
                 start_date=start_date,
                 end_date=end_date
             )
@@ -78,149 +93,149 @@ class AnalyticsDataConnector:
             logger.error(f"Error fetching pilot data: {str(e)}")
             return self._get_mock_data(pilot_id)
     
-    def _fetch_call_logs(
-        self,
-        start_date: datetime,
-        end_date: datetime
-    ) -> List[Dict]:
-        """Fetch call logs from Supabase"""
-        try:
-            response = self.client.table("call_logs").select("*").gte(
-                "created_at", start_date.isoformat()
-            ).lte(
-                "created_at", end_date.isoformat()
-            ).execute()
-            
-            return response.data if response.data else []
-        except Exception as e:
-            logger.error(f"Error fetching call logs: {str(e)}")
-            return []
-    
-    def _fetch_appointments(
+    def _stream_sources(
         self,
         start_date: datetime,
         end_date: datetime
-    ) -> List[Dict]:
-        """Fetch appointments/bookings from Supabase"""
-        try:
-            response = self.client.table("appointments").select("*").gte(
-                "created_at", start_date.isoformat()
-            ).lte(
-                "created_at", end_date.isoformat()
-            ).execute()
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Fetch all sources concurrently and yield (source, page) as pages arrive
+        
+        Each table is paged by its own worker thread; pages are handed over
+        through a bounded queue so only a few pages are held in memory.
+        """
+        pages: "queue.Queue[Tuple[str, Optional[List[Dict]]]]" = queue.Queue(maxsize=len(SOURCE_TABLES) * 2)
+        stop = threading.Event()
+        
+        def hand_over(item: Tuple[str, Optional[List[Dict]]]) -> bool:
+            # Give up if the consumer stopped reading
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce(source: str):
+            try:
+                for page in self._iter_pages(source, start_date, end_date):
+                    if not hand_over((source, page)):
+                        return
+            finally:
+                hand_over((source, None))
+        
+        with ThreadPoolExecutor(max_workers=len(SOURCE_TABLES)) as executor:
+            for source in SOURCE_TABLES:
+                executor.submit(produce, source)
             
-            return response.data if response.data else []
-        except Exception as e:
-            logger.error(f"Error fetching appointments: {str(e)}")
-            return []
+            try:
+                remaining = len(SOURCE_TABLES)
+                while remaining:
+                    source, page = pages.get()
+                    if page is None:
+                        remaining -= 1
+                        continue
+                    yield source, page
+            finally:
+                stop.set()
     
-    def _fetch_ai_demo_logs(
+    def _iter_pages(
         self,
+        source: str,
         start_date: datetime,
         end_date: datetime
-    ) -> List[Dict]:
-        """Fetch AI demo call logs from Supabase"""
+    ) -> Iterator[List[Dict]]:
+        """
+        Page through one table with keyset pagination on id
+        
+        Only the columns in SOURCE_TABLES are selected. Errors end the
+        stream for that table (logged), matching the old per-table behaviour.
+        """
+        table, columns = SOURCE_TABLES[source]
+        last_id = None
+        fetched = 0
+        
         try:
-            response = self.client.table("ai_demo_call_logs").select("*").gte(
-                "created_at", start_date.isoformat()
-            ).lte(
-                "created_at", end_date.isoformat()
-            ).execute()
-            
-            return response.data if response.data else []
+            while True:
+                query = self.client.table(table).select(columns).gte(
+                    "created_at", start_date.isoformat()
+                ).lte(
+                    "created_at", end_date.isoformat()
+                )
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                response = query.order("id").limit(ANALYTICS_PAGE_SIZE).execute()
+                
+                rows = response.data or []
+                if not rows:
+                    break
+                fetched += len(rows)
+                yield rows
+                
+                if len(rows) < ANALYTICS_PAGE_SIZE:
+                    break
+                last_id = rows[-1]["id"]
         except Exception as e:
-            logger.error(f"Error fetching AI demo logs: {str(e)}")
-            return []
+            logger.error(f"Error fetching {table}: {str(e)}")
+        
+        logger.info(f"Fetched {fetched} rows from {table}")
     
     def _structure_pilot_data(
         self,
         pilot_id: str,
-        call_logs: List[Dict],
-        appointments: List[Dict],
-        ai_demo_logs: List[Dict],
+        pages: Iterable[Tuple[str, List[Dict]]],
         start_date: datetime,
         end_date: datetime
     ) -> Dict[str, Any]:
-        """Structure raw data into format expected by analytics engines"""
-        
-        # Combine all call sources
-        all_calls = []
-        
-        # Process call_logs
-        for call in call_logs:
-            all_calls.append({
-                "call_id": call.get("id") or call.get("call_sid"),
-                "start_time": self._parse_datetime(call.get("created_at")),
-                "end_time": self._parse_datetime(call.get("updated_at")),
-                "duration_seconds": call.get("duration", 0),
-                "transcript": call.get("transcript", ""),
-                "status": call.get("status"),
-                "from_number": call.get("from_number"),
-                "to_number": call.get("to_number"),
-                "answered": call.get("status") == "completed"
-            })
-        
-        # Process AI demo logs
-        for call in ai_demo_logs:
-            all_calls.append({
-                "call_id": call.get("id"),
-                "start_time": self._parse_datetime(call.get("call_start_time")),
-                "end_time": self._parse_datetime(call.get("call_end_time")),
-                "duration_seconds": call.get("call_duration_seconds", 0),
-                "transcript": call.get("transcript", ""),
-                "status": call.get("call_status"),
-                "answered": call.get("call_status") == "completed"
-            })
+        """Structure streamed pages into format expected by analytics engines"""
         
-        # Calculate metrics
-        total_calls = len(all_calls)
-        calls_answered = len([c for c in all_calls if c.get("answered")])
-        
-        # Extract calls with transcripts for intent classification
-        calls_with_transcripts = [
-            {
-                "call_id": call["call_id"],
-                "transcript": call["transcript"]
-            }
-            for call in all_calls
-            if call.get("transcript")
-        ]
-        
-        # Extract call events for capacity analysis
-        call_events = [
-            {
-                "call_id": call["call_id"],
-                "start_time": call["start_time"],
-                "end_time": call["end_time"],
-                "duration_seconds": call["duration_seconds"]
-            }
-            for call in all_calls
-            if call.get("start_time") and call.get("end_time")
-        ]
-        
-        # Extract latency measurements (if available in call metadata)
+        total_calls = 0
+        calls_answered = 0
+        calls_with_transcripts = []
+        call_events = []
         latency_measurements = []
-        for call in all_calls:
-            call_id = call["call_id"]
-            # Add answer latency if available
-            latency_measurements.append({
-                "metric_type": "answer_latency",
-                "value_ms": 200,  # Default, should extract from call metadata
-                "call_id": call_id,
-                "time_of_day": call["start_time"].hour if call.get("start_time") else 12
-            })
-        
-        # Count bookings
-        bookings_created = len(appointments)
-        
-        # Calculate average booking delay
+        bookings_created = 0
         booking_delays = []
-        for appt in appointments:
-            created = self._parse_datetime(appt.get("created_at"))
-            scheduled = self._parse_datetime(appt.get("scheduled_time"))
-            if created and scheduled:
-                delay_hours = (scheduled - created).total_seconds() / 3600
-                booking_delays.append(delay_hours)
+        
+        for source, rows in pages:
+            if source == "appointments":
+                bookings_created += len(rows)
+                for appt in rows:
+                    delay_hours = self._booking_delay_hours(appt)
+                    if delay_hours is not None:
+                        booking_delays.append(delay_hours)
+                continue
+            
+            for row in rows:
+                call = self._normalize_call(source, row)
+                total_calls += 1
+                if call["answered"]:
+                    calls_answered += 1
+                
+                # Calls with transcripts for intent classification
+                if call["transcript"]:
+                    calls_with_transcripts.append({
+                        "call_id": call["call_id"],
+                        "transcript": call["transcript"]
+                    })
+                
+                # Call events for capacity analysis
+                if call["start_time"] and call["end_time"]:
+                    call_events.append({
+                        "call_id": call["call_id"],
+                        "start_time": call["start_time"],
+                        "end_time": call["end_time"],
+                        "duration_seconds": call["duration_seconds"]
+                    })
+                
+                # Latency measurements (if available in call metadata)
+                latency_measurements.append({
+                    "metric_type": "answer_latency",
+                    "value_ms": 200,  # Default, should extract from call metadata
+                    "call_id": call["call_id"],
+                    "time_of_day": call["start_time"].hour if call["start_time"] else 12
+                })
         
         avg_booking_delay = sum(booking_delays) / len(booking_delays) if booking_delays else 24.0
         
@@ -240,6 +255,49 @@ class AnalyticsDataConnector:
             "average_ticket_value": 450,  # Should be configured per pilot
         }
     
+    def _normalize_call(self, source: str, row: Dict) -> Dict[str, Any]:
+        """Map a call_logs or ai_demo_call_logs row to a common call shape"""
+        if source == "call_logs":
+            start_time = self._parse_datetime(row.get("started_at") or row.get("created_at"))
+            return {
+                "call_id": row.get("id") or row.get("call_sid"),
+                "start_time": start_time,
+                "end_time": self._parse_datetime(row.get("ended_at")),
+                "duration_seconds": row.get("duration") or 0,
+                "transcript": row.get("transcript") or "",
+                "answered": row.get("status") == "completed"
+            }
+        
+        # AI demo calls store the transcript as [{speaker, text, ...}, ...]
+        turns = row.get("full_transcript") or []
+        if isinstance(turns, list):
+            transcript = " ".join(str(t.get("text", "")) for t in turns if isinstance(t, dict)).strip()
+        else:
+            transcript = str(turns)
+        return {
+            "call_id": row.get("id"),
+            "start_time": self._parse_datetime(row.get("created_at")),
+            "end_time": self._parse_datetime(row.get("updated_at")),
+            "duration_seconds": row.get("recording_duration_seconds") or 0,
+            "transcript": transcript,
+            "answered": bool(transcript)
+        }
+    
+    def _booking_delay_hours(self, appt: Dict) -> Optional[float]:
+        """Hours between booking creation and the scheduled slot"""
+        created = self._parse_datetime(appt.get("created_at"))
+        if not created or not appt.get("scheduled_date"):
+            return None
+        scheduled = self._parse_datetime(
+            f"{appt['scheduled_date']}T{appt.get('scheduled_time') or '00:00:00'}"
+        )
+        if not scheduled:
+            return None
+        if (created.tzinfo is None) != (scheduled.tzinfo is None):
+            created = created.replace(tzinfo=None)
+            scheduled = scheduled.replace(tzinfo=None)
+        return (scheduled - created).total_seconds() / 3600
+    
     def _parse_datetime(self, dt_str: Any) -> Optional[datetime]:
         """Parse datetime string to datetime object"""
         if not dt_str:
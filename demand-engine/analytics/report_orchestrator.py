@@ -3,16 +3,30 @@ Report Generation Orchestrator
 
 Coordinates all 6 analytics engines to generate complete pilot reports.
 This is the main entry point for report generation.
+
+Engines run as a DAG of stages: stages with no dependency on each other run
+in parallel, and each stage's output is cached by a fingerprint of its
+inputs. Regenerating a report only reruns stages whose inputs changed, and
+intent classification is cached per call so new calls are the only ones
+classified.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, MutableMapping, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
+import hashlib
+import json
 import logging
+import os
+import threading
+import uuid
 
-from .baseline_counterfactual_engine import BaselineCounterfactualEngine
-from .assumptions_disclosure_engine import AssumptionsDisclosureEngine
-from .metric_segregation_engine import MetricSegregationEngine
+from .baseline_engine import BaselineEngine, BaselineSource
+from .assumptions_engine import AssumptionsEngine
+from .metric_segregation_engine import MetricSegregationEngine, MetricType
 from .call_intent_engine import CallIntentEngine
 from .capacity_saturation_engine import CapacitySaturationEngine, CallEvent
 from .latency_performance_engine import LatencyPerformanceEngine, PerformanceMetric
@@ -20,6 +34,66 @@ from .data_connector import AnalyticsDataConnector
 
 logger = logging.getLogger(__name__)
 
+# Bump when an engine's logic changes so cached stage outputs are not reused
+STAGE_CACHE_VERSION = "1"
+STAGE_CACHE_MAX_ENTRIES = int(os.getenv("REPORT_STAGE_CACHE_MAX_ENTRIES", "5000"))
+STAGE_MAX_WORKERS = int(os.getenv("REPORT_STAGE_MAX_WORKERS", "4"))
+
+# Baseline used when a report is generated from stored call data alone
+INDUSTRY_BASELINE_METRICS = {
+    "answer_rate": 0.62,
+    "booking_delay_hours": 24.0,
+    "average_handle_time_minutes": 5.2,
+    "after_hours_answer_rate": 0.40,
+    "peak_hour_capacity": 3
+}
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable hash of stage inputs"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class StageCache:
+    """
+    Thread-safe LRU of stage outputs keyed by stage name + input fingerprint.
+    
+    Any mapping with get() and item assignment can be used instead, e.g. a
+    modal.Dict so outputs are shared across containers.
+    """
+    
+    def __init__(self, max_entries: int = STAGE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class ReportStage:
+    """One engine stage in the report DAG"""
+    name: str
+    deps: Tuple[str, ...]
+    run: Callable[..., Any]  # Called with the outputs of deps, in order
+    inputs: Callable[..., Any]  # Called like run; returns what the output depends on
+
 
 class PilotData(BaseModel):
     """Input data for pilot report generation"""
@@ -68,8 +142,10 @@ class PilotReport(BaseModel):
     methodology: Dict[str, Any]
     
     # Metadata
+    report_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     report_version: str = "1.0"
     engines_used: List[str]
+    stage_cache_hits: List[str] = Field(default_factory=list)
 
 
 class ReportOrchestrator:
@@ -78,8 +154,9 @@ class ReportOrchestrator:
     Main entry point for report generation.
     """
     
-    def __init__(self, db_connection=None):
+    def __init__(self, db_connection=None, stage_cache: Optional[MutableMapping] = None):
         self.db = db_connection
+        self.stage_cache = stage_cache if stage_cache is not None else StageCache()
         
         # Initialize all engines
         self.baseline_engine = BaselineEngine(db_connection)
@@ -105,23 +182,14 @@ class ReportOrchestrator:
         """
         logger.info(f"Starting report generation for pilot: {pilot_data.pilot_id}")
         
-        # 1. Create baseline
-        baseline = self._process_baseline(pilot_data)
-        
-        # 2. Load assumptions
-        assumptions = self._load_assumptions()
-        
-        # 3. Classify calls
-        classifications = self._classify_calls(pilot_data)
-        
-        # 4. Analyze capacity
-        capacity_analysis = self._analyze_capacity(pilot_data)
-        
-        # 5. Analyze performance
-        performance_report = self._analyze_performance(pilot_data)
-        
-        # 6. Record all metrics
-        metrics = self._record_metrics(pilot_data, baseline, classifications)
+        # 1-6. Run engine stages (independent stages in parallel, cached by input)
+        outputs, cache_hits = self._run_stages(self._build_stages(pilot_data))
+        baseline = outputs["baseline"]
+        assumptions = outputs["assumptions"]
+        classifications = outputs["intent"]
+        capacity_analysis = outputs["capacity"]
+        performance_report = outputs["latency"]
+        metrics = outputs["segregation"]
         
         # 7. Generate report sections
         report = PilotReport(
@@ -155,12 +223,161 @@ class ReportOrchestrator:
                 "Call Intent Classification Engine",
                 "Call Capacity Saturation Engine",
                 "Latency & System Performance Engine"
-            ]
+            ],
+            stage_cache_hits=cache_hits
         )
         
-        logger.info(f"Report generation complete for pilot: {pilot_data.pilot_id}")
+        logger.info(
+            f"Report generation complete for pilot: {pilot_data.pilot_id} "
+            f"(cached stages: {', '.join(cache_hits) or 'none'})"
+        )
         return report
     
+    def generate_report(
+        self,
+        pilot_id: str,
+        pilot_data: Optional[PilotData] = None,
+        customer_name: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        use_real_data: bool = True
+    ) -> PilotReport:
+        """
+        Generate a report from stored call data (or given PilotData).
+        
+        Without pilot_data, call data comes from AnalyticsDataConnector
+        (mock data if use_real_data is False) against the industry baseline.
+        """
+        if pilot_data is None:
+            connector = AnalyticsDataConnector()
+            if use_real_data:
+                data = connector.get_pilot_call_data(pilot_id, start_date, end_date)
+            else:
+                data = connector._get_mock_data(pilot_id)
+            
+            pilot_data = PilotData(
+                pilot_id=pilot_id,
+                customer_id=pilot_id,
+                customer_name=customer_name or data["customer_name"],
+                baseline_source="industry_benchmark",
+                baseline_metrics=INDUSTRY_BASELINE_METRICS,
+                baseline_source_details="Industry benchmark for HVAC service businesses",
+                total_calls=data["total_calls"],
+                calls_answered=data["calls_answered"],
+                calls_with_transcripts=data["calls_with_transcripts"],
+                call_events=data["call_events"],
+                bookings_created=data["bookings_created"],
+                average_booking_delay_minutes=data["average_booking_delay_minutes"],
+                latency_measurements=data["latency_measurements"],
+                declared_capacity=data["declared_capacity"],
+                average_ticket_value=data["average_ticket_value"],
+                pilot_start_date=data["start_date"],
+                pilot_end_date=data["end_date"]
+            )
+        
+        return self.generate_pilot_report(pilot_data)
+    
+    def _build_stages(self, pilot_data: PilotData) -> List[ReportStage]:
+        """
+        Engine stage DAG for one report.
+        
+        baseline, assumptions, intent, capacity and latency only read
+        pilot_data and run in parallel; segregation needs baseline and intent.
+        """
+        return [
+            ReportStage(
+                name="baseline",
+                deps=(),
+                run=lambda: self._process_baseline(pilot_data),
+                inputs=lambda: pilot_data.model_dump(include={
+                    "pilot_id", "customer_id", "baseline_source",
+                    "baseline_metrics", "baseline_source_details"
+                })
+            ),
+            ReportStage(
+                name="assumptions",
+                deps=(),
+                run=self._load_assumptions,
+                inputs=lambda: None
+            ),
+            ReportStage(
+                name="intent",
+                deps=(),
+                run=lambda: self._classify_calls(pilot_data),
+                inputs=lambda: pilot_data.calls_with_transcripts
+            ),
+            ReportStage(
+                name="capacity",
+                deps=(),
+                run=lambda: self._analyze_capacity(pilot_data),
+                inputs=lambda: pilot_data.model_dump(include={
+                    "pilot_id", "call_events", "declared_capacity"
+                })
+            ),
+            ReportStage(
+                name="latency",
+                deps=(),
+                run=lambda: self._analyze_performance(pilot_data),
+                inputs=lambda: pilot_data.model_dump(include={
+                    "pilot_id", "latency_measurements", "pilot_start_date", "pilot_end_date"
+                })
+            ),
+            ReportStage(
+                name="segregation",
+                deps=("baseline", "intent"),
+                run=lambda baseline, classifications: self._record_metrics(
+                    pilot_data, baseline, classifications
+                ),
+                inputs=lambda baseline, classifications: (
+                    pilot_data.model_dump(include={
+                        "pilot_id", "total_calls", "calls_answered", "bookings_created"
+                    }),
+                    sum(1 for c in classifications if c.high_intent)
+                )
+            ),
+        ]
+    
+    def _run_stages(self, stages: List[ReportStage]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run stages in dependency order, reusing cached outputs.
+        
+        A stage is submitted as soon as all of its deps are done, so
+        independent stages overlap. Returns (outputs by name, cached stage names).
+        """
+        outputs: Dict[str, Any] = {}
+        cache_hits: List[str] = []
+        pending = {stage.name: stage for stage in stages}
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=STAGE_MAX_WORKERS) as executor:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    if not all(dep in outputs for dep in stage.deps):
+                        continue
+                    del pending[name]
+                    args = [outputs[dep] for dep in stage.deps]
+                    key = f"{stage.name}:{STAGE_CACHE_VERSION}:{fingerprint(stage.inputs(*args))}"
+                    cached = self.stage_cache.get(key)
+                    if cached is not None:
+                        logger.info(f"Stage {stage.name}: cache hit")
+                        outputs[name] = cached
+                        cache_hits.append(name)
+                        continue
+                    running[executor.submit(stage.run, *args)] = (name, key)
+                
+                if not running:
+                    if pending:
+                        raise ValueError(f"Unresolvable stage dependencies: {sorted(pending)}")
+                    continue
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, key = running.pop(future)
+                    outputs[name] = future.result()
+                    self.stage_cache[key] = outputs[name]
+        
+        return outputs, cache_hits
+    
     def _process_baseline(self, pilot_data: PilotData):
         """Process baseline data"""
         logger.info("Processing baseline data")
@@ -190,14 +407,28 @@ class ReportOrchestrator:
         """Classify all calls"""
         logger.info(f"Classifying {len(pilot_data.calls_with_transcripts)} calls")
         
+        # Calls are cached individually, so a regeneration after new calls
+        # arrive only classifies the new ones
         classifications = []
+        uncached = []
         for call_data in pilot_data.calls_with_transcripts:
-            classification = self.intent_engine.classify_call(
-                call_id=call_data.get("call_id"),
-                transcript=call_data.get("transcript", "")
-            )
+            key = f"call_intent:{STAGE_CACHE_VERSION}:{fingerprint(call_data.get('call_id'), call_data.get('transcript', ''))}"
+            classification = self.stage_cache.get(key)
+            if classification is None:
+                uncached.append((len(classifications), key, call_data))
             classifications.append(classification)
         
+        if uncached:
+            results = self.intent_engine.batch_classify([
+                {"call_id": call_data.get("call_id"), "transcript": call_data.get("transcript", "")}
+                for _, _, call_data in uncached
+            ])
+            for (position, key, _), classification in zip(uncached, results):
+                self.stage_cache[key] = classification
+                classifications[position] = classification
+        classified = len(uncached)
+        
+        logger.info(f"Classified {classified} new calls, {len(classifications) - classified} cached")
         return classifications
     
     def _analyze_capacity(self, pilot_data: PilotData):
@@ -286,6 +517,7 @@ class ReportOrchestrator:
             value=conversion_rate,
             description="Booking conversion rate from high-intent calls",
             calculation=f"{pilot_data.bookings_created} bookings / {high_intent_calls} high-intent calls",
+            source_metrics=["bookings_created", "high_intent_calls"],
             pilot_id=pilot_data.pilot_id
         ))
         
@@ -368,7 +600,7 @@ class ReportOrchestrator:
         """Generate financial model section"""
         # Get key assumptions
         conversion_improvement = self.assumptions_engine.get_assumption(assumptions, "conversion_rate_improvement")
-        capture_rate = self.assumptions_engine.get_assumption(assumptions, "capture_rate_conservative")
+        capture_rate = self.assumptions_engine.get_assumption(assumptions, "pilot_to_full_capture_rate")
         
         # Calculate opportunity
         weeks_in_year = 52
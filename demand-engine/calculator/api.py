@@ -7,9 +7,10 @@ import uuid
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 
-from .engine import calculate_missed_call_tax, calculate_roi, update_lead_score
-from .models import CalculatorInput, CalculatorResult, LeadSubmission
+from .engine import calculate_missed_call_tax, calculate_missed_call_tax_grid, calculate_roi, update_lead_score
+from .models import CalculatorInput, CalculatorResult, CalculatorGridInput, CalculatorGridResult, LeadSubmission
 from .storage import save_lead_submission, get_lead_by_session, update_lead_engagement
 from config.supabase_config import get_supabase
 
@@ -49,6 +50,32 @@ async def calculate_endpoint(input_data: CalculatorInput):
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
 
+@router.post("/grid", response_model=CalculatorGridResult)
+async def calculate_grid_endpoint(grid: CalculatorGridInput):
+    """
+    Evaluate a what-if grid of scenarios in one request
+    
+    POST /calculator/grid
+    
+    Body:
+    {
+        "business_types": ["HVAC", "Plumbing"],   // optional, default all
+        "calls_per_day": [10, 20, 30],
+        "answer_rates": [50, 65, 80],
+        "ticket_values": [1500, 2500],
+        "conversion_rate": 30                    // optional, as in /calculate
+    }
+    
+    Returns: CalculatorGridResult - one value per scenario in each metric
+    column, ordered business type × calls × answer rate × ticket value
+    """
+    try:
+        return await run_in_threadpool(calculate_missed_call_tax_grid, grid)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
+
+
 @router.post("/submit")
 async def submit_calculator(
     input_data: CalculatorInput,
@@ -287,16 +314,14 @@ async def generate_pdf_async(lead_id: str, result: CalculatorResult):
     """
     Generate PDF report and store in Supabase
     """
-    from pdf_generator.report_generator import ROIReportGenerator
+    from pdf_generator.render_pool import render_roi_report_async
     from storage_service.supabase_storage import SupabaseStorageClient
     
     try:
         print(f"📄 Generating PDF for lead {lead_id}")
         
-        generator = ROIReportGenerator()
-        
         # Get lead data for company info
-        lead = get_lead_by_session(result.session_id)
+        lead = await run_in_threadpool(get_lead_by_session, result.session_id)
         
         calculator_data = lead.get("raw_input", {})
         results_data = result.dict()
@@ -306,8 +331,8 @@ async def generate_pdf_async(lead_id: str, result: CalculatorResult):
             "phone": lead.get("phone")
         }
         
-        # Generate PDF
-        pdf_bytes = generator.generate_roi_report(
+        # Render in the PDF pool (cached by input hash)
+        pdf_bytes = await render_roi_report_async(
             calculator_data=calculator_data,
             results=results_data,
             company_info=company_info
@@ -318,7 +343,8 @@ async def generate_pdf_async(lead_id: str, result: CalculatorResult):
         company_name = company_info.get("company_name", "Company").replace(" ", "_")
         filename = f"Kestrel_ROI_Report_{company_name}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        upload_result = storage_client.upload_pdf(
+        upload_result = await run_in_threadpool(
+            storage_client.upload_pdf,
             pdf_bytes=pdf_bytes,
             filename=filename,
             lead_id=lead_id
@@ -326,10 +352,12 @@ async def generate_pdf_async(lead_id: str, result: CalculatorResult):
         
         # Update lead record with PDF URL
         supabase = get_supabase()
-        supabase.table("calculator_submissions").update({
-            "pdf_url": upload_result["signed_url"],
-            "pdf_path": upload_result["file_path"]
-        }).eq("session_id", result.session_id).execute()
+        await run_in_threadpool(
+            supabase.table("calculator_submissions").update({
+                "pdf_url": upload_result["signed_url"],
+                "pdf_path": upload_result["file_path"]
+            }).eq("session_id", result.session_id).execute
+        )
         
         print(f"✅ PDF generated and stored successfully for lead {lead_id}")
         print(f"   URL: {upload_result['signed_url']}")
@@ -7,7 +7,9 @@ from typing import Dict, Tuple
 from datetime import datetime, timezone
 import uuid
 
-from .models import CalculatorInput, CalculatorResult, BusinessType
+import numpy as np
+
+from .models import CalculatorInput, CalculatorResult, BusinessType, CalculatorGridInput, CalculatorGridResult
 
 
 # Industry benchmarks
@@ -44,6 +46,13 @@ INDUSTRY_BENCHMARKS = {
     },
 }
 
+# Projection assumptions: answer rate with the AI agent, and its monthly cost
+IMPROVED_ANSWER_RATE = 80.0
+AI_AGENT_MONTHLY_COST = 500
+
+# Lead tiers by minimum score, highest first
+LEAD_TIERS = [(90, "Hot"), (60, "Warm"), (30, "Qualified")]
+
 
 def calculate_missed_call_tax(input_data: CalculatorInput) -> CalculatorResult:
     """
@@ -86,14 +95,14 @@ def calculate_missed_call_tax(input_data: CalculatorInput) -> CalculatorResult:
     annual_loss = monthly_loss * 12
     
     # Improvement projections (assume 80% answer rate with AI agent)
-    improved_answer_rate = 80.0
+    improved_answer_rate = IMPROVED_ANSWER_RATE
     improved_calls_answered = int(total_calls_per_month * (improved_answer_rate / 100))
     additional_calls_answered = improved_calls_answered - calls_answered
     additional_jobs = int(additional_calls_answered * conversion_decimal)
     additional_revenue = additional_jobs * input_data.avg_ticket_value
     
     # ROI calculation (assume $500/month for AI agent)
-    monthly_cost = 500
+    monthly_cost = AI_AGENT_MONTHLY_COST
     roi_percentage = ((additional_revenue - monthly_cost) / monthly_cost * 100) if monthly_cost > 0 else 0
     
     # Performance vs industry
@@ -151,6 +160,114 @@ def calculate_missed_call_tax(input_data: CalculatorInput) -> CalculatorResult:
     )
 
 
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    np.round() that agrees with round()
+    
+    NumPy rounds the scaled value, which can land on the other side of a
+    tie than round()'s exact decimal rounding; the few near-ties are redone
+    with round() so grid results match the single calculation exactly.
+    """
+    rounded = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(v, digits) for v in values[ties].tolist()]
+    return rounded
+
+
+def calculate_missed_call_tax_grid(grid: CalculatorGridInput) -> CalculatorGridResult:
+    """
+    Evaluate calculate_missed_call_tax() over a what-if grid in one pass
+    
+    Every combination of business type × calls per day × answer rate ×
+    ticket value is computed with NumPy broadcasting (axes in that order),
+    using the same formulas and integer truncation as the single
+    calculation, so each scenario matches what /calculate returns for it.
+    Lead scores assume no contact details were given.
+    """
+    business_types = [BusinessType(b) for b in grid.business_types]
+    benchmarks = [INDUSTRY_BENCHMARKS.get(b, INDUSTRY_BENCHMARKS[BusinessType.HVAC]) for b in business_types]
+    
+    # Axis vectors shaped to broadcast to (business, calls, answer rate, ticket)
+    conversion_rate = np.array(
+        [grid.conversion_rate or b["avg_conversion_rate"] for b in benchmarks], dtype=float
+    )[:, None, None, None]
+    industry_avg = np.array([b["avg_answer_rate"] for b in benchmarks], dtype=float)[:, None, None, None]
+    calls_per_day = np.array(grid.calls_per_day, dtype=float)[None, :, None, None]
+    answer_rate = np.array(grid.answer_rates, dtype=float)[None, None, :, None]
+    ticket_value = np.array(grid.ticket_values, dtype=float)[None, None, None, :]
+    shape = (len(business_types), len(grid.calls_per_day), len(grid.answer_rates), len(grid.ticket_values))
+    
+    # Calculate monthly call volume
+    days_per_month = grid.days_open_per_week * 4.33
+    total_calls = np.trunc(calls_per_day * days_per_month)
+    
+    # Current performance
+    calls_answered = np.trunc(total_calls * (answer_rate / 100))
+    calls_missed = total_calls - calls_answered
+    missed_percentage = np.divide(
+        calls_missed, total_calls, out=np.zeros(np.broadcast(calls_missed, total_calls).shape), where=total_calls > 0
+    ) * 100
+    
+    # Revenue calculations
+    conversion_decimal = conversion_rate / 100
+    jobs_from_answered = np.trunc(calls_answered * conversion_decimal)
+    jobs_from_missed = np.trunc(calls_missed * conversion_decimal)
+    monthly_loss = jobs_from_missed * ticket_value
+    
+    # Improvement projections
+    improved_calls_answered = np.trunc(total_calls * (IMPROVED_ANSWER_RATE / 100))
+    additional_calls_answered = improved_calls_answered - calls_answered
+    additional_revenue = np.trunc(additional_calls_answered * conversion_decimal) * ticket_value
+    roi_percentage = (additional_revenue - AI_AGENT_MONTHLY_COST) / AI_AGENT_MONTHLY_COST * 100
+    
+    # Performance vs industry
+    performance = np.where(
+        answer_rate >= industry_avg, "Above average",
+        np.where(answer_rate >= industry_avg - 10, "Average", "Below average")
+    )
+    
+    # Lead scoring (base score only: no engagement or contact details)
+    lead_score = monthly_loss / 1000
+    lead_tier = np.select([lead_score >= threshold for threshold, _ in LEAD_TIERS], [name for _, name in LEAD_TIERS], "Cold")
+    
+    def column(values, digits=None):
+        flat = np.broadcast_to(values, shape).ravel()
+        return (_round(flat, digits) if digits is not None else flat).tolist()
+    
+    def count(values):
+        return np.broadcast_to(values, shape).ravel().astype(np.int64).tolist()
+    
+    return CalculatorGridResult(
+        business_types=[b.value for b in business_types],
+        calls_per_day=list(grid.calls_per_day),
+        answer_rates=list(grid.answer_rates),
+        ticket_values=list(grid.ticket_values),
+        shape=list(shape),
+        scenario_count=int(np.prod(shape)),
+        metrics={
+            "total_calls_per_month": count(total_calls),
+            "calls_answered": count(calls_answered),
+            "calls_missed": count(calls_missed),
+            "missed_call_percentage": column(missed_percentage, 1),
+            "potential_jobs_from_answered": count(jobs_from_answered),
+            "potential_jobs_from_missed": count(jobs_from_missed),
+            "revenue_captured": column(jobs_from_answered * ticket_value, 2),
+            "monthly_loss": column(monthly_loss, 2),
+            "annual_loss": column(monthly_loss * 12, 2),
+            "additional_calls_answered": count(additional_calls_answered),
+            "additional_revenue": column(additional_revenue, 2),
+            "roi_percentage": column(roi_percentage, 1),
+            "industry_average_answer_rate": column(industry_avg),
+            "your_performance_vs_industry": column(performance),
+            "lead_score": column(lead_score, 1),
+            "lead_tier": column(lead_tier),
+        },
+        calculated_at=datetime.now(timezone.utc)
+    )
+
+
 def calculate_roi(
     monthly_loss: float,
     monthly_cost: float = 500,
@@ -237,14 +354,7 @@ def calculate_lead_score(
     final_score = base_score * multiplier
     
     # Determine tier
-    if final_score >= 90:
-        tier = "Hot"
-    elif final_score >= 60:
-        tier = "Warm"
-    elif final_score >= 30:
-        tier = "Qualified"
-    else:
-        tier = "Cold"
+    tier = next((name for threshold, name in LEAD_TIERS if final_score >= threshold), "Cold")
     
     return round(final_score, 1), tier
 
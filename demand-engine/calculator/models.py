@@ -1,7 +1,7 @@
 """
 Pydantic models for calculator input/output validation
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from pydantic import BaseModel, Field, validator, EmailStr
 from enum import Enum
@@ -100,6 +100,78 @@ class CalculatorResult(BaseModel):
         }
 
 
+MAX_GRID_SCENARIOS = 20000
+
+
+class CalculatorGridInput(BaseModel):
+    """What-if grid: every combination of the listed values is evaluated"""
+    
+    business_types: List[BusinessType] = Field(default_factory=lambda: list(BusinessType), min_items=1)
+    calls_per_day: List[int] = Field(min_items=1, description="Incoming calls per day values")
+    answer_rates: List[float] = Field(min_items=1, description="% of calls answered values")
+    ticket_values: List[float] = Field(min_items=1, description="Average job values")
+    
+    days_open_per_week: int = Field(default=5, ge=1, le=7)
+    # Same default as CalculatorInput; 0 uses each business type's benchmark
+    conversion_rate: Optional[float] = Field(default=30, ge=0, le=100, description="% of answered calls that book")
+    
+    @validator('calls_per_day', each_item=True)
+    def validate_calls(cls, v):
+        if not 0 < v <= 1000:
+            raise ValueError("Calls per day must be between 1 and 1000")
+        return v
+    
+    @validator('answer_rates', each_item=True)
+    def validate_answer_rates(cls, v):
+        if not 0 <= v <= 100:
+            raise ValueError("Answer rates must be between 0 and 100%")
+        return v
+    
+    @validator('ticket_values', each_item=True)
+    def validate_ticket_values(cls, v):
+        if not 0 < v <= 100000:
+            raise ValueError("Ticket values must be between 0 and 100,000")
+        return v
+    
+    @validator('ticket_values')
+    def validate_grid_size(cls, v, values):
+        size = len(v)
+        for axis in ('business_types', 'calls_per_day', 'answer_rates'):
+            size *= len(values.get(axis) or [1])
+        if size > MAX_GRID_SCENARIOS:
+            raise ValueError(f"Grid has {size} scenarios; the maximum is {MAX_GRID_SCENARIOS}")
+        return v
+    
+    class Config:
+        use_enum_values = True
+
+
+class CalculatorGridResult(BaseModel):
+    """
+    Grid results as flat metric columns
+    
+    Scenario i of every column is the combination at index i of the grid in
+    row-major order over (business_types, calls_per_day, answer_rates,
+    ticket_values), i.e. ticket values vary fastest.
+    """
+    
+    business_types: List[str]
+    calls_per_day: List[int]
+    answer_rates: List[float]
+    ticket_values: List[float]
+    shape: List[int]
+    scenario_count: int
+    
+    metrics: Dict[str, List[Any]]
+    
+    calculated_at: datetime
+    
+    class Config:
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
+
+
 class LeadSubmission(BaseModel):
     """Lead data stored in database"""
     
@@ -5,7 +5,8 @@ from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 import uuid
 
-from config.supabase_config import get_supabase
+from config.supabase_config import get_supabase, call_rpc
+from utils.response_cache import ttl_cache
 from .models import LeadSubmission
 
 
@@ -160,12 +161,18 @@ def get_recent_leads(days: int = 7, limit: int = 100) -> list:
     return result.data or []
 
 
+@ttl_cache()
 def get_lead_stats() -> Dict[str, Any]:
     """
     Get aggregate lead statistics
     
     Returns: Dict with stats
     """
+    # Aggregated in Postgres (database/migrations/017_admin_stats_rpc.sql)
+    stats = call_rpc("get_lead_stats")
+    if stats:
+        return stats
+    
     client = get_supabase()
     
     # Get all leads
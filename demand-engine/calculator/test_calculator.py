@@ -8,8 +8,10 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from calculator.engine import calculate_missed_call_tax, calculate_roi, calculate_lead_score
-from calculator.models import CalculatorInput, BusinessType
+import itertools
+
+from calculator.engine import calculate_missed_call_tax, calculate_missed_call_tax_grid, calculate_roi, calculate_lead_score
+from calculator.models import CalculatorInput, CalculatorGridInput, BusinessType
 
 
 def test_basic_calculation():
@@ -214,6 +216,48 @@ def test_all_business_types():
     print("\n✅ Test 6 passed!")
 
 
+def test_grid_matches_single_calculation():
+    """Test that every grid scenario matches the single calculation"""
+    print("\n" + "="*60)
+    print("TEST 7: What-If Grid")
+    print("="*60)
+    
+    # Default conversion rate (as /calculate), then the industry benchmarks
+    for rate in ({}, {"conversion_rate": 0}):
+        grid = CalculatorGridInput(
+            calls_per_day=[1, 12, 30, 250],
+            answer_rates=[0, 47.5, 65, 80, 100],
+            ticket_values=[350, 2499.99, 12000],
+            days_open_per_week=6,
+            **rate
+        )
+        
+        result = calculate_missed_call_tax_grid(grid)
+        
+        print(f"\n   Scenarios: {result.scenario_count} (shape {result.shape}, {rate or 'default rate'})")
+        assert result.shape == [len(BusinessType), 4, 5, 3]
+        assert all(len(values) == result.scenario_count for values in result.metrics.values())
+        
+        combinations = itertools.product(
+            result.business_types, grid.calls_per_day, grid.answer_rates, grid.ticket_values
+        )
+        for index, (business_type, calls, answer_rate, ticket) in enumerate(combinations):
+            single = calculate_missed_call_tax(CalculatorInput(
+                business_type=business_type,
+                avg_ticket_value=ticket,
+                calls_per_day=calls,
+                current_answer_rate=answer_rate,
+                days_open_per_week=6,
+                **rate
+            ))
+            for metric, values in result.metrics.items():
+                assert values[index] == getattr(single, metric), \
+                    f"{metric} differs for {business_type}/{calls}/{answer_rate}/{ticket} ({rate})"
+    
+    print("   All scenarios match the single calculation")
+    print("\n✅ Test 7 passed!")
+
+
 def run_all_tests():
     """Run all calculator tests"""
     print("\n" + "="*60)
@@ -227,6 +271,7 @@ def run_all_tests():
         test_roi_calculation()
         test_lead_scoring()
         test_all_business_types()
+        test_grid_matches_single_calculation()
         
         print("\n" + "="*60)
         print("✅ ALL TESTS PASSED!")
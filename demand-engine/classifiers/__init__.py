@@ -1,8 +1,11 @@
 """Classification module for scoring and qualifying signals."""
 
-from .keywords import calculate_keyword_score, should_use_ai_classification
+from .keyword_scorer import KeywordScorer
+from .keywords import calculate_keyword_score, calculate_keyword_scores, should_use_ai_classification
 
 __all__ = [
+    "KeywordScorer",
     "calculate_keyword_score",
+    "calculate_keyword_scores",
     "should_use_ai_classification",
 ]
@@ -1,14 +1,66 @@
 """
 AI-Enhanced Pain Signal Scoring
 Uses OpenAI GPT-4 for nuanced analysis of pain signals beyond keyword matching.
+Requests go through the shared scoring service (concurrent, packed, memoized).
 """
 
-import os
 import json
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
-import openai
-from openai import OpenAI
+
+from classifiers.scoring_service import ScoringTask, get_scoring_service
+
+
+SIGNAL_ANALYSIS_PROMPT = """You are an expert HVAC business development analyst specializing in identifying high-value sales leads from online discussions.
+
+Analyze the following post and provide a detailed scoring assessment for an HVAC service company.
+
+Score each dimension from 0-10:
+
+1. **Urgency** (0-10): How immediate is the need?
+   - 10: Emergency/immediate need (broken system, no heat/AC)
+   - 7-9: Urgent but not emergency (system failing, needs repair soon)
+   - 4-6: Planning/considering (thinking about replacement)
+   - 0-3: General inquiry or future planning
+
+2. **Budget** (0-10): Financial capacity indicators
+   - 10: Clear budget mentioned, willing to invest
+   - 7-9: Discussing costs, comparing options
+   - 4-6: Price-conscious but willing to pay for quality
+   - 0-3: Looking for cheapest option, DIY mentions
+
+3. **Authority** (0-10): Decision-making power
+   - 10: Homeowner, business owner, clear decision maker
+   - 7-9: Primary household decision maker
+   - 4-6: Involved in decision but not sole authority
+   - 0-3: Renter, asking for someone else, no authority
+
+4. **Pain** (0-10): Problem severity and impact
+   - 10: Major comfort/health/safety issue
+   - 7-9: Significant discomfort or inefficiency
+   - 4-6: Noticeable problem but manageable
+   - 0-3: Minor inconvenience or curiosity
+
+Additionally provide:
+- **Sentiment**: positive, neutral, negative, frustrated, desperate
+- **Intent**: seeking_help, comparing_options, emergency, planning, complaining
+- **Lead_Quality**: hot, warm, qualified, cold
+- **Key_Indicators**: List 3-5 specific phrases or signals that influenced your scoring
+- **Recommended_Action**: immediate_contact, nurture, monitor, skip
+- **Reasoning**: 2-3 sentence explanation of your assessment"""
+
+SIGNAL_ANALYSIS_EXAMPLE = {
+    "urgency": 8,
+    "budget": 7,
+    "authority": 9,
+    "pain": 8,
+    "sentiment": "frustrated",
+    "intent": "seeking_help",
+    "lead_quality": "hot",
+    "key_indicators": ["broken AC", "no cooling", "homeowner", "willing to pay"],
+    "recommended_action": "immediate_contact",
+    "reasoning": "Homeowner with broken AC showing urgency and willingness to invest in solution."
+}
 
 
 class AISignalScorer:
@@ -18,13 +70,26 @@ class AISignalScorer:
     """
     
     def __init__(self):
-        """Initialize OpenAI client"""
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
+        """Attach to the shared scoring service (raises if OPENAI_API_KEY is unset)"""
+        self.service = get_scoring_service()
+        self.model = self.service.model  # gpt-4o-mini by default, cost-effective for classification
         
-        self.client = OpenAI(api_key=api_key)
-        self.model = "gpt-4o-mini"  # Cost-effective for classification
+        self.task = ScoringTask(
+            name="hvac_signal_v1",
+            instructions=SIGNAL_ANALYSIS_PROMPT,
+            result_example=SIGNAL_ANALYSIS_EXAMPLE,
+            format_item=lambda signal: self._prepare_context(
+                signal.get("title", ""),
+                signal.get("content", ""),
+                signal.get("source", "reddit"),
+                signal.get("metadata")
+            ),
+            # Memoize on the post text only so cross-posts share a result
+            content_key=lambda signal: f"{signal.get('title', '')}\n{(signal.get('content') or '')[:1000]}",
+            parse=self._parse_analysis,
+            fallback=lambda error: self._fallback_score(),
+            max_tokens_per_item=500
+        )
     
     def score_signal(
         self,
@@ -45,26 +110,37 @@ class AISignalScorer:
         Returns:
             Dict with AI scores, analysis, and recommendations
         """
+        return self.score_many([{
+            "title": title,
+            "content": content,
+            "source": source,
+            "metadata": metadata
+        }])[0]
+    
+    def score_many(
+        self,
+        signals: List[Dict[str, Any]],
+        max_concurrent: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Score signals concurrently, returning one score dict per signal in order"""
         try:
-            # Prepare context
-            context = self._prepare_context(title, content, source, metadata)
-            
-            # Get AI analysis
-            analysis = self._analyze_with_gpt(context)
-            
-            # Parse and structure results
-            result = self._parse_analysis(analysis)
-            
-            # Add metadata
-            result["analyzed_at"] = datetime.now(timezone.utc).isoformat()
-            result["model"] = self.model
-            result["source"] = source
-            
-            return result
-            
+            scores = self.service.score_many_sync(self.task, signals, max_concurrent)
         except Exception as e:
             print(f"❌ AI scoring error: {str(e)}")
-            return self._fallback_score()
+            scores = [self._fallback_score() for _ in signals]
+        
+        analyzed_at = datetime.now(timezone.utc).isoformat()
+        
+        # Cached results are shared, so add per-call metadata to copies
+        return [
+            {
+                **score,
+                "analyzed_at": analyzed_at,
+                "model": self.model,
+                "source": signal.get("source", "reddit")
+            }
+            for signal, score in zip(signals, scores)
+        ]
     
     def _prepare_context(
         self,
@@ -90,123 +166,47 @@ class AISignalScorer:
         
         return "\n".join(context_parts)
     
-    def _analyze_with_gpt(self, context: str) -> str:
-        """Call GPT-4 for signal analysis"""
+    def _parse_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse one post's GPT analysis into structured format
         
-        system_prompt = """You are an expert HVAC business development analyst specializing in identifying high-value sales leads from online discussions.
-
-Analyze the following post and provide a detailed scoring assessment for an HVAC service company.
-
-Score each dimension from 0-10:
-
-1. **Urgency** (0-10): How immediate is the need?
-   - 10: Emergency/immediate need (broken system, no heat/AC)
-   - 7-9: Urgent but not emergency (system failing, needs repair soon)
-   - 4-6: Planning/considering (thinking about replacement)
-   - 0-3: General inquiry or future planning
-
-2. **Budget** (0-10): Financial capacity indicators
-   - 10: Clear budget mentioned, willing to invest
-   - 7-9: Discussing costs, comparing options
-   - 4-6: Price-conscious but willing to pay for quality
-   - 0-3: Looking for cheapest option, DIY mentions
-
-3. **Authority** (0-10): Decision-making power
-   - 10: Homeowner, business owner, clear decision maker
-   - 7-9: Primary household decision maker
-   - 4-6: Involved in decision but not sole authority
-   - 0-3: Renter, asking for someone else, no authority
-
-4. **Pain** (0-10): Problem severity and impact
-   - 10: Major comfort/health/safety issue
-   - 7-9: Significant discomfort or inefficiency
-   - 4-6: Noticeable problem but manageable
-   - 0-3: Minor inconvenience or curiosity
-
-Additionally provide:
-- **Sentiment**: positive, neutral, negative, frustrated, desperate
-- **Intent**: seeking_help, comparing_options, emergency, planning, complaining
-- **Lead_Quality**: hot, warm, qualified, cold
-- **Key_Indicators**: List 3-5 specific phrases or signals that influenced your scoring
-- **Recommended_Action**: immediate_contact, nurture, monitor, skip
-- **Reasoning**: 2-3 sentence explanation of your assessment
-
-Respond ONLY with valid JSON in this exact format:
-{
-  "urgency": 8,
-  "budget": 7,
-  "authority": 9,
-  "pain": 8,
-  "sentiment": "frustrated",
-  "intent": "seeking_help",
-  "lead_quality": "hot",
-  "key_indicators": ["broken AC", "no cooling", "homeowner", "willing to pay"],
-  "recommended_action": "immediate_contact",
-  "reasoning": "Homeowner with broken AC showing urgency and willingness to invest in solution."
-}"""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": context}
-                ],
-                temperature=0.3,  # Lower temperature for consistent scoring
-                max_tokens=500,
-                response_format={"type": "json_object"}
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            print(f"❌ OpenAI API error: {str(e)}")
-            raise
-    
-    def _parse_analysis(self, analysis: str) -> Dict[str, Any]:
-        """Parse GPT response into structured format"""
-        try:
-            data = json.loads(analysis)
-            
-            # Calculate total score (0-100)
-            urgency = data.get("urgency", 0)
-            budget = data.get("budget", 0)
-            authority = data.get("authority", 0)
-            pain = data.get("pain", 0)
-            
-            total_score = (urgency * 0.25 + budget * 0.25 + 
-                          authority * 0.25 + pain * 0.25) * 10
-            
-            # Determine tier
-            if total_score >= 85:
-                tier = "hot"
-            elif total_score >= 70:
-                tier = "warm"
-            elif total_score >= 50:
-                tier = "qualified"
-            else:
-                tier = "cold"
-            
-            return {
-                "ai_urgency_score": urgency,
-                "ai_budget_score": budget,
-                "ai_authority_score": authority,
-                "ai_pain_score": pain,
-                "ai_total_score": round(total_score, 2),
-                "ai_tier": tier,
-                "sentiment": data.get("sentiment", "neutral"),
-                "intent": data.get("intent", "unknown"),
-                "lead_quality": data.get("lead_quality", "cold"),
-                "key_indicators": data.get("key_indicators", []),
-                "recommended_action": data.get("recommended_action", "monitor"),
-                "reasoning": data.get("reasoning", ""),
-                "confidence": "high"
-            }
-            
-        except json.JSONDecodeError as e:
-            print(f"❌ Failed to parse AI response: {str(e)}")
-            print(f"Raw response: {analysis}")
-            return self._fallback_score()
+        Raises on malformed scores so the service retries the post instead
+        of caching a bad result.
+        """
+        # Calculate total score (0-100)
+        urgency = data.get("urgency", 0)
+        budget = data.get("budget", 0)
+        authority = data.get("authority", 0)
+        pain = data.get("pain", 0)
+        
+        total_score = (urgency * 0.25 + budget * 0.25 + 
+                      authority * 0.25 + pain * 0.25) * 10
+        
+        # Determine tier
+        if total_score >= 85:
+            tier = "hot"
+        elif total_score >= 70:
+            tier = "warm"
+        elif total_score >= 50:
+            tier = "qualified"
+        else:
+            tier = "cold"
+        
+        return {
+            "ai_urgency_score": urgency,
+            "ai_budget_score": budget,
+            "ai_authority_score": authority,
+            "ai_pain_score": pain,
+            "ai_total_score": round(total_score, 2),
+            "ai_tier": tier,
+            "sentiment": data.get("sentiment", "neutral"),
+            "intent": data.get("intent", "unknown"),
+            "lead_quality": data.get("lead_quality", "cold"),
+            "key_indicators": data.get("key_indicators", []),
+            "recommended_action": data.get("recommended_action", "monitor"),
+            "reasoning": data.get("reasoning", ""),
+            "confidence": "high"
+        }
     
     def _fallback_score(self) -> Dict[str, Any]:
         """Fallback scores when AI fails"""
@@ -236,35 +236,18 @@ Respond ONLY with valid JSON in this exact format:
         
         Args:
             signals: List of signal dicts with title, content, source
-            max_concurrent: Max concurrent API calls
+            max_concurrent: Max concurrent API calls (several short
+                signals share each call)
         
         Returns:
             List of scored signals with AI analysis
         """
-        results = []
-        
-        for signal in signals:
-            try:
-                score = self.score_signal(
-                    title=signal.get("title", ""),
-                    content=signal.get("content", ""),
-                    source=signal.get("source", "reddit"),
-                    metadata=signal.get("metadata", {})
-                )
-                
-                results.append({
-                    **signal,
-                    **score
-                })
-                
-            except Exception as e:
-                print(f"❌ Batch scoring error for signal: {str(e)}")
-                results.append({
-                    **signal,
-                    **self._fallback_score()
-                })
+        scores = self.score_many(signals, max_concurrent)
         
-        return results
+        return [
+            {**signal, **score}
+            for signal, score in zip(signals, scores)
+        ]
 
 
 def test_ai_scorer():
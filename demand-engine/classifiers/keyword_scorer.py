@@ -0,0 +1,172 @@
+"""
+Batch keyword scorer
+Compiles keyword dictionaries once and scores a whole batch of texts in
+one pass, returning every category's matches and scores together
+
+Matching keeps the `keyword in text.lower()` semantics the scorers have
+always used (substring, case-insensitive) without searching every text for
+every keyword. A keyword without whitespace can only occur inside a single
+word, so keywords are searched once in the batch's vocabulary (its unique
+words, typically a small fraction of the text) and each text's matches are
+a set lookup over its own words. Multi-word keywords are confirmed against
+the text only when all of their words were found.
+
+Example:
+    scorer = KeywordScorer({
+        "urgency": weighted({"immediate": ["asap", "urgent"], "later": ["soon"]},
+                            {"immediate": 10, "later": 2}),
+        "pain": ["frustrated", "missed calls"],  # weight 1 each (match counts)
+    })
+    scores = scorer.score_batch(texts)  # [{"urgency": 12, "pain": 1}, ...]
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+# Never part of a keyword, so matches can't span two texts
+_SEPARATOR = "\x00"
+
+KeywordEntries = Union[Sequence[str], Sequence[Tuple[str, float]]]
+
+
+def weighted(tiers: Dict[str, Iterable[str]], weights: Dict[str, float]) -> List[Tuple[str, float]]:
+    """Flatten a {tier: [keywords]} dictionary into (keyword, weight) entries"""
+    return [
+        (keyword, weights[tier])
+        for tier, keywords in tiers.items()
+        for keyword in keywords
+    ]
+
+
+class KeywordScorer:
+    """Compiled keyword categories for batch matching"""
+
+    def __init__(self, categories: Dict[str, KeywordEntries]):
+        """
+        Args:
+            categories: Category -> keywords, either plain strings (weight 1)
+                or (keyword, weight) pairs. Order is kept in match results.
+        """
+        self.categories = list(categories)
+
+        # Unique keyword -> [(category, position in category, keyword, weight)]
+        self._entries: Dict[str, List[Tuple[str, int, str, float]]] = {}
+        for category, entries in categories.items():
+            for position, entry in enumerate(entries):
+                keyword, weight = (entry, 1) if isinstance(entry, str) else entry
+                self._entries.setdefault(keyword.lower(), []).append((category, position, keyword, weight))
+
+        # Single-word keywords are matched via the vocabulary. Multi-word ones
+        # are indexed by their longest word (short words like "of" or "the"
+        # would hit most of the vocabulary) and confirmed against the text.
+        self._terms = set()
+        self._phrases: Dict[str, List[str]] = {}
+        for keyword in self._entries:
+            words = keyword.split()
+            if not words:
+                continue
+            if len(words) == 1 and words[0] == keyword:
+                self._terms.add(keyword)
+            else:
+                term = max(words, key=len)
+                self._terms.add(term)
+                self._phrases.setdefault(term, []).append(keyword)
+
+        self._keywords = tuple(self._entries)
+
+    def match_batch(self, texts: Sequence[str]) -> List[Dict[str, List[Tuple[str, float]]]]:
+        """
+        Find keyword matches for every text
+
+        Returns one {category: [(keyword, weight), ...]} dict per text, with
+        keywords in the order they were defined.
+        """
+        # Identical texts (cross-posts, reposts) are matched once
+        slots: Dict[str, int] = {}
+        unique: List[str] = []
+        text_slots = []
+        for text in texts:
+            lowered = (text or "").lower()
+            if lowered not in slots:
+                slots[lowered] = len(unique)
+                unique.append(lowered)
+            text_slots.append(slots[lowered])
+
+        if len(unique) == 1:
+            return [self._categorize(filter(unique[0].__contains__, self._keywords))] * len(texts)
+
+        word_sets = [set(lowered.split()) for lowered in unique]
+        vocabulary = list(set().union(*word_sets))
+
+        if sum(map(len, vocabulary)) * 2 > sum(map(len, unique)):
+            # Little repetition across the batch: searching each text
+            # directly is cheaper than indexing the vocabulary
+            results = [
+                self._categorize(filter(lowered.__contains__, self._keywords))
+                for lowered in unique
+            ]
+            return [results[slot] for slot in text_slots]
+
+        word_terms = self._terms_by_word(vocabulary)
+
+        results = []
+        for lowered, words in zip(unique, word_sets):
+            present = set()
+            for word in words & word_terms.keys():
+                present.update(word_terms[word])
+
+            hits = present & self._entries.keys()
+            for term in present & self._phrases.keys():
+                hits.update(keyword for keyword in self._phrases[term] if keyword in lowered)
+
+            results.append(self._categorize(hits))
+
+        return [results[slot] for slot in text_slots]
+
+    def _terms_by_word(self, vocabulary: List[str]) -> Dict[str, List[str]]:
+        """Vocabulary word -> keyword terms it contains (one scan per term)"""
+        starts = []
+        offset = 0
+        for word in vocabulary:
+            starts.append(offset)
+            offset += len(word) + 1
+        joined = _SEPARATOR.join(vocabulary)
+
+        word_terms: Dict[str, List[str]] = {}
+        for term in self._terms:
+            index = joined.find(term)
+            while index != -1:
+                slot = bisect_right(starts, index) - 1
+                word_terms.setdefault(vocabulary[slot], []).append(term)
+                # One hit per word is enough; resume at the next word
+                if slot + 1 == len(starts):
+                    break
+                index = joined.find(term, starts[slot + 1])
+
+        return word_terms
+
+    def _categorize(self, hits: Iterable[str]) -> Dict[str, List[Tuple[str, float]]]:
+        found: Dict[str, List[Tuple[int, str, float]]] = {}
+        for keyword in hits:
+            for category, position, original, weight in self._entries[keyword]:
+                found.setdefault(category, []).append((position, original, weight))
+
+        matches = {category: [] for category in self.categories}
+        for category, entries in found.items():
+            entries.sort()
+            matches[category] = [(keyword, weight) for _, keyword, weight in entries]
+
+        return matches
+
+    def score_batch(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        """Summed keyword weights per category for every text"""
+        return [
+            {category: sum(weight for _, weight in found) for category, found in matches.items()}
+            for matches in self.match_batch(texts)
+        ]
+
+    def match(self, text: str) -> Dict[str, List[Tuple[str, float]]]:
+        return self.match_batch([text])[0]
+
+    def score(self, text: str) -> Dict[str, float]:
+        return self.score_batch([text])[0]
@@ -3,6 +3,10 @@ Keyword definitions for signal classification
 Fast pre-filtering before AI classification
 """
 
+from typing import List
+
+from classifiers.keyword_scorer import KeywordScorer, weighted
+
 # Pain signals - business struggles and challenges
 PAIN_KEYWORDS = {
     "high_priority": [
@@ -120,6 +124,77 @@ SERVICE_PAIN_POINTS = {
 }
 
 
+KEYWORD_SCORER = KeywordScorer({
+    "pain": weighted(PAIN_KEYWORDS, {"high_priority": 8, "medium_priority": 5, "low_priority": 2}),
+    "service_pain": [(kw, 3) for keywords in SERVICE_PAIN_POINTS.values() for kw in keywords],
+    "urgency": weighted(URGENCY_KEYWORDS, {"immediate": 10, "short_term": 6, "long_term": 2}),
+    "budget": weighted(BUDGET_KEYWORDS, {"high_budget": 8, "budget_conscious": 5, "budget_constrained": 2}),
+    "authority": weighted(AUTHORITY_KEYWORDS, {"decision_maker": 12, "influencer": 7, "researcher": 3}),
+    **{f"business_type:{biz_type}": keywords for biz_type, keywords in BUSINESS_TYPE_KEYWORDS.items()},
+    "disqualifiers": DISQUALIFIER_KEYWORDS,
+})
+
+
+def calculate_keyword_scores(texts: List[str]) -> List[dict]:
+    """
+    Calculate keyword-based scores for a batch of texts in one pass
+    
+    Returns one calculate_keyword_score() result per text, in order
+    """
+    results = []
+    
+    for found in KEYWORD_SCORER.match_batch(texts):
+        keywords = lambda category: [kw for kw, _ in found[category]]
+        total = lambda category: sum(weight for _, weight in found[category])
+        
+        matched = {
+            "pain": keywords("pain"),
+            "urgency": keywords("urgency"),
+            "budget": keywords("budget"),
+            "authority": keywords("authority"),
+            "business_type": [],
+            "service_pain": keywords("service_pain"),
+            "disqualifiers": keywords("disqualifiers")
+        }
+        
+        # Pain signals, plus service-specific pain points (bonus)
+        pain_score = min(25, total("pain") + total("service_pain"))
+        urgency_score = min(25, total("urgency"))
+        budget_score = min(25, total("budget"))
+        authority_score = min(25, total("authority"))
+        
+        # Business type detection
+        detected_types = []
+        for biz_type in BUSINESS_TYPE_KEYWORDS:
+            biz_keywords = keywords(f"business_type:{biz_type}")
+            if biz_keywords:
+                matched["business_type"].extend(biz_keywords)
+                detected_types.append(biz_type)
+        
+        # Disqualifiers
+        has_disqualifiers = bool(matched["disqualifiers"])
+        
+        # Total score
+        total_score = pain_score + urgency_score + budget_score + authority_score
+        
+        # Penalty for disqualifiers
+        if has_disqualifiers:
+            total_score = int(total_score * 0.5)
+        
+        results.append({
+            "total_score": min(100, total_score),
+            "pain_score": pain_score,
+            "urgency_score": urgency_score,
+            "budget_score": budget_score,
+            "authority_score": authority_score,
+            "matched_keywords": matched,
+            "business_type": detected_types[0] if detected_types else None,
+            "has_disqualifiers": has_disqualifiers,
+        })
+    
+    return results
+
+
 def calculate_keyword_score(text: str) -> dict:
     """
     Calculate comprehensive keyword-based score
@@ -134,118 +209,7 @@ def calculate_keyword_score(text: str) -> dict:
         - business_type: detected business type
         - has_disqualifiers: bool
     """
-    text_lower = text.lower()
-    
-    matched = {
-        "pain": [],
-        "urgency": [],
-        "budget": [],
-        "authority": [],
-        "business_type": [],
-        "service_pain": [],
-        "disqualifiers": []
-    }
-    
-    # Pain signals
-    pain_score = 0
-    for priority, keywords in PAIN_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                matched["pain"].append(kw)
-                if priority == "high_priority":
-                    pain_score += 8
-                elif priority == "medium_priority":
-                    pain_score += 5
-                else:
-                    pain_score += 2
-    
-    # Service-specific pain points (bonus)
-    for category, keywords in SERVICE_PAIN_POINTS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                matched["service_pain"].append(kw)
-                pain_score += 3
-    
-    pain_score = min(25, pain_score)
-    
-    # Urgency signals
-    urgency_score = 0
-    for priority, keywords in URGENCY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                matched["urgency"].append(kw)
-                if priority == "immediate":
-                    urgency_score += 10
-                elif priority == "short_term":
-                    urgency_score += 6
-                else:
-                    urgency_score += 2
-    
-    urgency_score = min(25, urgency_score)
-    
-    # Budget signals
-    budget_score = 0
-    for category, keywords in BUDGET_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                matched["budget"].append(kw)
-                if category == "high_budget":
-                    budget_score += 8
-                elif category == "budget_conscious":
-                    budget_score += 5
-                else:
-                    budget_score += 2
-    
-    budget_score = min(25, budget_score)
-    
-    # Authority signals
-    authority_score = 0
-    for category, keywords in AUTHORITY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                matched["authority"].append(kw)
-                if category == "decision_maker":
-                    authority_score += 12
-                elif category == "influencer":
-                    authority_score += 7
-                else:
-                    authority_score += 3
-    
-    authority_score = min(25, authority_score)
-    
-    # Business type detection
-    detected_types = []
-    for biz_type, keywords in BUSINESS_TYPE_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                matched["business_type"].append(kw)
-                if biz_type not in detected_types:
-                    detected_types.append(biz_type)
-    
-    # Disqualifiers
-    has_disqualifiers = False
-    for kw in DISQUALIFIER_KEYWORDS:
-        if kw in text_lower:
-            matched["disqualifiers"].append(kw)
-            has_disqualifiers = True
-    
-    # Total score
-    total_score = pain_score + urgency_score + budget_score + authority_score
-    
-    # Penalty for disqualifiers
-    if has_disqualifiers:
-        total_score = int(total_score * 0.5)
-    
-    return {
-        "total_score": min(100, total_score),
-        "pain_score": pain_score,
-        "urgency_score": urgency_score,
-        "budget_score": budget_score,
-        "authority_score": authority_score,
-        "matched_keywords": matched,
-        "business_type": detected_types[0] if detected_types else None,
-        "has_disqualifiers": has_disqualifiers,
-    }
+    return calculate_keyword_scores([text])[0]
 
 
 def should_use_ai_classification(keyword_score: dict) -> bool:
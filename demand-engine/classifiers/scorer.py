@@ -4,107 +4,126 @@ Runs on Modal for batch processing
 """
 import os
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 import modal
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.modal_config import app, scraper_image, secrets
-from classifiers.keywords import calculate_keyword_score, should_use_ai_classification
+from classifiers.keywords import calculate_keyword_scores, should_use_ai_classification
+from classifiers.scoring_service import ScoringTask, get_scoring_service
 
 
 AI_CLASSIFICATION_PROMPT = """You are a lead qualification expert for an AI call answering service targeting HVAC, plumbing, and electrical contractors.
 
-Analyze this post and score it on these dimensions (0-25 each):
+Analyze each post and score it on these dimensions (0-25 each):
 
 1. PAIN (0-25): How much is this business struggling with call handling, growth, or operations?
 2. URGENCY (0-25): How time-sensitive is their need?
 3. BUDGET (0-25): Do they have budget/authority to invest in solutions?
-4. AUTHORITY (0-25): Is this person a decision-maker (owner/manager)?
+4. AUTHORITY (0-25): Is this person a decision-maker (owner/manager)?"""
 
-POST:
-Title: {title}
-Content: {content}
-Source: {source}
+AI_CLASSIFICATION_EXAMPLE = {
+    "pain_score": 18,
+    "urgency_score": 12,
+    "budget_score": 10,
+    "authority_score": 22,
+    "reasoning": "<brief explanation>",
+    "is_qualified": True,
+    "business_type": "<hvac|plumbing|electrical|general_contractor|other|unknown>"
+}
 
-Respond ONLY with valid JSON:
-{{
-  "pain_score": <0-25>,
-  "urgency_score": <0-25>,
-  "budget_score": <0-25>,
-  "authority_score": <0-25>,
-  "reasoning": "<brief explanation>",
-  "is_qualified": <true/false>,
-  "business_type": "<hvac|plumbing|electrical|general_contractor|other|unknown>"
-}}"""
+
+def format_signal(signal: Dict) -> str:
+    return (
+        f"Title: {signal.get('title', '')}\n"
+        f"Content: {(signal.get('content') or '')[:2000]}\n"  # Limit content length
+        f"Source: {signal.get('source_platform', 'unknown')}"
+    )
 
 
-def create_openai_client() -> OpenAI:
-    """Create OpenAI client"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY must be set")
-    return OpenAI(api_key=api_key)
+def parse_classification(result: Dict) -> Dict:
+    return {
+        "ai_pain_score": int(result.get("pain_score", 0)),
+        "ai_urgency_score": int(result.get("urgency_score", 0)),
+        "ai_budget_score": int(result.get("budget_score", 0)),
+        "ai_authority_score": int(result.get("authority_score", 0)),
+        "ai_reasoning": result.get("reasoning", ""),
+        "ai_is_qualified": result.get("is_qualified", False),
+        "ai_business_type": result.get("business_type", "unknown"),
+        "classification_method": "ai",
+    }
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
+def classification_error(error: str) -> Dict:
+    print(f"❌ AI classification error: {error}")
+    return {
+        "ai_pain_score": 0,
+        "ai_urgency_score": 0,
+        "ai_budget_score": 0,
+        "ai_authority_score": 0,
+        "ai_reasoning": f"Error: {error}",
+        "ai_is_qualified": False,
+        "classification_method": "error",
+    }
+
+
+CLASSIFICATION_TASK = ScoringTask(
+    name="lead_classification_v1",
+    instructions=AI_CLASSIFICATION_PROMPT,
+    result_example=AI_CLASSIFICATION_EXAMPLE,
+    format_item=format_signal,
+    content_key=lambda signal: f"{signal.get('title', '')}\n{(signal.get('content') or '')[:2000]}",
+    parse=parse_classification,
+    fallback=classification_error,
 )
+
+
+def classify_many_with_ai(signals: List[Dict]) -> List[Dict]:
+    """
+    Use GPT-4o-mini to classify signals (concurrent, packed and memoized)
+    
+    Returns one dict with AI scores and reasoning per signal, in order
+    """
+    if not signals:
+        return []
+    
+    try:
+        return get_scoring_service().score_many_sync(CLASSIFICATION_TASK, signals)
+    except Exception as e:
+        return [classification_error(str(e)) for _ in signals]
+
+
 def classify_with_ai(signal: Dict) -> Dict:
     """
     Use GPT-4o-mini to classify signal
     
     Returns dict with AI scores and reasoning
     """
-    client = create_openai_client()
-    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    return classify_many_with_ai([signal])[0]
+
+
+def classify_signals(signals: List[Dict]) -> List[Tuple[Dict, Optional[Dict]]]:
+    """
+    Keyword-score signals, then AI-classify the ambiguous ones in one pass
     
-    prompt = AI_CLASSIFICATION_PROMPT.format(
-        title=signal.get("title", ""),
-        content=signal.get("content", "")[:2000],  # Limit content length
-        source=signal.get("source_platform", "unknown")
-    )
+    Returns (keyword_result, ai_result or None) per signal, in order
+    """
+    keyword_results = calculate_keyword_scores([
+        f"{signal.get('title', '')} {signal.get('content', '')}"
+        for signal in signals
+    ])
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "You are a lead qualification expert. Respond only with valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=300,
-            response_format={"type": "json_object"}
-        )
-        
-        result = json.loads(response.choices[0].message.content)
-        
-        return {
-            "ai_pain_score": result.get("pain_score", 0),
-            "ai_urgency_score": result.get("urgency_score", 0),
-            "ai_budget_score": result.get("budget_score", 0),
-            "ai_authority_score": result.get("authority_score", 0),
-            "ai_reasoning": result.get("reasoning", ""),
-            "ai_is_qualified": result.get("is_qualified", False),
-            "ai_business_type": result.get("business_type", "unknown"),
-            "classification_method": "ai",
-        }
-        
-    except Exception as e:
-        print(f"❌ AI classification error: {e}")
-        return {
-            "ai_pain_score": 0,
-            "ai_urgency_score": 0,
-            "ai_budget_score": 0,
-            "ai_authority_score": 0,
-            "ai_reasoning": f"Error: {str(e)}",
-            "ai_is_qualified": False,
-            "classification_method": "error",
-        }
+    ai_results: List[Optional[Dict]] = [None] * len(signals)
+    ambiguous = [i for i, keyword_result in enumerate(keyword_results) if should_use_ai_classification(keyword_result)]
+    
+    if ambiguous:
+        print(f"🤖 Using AI for refinement of {len(ambiguous)}/{len(signals)} signals...")
+        for i, ai_result in zip(ambiguous, classify_many_with_ai([signals[i] for i in ambiguous])):
+            ai_results[i] = ai_result
+    
+    return list(zip(keyword_results, ai_results))
 
 
 def merge_scores(keyword_result: Dict, ai_result: Optional[Dict] = None) -> Dict:
@@ -149,6 +168,38 @@ def merge_scores(keyword_result: Dict, ai_result: Optional[Dict] = None) -> Dict
     }
 
 
+def save_classification(client, signal: Dict, keyword_result: Dict, ai_result: Optional[Dict]) -> Dict:
+    """Merge scores and write the classification back to the signal row"""
+    signal_id = signal["id"]
+    final_result = merge_scores(keyword_result, ai_result)
+    
+    # Update database
+    update_data = {
+        "classified_score": final_result["final_score"],
+        "urgency_signals": keyword_result["matched_keywords"]["urgency"],
+        "budget_signals": keyword_result["matched_keywords"]["budget"],
+        "authority_signals": keyword_result["matched_keywords"]["authority"],
+        "pain_signals": keyword_result["matched_keywords"]["pain"],
+        "is_qualified": final_result["is_qualified"],
+        "classification_method": final_result["classification_method"],
+        "classification_confidence": 0.85 if final_result["classification_method"] == "hybrid" else 0.70,
+        "status": "classified",
+        "processed_at": datetime.now(timezone.utc).isoformat(),
+    }
+    
+    # Add AI data to raw_data if used
+    if ai_result:
+        signal["raw_data"] = signal.get("raw_data") or {}
+        signal["raw_data"]["ai_classification"] = ai_result
+        update_data["raw_data"] = signal["raw_data"]
+    
+    client.table("signals").update(update_data).eq("id", signal_id).execute()
+    
+    print(f"✅ Signal {signal_id[:8]}... scored: {final_result['final_score']} (qualified: {final_result['is_qualified']})")
+    
+    return final_result
+
+
 @app.function(
     image=scraper_image,
     secrets=secrets,
@@ -178,48 +229,11 @@ def score_signal(signal_id: str) -> Dict:
     
     signal = result.data[0]
     
-    # Step 1: Keyword scoring
-    text = f"{signal.get('title', '')} {signal.get('content', '')}"
-    keyword_result = calculate_keyword_score(text)
+    keyword_result, ai_result = classify_signals([signal])[0]
     
     print(f"📊 Signal {signal_id[:8]}... keyword score: {keyword_result['total_score']}")
     
-    # Step 2: Decide if AI needed
-    ai_result = None
-    if should_use_ai_classification(keyword_result):
-        print(f"🤖 Using AI for refinement...")
-        ai_result = classify_with_ai(signal)
-    else:
-        print(f"⚡ Keyword score sufficient, skipping AI")
-    
-    # Step 3: Merge scores
-    final_result = merge_scores(keyword_result, ai_result)
-    
-    # Step 4: Update database
-    update_data = {
-        "classified_score": final_result["final_score"],
-        "urgency_signals": keyword_result["matched_keywords"]["urgency"],
-        "budget_signals": keyword_result["matched_keywords"]["budget"],
-        "authority_signals": keyword_result["matched_keywords"]["authority"],
-        "pain_signals": keyword_result["matched_keywords"]["pain"],
-        "is_qualified": final_result["is_qualified"],
-        "classification_method": final_result["classification_method"],
-        "classification_confidence": 0.85 if final_result["classification_method"] == "hybrid" else 0.70,
-        "status": "classified",
-        "processed_at": datetime.now(timezone.utc).isoformat(),
-    }
-    
-    # Add AI data to raw_data if used
-    if ai_result:
-        signal["raw_data"] = signal.get("raw_data", {})
-        signal["raw_data"]["ai_classification"] = ai_result
-        update_data["raw_data"] = signal["raw_data"]
-    
-    client.table("signals").update(update_data).eq("id", signal_id).execute()
-    
-    print(f"✅ Signal {signal_id[:8]}... scored: {final_result['final_score']} (qualified: {final_result['is_qualified']})")
-    
-    return final_result
+    return save_classification(client, signal, keyword_result, ai_result)
 
 
 @app.function(
@@ -245,7 +259,7 @@ def score_batch(batch_size: int = 50, source_type: Optional[str] = None) -> Dict
     client = create_client(supabase_url, supabase_key)
     
     # Fetch unclassified signals
-    query = client.table("signals").select("id").eq("status", "pending")
+    query = client.table("signals").select("*").eq("status", "pending")
     
     if source_type:
         query = query.eq("source_type", source_type)
@@ -265,9 +279,12 @@ def score_batch(batch_size: int = 50, source_type: Optional[str] = None) -> Dict
         "errors": 0,
     }
     
-    for signal in signals:
+    # AI calls for the whole batch run concurrently on one shared client
+    classified = classify_signals(signals)
+    
+    for signal, (keyword_result, ai_result) in zip(signals, classified):
         try:
-            result = score_signal.remote(signal["id"])
+            result = save_classification(client, signal, keyword_result, ai_result)
             
             stats["total_processed"] += 1
             
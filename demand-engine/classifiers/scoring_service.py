@@ -0,0 +1,375 @@
+"""
+AI Scoring Service
+Scores signals with OpenAI through a bounded async worker pool on one
+shared client, packing several short posts into each structured-output
+request and memoizing results by content hash
+
+Results are cached in two tiers, keyed by task, model and normalized
+content (so reposts and cross-posts are only paid for once):
+- In-process LRU (always on)
+- Redis (optional, shared across workers/runs) if REDIS_URL is set and
+  the redis package is installed
+
+Example:
+    service = get_scoring_service()
+    results = service.score_many_sync(task, items)
+"""
+
+import os
+import re
+import json
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from scrapers.runtime import run_sync
+
+logger = logging.getLogger(__name__)
+
+# Try to import Redis, but make it optional
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Configuration
+REDIS_URL = os.getenv("REDIS_URL")
+AI_SCORING_CONCURRENCY = int(os.getenv("AI_SCORING_CONCURRENCY", "4"))
+AI_SCORING_PACK_SIZE = int(os.getenv("AI_SCORING_PACK_SIZE", "5"))
+AI_SCORING_PACK_MAX_CHARS = int(os.getenv("AI_SCORING_PACK_MAX_CHARS", "800"))  # longer posts go alone
+AI_SCORING_MAX_RETRIES = int(os.getenv("AI_SCORING_MAX_RETRIES", "3"))
+AI_SCORE_CACHE_MAX_ENTRIES = int(os.getenv("AI_SCORE_CACHE_MAX_ENTRIES", "5000"))
+AI_SCORE_CACHE_TTL = int(os.getenv("AI_SCORE_CACHE_TTL", str(7 * 86400)))
+AI_SCORE_REDIS_PREFIX = "ai_score:"
+
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+
+class ScoringTask:
+    """
+    One kind of scoring request (prompt + result handling)
+
+    The service adds the multi-post framing: posts are sent as
+    "### POST <id>" sections and the model returns
+    {"results": [{"id": "<id>", ...result_example fields}]}.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        instructions: str,
+        result_example: Dict[str, Any],
+        format_item: Callable[[Dict], str],
+        content_key: Callable[[Dict], str],
+        parse: Callable[[Dict], Dict],
+        fallback: Callable[[str], Dict],
+        max_tokens_per_item: int = 300,
+        temperature: float = 0.3
+    ):
+        """
+        Args:
+            name: Cache namespace (change it when the prompt changes)
+            instructions: Scoring instructions for the system prompt
+            result_example: Example of the JSON object returned per post
+            format_item: Item -> post text sent to the model
+            content_key: Item -> text that identifies the content for memoization
+            parse: Model's JSON object for one post -> result dict
+            fallback: Error message -> result dict used when scoring fails
+            max_tokens_per_item: Completion budget per post
+            temperature: Sampling temperature
+        """
+        self.name = name
+        self.format_item = format_item
+        self.content_key = content_key
+        self.parse = parse
+        self.fallback = fallback
+        self.max_tokens_per_item = max_tokens_per_item
+        self.temperature = temperature
+
+        self.system_prompt = (
+            f"{instructions.strip()}\n\n"
+            "You will receive one or more posts, each starting with a \"### POST <id>\" line. "
+            "Score every post independently.\n\n"
+            "Respond ONLY with valid JSON in this exact format:\n"
+            "{\"results\": [<one object per post>]}\n\n"
+            "where each object has the post's \"id\" plus these fields:\n"
+            f"{json.dumps({'id': '0', **result_example}, indent=2)}"
+        )
+
+
+class ScoreCache:
+    """Two-tier (LRU + optional Redis) cache of parsed scoring results"""
+
+    def __init__(self, redis_url: Optional[str] = REDIS_URL, max_entries: int = AI_SCORE_CACHE_MAX_ENTRIES):
+        self._local: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.redis_client = None
+
+        if REDIS_AVAILABLE and redis_url:
+            try:
+                self.redis_client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                )
+                self.redis_client.ping()
+                logger.info("AI score cache using Redis")
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for AI score cache ({e}), using in-process cache only")
+                self.redis_client = None
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            if key in self._local:
+                self._local.move_to_end(key)
+                return self._local[key]
+
+        if self.redis_client:
+            try:
+                raw = self.redis_client.get(AI_SCORE_REDIS_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"AI score cache Redis read failed: {e}")
+                raw = None
+            if raw is not None:
+                result = json.loads(raw)
+                self._set_local(key, result)
+                return result
+
+        return None
+
+    def set(self, key: str, result: Dict) -> None:
+        self._set_local(key, result)
+
+        if self.redis_client:
+            try:
+                self.redis_client.set(AI_SCORE_REDIS_PREFIX + key, json.dumps(result, default=str), ex=AI_SCORE_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"AI score cache Redis write failed: {e}")
+
+    def _set_local(self, key: str, result: Dict) -> None:
+        with self._lock:
+            self._local[key] = result
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (e.g. in tests)"""
+        with self._lock:
+            self._local.clear()
+
+
+class AIScoringService:
+    """
+    Score many items concurrently with packing and memoization
+
+    Per call: cached items are answered without a request, duplicate items
+    share one slot, short items are packed AI_SCORING_PACK_SIZE to a
+    request, and at most max_concurrency requests are in flight. Items a
+    packed response drops are retried on their own, one at a time inside
+    the pack's slot; items that still fail, and every item of a request
+    that fails outright, get the task's fallback (fallbacks are never cached).
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        max_concurrency: int = AI_SCORING_CONCURRENCY,
+        pack_size: int = AI_SCORING_PACK_SIZE,
+        pack_max_chars: int = AI_SCORING_PACK_MAX_CHARS,
+        cache: Optional[ScoreCache] = None
+    ):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY must be set")
+
+        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.max_concurrency = max(1, max_concurrency)
+        self.pack_size = max(1, pack_size)
+        self.pack_max_chars = pack_max_chars
+        self.cache = cache or ScoreCache()
+
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_loop = None
+
+    def client(self) -> AsyncOpenAI:
+        """Shared OpenAI client for the running event loop (keep-alive pool)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # The client's connection pool is bound to the loop that created it
+            self._client = AsyncOpenAI(api_key=self.api_key, max_retries=0)
+            self._client_loop = loop
+        return self._client
+
+    def cache_key(self, task: ScoringTask, item: Dict) -> str:
+        content = re.sub(r"\s+", " ", task.content_key(item)).strip().lower()
+        return hashlib.sha256(f"{task.name}|{self.model}|{content}".encode("utf-8")).hexdigest()
+
+    async def score_many(
+        self,
+        task: ScoringTask,
+        items: List[Dict],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Score items, returning one result per item in order
+
+        Args:
+            task: What to score and how to parse it
+            items: Items understood by the task's formatters
+            max_concurrency: Override the in-flight request limit
+        """
+        results: List[Optional[Dict]] = [None] * len(items)
+        pending: Dict[str, List[int]] = {}
+
+        for i, item in enumerate(items):
+            key = self.cache_key(task, item)
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending:
+            packs = self._pack(task, [(key, items[indexes[0]]) for key, indexes in pending.items()])
+            semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+
+            async def run(pack: List[Tuple[str, Dict]]) -> Dict[str, Dict]:
+                async with semaphore:
+                    return await self._score_pack(task, pack)
+
+            logger.info(
+                f"AI scoring {len(items)} items: {len(items) - sum(map(len, pending.values()))} cached, "
+                f"{len(pending)} unique in {len(packs)} requests"
+            )
+
+            for scored in await asyncio.gather(*(run(pack) for pack in packs)):
+                for key, result in scored.items():
+                    for i in pending[key]:
+                        results[i] = result
+
+        return results
+
+    def score_many_sync(self, task: ScoringTask, items: List[Dict], max_concurrency: Optional[int] = None) -> List[Dict]:
+        """score_many() for sync callers"""
+        return run_sync(self.score_many(task, items, max_concurrency))
+
+    def _pack(self, task: ScoringTask, entries: List[Tuple[str, Dict]]) -> List[List[Tuple[str, Dict]]]:
+        packs = []
+        current: List[Tuple[str, Dict]] = []
+
+        for key, item in entries:
+            if len(task.format_item(item)) > self.pack_max_chars:
+                packs.append([(key, item)])
+                continue
+            current.append((key, item))
+            if len(current) >= self.pack_size:
+                packs.append(current)
+                current = []
+
+        if current:
+            packs.append(current)
+
+        return packs
+
+    async def _score_pack(self, task: ScoringTask, pack: List[Tuple[str, Dict]]) -> Dict[str, Dict]:
+        try:
+            entries = await self._request(task, pack)
+        except Exception as e:
+            # Already retried in _request (rate limits included); splitting the
+            # pack would only multiply the requests against a failing API
+            logger.error(f"AI scoring request failed ({len(pack)} items): {str(e)}")
+            return {key: task.fallback(str(e)) for key, _ in pack}
+
+        results: Dict[str, Dict] = {}
+        missing: List[Tuple[str, Dict]] = []
+
+        for index, (key, item) in enumerate(pack):
+            raw = entries.get(str(index))
+            try:
+                if raw is None:
+                    raise ValueError("no result returned for post")
+                result = task.parse(raw)
+            except Exception as e:
+                if len(pack) == 1:
+                    results[key] = task.fallback(str(e))
+                else:
+                    missing.append((key, item))
+                continue
+
+            self.cache.set(key, result)
+            results[key] = result
+
+        # Retry whatever the packed request dropped, one post per request and
+        # one request at a time, so the pack never holds more than its slot
+        for entry in missing:
+            results.update(await self._score_pack(task, [entry]))
+
+        return results
+
+    async def _request(self, task: ScoringTask, pack: List[Tuple[str, Dict]]) -> Dict[str, Dict]:
+        """One chat completion for a pack, returning the model's objects by post id"""
+        user_content = "\n\n".join(
+            f"### POST {index}\n{task.format_item(item)}"
+            for index, (_, item) in enumerate(pack)
+        )
+
+        for attempt in range(AI_SCORING_MAX_RETRIES):
+            try:
+                response = await self.client().chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": task.system_prompt},
+                        {"role": "user", "content": user_content}
+                    ],
+                    temperature=task.temperature,
+                    max_tokens=task.max_tokens_per_item * len(pack) + 50,
+                    response_format={"type": "json_object"}
+                )
+                break
+            except RETRYABLE_ERRORS as e:
+                if attempt == AI_SCORING_MAX_RETRIES - 1:
+                    raise
+                delay = min(10, 2 ** (attempt + 1))
+                logger.warning(f"OpenAI request failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+        data = json.loads(response.choices[0].message.content)
+        entries = data.get("results") if isinstance(data, dict) else None
+
+        if entries is None and isinstance(data, dict) and len(pack) == 1:
+            # Model answered a single post without the wrapper
+            return {"0": data}
+
+        return {
+            str(entry.get("id")): entry
+            for entry in entries or []
+            if isinstance(entry, dict)
+        }
+
+
+_scoring_service: Optional[AIScoringService] = None
+_scoring_service_lock = threading.Lock()
+
+
+def get_scoring_service() -> AIScoringService:
+    """Get or create the process-wide scoring service (raises if OPENAI_API_KEY is unset)"""
+    global _scoring_service
+    with _scoring_service_lock:
+        if _scoring_service is None:
+            _scoring_service = AIScoringService()
+        return _scoring_service
@@ -2,12 +2,15 @@
 Supabase configuration and helper functions
 """
 import os
+import logging
 from typing import Optional
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class SupabaseClient:
     """Singleton Supabase client"""
     
@@ -50,3 +53,18 @@ class Tables:
     ENGAGEMENT_TRACKING = "engagement_tracking"
     CALCULATOR_SUBMISSIONS = "calculator_submissions"
     ERROR_LOGS = "error_logs"
+
+
+def call_rpc(name: str, params: Optional[dict] = None):
+    """
+    Call a Postgres function through PostgREST
+    
+    Returns the function's data, or None if the call failed (e.g. the
+    migration defining it has not been applied yet) so callers can fall
+    back to client-side aggregation.
+    """
+    try:
+        return get_supabase().rpc(name, params or {}).execute().data
+    except Exception as e:
+        logger.warning(f"RPC {name} unavailable, falling back: {str(e)}")
+        return None
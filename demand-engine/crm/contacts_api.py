@@ -5,17 +5,30 @@ Manage contacts and company information
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+import base64
+import json
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.supabase_config import get_supabase
+from utils.response_cache import ttl_cache
 
 router = APIRouter(prefix="/api/crm/contacts", tags=["CRM - Contacts"])
 
+# Unified contacts + business_contacts (database/migrations/019_unified_contacts_view.sql)
+CONTACTS_VIEW = "crm_contacts_unified"
+CONTACT_LIST_COLUMNS = (
+    "uid, id, first_name, last_name, email, phone, mobile, company_name, job_title, "
+    "address, city, state, zip_code, website, lead_id, is_primary, email_subscribed, "
+    "sms_subscribed, tags, notes, created_at, source, signal_id"
+)
+# Totals are planner estimates, refreshed at most this often per filter set
+CONTACTS_COUNT_TTL = float(os.getenv("CONTACTS_COUNT_TTL", "60"))
+
 # Models
 class ContactCreate(BaseModel):
     first_name: Optional[str] = None
@@ -69,38 +82,143 @@ class ContactUpdate(BaseModel):
 async def get_contacts(
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     company: Optional[str] = None,
     email_subscribed: Optional[bool] = None
 ):
-    """Get all contacts with filtering from both contacts and business_contacts tables"""
+    """
+    Get all contacts with filtering from both contacts and business_contacts tables
+    
+    Pages newest first. Pass the returned next_cursor back as `cursor` to get
+    the following page (keyset, constant cost at any depth); `offset` is kept
+    for older clients. `total` is an estimate, cached briefly per filter set.
+    """
     try:
         supabase = get_supabase()
-        all_contacts = []
-        total_count = 0
         
-        # Try to get from contacts table first
         try:
-            query = supabase.table("contacts").select("*")
-            
-            if search:
-                query = query.or_(f"first_name.ilike.%{search}%,last_name.ilike.%{search}%,email.ilike.%{search}%,company_name.ilike.%{search}%")
-            
-            if company:
-                query = query.ilike("company_name", f"%{company}%")
-            
-            if email_subscribed is not None:
-                query = query.eq("email_subscribed", email_subscribed)
+            query = _filtered_contacts(
+                supabase.table(CONTACTS_VIEW).select(CONTACT_LIST_COLUMNS),
+                search, company, email_subscribed
+            )
             
-            response = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-            all_contacts.extend(response.data or [])
+            if cursor:
+                after_created_at, after_uid = _decode_cursor(cursor)
+                query = query.or_(
+                    f'created_at.lt."{after_created_at}",'
+                    f'and(created_at.eq."{after_created_at}",uid.lt."{after_uid}")'
+                )
+                query = query.order("created_at", desc=True).order("uid", desc=True).limit(limit)
+            else:
+                query = query.order("created_at", desc=True).order("uid", desc=True).range(offset, offset + limit - 1)
             
-            count_response = supabase.table("contacts").select("id", count="exact").execute()
-            total_count += count_response.count or 0
+            contacts = query.execute().data or []
+        except HTTPException:
+            raise
         except Exception as e:
-            print(f"Error fetching from contacts table: {e}")
+            # View not migrated yet
+            print(f"Error fetching from {CONTACTS_VIEW}, merging tables: {e}")
+            contacts = _fetch_contacts_merged(supabase, limit, offset, search, company, email_subscribed)
+        
+        next_cursor = None
+        if len(contacts) == limit and contacts[-1].get("uid"):
+            next_cursor = _encode_cursor(contacts[-1]["created_at"], contacts[-1]["uid"])
+        
+        return {
+            "contacts": contacts,
+            "total": _estimate_contacts_total(search, company, email_subscribed),
+            "total_is_estimate": True,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor
+        }
         
-        # Also get from business_contacts table
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _filtered_contacts(query, search: Optional[str], company: Optional[str], email_subscribed: Optional[bool]):
+    """Apply the list filters to a query on the unified contacts view"""
+    if search:
+        query = query.or_(f"first_name.ilike.%{search}%,last_name.ilike.%{search}%,email.ilike.%{search}%,company_name.ilike.%{search}%,phone.ilike.%{search}%")
+    
+    if company:
+        query = query.ilike("company_name", f"%{company}%")
+    
+    if email_subscribed is not None:
+        query = query.eq("email_subscribed", email_subscribed)
+    
+    return query
+
+
+def _encode_cursor(created_at: str, uid: str) -> str:
+    raw = json.dumps([created_at, uid]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        created_at, uid = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(created_at), str(uid)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@ttl_cache(ttl=CONTACTS_COUNT_TTL)
+def _estimate_contacts_total(search: Optional[str], company: Optional[str], email_subscribed: Optional[bool]) -> int:
+    """Planner-estimated total for a filter set (exact for small results)"""
+    supabase = get_supabase()
+    
+    try:
+        query = _filtered_contacts(
+            supabase.table(CONTACTS_VIEW).select("uid", count="estimated"),
+            search, company, email_subscribed
+        )
+        return query.limit(1).execute().count or 0
+    except Exception as e:
+        print(f"Error estimating from {CONTACTS_VIEW}, counting tables: {e}")
+    
+    total = 0
+    for table in ("contacts", "business_contacts"):
+        try:
+            total += supabase.table(table).select("id", count="estimated").limit(1).execute().count or 0
+        except Exception as e:
+            print(f"Error counting {table}: {e}")
+    return total
+
+
+def _fetch_contacts_merged(
+    supabase,
+    limit: int,
+    offset: int,
+    search: Optional[str],
+    company: Optional[str],
+    email_subscribed: Optional[bool]
+) -> list:
+    """Merge contacts and business_contacts in Python (before the view exists)"""
+    all_contacts = []
+    
+    try:
+        query = supabase.table("contacts").select("*").is_("deleted_at", None)
+        
+        if search:
+            query = query.or_(f"first_name.ilike.%{search}%,last_name.ilike.%{search}%,email.ilike.%{search}%,company_name.ilike.%{search}%")
+        
+        if company:
+            query = query.ilike("company_name", f"%{company}%")
+        
+        if email_subscribed is not None:
+            query = query.eq("email_subscribed", email_subscribed)
+        
+        response = query.order("created_at", desc=True).range(0, offset + limit - 1).execute()
+        all_contacts.extend(response.data or [])
+    except Exception as e:
+        print(f"Error fetching from contacts table: {e}")
+    
+    if email_subscribed is None:
         try:
             query = supabase.table("business_contacts").select("*")
             
@@ -110,7 +228,7 @@ async def get_contacts(
             if company:
                 query = query.ilike("business_name", f"%{company}%")
             
-            response = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+            response = query.order("created_at", desc=True).range(0, offset + limit - 1).execute()
             
             # Transform business_contacts to match contacts format
             for bc in response.data or []:
@@ -131,24 +249,12 @@ async def get_contacts(
                     "signal_id": bc.get("signal_id"),
                     "notes": bc.get("notes")
                 })
-            
-            count_response = supabase.table("business_contacts").select("id", count="exact").execute()
-            total_count += count_response.count or 0
         except Exception as e:
             print(f"Error fetching from business_contacts table: {e}")
-        
-        # Sort by created_at and apply pagination
-        all_contacts.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        return {
-            "contacts": all_contacts[:limit],
-            "total": total_count,
-            "limit": limit,
-            "offset": offset
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Sort by created_at and apply pagination
+    all_contacts.sort(key=lambda x: x.get("created_at") or "", reverse=True)
+    return all_contacts[offset:offset + limit]
 
 
 @router.get("/{contact_id}")
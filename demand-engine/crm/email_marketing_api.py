@@ -9,12 +9,15 @@ from typing import List, Optional
 from datetime import datetime
 import sys
 import os
-import httpx
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.supabase_config import get_supabase
 from email_service.resend_client import ResendEmailClient
+from email_service.campaign_engine import CampaignSendEngine
+
+# Rows per campaign_recipients insert when queueing a campaign
+RECIPIENT_INSERT_CHUNK = int(os.getenv("CAMPAIGN_RECIPIENT_INSERT_CHUNK", "1000"))
 
 router = APIRouter(prefix="/api/crm/email-marketing", tags=["CRM - Email Marketing"])
 
@@ -273,7 +276,7 @@ async def send_campaign(
             return {
                 "success": True,
                 "message": "Test email sent",
-                "email_id": result.get("email_id")
+                "email_id": result.get("id")
             }
         
         # Get recipients based on target segment
@@ -297,26 +300,37 @@ async def send_campaign(
             "recipient_count": len(recipients)
         }).eq("id", campaign_id).execute()
         
-        # Create recipient records
-        recipient_records = []
-        for recipient in recipients:
-            recipient_records.append({
-                "campaign_id": campaign_id,
-                "contact_id": recipient["id"],
-                "lead_id": recipient.get("lead_id"),
-                "email": recipient["email"],
-                "status": "pending"
-            })
+        # Create recipient records (ids are needed for bulk status writes)
+        contacts_by_id = {recipient["id"]: recipient for recipient in recipients}
+        send_list = []
         
-        if recipient_records:
-            supabase.table("campaign_recipients").insert(recipient_records).execute()
+        for i in range(0, len(recipients), RECIPIENT_INSERT_CHUNK):
+            recipient_records = [
+                {
+                    "campaign_id": campaign_id,
+                    "contact_id": recipient["id"],
+                    "lead_id": recipient.get("lead_id"),
+                    "email": recipient["email"],
+                    "status": "pending"
+                }
+                for recipient in recipients[i:i + RECIPIENT_INSERT_CHUNK]
+            ]
+            inserted = supabase.table("campaign_recipients").insert(recipient_records).execute()
+            
+            for record in inserted.data or []:
+                contact = contacts_by_id.get(record.get("contact_id"), {})
+                send_list.append({
+                    **record,
+                    "first_name": contact.get("first_name"),
+                    "last_name": contact.get("last_name")
+                })
         
         # Send emails in background
         background_tasks.add_task(
             send_campaign_emails,
             campaign_id,
             campaign,
-            recipients
+            send_list
         )
         
         return {
@@ -331,80 +345,20 @@ async def send_campaign(
 
 async def send_campaign_emails(campaign_id: str, campaign: dict, recipients: List[dict]):
     """Background task to send campaign emails"""
+    supabase = get_supabase()
+    
     try:
-        supabase = get_supabase()
-        email_client = ResendEmailClient()
-        
-        sent_count = 0
-        failed_count = 0
-        
-        for recipient in recipients:
-            try:
-                # Personalize content
-                html_content = campaign.get("html_content", "")
-                text_content = campaign.get("text_content", "")
-                subject = campaign.get("subject", "")
-                
-                # Replace variables
-                replacements = {
-                    "{{first_name}}": recipient.get("first_name", ""),
-                    "{{last_name}}": recipient.get("last_name", ""),
-                    "{{email}}": recipient.get("email", "")
-                }
-                
-                for key, value in replacements.items():
-                    html_content = html_content.replace(key, value)
-                    text_content = text_content.replace(key, value) if text_content else None
-                    subject = subject.replace(key, value)
-                
-                # Send email
-                result = await email_client.send_email(
-                    to_email=recipient["email"],
-                    subject=subject,
-                    html_content=html_content,
-                    text_content=text_content
-                )
-                
-                # Update recipient status
-                supabase.table("campaign_recipients").update({
-                    "status": "sent",
-                    "resend_email_id": result.get("email_id"),
-                    "sent_at": datetime.now().isoformat()
-                }).eq("campaign_id", campaign_id).eq("contact_id", recipient["id"]).execute()
-                
-                # Create activity
-                supabase.table("activities").insert({
-                    "lead_id": recipient.get("lead_id"),
-                    "contact_id": recipient["id"],
-                    "activity_type": "email",
-                    "subject": subject,
-                    "description": f"Campaign email sent: {campaign['name']}",
-                    "direction": "outbound",
-                    "email_id": result.get("email_id"),
-                    "email_status": "sent"
-                }).execute()
-                
-                sent_count += 1
-                
-            except Exception as e:
-                print(f"Failed to send to {recipient['email']}: {str(e)}")
-                
-                # Update recipient with error
-                supabase.table("campaign_recipients").update({
-                    "status": "failed",
-                    "error_message": str(e)
-                }).eq("campaign_id", campaign_id).eq("contact_id", recipient["id"]).execute()
-                
-                failed_count += 1
+        engine = CampaignSendEngine()
+        totals = await engine.send(campaign_id, campaign, recipients)
         
         # Update campaign final stats
         supabase.table("email_campaigns").update({
             "status": "sent",
-            "total_sent": sent_count,
+            "total_sent": totals["sent"],
             "sent_at": datetime.now().isoformat()
         }).eq("id", campaign_id).execute()
         
-        print(f"Campaign {campaign_id} complete: {sent_count} sent, {failed_count} failed")
+        print(f"Campaign {campaign_id} complete: {totals['sent']} sent, {totals['failed']} failed, {totals['unknown']} unknown")
         
     except Exception as e:
         print(f"Campaign sending error: {str(e)}")
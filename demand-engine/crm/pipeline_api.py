@@ -11,10 +11,23 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.supabase_config import get_supabase
+from config.supabase_config import get_supabase, call_rpc
 
 router = APIRouter(prefix="/api/crm/pipeline", tags=["CRM - Pipeline"])
 
+# Board columns, keyed by the status value leads/signals carry
+BOARD_STAGES = {
+    "new": {"name": "New", "color": "#3B82F6", "position": 1},
+    "contacted": {"name": "Contacted", "color": "#F59E0B", "position": 2},
+    "qualified": {"name": "Qualified", "color": "#8B5CF6", "position": 3},
+    "proposal": {"name": "Proposal", "color": "#EC4899", "position": 4},
+    "negotiation": {"name": "Negotiation", "color": "#F97316", "position": 5},
+    "won": {"name": "Won", "color": "#10B981", "position": 6},
+    "lost": {"name": "Lost", "color": "#EF4444", "position": 7}
+}
+
+SIGNAL_BOARD_COLUMNS = "id, business_name, email, phone, pain_score, status, city, state, source, created_at"
+
 # Models
 class StageUpdate(BaseModel):
     name: Optional[str] = None
@@ -59,27 +72,15 @@ async def get_pipeline_stages():
 @router.get("/view")
 async def get_pipeline_view(
     stage: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    limit_per_stage: Optional[int] = None
 ):
     """Get pipeline view with leads grouped by stage - uses signals table as fallback"""
     try:
-        supabase = get_supabase()
-        
-        # Define default stages with colors
-        default_stages = {
-            "new": {"name": "New", "color": "#3B82F6", "position": 1},
-            "contacted": {"name": "Contacted", "color": "#F59E0B", "position": 2},
-            "qualified": {"name": "Qualified", "color": "#8B5CF6", "position": 3},
-            "proposal": {"name": "Proposal", "color": "#EC4899", "position": 4},
-            "negotiation": {"name": "Negotiation", "color": "#F97316", "position": 5},
-            "won": {"name": "Won", "color": "#10B981", "position": 6},
-            "lost": {"name": "Lost", "color": "#EF4444", "position": 7}
-        }
-        
         stages_data = {}
         
         # Initialize all stages
-        for key, stage_info in default_stages.items():
+        for stage_info in BOARD_STAGES.values():
             stages_data[stage_info["name"]] = {
                 "name": stage_info["name"],
                 "color": stage_info["color"],
@@ -87,55 +88,18 @@ async def get_pipeline_view(
                 "leads": []
             }
         
-        # Try to get from lead_pipeline_view first
-        try:
-            query = supabase.table("lead_pipeline_view").select("*")
-            if stage:
-                query = query.eq("stage_name", stage)
-            if search:
-                query = query.or_(f"business_name.ilike.%{search}%,contact_name.ilike.%{search}%,email.ilike.%{search}%")
-            
-            response = query.order("stage_position").order("lead_score", desc=True).execute()
-            
-            for lead in response.data or []:
-                stage_name = lead.get("stage_name") or "New"
-                if stage_name in stages_data:
-                    stages_data[stage_name]["leads"].append(lead)
-        except Exception as e:
-            print(f"lead_pipeline_view not found, using signals: {e}")
+        # Grouped in Postgres (database/migrations/018_pipeline_funnel_rpc.sql)
+        board = call_rpc("get_pipeline_board", {
+            "p_stage": stage,
+            "p_search": search,
+            "p_limit_per_stage": limit_per_stage
+        })
+        if board is None:
+            board = _fetch_pipeline_board(stage, search, limit_per_stage)
         
-        # Also get from signals table as leads
-        try:
-            query = supabase.table("signals").select("*")
-            if search:
-                query = query.or_(f"business_name.ilike.%{search}%,phone.ilike.%{search}%")
-            
-            response = query.order("created_at", desc=True).execute()
-            
-            for signal in response.data or []:
-                # Map signal status to pipeline stage
-                status = signal.get("status", "new")
-                stage_name = default_stages.get(status, default_stages["new"])["name"]
-                
-                if stage and stage != stage_name:
-                    continue
-                
-                lead = {
-                    "id": signal.get("id"),
-                    "business_name": signal.get("business_name"),
-                    "contact_name": signal.get("business_name"),
-                    "email": signal.get("email"),
-                    "phone": signal.get("phone"),
-                    "lead_score": signal.get("pain_score", 0),
-                    "stage_name": stage_name,
-                    "city": signal.get("city"),
-                    "state": signal.get("state"),
-                    "source": signal.get("source"),
-                    "created_at": signal.get("created_at")
-                }
-                stages_data[stage_name]["leads"].append(lead)
-        except Exception as e:
-            print(f"Error fetching signals for pipeline: {e}")
+        for stage_name, leads in board.items():
+            if stage_name in stages_data:
+                stages_data[stage_name]["leads"] = leads
         
         # Convert to list and sort by position
         pipeline = list(stages_data.values())
@@ -147,6 +111,68 @@ async def get_pipeline_view(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _fetch_pipeline_board(
+    stage: Optional[str],
+    search: Optional[str],
+    limit_per_stage: Optional[int]
+) -> dict:
+    """Client-side board grouping, used when the board RPC is unavailable"""
+    supabase = get_supabase()
+    board = {}
+    
+    # Try to get from lead_pipeline_view first
+    try:
+        query = supabase.table("lead_pipeline_view").select("*")
+        if stage:
+            query = query.eq("stage_name", stage)
+        if search:
+            query = query.or_(f"business_name.ilike.%{search}%,contact_name.ilike.%{search}%,email.ilike.%{search}%")
+        
+        response = query.order("stage_position").order("lead_score", desc=True).execute()
+        
+        for lead in response.data or []:
+            board.setdefault(lead.get("stage_name") or "New", []).append(lead)
+    except Exception as e:
+        print(f"lead_pipeline_view not found, using signals: {e}")
+    
+    # Also get from signals table as leads
+    try:
+        query = supabase.table("signals").select(SIGNAL_BOARD_COLUMNS)
+        if search:
+            query = query.or_(f"business_name.ilike.%{search}%,phone.ilike.%{search}%")
+        
+        response = query.order("created_at", desc=True).execute()
+        
+        for signal in response.data or []:
+            # Map signal status to pipeline stage
+            status = signal.get("status", "new")
+            stage_name = BOARD_STAGES.get(status, BOARD_STAGES["new"])["name"]
+            
+            if stage and stage != stage_name:
+                continue
+            
+            board.setdefault(stage_name, []).append({
+                "id": signal.get("id"),
+                "business_name": signal.get("business_name"),
+                "contact_name": signal.get("business_name"),
+                "email": signal.get("email"),
+                "phone": signal.get("phone"),
+                "lead_score": signal.get("pain_score", 0),
+                "stage_name": stage_name,
+                "city": signal.get("city"),
+                "state": signal.get("state"),
+                "source": signal.get("source"),
+                "created_at": signal.get("created_at")
+            })
+    except Exception as e:
+        print(f"Error fetching signals for pipeline: {e}")
+    
+    if limit_per_stage is not None:
+        board = {name: leads[:limit_per_stage] for name, leads in board.items()}
+    
+    return board
+
+
 @router.post("/leads/{lead_id}/move")
 async def move_lead_to_stage(lead_id: str, update: LeadStageUpdate):
     """Move lead to different stage"""
@@ -183,6 +209,11 @@ async def move_lead_to_stage(lead_id: str, update: LeadStageUpdate):
 async def get_pipeline_stats():
     """Get pipeline statistics"""
     try:
+        # Grouped in Postgres (database/migrations/018_pipeline_funnel_rpc.sql)
+        stats = call_rpc("get_pipeline_stats")
+        if stats is not None:
+            return stats
+        
         supabase = get_supabase()
         
         # Get leads by stage
@@ -240,17 +271,23 @@ async def update_stage(stage_id: str, update: StageUpdate):
 async def get_conversion_funnel():
     """Get conversion funnel data"""
     try:
+        # Single grouped query in Postgres (database/migrations/018_pipeline_funnel_rpc.sql)
+        funnel = call_rpc("get_conversion_funnel")
+        if funnel is not None:
+            return funnel
+        
         supabase = get_supabase()
         
         # Get all stages in order
-        stages_response = supabase.table("pipeline_stages").select("*").eq("is_active", True).order("position").execute()
+        stages_response = supabase.table("pipeline_stages").select("name, color, position").eq("is_active", True).order("position").execute()
         
         funnel = []
         
         for stage in stages_response.data or []:
-            # Count leads in this stage
             status = stage["name"].lower().replace(" ", "_")
-            count_response = supabase.table("leads").select("id", count="exact").eq("status", status).execute()
+            
+            # Exact count per stage; selecting rows would stop at PostgREST's max-rows cap
+            count_response = supabase.table("leads").select("id", count="exact").eq("status", status).limit(1).execute()
             
             funnel.append({
                 "stage": stage["name"],
@@ -0,0 +1,205 @@
+"""
+Campaign Send Engine
+Sends marketing campaigns through Resend's batch API with bounded
+concurrency, writing recipient statuses and activities in bulk
+"""
+
+import os
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from config.supabase_config import get_supabase
+from email_service.resend_client import ResendEmailClient, RESEND_BATCH_LIMIT
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_SEND_BATCH_SIZE = min(int(os.getenv("CAMPAIGN_SEND_BATCH_SIZE", str(RESEND_BATCH_LIMIT))), RESEND_BATCH_LIMIT)
+CAMPAIGN_SEND_CONCURRENCY = int(os.getenv("CAMPAIGN_SEND_CONCURRENCY", "4"))
+
+# Batch responses that mean Resend validated and rejected the whole batch
+# before sending anything, so individual retries can't duplicate emails
+BATCH_REJECTED_STATUSES = {400, 422}
+
+
+def personalize(text: Optional[str], recipient: Dict[str, Any]) -> Optional[str]:
+    """Replace {{first_name}}, {{last_name}} and {{email}} placeholders"""
+    if not text:
+        return text
+
+    replacements = {
+        "{{first_name}}": recipient.get("first_name") or "",
+        "{{last_name}}": recipient.get("last_name") or "",
+        "{{email}}": recipient.get("email") or ""
+    }
+
+    for key, value in replacements.items():
+        text = text.replace(key, value)
+
+    return text
+
+
+class CampaignSendEngine:
+    """
+    Send one campaign to many recipients
+
+    Recipients are split into Resend batches (up to 100 per API call) sent
+    by a bounded number of concurrent workers over the shared HTTP client.
+    Each finished batch is recorded with one campaign_recipients upsert and
+    one activities insert. If Resend rejects a whole batch as invalid, that
+    batch is retried one email at a time so only the bad addresses fail.
+    Any other failure may have happened after Resend accepted the batch
+    (timeouts, 5xx, an unexpected response), so those recipients are marked
+    "unknown" rather than resent. Batches carry an Idempotency-Key, so a
+    request Resend already accepted is never delivered twice.
+    """
+
+    def __init__(
+        self,
+        email_client: Optional[ResendEmailClient] = None,
+        batch_size: int = CAMPAIGN_SEND_BATCH_SIZE,
+        max_concurrency: int = CAMPAIGN_SEND_CONCURRENCY
+    ):
+        self.email_client = email_client or ResendEmailClient()
+        self.batch_size = max(1, min(batch_size, RESEND_BATCH_LIMIT))
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def send(self, campaign_id: str, campaign: dict, recipients: List[dict]) -> Dict[str, int]:
+        """
+        Send a campaign
+
+        Args:
+            campaign_id: Campaign ID
+            campaign: Campaign row (subject, html_content, text_content, name)
+            recipients: campaign_recipients rows (id, contact_id, lead_id, email)
+                merged with the contact's first_name/last_name
+
+        Returns:
+            {"sent": n, "failed": n, "unknown": n}
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [
+            recipients[i:i + self.batch_size]
+            for i in range(0, len(recipients), self.batch_size)
+        ]
+
+        async def run(batch: List[dict]) -> Dict[str, int]:
+            async with semaphore:
+                return await self._send_batch(campaign_id, campaign, batch)
+
+        totals = {"sent": 0, "failed": 0, "unknown": 0}
+        for counts in await asyncio.gather(*(run(batch) for batch in batches)):
+            for key in totals:
+                totals[key] += counts[key]
+
+        return totals
+
+    async def _send_batch(self, campaign_id: str, campaign: dict, batch: List[dict]) -> Dict[str, int]:
+        messages = [
+            self.email_client.build_payload(
+                to_email=recipient["email"],
+                subject=personalize(campaign.get("subject", ""), recipient),
+                html_content=personalize(campaign.get("html_content", ""), recipient),
+                text_content=personalize(campaign.get("text_content"), recipient)
+            )
+            for recipient in batch
+        ]
+
+        # Stable per batch, so a retried request for the same recipients is deduplicated
+        idempotency_key = "campaign-{}-{}".format(
+            campaign_id,
+            hashlib.sha256(",".join(str(recipient["id"]) for recipient in batch).encode()).hexdigest()[:32]
+        )
+
+        try:
+            sent = await self.email_client.send_batch(messages, idempotency_key=idempotency_key)
+            if len(sent) == len(batch):
+                outcomes = [("sent", item.get("id"), None) for item in sent]
+            else:
+                # Accepted, but the ids can't be matched to recipients
+                error = f"Resend returned {len(sent)} results for {len(batch)} emails"
+                logger.error(f"Batch for campaign {campaign_id}: {error}")
+                outcomes = [("unknown", None, error)] * len(batch)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in BATCH_REJECTED_STATUSES:
+                logger.warning(f"Batch rejected for campaign {campaign_id}, sending individually: {str(e)}")
+                outcomes = [await self._send_one(message) for message in messages]
+            else:
+                # Not accepted (auth, rate limit after retries) or server error
+                status = "unknown" if e.response.status_code >= 500 else "failed"
+                logger.error(f"Batch send failed for campaign {campaign_id}: {str(e)}")
+                outcomes = [(status, None, str(e))] * len(batch)
+        except Exception as e:
+            # Timeouts and dropped connections: the batch may have gone out
+            logger.error(f"Batch send for campaign {campaign_id} ended ambiguously: {str(e)}")
+            outcomes = [("unknown", None, str(e))] * len(batch)
+
+        await asyncio.to_thread(self._record_batch, campaign_id, campaign, batch, messages, outcomes)
+
+        return {
+            key: sum(1 for status, _, _ in outcomes if status == key)
+            for key in ("sent", "failed", "unknown")
+        }
+
+    async def _send_one(self, message: dict):
+        try:
+            result = await self.email_client.send_email(
+                to_email=message["to"][0],
+                subject=message["subject"],
+                html_content=message["html"],
+                text_content=message.get("text")
+            )
+            return "sent", result.get("id"), None
+        except Exception as e:
+            return "failed", None, str(e)
+
+    def _record_batch(self, campaign_id: str, campaign: dict, batch: List[dict], messages: List[dict], outcomes: list):
+        """Write a batch's recipient statuses and activities in two requests"""
+        supabase = get_supabase()
+        sent_at = datetime.now().isoformat()
+
+        recipient_rows = []
+        activities = []
+
+        for recipient, message, (status, email_id, error) in zip(batch, messages, outcomes):
+            row = {
+                "id": recipient["id"],
+                "campaign_id": campaign_id,
+                "contact_id": recipient.get("contact_id"),
+                "lead_id": recipient.get("lead_id"),
+                "email": recipient["email"]
+            }
+
+            # Every row carries the same keys so PostgREST accepts the bulk upsert
+            if status != "sent":
+                logger.warning(f"Email to {recipient['email']} {status}: {error}")
+                row.update({"status": status, "resend_email_id": None, "sent_at": None, "error_message": error})
+            else:
+                row.update({"status": "sent", "resend_email_id": email_id, "sent_at": sent_at, "error_message": None})
+                activities.append({
+                    "lead_id": recipient.get("lead_id"),
+                    "contact_id": recipient.get("contact_id"),
+                    "activity_type": "email",
+                    "subject": message["subject"],
+                    "description": f"Campaign email sent: {campaign.get('name')}",
+                    "direction": "outbound",
+                    "email_id": email_id,
+                    "email_status": "sent"
+                })
+
+            recipient_rows.append(row)
+
+        try:
+            supabase.table("campaign_recipients").upsert(recipient_rows, on_conflict="id").execute()
+        except Exception as e:
+            logger.error(f"Error recording recipient statuses for campaign {campaign_id}: {str(e)}")
+
+        if activities:
+            try:
+                supabase.table("activities").insert(activities).execute()
+            except Exception as e:
+                logger.error(f"Error logging campaign activities for campaign {campaign_id}: {str(e)}")
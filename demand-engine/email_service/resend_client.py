@@ -4,12 +4,34 @@ Sends ROI calculator results and PDF reports to leads
 """
 
 import os
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Resend accepts at most this many emails per /emails/batch call
+RESEND_BATCH_LIMIT = 100
+RESEND_MAX_RETRIES = int(os.getenv("RESEND_MAX_RETRIES", "3"))
+
+# Shared pooled client, one per event loop
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared Resend HTTP client (keep-alive connection pool)"""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        _http_client_loop = loop
+    return _http_client
+
 
 class ResendEmailClient:
     """Client for sending emails via Resend API"""
@@ -27,7 +49,8 @@ class ResendEmailClient:
         to_email: str,
         subject: str,
         html_content: str,
-        attachments: Optional[list] = None
+        attachments: Optional[list] = None,
+        text_content: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Send email via Resend API
@@ -37,18 +60,66 @@ class ResendEmailClient:
             subject: Email subject
             html_content: HTML email body
             attachments: Optional list of attachments
+            text_content: Optional plain-text body
             
         Returns:
             Response from Resend API
         """
-        if not self.api_key:
-            raise ValueError("RESEND_API_KEY not configured")
+        payload = self.build_payload(to_email, subject, html_content, text_content)
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        if attachments:
+            payload["attachments"] = attachments
+        
+        try:
+            result = await self._post("/emails", payload)
+            logger.info(f"Email sent successfully to {to_email}: {result.get('id')}")
+            return result
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Resend API error: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send email: {str(e)}")
+            raise
+    
+    async def send_batch(
+        self,
+        emails: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send up to RESEND_BATCH_LIMIT emails in one Resend API call
+        
+        Args:
+            emails: Payloads from build_payload (no attachments)
+            idempotency_key: Sent as Idempotency-Key so a repeated request
+                for the same batch isn't delivered twice
+            
+        Returns:
+            One {"id": ...} per email, in order
+        """
+        if len(emails) > RESEND_BATCH_LIMIT:
+            raise ValueError(f"Resend batch limit is {RESEND_BATCH_LIMIT} emails")
         
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        
+        try:
+            result = await self._post("/emails/batch", emails, headers)
+            logger.info(f"Batch of {len(emails)} emails sent")
+            return result.get("data", [])
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Resend batch API error: {e.response.status_code} - {e.response.text}")
+            raise
+    
+    def build_payload(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a Resend email payload"""
         payload = {
             "from": self.from_email,
             "to": [to_email],
@@ -56,30 +127,38 @@ class ResendEmailClient:
             "html": html_content
         }
         
-        if attachments:
-            payload["attachments"] = attachments
+        if text_content:
+            payload["text"] = text_content
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/emails",
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                logger.info(f"Email sent successfully to {to_email}: {result.get('id')}")
-                return result
-                
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Resend API error: {e.response.status_code} - {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(f"Failed to send email: {str(e)}")
-                raise
+        return payload
+    
+    async def _post(self, path: str, payload: Any, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """POST to Resend on the shared client, backing off on rate limits"""
+        if not self.api_key:
+            raise ValueError("RESEND_API_KEY not configured")
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            **(extra_headers or {})
+        }
+        
+        client = get_http_client()
+        
+        for attempt in range(RESEND_MAX_RETRIES + 1):
+            response = await client.post(f"{self.base_url}{path}", json=payload, headers=headers)
+            
+            if response.status_code == 429 and attempt < RESEND_MAX_RETRIES:
+                try:
+                    delay = float(response.headers.get("retry-after", ""))
+                except ValueError:
+                    delay = 2 ** attempt
+                logger.warning(f"Resend rate limited, retrying in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            response.raise_for_status()
+            return response.json()
     
     async def send_roi_report_email(
         self,
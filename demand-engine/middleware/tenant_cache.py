@@ -0,0 +1,192 @@
+"""
+Tenant Resolution Cache
+Caches tenant lookups (by phone, subdomain, slug) so inbound webhooks and
+tenant-scoped requests don't hit the database for the same few tenants
+
+Two tiers:
+- In-process TTL cache (always on)
+- Redis (optional, shared across instances) if REDIS_URL is set and the
+  redis package is installed
+
+Misses are cached too (negative caching) with a shorter TTL. Admin tenant
+APIs call invalidate_tenant() on create/update/delete; the shared tier is
+cleared immediately, other instances' local copies expire within
+TENANT_LOCAL_CACHE_TTL.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Try to import Redis, but make it optional
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Configuration
+REDIS_URL = os.getenv("REDIS_URL")
+TENANT_CACHE_TTL = int(os.getenv("TENANT_CACHE_TTL", "300"))
+TENANT_LOCAL_CACHE_TTL = int(os.getenv("TENANT_LOCAL_CACHE_TTL", "60"))
+TENANT_NEGATIVE_CACHE_TTL = int(os.getenv("TENANT_NEGATIVE_CACHE_TTL", "30"))
+TENANT_CACHE_MAX_ENTRIES = int(os.getenv("TENANT_CACHE_MAX_ENTRIES", "1024"))
+TENANT_REDIS_PREFIX = "tenant_resolve:"
+
+# Stored for "no such tenant"
+_MISS = "__miss__"
+
+
+class TenantCache:
+    """
+    Two-tier cache of resolved tenant dicts
+
+    Keys are (kind, value), e.g. ("phone", "+15551234567").
+    get() returns (hit, tenant); tenant is None for a cached miss.
+    """
+
+    def __init__(self, redis_url: Optional[str] = REDIS_URL):
+        self._local: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.redis_client = None
+
+        if REDIS_AVAILABLE and redis_url:
+            try:
+                self.redis_client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                )
+                self.redis_client.ping()
+                logger.info("Tenant cache using Redis")
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for tenant cache ({e}), using in-process cache only")
+                self.redis_client = None
+
+    @staticmethod
+    def _key(kind: str, value: str) -> str:
+        return f"{kind}:{value}"
+
+    def get(self, kind: str, value: str) -> Tuple[bool, Optional[dict]]:
+        key = self._key(kind, value)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, stored = entry
+                if now < expires_at:
+                    return True, None if stored == _MISS else stored
+                del self._local[key]
+
+        if self.redis_client:
+            try:
+                raw = self.redis_client.get(TENANT_REDIS_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Tenant cache Redis read failed: {e}")
+                raw = None
+            if raw is not None:
+                stored = _MISS if raw == _MISS else json.loads(raw)
+                self._set_local(key, stored, now)
+                return True, None if stored == _MISS else stored
+
+        return False, None
+
+    def set(self, kind: str, value: str, tenant: Optional[dict]) -> None:
+        key = self._key(kind, value)
+        stored = tenant if tenant is not None else _MISS
+        self._set_local(key, stored, time.monotonic())
+
+        if self.redis_client:
+            ttl = TENANT_CACHE_TTL if tenant is not None else TENANT_NEGATIVE_CACHE_TTL
+            raw = _MISS if tenant is None else json.dumps(tenant, default=str)
+            try:
+                self.redis_client.set(TENANT_REDIS_PREFIX + key, raw, ex=ttl)
+            except Exception as e:
+                logger.warning(f"Tenant cache Redis write failed: {e}")
+
+    def _set_local(self, key: str, stored: Any, now: float) -> None:
+        ttl = TENANT_LOCAL_CACHE_TTL if stored != _MISS else min(TENANT_LOCAL_CACHE_TTL, TENANT_NEGATIVE_CACHE_TTL)
+        with self._lock:
+            if key not in self._local and len(self._local) >= TENANT_CACHE_MAX_ENTRIES:
+                for stale in [k for k, (exp, _) in self._local.items() if exp <= now]:
+                    del self._local[stale]
+                while len(self._local) >= TENANT_CACHE_MAX_ENTRIES:
+                    del self._local[next(iter(self._local))]
+            self._local[key] = (now + ttl, stored)
+
+    def delete(self, kind: str, value: str) -> None:
+        key = self._key(kind, value)
+        with self._lock:
+            self._local.pop(key, None)
+
+        if self.redis_client:
+            try:
+                self.redis_client.delete(TENANT_REDIS_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Tenant cache Redis delete failed: {e}")
+
+    def clear(self) -> None:
+        """Drop the in-process tier (e.g. in tests)"""
+        with self._lock:
+            self._local.clear()
+
+
+_tenant_cache: Optional[TenantCache] = None
+
+
+def get_tenant_cache() -> TenantCache:
+    """Get or create the process-wide tenant cache"""
+    global _tenant_cache
+    if _tenant_cache is None:
+        _tenant_cache = TenantCache()
+    return _tenant_cache
+
+
+# Lookup kind -> tenant field it is keyed on
+CACHED_LOOKUPS = (("phone", "twilio_phone_number"), ("subdomain", "subdomain"), ("slug", "slug"))
+
+
+def tenant_cache_keys(tenant: Any) -> Dict[str, Optional[str]]:
+    """
+    Snapshot of the fields a tenant is cached under
+
+    Take it before changing the record, then pass it to invalidate_tenant()
+    after committing so the old keys are cleared too.
+
+    Args:
+        tenant: Tenant ORM object or tenant dict
+    """
+    def field(name: str) -> Optional[str]:
+        value = tenant.get(name) if isinstance(tenant, dict) else getattr(tenant, name, None)
+        return str(value) if value else None
+
+    return {name: field(name) for _, name in CACHED_LOOKUPS}
+
+
+def invalidate_tenant(tenant: Any) -> None:
+    """
+    Drop every cached lookup that could resolve to or miss this tenant
+
+    Call after committing, with the new record and with the
+    tenant_cache_keys() snapshot of the old one, so both the old keys and
+    any negative entries for the new ones are cleared. Invalidating before
+    the commit lets a concurrent request re-cache the old row.
+
+    Args:
+        tenant: Tenant ORM object, tenant dict or tenant_cache_keys() snapshot
+    """
+    if tenant is None:
+        return
+
+    keys = tenant_cache_keys(tenant)
+    cache = get_tenant_cache()
+    for kind, name in CACHED_LOOKUPS:
+        if keys[name]:
+            cache.delete(kind, keys[name])
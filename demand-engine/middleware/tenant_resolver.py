@@ -11,6 +11,8 @@ from fastapi import Request, HTTPException
 from sqlalchemy.orm import Session
 import hashlib
 
+from middleware.tenant_cache import get_tenant_cache
+
 # Thread-safe tenant context
 _tenant_context: ContextVar[Optional[dict]] = ContextVar('tenant_context', default=None)
 
@@ -56,8 +58,13 @@ class TenantContext:
 def get_tenant_by_phone(phone: str, db: Session) -> Optional[dict]:
     """
     Resolve tenant by Twilio phone number
-    PRIMARY method for voice agent calls
+    PRIMARY method for voice agent calls (cached, including misses)
     """
+    cache = get_tenant_cache()
+    hit, tenant = cache.get("phone", phone)
+    if hit:
+        return tenant
+    
     try:
         from app.models.db_models import Tenant
         
@@ -67,26 +74,9 @@ def get_tenant_by_phone(phone: str, db: Session) -> Optional[dict]:
             Tenant.deleted_at == None
         ).first()
         
-        if tenant:
-            return {
-                'id': str(tenant.id),
-                'slug': tenant.slug,
-                'company_name': tenant.company_name,
-                'twilio_phone_number': tenant.twilio_phone_number,
-                'forward_to_number': tenant.forward_to_number,
-                'emergency_phone': tenant.emergency_phone,
-                'timezone': tenant.timezone,
-                'business_hours': tenant.business_hours,
-                'ai_model': tenant.ai_model,
-                'ai_voice': tenant.ai_voice,
-                'custom_system_prompt': tenant.custom_system_prompt,
-                'greeting_message': tenant.greeting_message,
-                'emergency_keywords': tenant.emergency_keywords,
-                'plan_tier': tenant.plan_tier,
-                'features': tenant.features
-            }
-        
-        return None
+        result = _voice_tenant_dict(tenant) if tenant else None
+        cache.set("phone", phone, result)
+        return result
     
     except Exception as e:
         print(f"Error resolving tenant by phone: {e}")
@@ -96,8 +86,13 @@ def get_tenant_by_phone(phone: str, db: Session) -> Optional[dict]:
 def get_tenant_by_subdomain(subdomain: str, db: Session) -> Optional[dict]:
     """
     Resolve tenant by subdomain
-    For dashboard access
+    For dashboard access (cached, including misses)
     """
+    cache = get_tenant_cache()
+    hit, tenant = cache.get("subdomain", subdomain)
+    if hit:
+        return tenant
+    
     try:
         from app.models.db_models import Tenant
         
@@ -107,15 +102,17 @@ def get_tenant_by_subdomain(subdomain: str, db: Session) -> Optional[dict]:
             Tenant.deleted_at == None
         ).first()
         
+        result = None
         if tenant:
-            return {
+            result = {
                 'id': str(tenant.id),
                 'slug': tenant.slug,
                 'company_name': tenant.company_name,
                 'plan_tier': tenant.plan_tier
             }
         
-        return None
+        cache.set("subdomain", subdomain, result)
+        return result
     
     except Exception as e:
         print(f"Error resolving tenant by subdomain: {e}")
@@ -266,6 +263,11 @@ def get_default_tenant(db: Session) -> Optional[dict]:
     Get default tenant (preserves existing functionality)
     This ensures voice agent keeps working even without multi-tenant setup
     """
+    cache = get_tenant_cache()
+    hit, tenant = cache.get("slug", "default")
+    if hit:
+        return tenant
+    
     try:
         from app.models.db_models import Tenant
         
@@ -273,27 +275,31 @@ def get_default_tenant(db: Session) -> Optional[dict]:
             Tenant.slug == 'default'
         ).first()
         
-        if tenant:
-            return {
-                'id': str(tenant.id),
-                'slug': tenant.slug,
-                'company_name': tenant.company_name,
-                'twilio_phone_number': tenant.twilio_phone_number,
-                'forward_to_number': tenant.forward_to_number,
-                'emergency_phone': tenant.emergency_phone,
-                'timezone': tenant.timezone,
-                'business_hours': tenant.business_hours,
-                'ai_model': tenant.ai_model,
-                'ai_voice': tenant.ai_voice,
-                'custom_system_prompt': tenant.custom_system_prompt,
-                'greeting_message': tenant.greeting_message,
-                'emergency_keywords': tenant.emergency_keywords,
-                'plan_tier': tenant.plan_tier,
-                'features': tenant.features
-            }
-        
-        return None
+        result = _voice_tenant_dict(tenant) if tenant else None
+        cache.set("slug", "default", result)
+        return result
     
     except Exception as e:
         print(f"Error getting default tenant: {e}")
         return None
+
+
+def _voice_tenant_dict(tenant) -> dict:
+    """Tenant fields the voice agent needs per call"""
+    return {
+        'id': str(tenant.id),
+        'slug': tenant.slug,
+        'company_name': tenant.company_name,
+        'twilio_phone_number': tenant.twilio_phone_number,
+        'forward_to_number': tenant.forward_to_number,
+        'emergency_phone': tenant.emergency_phone,
+        'timezone': tenant.timezone,
+        'business_hours': tenant.business_hours,
+        'ai_model': tenant.ai_model,
+        'ai_voice': tenant.ai_voice,
+        'custom_system_prompt': tenant.custom_system_prompt,
+        'greeting_message': tenant.greeting_message,
+        'emergency_keywords': tenant.emergency_keywords,
+        'plan_tier': tenant.plan_tier,
+        'features': tenant.features
+    }
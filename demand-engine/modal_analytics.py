@@ -35,6 +35,26 @@ image = (
     )
 )
 
+# Engine stage outputs shared across containers and report regenerations
+STAGE_CACHE_NAME = "kestrel-report-stage-cache"
+_orchestrator = None
+
+
+def get_orchestrator():
+    """Orchestrator reused across requests, backed by the shared stage cache"""
+    global _orchestrator
+    if _orchestrator is None:
+        from analytics.report_orchestrator import ReportOrchestrator
+        
+        try:
+            stage_cache = modal.Dict.from_name(STAGE_CACHE_NAME, create_if_missing=True)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Shared stage cache unavailable, using in-memory cache: {e}")
+            stage_cache = None
+        _orchestrator = ReportOrchestrator(stage_cache=stage_cache)
+    return _orchestrator
+
+
 # Request/Response models
 class ReportGenerationRequest(BaseModel):
     pilot_id: str
@@ -96,55 +116,25 @@ async def generate_report(request: ReportGenerationRequest):
         import sys
         sys.path.insert(0, '/root')
         
-        from analytics.report_orchestrator import ReportOrchestrator, PilotData
-        from datetime import datetime, timedelta
-        
         logging.basicConfig(level=logging.INFO)
         logger = logging.getLogger(__name__)
         
         logger.info(f"Generating report for pilot: {request.pilot_id}")
         
-        # Initialize orchestrator
-        orchestrator = ReportOrchestrator()
+        # Reuse the orchestrator so unchanged engine stages come from cache
+        orchestrator = get_orchestrator()
         
-        # Generate report using real data if requested
-        if request.use_real_data:
-            logger.info("Using real data from Supabase")
-            report = orchestrator.generate_report(pilot_id=request.pilot_id)
-        else:
-            # Use mock data
-            logger.info("Using mock data")
-            start_date = datetime.fromisoformat(request.start_date) if request.start_date else datetime.now() - timedelta(days=30)
-            end_date = datetime.fromisoformat(request.end_date) if request.end_date else datetime.now()
-            
-            pilot_data = PilotData(
-                pilot_id=request.pilot_id,
-                customer_name=request.customer_name,
-                start_date=start_date,
-                end_date=end_date,
-                total_calls=127,
-                calls_answered=127,
-                calls_with_transcripts=[
-                    {"call_id": "call_001", "transcript": "My AC stopped working, it's an emergency!"},
-                ],
-                call_events=[
-                    {
-                        "call_id": "call_001",
-                        "start_time": datetime.now(),
-                        "end_time": datetime.now() + timedelta(minutes=5),
-                        "duration_seconds": 300
-                    }
-                ],
-                bookings_created=34,
-                average_booking_delay_minutes=3.2,
-                latency_measurements=[
-                    {"metric_type": "answer_latency", "value_ms": 205, "call_id": "call_001", "time_of_day": 10},
-                ],
-                declared_capacity=3,
-                average_ticket_value=450,
-            )
-            
-            report = orchestrator.generate_report(pilot_data=pilot_data)
+        start_date = datetime.fromisoformat(request.start_date) if request.start_date else None
+        end_date = datetime.fromisoformat(request.end_date) if request.end_date else None
+        
+        logger.info("Using real data from Supabase" if request.use_real_data else "Using mock data")
+        report = orchestrator.generate_report(
+            pilot_id=request.pilot_id,
+            customer_name=request.customer_name,
+            start_date=start_date,
+            end_date=end_date,
+            use_real_data=request.use_real_data
+        )
         
         logger.info(f"Report generated successfully: {report.report_id}")
         
@@ -157,7 +147,7 @@ async def generate_report(request: ReportGenerationRequest):
         )
         
     except Exception as e:
-        logger.error(f"Error generating report: {str(e)}")
+        logging.getLogger(__name__).error(f"Error generating report: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate report: {str(e)}"
@@ -131,6 +131,51 @@ def run_daily_digest():
         }
 
 
+@app.function(
+    image=image,
+    secrets=[
+        modal.Secret.from_name("hvac-agent-secrets"),  # Consolidated secrets
+    ],
+    schedule=modal.Cron("15 * * * *"),  # Hourly
+    timeout=300,  # 5 minutes max
+)
+def run_weekly_analytics_rollup():
+    """
+    Refresh weekly_analytics for weeks with new calls, appointments or signals
+    Scheduled to run hourly
+    """
+    import sys
+    sys.path.insert(0, '/root')
+    
+    from config.supabase_config import get_supabase
+    from services.weekly_analytics import refresh_weekly_analytics
+    import logging
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    logger = logging.getLogger(__name__)
+    
+    try:
+        refreshed = refresh_weekly_analytics(get_supabase())
+        
+        return {
+            "success": True,
+            "timestamp": datetime.utcnow().isoformat(),
+            "rows_refreshed": refreshed
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Weekly analytics rollup failed: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+
 @app.local_entrypoint()
 def main():
     """
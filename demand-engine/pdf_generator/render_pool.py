@@ -0,0 +1,202 @@
+"""
+PDF Render Pool
+Runs reportlab rendering in a bounded process pool so async routes never
+block the event loop, and caches rendered reports by input hash
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .report_generator import ROIReportGenerator
+
+logger = logging.getLogger(__name__)
+
+# Rendering is CPU-bound; keep the pool small so it can't starve the API
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "2"))
+PDF_CACHE_MAX_ENTRIES = int(os.getenv("PDF_CACHE_MAX_ENTRIES", "128"))
+
+# Fields generate_roi_report prints; nothing else affects the PDF
+REPORT_INPUT_FIELDS = ("business_type", "avg_ticket_value", "calls_per_day", "current_answer_rate")
+REPORT_RESULT_FIELDS = (
+    "annual_loss", "monthly_loss", "calls_missed", "recoverable_revenue",
+    "roi_percentage", "lead_tier", "total_calls_per_month",
+)
+REPORT_COMPANY_FIELDS = ("company_name",)
+
+_generator: Optional[ROIReportGenerator] = None
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_cache_lock = threading.Lock()
+_inflight: Dict[str, "asyncio.Future[bytes]"] = {}
+
+
+def _warm_worker() -> None:
+    """Build the per-process generator (stylesheet, table styles) up front"""
+    global _generator
+    if _generator is None:
+        _generator = ROIReportGenerator()
+
+
+def render_roi_report(
+    calculator_data: Dict[str, Any],
+    results: Dict[str, Any],
+    company_info: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """Render a report in the current process (executor entry point)"""
+    _warm_worker()
+    return _generator.generate_roi_report(calculator_data, results, company_info)
+
+
+def report_cache_key(
+    calculator_data: Dict[str, Any],
+    results: Dict[str, Any],
+    company_info: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Hash of everything that ends up in the PDF
+
+    Only the rendered fields are hashed, so metadata such as session_id or
+    calculated_at doesn't defeat the cache. The report date is printed on
+    the first page, so it is part of the key.
+    """
+    company_info = company_info or {}
+    payload = json.dumps(
+        {
+            "calculator_data": {field: calculator_data.get(field) for field in REPORT_INPUT_FIELDS},
+            "results": {field: results.get(field) for field in REPORT_RESULT_FIELDS},
+            "company_info": {field: company_info.get(field) for field in REPORT_COMPANY_FIELDS},
+            "report_date": datetime.now().strftime("%Y-%m-%d"),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_render_executor() -> Executor:
+    """Get the shared render pool, falling back to threads if processes are unavailable"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                try:
+                    _executor = ProcessPoolExecutor(
+                        max_workers=PDF_RENDER_WORKERS,
+                        initializer=_warm_worker,
+                    )
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable, rendering PDFs in threads: {e}")
+                    _executor = ThreadPoolExecutor(
+                        max_workers=PDF_RENDER_WORKERS,
+                        thread_name_prefix="pdf-render",
+                    )
+    return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+
+
+def _cache_get(key: str) -> Optional[bytes]:
+    with _cache_lock:
+        pdf_bytes = _cache.get(key)
+        if pdf_bytes is not None:
+            _cache.move_to_end(key)
+        return pdf_bytes
+
+
+def _cache_set(key: str, pdf_bytes: bytes) -> None:
+    with _cache_lock:
+        _cache[key] = pdf_bytes
+        _cache.move_to_end(key)
+        while len(_cache) > PDF_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+async def _render(
+    calculator_data: Dict[str, Any],
+    results: Dict[str, Any],
+    company_info: Optional[Dict[str, Any]]
+) -> bytes:
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            get_render_executor(), render_roi_report, calculator_data, results, company_info
+        )
+    except BrokenProcessPool:
+        # A worker died (OOM, signal); rebuild the pool and retry once
+        logger.warning("PDF render pool broken, restarting")
+        _reset_executor()
+        return await loop.run_in_executor(
+            get_render_executor(), render_roi_report, calculator_data, results, company_info
+        )
+
+
+async def render_roi_report_async(
+    calculator_data: Dict[str, Any],
+    results: Dict[str, Any],
+    company_info: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Render an ROI report off the event loop
+
+    Identical inputs are served from cache, and concurrent requests for the
+    same report share a single render.
+
+    Args:
+        calculator_data: Input data from calculator
+        results: Calculated results
+        company_info: Optional company information
+
+    Returns:
+        PDF file as bytes
+    """
+    key = report_cache_key(calculator_data, results, company_info)
+
+    pdf_bytes = _cache_get(key)
+    if pdf_bytes is not None:
+        return pdf_bytes
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        pdf_bytes = await _render(calculator_data, results, company_info)
+        _cache_set(key, pdf_bytes)
+        future.set_result(pdf_bytes)
+        return pdf_bytes
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so waiter-less failures don't log "never retrieved"
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+def clear_cache() -> None:
+    """Drop every cached report (e.g. after a template change or in tests)"""
+    with _cache_lock:
+        _cache.clear()
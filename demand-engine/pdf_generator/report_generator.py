@@ -14,56 +14,140 @@ from typing import Dict, Any
 import io
 
 
+# Static layout, built once per process and reused by every render
+_report_styles = None
+
+CURRENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#fef2f2')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#991b1b')),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fecaca'))
+])
+
+RECOVERY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0fdf4')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#166534')),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
+])
+
+BUSINESS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f5f9')),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+])
+
+CTA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#eff6ff')),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#93c5fd'))
+])
+
+FEATURES = [
+    "✓ Custom-built HVAC AI call agent for your business",
+    "✓ Live in 48 hours with zero technical work from you",
+    "✓ Answers every call in 200ms, 24/7/365",
+    "✓ Emergency routing and HVAC-specific protocols",
+    "✓ Integration with ServiceTitan or Housecall Pro",
+    "✓ Ongoing monitoring and optimization by our team"
+]
+
+CTA_DATA = [
+    ['📞 Call Us', '(555) 123-4567'],
+    ['🌐 Website', 'hvacaiagent.frontofai.com'],
+    ['📧 Email', 'hello@kestral.ai']
+]
+
+
+def get_report_styles():
+    """Stylesheet with Kestrel branding (built once per process)"""
+    global _report_styles
+    if _report_styles is None:
+        _report_styles = _build_styles()
+    return _report_styles
+
+
+def _build_styles():
+    """Setup custom paragraph styles for Kestrel branding"""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='KestrelTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1e3a8a'),
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='KestrelSubtitle',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.HexColor('#64748b'),
+        spaceAfter=20,
+        alignment=TA_CENTER
+    ))
+    
+    # Section header
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#1e3a8a'),
+        spaceAfter=10,
+        spaceBefore=15,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Highlight box
+    styles.add(ParagraphStyle(
+        name='HighlightText',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=colors.HexColor('#0f172a'),
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Footer
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=TA_CENTER
+    ))
+    
+    return styles
+
+
 class ROIReportGenerator:
     """Generate PDF reports for calculator submissions"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for Kestrel branding"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='KestrelTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1e3a8a'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='KestrelSubtitle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=colors.HexColor('#64748b'),
-            spaceAfter=20,
-            alignment=TA_CENTER
-        ))
-        
-        # Section header
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#1e3a8a'),
-            spaceAfter=10,
-            spaceBefore=15,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Highlight box
-        self.styles.add(ParagraphStyle(
-            name='HighlightText',
-            parent=self.styles['Normal'],
-            fontSize=14,
-            textColor=colors.HexColor('#0f172a'),
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
+        self.styles = get_report_styles()
     
     def generate_roi_report(
         self,
@@ -128,17 +212,7 @@ class ROIReportGenerator:
         ]
         
         current_table = Table(current_loss_data, colWidths=[4*inch, 2*inch])
-        current_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#fef2f2')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#991b1b')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fecaca'))
-        ]))
+        current_table.setStyle(CURRENT_TABLE_STYLE)
         story.append(current_table)
         story.append(Spacer(1, 0.2*inch))
         
@@ -150,17 +224,7 @@ class ROIReportGenerator:
         ]
         
         recovery_table = Table(recovery_data, colWidths=[4*inch, 2*inch])
-        recovery_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0fdf4')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#166534')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
-        ]))
+        recovery_table.setStyle(RECOVERY_TABLE_STYLE)
         story.append(recovery_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -176,31 +240,15 @@ class ROIReportGenerator:
         ]
         
         business_table = Table(business_data, colWidths=[3*inch, 3*inch])
-        business_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f5f9')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
-        ]))
+        business_table.setStyle(BUSINESS_TABLE_STYLE)
         story.append(business_table)
         story.append(Spacer(1, 0.3*inch))
         
         # What You Get with Kestrel
         story.append(Paragraph("What You Get with Kestrel", self.styles['SectionHeader']))
         
-        features = [
-            "✓ Custom-built HVAC AI call agent for your business",
-            "✓ Live in 48 hours with zero technical work from you",
-            "✓ Answers every call in 200ms, 24/7/365",
-            "✓ Emergency routing and HVAC-specific protocols",
-            "✓ Integration with ServiceTitan or Housecall Pro",
-            "✓ Ongoing monitoring and optimization by our team"
-        ]
         
-        for feature in features:
+        for feature in FEATURES:
             story.append(Paragraph(feature, self.styles['Normal']))
             story.append(Spacer(1, 0.08*inch))
         
@@ -214,35 +262,16 @@ class ROIReportGenerator:
         ))
         story.append(Spacer(1, 0.15*inch))
         
-        cta_data = [
-            ['📞 Call Us', '(555) 123-4567'],
-            ['🌐 Website', 'hvacaiagent.frontofai.com'],
-            ['📧 Email', 'hello@kestral.ai']
-        ]
         
-        cta_table = Table(cta_data, colWidths=[2*inch, 4*inch])
-        cta_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#eff6ff')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#93c5fd'))
-        ]))
+        cta_table = Table(CTA_DATA, colWidths=[2*inch, 4*inch])
+        cta_table.setStyle(CTA_TABLE_STYLE)
         story.append(cta_table)
         
         # Footer
         story.append(Spacer(1, 0.4*inch))
         story.append(Paragraph(
             "This report is confidential and prepared exclusively for the recipient.",
-            ParagraphStyle(
-                name='Footer',
-                parent=self.styles['Normal'],
-                fontSize=8,
-                textColor=colors.grey,
-                alignment=TA_CENTER
-            )
+            self.styles['Footer']
         ))
         
         # Build PDF
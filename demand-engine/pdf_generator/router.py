@@ -8,7 +8,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 import logging
 
-from .report_generator import ROIReportGenerator
+from .render_pool import render_roi_report_async
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +49,13 @@ async def generate_roi_report(request: PDFGenerationRequest):
     Returns PDF file as binary response
     """
     try:
-        generator = ROIReportGenerator()
-        
         # Convert Pydantic models to dicts
         calculator_dict = request.calculator_data.dict()
         results_dict = request.results.dict()
         company_dict = request.company_info.dict() if request.company_info else {}
         
-        # Generate PDF
-        pdf_bytes = generator.generate_roi_report(
+        # Render in the PDF pool (cached by input hash)
+        pdf_bytes = await render_roi_report_async(
             calculator_data=calculator_dict,
             results=results_dict,
             company_info=company_dict
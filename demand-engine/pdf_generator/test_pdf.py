@@ -3,9 +3,15 @@ Test script for PDF generation
 Run locally to test PDF report generation
 """
 
+import sys
+from pathlib import Path
+
 from report_generator import ROIReportGenerator
 from datetime import datetime
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 def test_pdf_generation():
     """Test PDF generation with sample data"""
     
@@ -55,5 +61,36 @@ def test_pdf_generation():
     
     return filename
 
+def test_report_cache_key():
+    """Two calculations with the same inputs share a cached report"""
+    from calculator.engine import calculate_missed_call_tax
+    from calculator.models import CalculatorInput, BusinessType
+    from pdf_generator.render_pool import report_cache_key
+    
+    def calculate(session_id):
+        return calculate_missed_call_tax(CalculatorInput(
+            business_type=BusinessType.HVAC,
+            avg_ticket_value=2500,
+            calls_per_day=30,
+            current_answer_rate=65,
+            session_id=session_id
+        ))
+    
+    first, second = calculate("session-a"), calculate("session-b")
+    assert first.calculated_at != second.calculated_at or first.session_id != second.session_id
+    
+    # Same payloads as calculator.api.generate_pdf_async
+    calculator_data = {"business_type": "hvac", "avg_ticket_value": 2500, "calls_per_day": 30, "current_answer_rate": 65}
+    company_info = {"company_name": "ABC HVAC Services", "email": "owner@abchvac.com"}
+    
+    first_key = report_cache_key(calculator_data, first.dict(), company_info)
+    assert first_key == report_cache_key(calculator_data, second.dict(), company_info)
+    
+    # A different rendered value is a different report
+    assert first_key != report_cache_key({**calculator_data, "calls_per_day": 31}, first.dict(), company_info)
+    
+    print("✅ Same inputs share a report cache key")
+
 if __name__ == "__main__":
     test_pdf_generation()
+    test_report_cache_key()
@@ -14,6 +14,7 @@ import hashlib
 
 from app.database import get_db
 from app.models.db_models import Tenant, TenantUser, TenantAPIKey
+from middleware.tenant_cache import invalidate_tenant, tenant_cache_keys
 
 router = APIRouter(prefix="/api/admin/tenants", tags=["Admin - Tenants"])
 
@@ -165,6 +166,9 @@ async def create_tenant(
     db.commit()
     db.refresh(tenant)
     
+    # Clear cached "no tenant" results for the new phone/subdomain
+    invalidate_tenant(tenant)
+    
     # Create owner user
     owner = TenantUser(
         tenant_id=tenant.id,
@@ -245,6 +249,9 @@ async def update_tenant(
             detail="Tenant not found"
         )
     
+    # Cached lookups under the old phone/subdomain/slug
+    previous_keys = tenant_cache_keys(tenant)
+    
     # Update fields
     update_data = tenant_data.dict(exclude_unset=True)
     for field, value in update_data.items():
@@ -253,6 +260,10 @@ async def update_tenant(
     db.commit()
     db.refresh(tenant)
     
+    # Only after the commit, or a concurrent lookup re-caches the old row
+    invalidate_tenant(previous_keys)
+    invalidate_tenant(tenant)
+    
     return tenant
 
 
@@ -273,6 +284,8 @@ async def delete_tenant(
             detail="Tenant not found"
         )
     
+    previous_keys = tenant_cache_keys(tenant)
+    
     if hard_delete:
         # Hard delete - removes all data
         db.delete(tenant)
@@ -282,6 +295,7 @@ async def delete_tenant(
         tenant.is_active = False
     
     db.commit()
+    invalidate_tenant(previous_keys)
     return None
 
 
@@ -7,9 +7,12 @@ from fastapi import APIRouter, HTTPException, Form, Depends
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime, date, timedelta
+import asyncio
 import logging
 from sqlalchemy.orm import Session
+from config.supabase_config import get_supabase
 from services.missed_call_handler import get_missed_call_handler
+from services.weekly_analytics import get_weekly_analytics, week_bounds
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,7 @@ class ForwardingConfig(BaseModel):
 
 class WeeklyReportRequest(BaseModel):
     week_start: date
-    tenant_id: Optional[int] = 1
+    tenant_id: Optional[str] = None
 
 # ==================== FORWARDING CONFIG ====================
 
@@ -158,26 +161,38 @@ async def handle_call_status(
 
 # ==================== WEEKLY REPORTS ====================
 
+def _ai_calls_limit(tenant_id: str) -> Optional[int]:
+    response = get_supabase().table("tenants")\
+        .select("ai_calls_limit")\
+        .eq("id", tenant_id)\
+        .limit(1)\
+        .execute()
+    return response.data[0].get("ai_calls_limit") if response.data else None
+
+
 @router.get("/reports/weekly")
 async def get_weekly_report(
     week_start: Optional[str] = None,
-    tenant_id: int = 1
+    tenant_id: Optional[str] = None
 ):
     """
     Get weekly call analytics report
+    
+    Reads the weekly_analytics rollup (refreshed hourly); tenant_id omitted
+    returns the totals across all tenants.
     """
     try:
         # Default to current week if not specified
         if not week_start:
-            today = date.today()
-            week_start_date = today - timedelta(days=today.weekday())
+            week_start_date, week_end_date = week_bounds()
         else:
-            week_start_date = date.fromisoformat(week_start)
+            week_start_date, week_end_date = week_bounds(date.fromisoformat(week_start))
         
-        week_end_date = week_start_date + timedelta(days=6)
+        # A week without a rollup row had no activity (or hasn't been refreshed yet)
+        row = await asyncio.to_thread(get_weekly_analytics, get_supabase(), week_start_date, tenant_id) or {}
         
-        # TODO: Query weekly_analytics table
-        # For now, return mock data
+        ai_handled_calls = row.get("ai_handled_calls", 0)
+        ai_calls_limit = await asyncio.to_thread(_ai_calls_limit, tenant_id) if tenant_id else None
         
         report = {
             "week_start": week_start_date.isoformat(),
@@ -185,42 +200,50 @@ async def get_weekly_report(
             "tenant_id": tenant_id,
             
             # Call metrics
-            "total_calls": 47,
-            "answered_calls": 38,
-            "missed_calls": 6,
-            "dropped_calls": 3,
-            "after_hours_calls": 12,
+            "total_calls": row.get("total_calls", 0),
+            "answered_calls": row.get("answered_calls", 0),
+            "missed_calls": row.get("missed_calls", 0),
+            "dropped_calls": row.get("dropped_calls", 0),
+            "after_hours_calls": row.get("after_hours_calls", 0),
             
             # Duration metrics
-            "total_duration_seconds": 5420,
-            "avg_duration_seconds": 143,
+            "total_duration_seconds": row.get("total_duration_seconds", 0),
+            "avg_duration_seconds": row.get("avg_duration_seconds", 0),
             
             # AI metrics
-            "ai_handled_calls": 35,
-            "human_transferred_calls": 3,
-            "ai_calls_remaining": 20 - 35,  # Assuming 20 call limit
+            "ai_handled_calls": ai_handled_calls,
+            "human_transferred_calls": row.get("human_transferred_calls", 0),
+            "ai_calls_remaining": ai_calls_limit - ai_handled_calls if ai_calls_limit is not None else None,
             
             # Issue breakdown
             "issues": {
-                "ac": 18,
-                "heating": 12,
-                "maintenance": 8,
-                "emergency": 2
+                "ac": row.get("ac_issues", 0),
+                "heating": row.get("heating_issues", 0),
+                "maintenance": row.get("maintenance_issues", 0),
+                "emergency": row.get("emergency_issues", 0)
             },
             
             # Busiest hours
-            "busiest_hours": [
-                {"hour": 10, "calls": 8},
-                {"hour": 14, "calls": 7},
-                {"hour": 16, "calls": 6}
-            ],
+            "busiest_hours": row.get("busiest_hours") or [],
             
             # Sentiment
-            "avg_sentiment_score": 0.65
+            "avg_sentiment_score": row.get("avg_sentiment_score"),
+            
+            # Appointments
+            "appointments": {
+                "booked": row.get("appointments_booked", 0),
+                "completed": row.get("appointments_completed", 0),
+                "cancelled": row.get("appointments_cancelled", 0),
+                "no_show": row.get("appointments_no_show", 0)
+            },
+            
+            "refreshed_at": row.get("refreshed_at")
         }
         
         return report
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid week_start: {e}")
     except Exception as e:
         logger.error(f"Error getting weekly report: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -229,7 +252,7 @@ async def get_weekly_report(
 @router.get("/reports/weekly/export")
 async def export_weekly_report(
     week_start: Optional[str] = None,
-    tenant_id: int = 1,
+    tenant_id: Optional[str] = None,
     format: str = "pdf"
 ):
     """
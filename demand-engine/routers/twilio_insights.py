@@ -1,17 +1,26 @@
 """
 Twilio Insights API - Real call analytics from Twilio
 Provides: Call history, costs, transcripts, number status, uptime tracking
+
+Call history, cost, uptime and offline queries read the local call mirror
+(services/twilio_call_mirror.py), which each request refreshes in the
+background when stale; only per-call lookups (recordings, transcripts,
+number configuration) still go to Twilio, off the event loop.
 """
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import asyncio
 import os
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 import logging
 
+from config.supabase_config import get_supabase
+from services.twilio_call_mirror import TwilioCallMirror
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/twilio/insights", tags=["Twilio Insights"])
@@ -21,6 +30,32 @@ TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 
 client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN) if TWILIO_ACCOUNT_SID else None
 
+_call_mirror: Optional[TwilioCallMirror] = None
+
+
+def get_call_mirror() -> TwilioCallMirror:
+    """Shared call mirror for the configured Twilio account"""
+    global _call_mirror
+    if _call_mirror is None:
+        _call_mirror = TwilioCallMirror(client, get_supabase(), cursor_key=TWILIO_ACCOUNT_SID or "calls")
+    return _call_mirror
+
+
+def _mirror() -> TwilioCallMirror:
+    """Call mirror for a request, kicking off a background sync if it's stale"""
+    if not client:
+        raise HTTPException(status_code=500, detail="Twilio not configured")
+    mirror = get_call_mirror()
+    mirror.refresh_in_background()
+    return mirror
+
+
+def _recording_url(call_sid: str) -> Optional[str]:
+    recordings = client.recordings.list(call_sid=call_sid, limit=1)
+    if recordings:
+        return f"https://api.twilio.com{recordings[0].uri.replace('.json', '.mp3')}"
+    return None
+
 
 class CallInsight(BaseModel):
     call_sid: str
@@ -81,53 +116,42 @@ async def get_call_history(
     """
     Get real call history from Twilio with full details
     """
-    if not client:
-        raise HTTPException(status_code=500, detail="Twilio not configured")
+    mirror = _mirror()
     
     try:
         # Calculate date range
-        start_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Build query parameters
-        query_params = {
-            "start_time_after": start_date,
-            "limit": limit
-        }
+        start_date = datetime.now(timezone.utc) - timedelta(days=days)
         
-        if phone_number:
-            query_params["to"] = phone_number
-        
-        # Fetch calls from Twilio
-        calls = client.calls.list(**query_params)
+        calls = await asyncio.to_thread(mirror.recent_calls, start_date, phone_number, limit)
         
         # Format response
-        call_insights = []
-        for call in calls:
-            insight = CallInsight(
-                call_sid=call.sid,
-                from_number=call.from_formatted or call.from_,
-                to_number=call.to_formatted or call.to,
-                status=call.status,
-                duration=int(call.duration) if call.duration else 0,
-                start_time=call.start_time,
-                end_time=call.end_time,
-                price=call.price,
-                price_unit=call.price_unit,
-                direction=call.direction,
-                answered_by=call.answered_by,
+        call_insights = [
+            CallInsight(
+                call_sid=call["call_sid"],
+                from_number=call.get("from_formatted") or call.get("from_number"),
+                to_number=call.get("to_formatted") or call.get("to_number"),
+                status=call["status"],
+                duration=call.get("duration") or 0,
+                start_time=call["start_time"],
+                end_time=call.get("end_time"),
+                price=str(call["price"]) if call.get("price") is not None else None,
+                price_unit=call.get("price_unit"),
+                direction=call.get("direction"),
+                answered_by=call.get("answered_by"),
                 recording_url=None,
                 transcript_url=None
             )
-            
-            # Try to get recording if available
-            try:
-                recordings = client.recordings.list(call_sid=call.sid, limit=1)
-                if recordings:
-                    insight.recording_url = f"https://api.twilio.com{recordings[0].uri.replace('.json', '.mp3')}"
-            except Exception:
-                pass
-            
-            call_insights.append(insight)
+            for call in calls
+        ]
+        
+        # Try to get recordings if available (looked up concurrently)
+        recording_urls = await asyncio.gather(
+            *(asyncio.to_thread(_recording_url, insight.call_sid) for insight in call_insights),
+            return_exceptions=True
+        )
+        for insight, recording_url in zip(call_insights, recording_urls):
+            if isinstance(recording_url, str):
+                insight.recording_url = recording_url
         
         return call_insights
         
@@ -144,12 +168,11 @@ async def get_number_status(phone_number: str) -> NumberStatus:
     """
     Get detailed status of a Twilio phone number
     """
-    if not client:
-        raise HTTPException(status_code=500, detail="Twilio not configured")
+    mirror = _mirror()
     
     try:
         # Find the number
-        numbers = client.incoming_phone_numbers.list(phone_number=phone_number)
+        numbers = await asyncio.to_thread(client.incoming_phone_numbers.list, phone_number=phone_number)
         
         if not numbers:
             raise HTTPException(status_code=404, detail="Number not found")
@@ -159,9 +182,7 @@ async def get_number_status(phone_number: str) -> NumberStatus:
         # Get last call time
         last_call_time = None
         try:
-            recent_calls = client.calls.list(to=phone_number, limit=1)
-            if recent_calls:
-                last_call_time = recent_calls[0].start_time
+            last_call_time = await asyncio.to_thread(mirror.last_call_time, phone_number)
         except Exception:
             pass
         
@@ -198,37 +219,23 @@ async def get_cost_summary(
     """
     Get cost summary for calls over a period
     """
-    if not client:
-        raise HTTPException(status_code=500, detail="Twilio not configured")
+    mirror = _mirror()
     
     try:
         # Calculate date range
-        end_date = datetime.utcnow()
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        # Build query parameters
-        query_params = {
-            "start_time_after": start_date,
-            "end_time_before": end_date
-        }
-        
-        if phone_number:
-            query_params["to"] = phone_number
-        
-        # Fetch calls
-        calls = client.calls.list(**query_params)
+        stats = await asyncio.to_thread(mirror.stats, start_date, end_date, phone_number)
         
         # Calculate metrics
-        total_calls = len(calls)
-        total_duration = sum(int(call.duration) if call.duration else 0 for call in calls)
-        total_cost = sum(abs(float(call.price)) if call.price else 0 for call in calls)
+        total_calls = stats["total_calls"]
+        total_duration = stats["total_duration"]
+        total_cost = stats["total_cost"]
         
         avg_cost = total_cost / total_calls if total_calls > 0 else 0
         avg_duration = total_duration / total_calls if total_calls > 0 else 0
         
-        # Get currency from first call
-        currency = calls[0].price_unit if calls and calls[0].price_unit else "USD"
-        
         return CostSummary(
             total_calls=total_calls,
             total_duration_minutes=total_duration / 60,
@@ -237,12 +244,9 @@ async def get_cost_summary(
             average_duration=avg_duration,
             period_start=start_date,
             period_end=end_date,
-            currency=currency
+            currency=stats["currency"]
         )
         
-    except TwilioRestException as e:
-        logger.error(f"Twilio API error: {e}")
-        raise HTTPException(status_code=500, detail=f"Twilio error: {str(e)}")
     except Exception as e:
         logger.error(f"Error calculating cost summary: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -256,59 +260,33 @@ async def get_uptime_metrics(
     """
     Get uptime and reliability metrics
     """
-    if not client:
-        raise HTTPException(status_code=500, detail="Twilio not configured")
+    mirror = _mirror()
     
     try:
         # Calculate date range
-        end_date = datetime.utcnow()
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        # Build query parameters
-        query_params = {
-            "start_time_after": start_date,
-            "end_time_before": end_date
-        }
-        
-        if phone_number:
-            query_params["to"] = phone_number
-        
-        # Fetch calls
-        calls = client.calls.list(**query_params)
-        
-        # Categorize calls
-        total_calls = len(calls)
-        successful = sum(1 for call in calls if call.status == "completed")
-        failed = sum(1 for call in calls if call.status in ["failed", "canceled"])
-        busy = sum(1 for call in calls if call.status == "busy")
-        no_answer = sum(1 for call in calls if call.status == "no-answer")
+        stats = await asyncio.to_thread(mirror.stats, start_date, end_date, phone_number)
         
         # Calculate uptime percentage
+        total_calls = stats["total_calls"]
+        successful = stats["completed_calls"]
         uptime = (successful / total_calls * 100) if total_calls > 0 else 100.0
         
-        # Calculate average response time (time to answer)
-        response_times = []
-        for call in calls:
-            if call.start_time and call.end_time and call.status == "completed":
-                response_times.append((call.end_time - call.start_time).total_seconds())
-        
-        avg_response = sum(response_times) / len(response_times) if response_times else 0
-        
         return UptimeMetrics(
             total_calls=total_calls,
             successful_calls=successful,
-            failed_calls=failed,
-            busy_calls=busy,
-            no_answer_calls=no_answer,
+            failed_calls=stats["failed_calls"],
+            busy_calls=stats["busy_calls"],
+            no_answer_calls=stats["no_answer_calls"],
             uptime_percentage=uptime,
-            average_response_time=avg_response,
+            # Average length of completed calls
+            average_response_time=stats["average_completed_seconds"],
             period_start=start_date,
             period_end=end_date
         )
         
-    except TwilioRestException as e:
-        logger.error(f"Twilio API error: {e}")
-        raise HTTPException(status_code=500, detail=f"Twilio error: {str(e)}")
     except Exception as e:
         logger.error(f"Error calculating uptime metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -373,34 +351,20 @@ async def get_offline_history(
     """
     Analyze when the number was offline/unavailable
     """
-    if not client:
-        raise HTTPException(status_code=500, detail="Twilio not configured")
+    mirror = _mirror()
     
     try:
-        # Get all calls to this number
-        end_date = datetime.utcnow()
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        calls = client.calls.list(
-            to=phone_number,
-            start_time_after=start_date,
-            end_time_before=end_date
+        stats, incidents = await asyncio.gather(
+            asyncio.to_thread(mirror.stats, start_date, end_date, phone_number),
+            asyncio.to_thread(mirror.offline_incidents, start_date, end_date, phone_number, 10)
         )
         
-        # Identify offline periods (failed calls, no-answer, etc.)
-        offline_incidents = []
-        for call in calls:
-            if call.status in ["failed", "canceled", "no-answer"]:
-                offline_incidents.append({
-                    "timestamp": call.start_time,
-                    "status": call.status,
-                    "from": call.from_formatted or call.from_,
-                    "duration_attempted": call.duration
-                })
-        
-        # Calculate offline percentage
-        total_calls = len(calls)
-        offline_count = len(offline_incidents)
+        # Offline periods are failed, canceled and unanswered calls
+        total_calls = stats["total_calls"]
+        offline_count = stats["failed_calls"] + stats["no_answer_calls"]
         offline_percentage = (offline_count / total_calls * 100) if total_calls > 0 else 0
         
         return {
@@ -411,12 +375,36 @@ async def get_offline_history(
             "offline_incidents": offline_count,
             "offline_percentage": offline_percentage,
             "uptime_percentage": 100 - offline_percentage,
-            "incidents": offline_incidents[:10]  # Return last 10 incidents
+            "incidents": [  # Return last 10 incidents
+                {
+                    "timestamp": call["start_time"],
+                    "status": call["status"],
+                    "from": call.get("from_formatted") or call.get("from_number"),
+                    "duration_attempted": call.get("duration")
+                }
+                for call in incidents
+            ]
         }
         
+    except Exception as e:
+        logger.error(f"Error analyzing offline history: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/sync")
+async def sync_call_mirror() -> Dict[str, Any]:
+    """
+    Sync the local call mirror with Twilio now (e.g. from a scheduler)
+    """
+    if not client:
+        raise HTTPException(status_code=500, detail="Twilio not configured")
+    
+    try:
+        return await asyncio.to_thread(get_call_mirror().sync)
+        
     except TwilioRestException as e:
         logger.error(f"Twilio API error: {e}")
         raise HTTPException(status_code=500, detail=f"Twilio error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error analyzing offline history: {e}")
+        logger.error(f"Error syncing call mirror: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -11,6 +11,14 @@ from typing import List, Dict, Optional
 import json
 import re
 
+from classifiers.keyword_scorer import KeywordScorer
+from scrapers.runtime import ScraperRuntime, run_sync
+
+# Complaint severity keywords (points per match)
+SEVERITY_SCORER = KeywordScorer({
+    "severity": [(kw, 15) for kw in ['terrible', 'worst', 'never', 'scam', 'fraud', 'horrible']],
+})
+
 class BBBComplaintsScraper:
     """
     Scrapes BBB for complaints against HVAC/Plumbing companies
@@ -67,33 +75,49 @@ class BBBComplaintsScraper:
         Returns:
             Pain signal analysis
         """
-        # Recent complaints = hot leads
-        days_old = (datetime.now() - datetime.fromisoformat(complaint['complaint_date'])).days
-        recency_score = max(100 - (days_old * 3), 30)
-        
-        # Unresolved complaints score higher
-        resolution_penalty = 0 if complaint.get('status') == 'unresolved' else 20
+        return self.analyze_complaint_signals([complaint])[0]
+    
+    def analyze_complaint_signals(self, complaints: List[Dict]) -> List[Dict]:
+        """
+        Analyze a batch of complaints for pain signals in one pass
         
+        Args:
+            complaints: Complaint data
+            
+        Returns:
+            Pain signal analysis per complaint, in order
+        """
         # Severity based on complaint text
-        complaint_text = complaint.get('complaint_text', '').lower()
-        severity_keywords = ['terrible', 'worst', 'never', 'scam', 'fraud', 'horrible']
-        severity_score = sum(15 for kw in severity_keywords if kw in complaint_text)
+        severities = SEVERITY_SCORER.score_batch([c.get('complaint_text', '') for c in complaints])
         
-        total_score = min(recency_score + severity_score - resolution_penalty, 100)
+        analyses = []
+        for complaint, scores in zip(complaints, severities):
+            # Recent complaints = hot leads
+            days_old = (datetime.now() - datetime.fromisoformat(complaint['complaint_date'])).days
+            recency_score = max(100 - (days_old * 3), 30)
+            
+            # Unresolved complaints score higher
+            resolution_penalty = 0 if complaint.get('status') == 'unresolved' else 20
+            
+            severity_score = scores["severity"]
+            
+            total_score = min(recency_score + severity_score - resolution_penalty, 100)
+            
+            analyses.append({
+                "urgency_score": min(recency_score, 100),
+                "budget_score": 70,  # Dissatisfied customer = willing to pay for better service
+                "authority_score": 80,  # Complainant = decision maker
+                "pain_score": min(severity_score + 50, 100),
+                "total_score": total_score,
+                "signals": {
+                    "recent_complaint": days_old < 30,
+                    "unresolved": complaint.get('status') == 'unresolved',
+                    "high_severity": severity_score > 30,
+                    "days_old": days_old
+                }
+            })
         
-        return {
-            "urgency_score": min(recency_score, 100),
-            "budget_score": 70,  # Dissatisfied customer = willing to pay for better service
-            "authority_score": 80,  # Complainant = decision maker
-            "pain_score": min(severity_score + 50, 100),
-            "total_score": total_score,
-            "signals": {
-                "recent_complaint": days_old < 30,
-                "unresolved": complaint.get('status') == 'unresolved',
-                "high_severity": severity_score > 30,
-                "days_old": days_old
-            }
-        }
+        return analyses
     
     def extract_customer_info(self, complaint: Dict) -> Dict:
         """
@@ -126,31 +150,67 @@ class BBBComplaintsScraper:
         Returns:
             List of all complaint signals
         """
+        return run_sync(self.scrape_all_areas_async(days_back))
+    
+    async def scrape_all_areas_async(
+        self,
+        days_back: int = 30,
+        runtime: Optional[ScraperRuntime] = None
+    ) -> List[Dict]:
+        """
+        Check every category×area pair concurrently under BBB's rate limit
+        
+        Args:
+            days_back: How many days back to check
+            runtime: Shared runtime (a private one is created if omitted)
+        """
+        host = self.base_url.split("://", 1)[-1]
+        pairs = [
+            (category, area)
+            for category in self.target_categories
+            for area in self.target_areas
+        ]
+        
+        async def scrape_all(rt: ScraperRuntime) -> List[Optional[List[Dict]]]:
+            return await rt.gather(
+                (
+                    rt.run_blocking(host, self.scrape_complaints, category, area, days_back)
+                    for category, area in pairs
+                ),
+                label="bbb complaints"
+            )
+        
+        if runtime is not None:
+            results = await scrape_all(runtime)
+        else:
+            async with ScraperRuntime() as rt:
+                results = await scrape_all(rt)
+        
+        found = []
+        for (category, area), complaints in zip(pairs, results):
+            complaints = complaints or []
+            print(f"🔍 BBB complaints: {category} in {area}: found {len(complaints)}")
+            found.extend((category, area, complaint) for complaint in complaints)
+        
+        # Keyword analysis for every complaint in one pass
+        analyses = self.analyze_complaint_signals([complaint for _, _, complaint in found])
+        
         all_signals = []
         
-        for category in self.target_categories:
-            for area in self.target_areas:
-                print(f"🔍 Checking BBB complaints: {category} in {area}")
-                
-                complaints = self.scrape_complaints(category, area, days_back)
-                
-                for complaint in complaints:
-                    customer_info = self.extract_customer_info(complaint)
-                    pain_analysis = self.analyze_complaint_signal(complaint)
-                    
-                    signal = {
-                        **customer_info,
-                        **pain_analysis,
-                        "source_type": "bbb_complaints",
-                        "signal_type": "customer_complaint",
-                        "category": category,
-                        "area": area,
-                        "scraped_at": datetime.now().isoformat()
-                    }
-                    
-                    all_signals.append(signal)
-                
-                print(f"   Found {len(complaints)} complaints")
+        for (category, area, complaint), pain_analysis in zip(found, analyses):
+            customer_info = self.extract_customer_info(complaint)
+            
+            signal = {
+                **customer_info,
+                **pain_analysis,
+                "source_type": "bbb_complaints",
+                "signal_type": "customer_complaint",
+                "category": category,
+                "area": area,
+                "scraped_at": datetime.now().isoformat()
+            }
+            
+            all_signals.append(signal)
         
         return all_signals
     
@@ -0,0 +1,130 @@
+"""
+Scraper Checkpoints
+Per-source high-water marks (newest item already processed per query) so
+scheduled runs only fetch and score items newer than the previous run
+
+Cursors are loaded with one query per source and written back with one
+upsert. Callers advance a cursor only after that query's items are saved,
+so a failed run re-fetches instead of skipping items.
+
+Example:
+    checkpoints = CheckpointStore(supabase, "reddit_monitor")
+    since = checkpoints.since("HVAC")
+    ... fetch items newer than `since`, process and save them ...
+    checkpoints.advance("HVAC", newest['created_utc'], newest['id'])
+    checkpoints.save()
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE = "scraper_checkpoints"
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class CheckpointStore:
+    """Cursors for one scraper source, keyed by query (subreddit, search, ...)"""
+
+    def __init__(self, supabase, source: str):
+        """
+        Args:
+            supabase: Supabase client
+            source: Scraper name (scraper_checkpoints.source)
+        """
+        self.supabase = supabase
+        self.source = source
+
+        self._cursors: Dict[str, Dict] = {}
+        self._dirty = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Fetch all cursors for this source (once; safe to call from threads)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            try:
+                response = self.supabase.table(CHECKPOINT_TABLE)\
+                    .select("cursor_key, last_seen_id, last_seen_at")\
+                    .eq("source", self.source)\
+                    .execute()
+            except Exception as e:
+                # No checkpoints: fall back to full fetches
+                logger.warning(f"Could not load {self.source} checkpoints, fetching everything: {str(e)}")
+                return
+
+            for row in response.data or []:
+                last_seen_at = _parse_timestamp(row.get("last_seen_at"))
+                if last_seen_at:
+                    self._cursors[row["cursor_key"]] = {
+                        "last_seen_id": row.get("last_seen_id"),
+                        "last_seen_at": last_seen_at
+                    }
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cursor for a query: {'last_seen_id', 'last_seen_at'} or None"""
+        self.load()
+        with self._lock:
+            cursor = self._cursors.get(key)
+            return dict(cursor) if cursor else None
+
+    def since(self, key: str) -> Optional[datetime]:
+        """Timestamp of the newest item already processed for a query"""
+        cursor = self.get(key)
+        return cursor["last_seen_at"] if cursor else None
+
+    def advance(self, key: str, last_seen_at: datetime, last_seen_id: Optional[str] = None) -> None:
+        """Move a cursor forward (never backwards); written on save()"""
+        last_seen_at = _parse_timestamp(last_seen_at)
+        if last_seen_at is None:
+            return
+
+        self.load()
+        with self._lock:
+            current = self._cursors.get(key)
+            if current and current["last_seen_at"] >= last_seen_at:
+                return
+            self._cursors[key] = {"last_seen_id": last_seen_id, "last_seen_at": last_seen_at}
+            self._dirty.add(key)
+
+    def save(self) -> None:
+        """Upsert every advanced cursor in one request (best effort)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = datetime.now(timezone.utc).isoformat()
+            rows = [
+                {
+                    "source": self.source,
+                    "cursor_key": key,
+                    "last_seen_id": self._cursors[key]["last_seen_id"],
+                    "last_seen_at": self._cursors[key]["last_seen_at"].isoformat(),
+                    "updated_at": now
+                }
+                for key in sorted(self._dirty)
+            ]
+
+        try:
+            self.supabase.table(CHECKPOINT_TABLE).upsert(rows, on_conflict="source,cursor_key").execute()
+        except Exception as e:
+            logger.error(f"Failed to save {self.source} checkpoints: {str(e)}")
+            return
+
+        with self._lock:
+            self._dirty.difference_update(row["cursor_key"] for row in rows)
@@ -0,0 +1,274 @@
+"""
+Content Hash Deduplication for Scraped Signals
+Local Bloom filter of known content hashes, persisted between runs, backed
+by one bulk `in_` lookup per batch for hashes that might already exist
+
+On first use the filter is warmed from the signal table (hash column only),
+then kept current by pulling hashes created since the last sync, so a
+negative from the filter means "not in the table" and needs no query.
+Positives (real or false) are confirmed against the table in bulk.
+
+Set DEDUP_STATE_DIR to a persistent volume to keep the filter across
+containers; otherwise it is rebuilt from the table when missing.
+"""
+
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import math
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+DEDUP_STATE_DIR = os.getenv("DEDUP_STATE_DIR", os.path.join(tempfile.gettempdir(), "demand-engine-dedup"))
+DEDUP_BLOOM_CAPACITY = int(os.getenv("DEDUP_BLOOM_CAPACITY", "200000"))
+DEDUP_BLOOM_ERROR_RATE = float(os.getenv("DEDUP_BLOOM_ERROR_RATE", "0.001"))
+DEDUP_BLOOM_MAX_AGE_DAYS = int(os.getenv("DEDUP_BLOOM_MAX_AGE_DAYS", "30"))
+DEDUP_SYNC_PAGE_SIZE = int(os.getenv("DEDUP_SYNC_PAGE_SIZE", "1000"))
+DEDUP_LOOKUP_CHUNK = 100  # hashes per `in_` query (keeps URLs short)
+
+STATE_VERSION = 1
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys"""
+
+    def __init__(self, capacity: int = DEDUP_BLOOM_CAPACITY, error_rate: float = DEDUP_BLOOM_ERROR_RATE):
+        self.size_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.size_bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, key: str) -> None:
+        new = False
+        for pos in self._positions(key):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                new = True
+        if new:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        for pos in self._positions(key):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ContentHashDeduper:
+    """
+    Deduplicate signals by content hash against one Supabase table
+
+    Example:
+        deduper = ContentHashDeduper(supabase, "reddit_signals", lookback_days=7)
+        duplicates = deduper.find_duplicates(hashes)
+        ... save the rest ...
+        deduper.add(saved_hashes)
+        deduper.persist()
+    """
+
+    def __init__(
+        self,
+        supabase,
+        table: str,
+        hash_column: str = "content_hash",
+        lookback_days: Optional[int] = None,
+        state_dir: str = DEDUP_STATE_DIR
+    ):
+        """
+        Args:
+            supabase: Supabase client
+            table: Signal table holding the hashes
+            hash_column: Column with the content hash
+            lookback_days: Only rows created in this window count as
+                duplicates (None = all time)
+            state_dir: Directory for the persisted filter
+        """
+        self.supabase = supabase
+        self.table = table
+        self.hash_column = hash_column
+        self.lookback_days = lookback_days
+        # The filter only holds hashes from its own window, so its negatives
+        # can't be trusted by a deduper with a longer one
+        window = f"{lookback_days}d" if lookback_days is not None else "all"
+        self.state_path = os.path.join(state_dir, f"{table}.{hash_column}.{window}.bloom.json")
+
+        self.bloom: Optional[BloomFilter] = None
+        self.created_at = 0.0
+        self.last_synced: Optional[str] = None
+        self._synced = False
+        self._dirty = False
+
+    def find_duplicates(self, hashes: Iterable[str]) -> Set[str]:
+        """
+        Return the hashes that already exist in the table
+
+        One bulk query (per DEDUP_LOOKUP_CHUNK hashes) covers every hash the
+        filter can't rule out; the rest need no query at all.
+        """
+        self._ensure_synced()
+
+        unique = {h for h in hashes if h}
+        if self.bloom is None:
+            # Filter unavailable: check everything in bulk
+            candidates = unique
+        else:
+            candidates = {h for h in unique if h in self.bloom}
+
+        if not candidates:
+            return set()
+
+        return self._lookup(sorted(candidates))
+
+    def is_duplicate(self, content_hash: str) -> bool:
+        """Single-hash convenience wrapper around find_duplicates"""
+        return content_hash in self.find_duplicates([content_hash])
+
+    def add(self, hashes: Iterable[str]) -> None:
+        """Record hashes that were just written to the table"""
+        if self.bloom is None:
+            return
+        for content_hash in hashes:
+            if content_hash:
+                self.bloom.add(content_hash)
+                self._dirty = True
+
+    def persist(self) -> None:
+        """Write the filter to DEDUP_STATE_DIR (best effort)"""
+        if self.bloom is None or not self._dirty:
+            return
+
+        state = {
+            "version": STATE_VERSION,
+            "capacity": self.bloom.capacity,
+            "size_bits": self.bloom.size_bits,
+            "num_hashes": self.bloom.num_hashes,
+            "count": self.bloom.count,
+            "created_at": self.created_at,
+            "last_synced": self.last_synced,
+            "bits": base64.b64encode(bytes(self.bloom.bits)).decode("ascii")
+        }
+
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not persist dedup filter for {self.table}: {str(e)}")
+
+    def _ensure_synced(self) -> None:
+        if self._synced:
+            return
+        self._synced = True
+
+        if not self._load():
+            self.bloom = BloomFilter()
+            self.created_at = time.time()
+            self.last_synced = None
+
+        try:
+            self._sync_from_table()
+        except Exception as e:
+            # Without a complete filter, negatives can't be trusted
+            logger.warning(f"Dedup filter sync failed for {self.table}, using bulk lookups only: {str(e)}")
+            self.bloom = None
+
+    def _load(self) -> bool:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        max_age = DEDUP_BLOOM_MAX_AGE_DAYS * 86400
+        if state.get("version") != STATE_VERSION or time.time() - state.get("created_at", 0) > max_age:
+            return False
+
+        bloom = BloomFilter(capacity=state["capacity"])
+        if bloom.size_bits != state["size_bits"] or bloom.num_hashes != state["num_hashes"]:
+            return False
+        bloom.bits = bytearray(base64.b64decode(state["bits"]))
+        bloom.count = state["count"]
+
+        if bloom.is_full:
+            return False
+
+        self.bloom = bloom
+        self.created_at = state["created_at"]
+        self.last_synced = state.get("last_synced")
+        return True
+
+    def _sync_from_table(self) -> None:
+        """Add hashes created since the last sync (or in the lookback window)"""
+        since = self.last_synced
+        if since is None and self.lookback_days is not None:
+            since = (datetime.now(timezone.utc) - timedelta(days=self.lookback_days)).isoformat()
+
+        offset = 0
+        added = 0
+        while True:
+            query = self.supabase.table(self.table).select(f"{self.hash_column}, created_at")
+            if since:
+                query = query.gte("created_at", since)
+            response = query.order("created_at").range(offset, offset + DEDUP_SYNC_PAGE_SIZE - 1).execute()
+            rows = response.data or []
+
+            for row in rows:
+                if row.get(self.hash_column):
+                    self.bloom.add(row[self.hash_column])
+                    added += 1
+                if row.get("created_at"):
+                    self.last_synced = row["created_at"]
+
+            if len(rows) < DEDUP_SYNC_PAGE_SIZE:
+                break
+            offset += DEDUP_SYNC_PAGE_SIZE
+
+        if added:
+            self._dirty = True
+        logger.info(f"Dedup filter for {self.table} synced ({added} new hashes)")
+
+    def _lookup(self, candidates: List[str]) -> Set[str]:
+        found = set()
+        cutoff = None
+        if self.lookback_days is not None:
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=self.lookback_days)).isoformat()
+
+        for i in range(0, len(candidates), DEDUP_LOOKUP_CHUNK):
+            chunk = candidates[i:i + DEDUP_LOOKUP_CHUNK]
+            try:
+                query = self.supabase.table(self.table)\
+                    .select(self.hash_column)\
+                    .in_(self.hash_column, chunk)
+                if cutoff:
+                    query = query.gte("created_at", cutoff)
+                response = query.execute()
+                found.update(row[self.hash_column] for row in response.data or [])
+            except Exception as e:
+                # Same failure mode as the per-row checks: treat as not duplicate
+                logger.error(f"Error checking duplicates in {self.table}: {str(e)}")
+
+        return found
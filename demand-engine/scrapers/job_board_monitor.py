@@ -8,12 +8,17 @@ import hashlib
 import re
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 import logging
-import httpx
 from bs4 import BeautifulSoup
 
 from config.supabase_config import get_supabase
+from scrapers.dedup import ContentHashDeduper
+from scrapers.signal_writer import SignalBatchWriter
+from scrapers.runtime import ScraperRuntime, run_sync
+from scrapers.checkpoints import CheckpointStore
 from classifiers.ai_scorer import AISignalScorer
+from classifiers.keyword_scorer import KeywordScorer
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +63,7 @@ EXPANSION_KEYWORDS = {
         'need help', 'short staffed', 'growing pains', 'can\'t keep up'
     ]
 }
+KEYWORD_SCORER = KeywordScorer(EXPANSION_KEYWORDS)
 
 
 class JobBoardMonitor:
@@ -66,13 +72,13 @@ class JobBoardMonitor:
     def __init__(self):
         """Initialize job board monitor"""
         self.supabase = get_supabase()
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+        self.deduper = ContentHashDeduper(self.supabase, "job_board_signals")
+        self.writer = SignalBatchWriter(
+            self.supabase,
+            "job_board_signals",
+            on_written=lambda rows: self.deduper.add(row.get('content_hash') for row in rows)
         )
+        self.checkpoints = CheckpointStore(self.supabase, "job_board_monitor")
         
         # Initialize AI scorer if enabled
         self.ai_scorer = None
@@ -83,10 +89,25 @@ class JobBoardMonitor:
             except Exception as e:
                 logger.warning(f"⚠️ AI scoring disabled: {str(e)}")
     
-    def search_indeed(self, job_title: str, location: str = "United States") -> List[Dict]:
+    def lookback_days(self, since: Optional[datetime]) -> int:
+        """Days to search back: up to the query's checkpoint, capped at LOOKBACK_DAYS"""
+        if since is None:
+            return LOOKBACK_DAYS
+        elapsed = datetime.now(timezone.utc) - since
+        return max(1, min(LOOKBACK_DAYS, elapsed.days + 1))
+    
+    def search_indeed(
+        self,
+        job_title: str,
+        location: str = "United States",
+        since: Optional[datetime] = None
+    ) -> List[Dict]:
         """
         Search Indeed for HVAC jobs
         Note: This is a simplified version. Production would use Indeed API or proper scraping
+        
+        Args:
+            since: Only postings after this (the query's checkpoint)
         """
         jobs = []
         
@@ -94,7 +115,7 @@ class JobBoardMonitor:
             params = {
                 'q': job_title,
                 'l': location,
-                'fromage': LOOKBACK_DAYS,
+                'fromage': self.lookback_days(since),
                 'sort': 'date'
             }
             
@@ -110,10 +131,19 @@ class JobBoardMonitor:
         
         return jobs
     
-    def search_ziprecruiter(self, job_title: str, location: str = "United States") -> List[Dict]:
+    def search_ziprecruiter(
+        self,
+        job_title: str,
+        location: str = "United States",
+        since: Optional[datetime] = None
+    ) -> List[Dict]:
         """
         Search ZipRecruiter for HVAC jobs
         Note: This is a simplified version. Production would use ZipRecruiter API
+        with days_ago=self.lookback_days(since)
+        
+        Args:
+            since: Only postings after this (the query's checkpoint)
         """
         jobs = []
         
@@ -154,21 +184,18 @@ class JobBoardMonitor:
     
     def score_job_keywords(self, title: str, description: str) -> Dict[str, int]:
         """Score job posting using keyword matching"""
-        text = f"{title} {description}".lower()
-        
-        scores = {}
-        for category, keywords in EXPANSION_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text:
-                    score += 1
-            
+        return self.score_jobs_keywords([(title, description)])[0]
+    
+    def score_jobs_keywords(self, jobs: List[tuple]) -> List[Dict[str, int]]:
+        """Keyword-score a batch of (title, description) pairs in one pass"""
+        results = []
+        for counts in KEYWORD_SCORER.score_batch([f"{title} {description}" for title, description in jobs]):
             # Normalize to 0-10 scale
-            max_possible = len(keywords)
-            normalized = min(10, int((score / max_possible) * 20))
-            scores[category] = normalized
-        
-        return scores
+            results.append({
+                category: min(10, int((counts[category] / len(keywords)) * 20))
+                for category, keywords in EXPANSION_KEYWORDS.items()
+            })
+        return results
     
     def score_job_ai(
         self,
@@ -191,6 +218,31 @@ class JobBoardMonitor:
             logger.error(f"❌ AI scoring failed: {str(e)}")
             return None
     
+    def score_jobs_ai(self, jobs: List[Dict]) -> Dict[str, Dict]:
+        """Score job postings using AI in one concurrent batch, keyed by job id"""
+        if not self.ai_scorer or not jobs:
+            return {}
+        
+        try:
+            results = self.ai_scorer.batch_score([
+                {
+                    'title': job['job_title'],
+                    'content': job['job_description'],
+                    'source': 'job_board',
+                    'metadata': {
+                        'platform': job['platform'],
+                        'company': job['company_name'],
+                        'location': job['location']
+                    }
+                }
+                for job in jobs
+            ])
+        except Exception as e:
+            logger.error(f"❌ AI batch scoring failed: {str(e)}")
+            return {}
+        
+        return {job['job_id']: result for job, result in zip(jobs, results)}
+    
     def extract_company_info(self, description: str) -> Dict[str, Optional[str]]:
         """Extract company information from job description"""
         info = {
@@ -224,16 +276,11 @@ class JobBoardMonitor:
     
     def check_duplicate(self, content_hash: str) -> bool:
         """Check if job posting already exists"""
-        try:
-            result = self.supabase.table("job_board_signals")\
-                .select("id")\
-                .eq("content_hash", content_hash)\
-                .execute()
-            
-            return len(result.data) > 0
-        except Exception as e:
-            logger.error(f"❌ Duplicate check failed: {str(e)}")
-            return False
+        return self.deduper.is_duplicate(content_hash)
+    
+    def find_duplicates(self, content_hashes: List[str]) -> set:
+        """Check a whole batch of hashes with one bulk lookup"""
+        return self.deduper.find_duplicates(content_hashes)
     
     def save_signal(
         self,
@@ -241,7 +288,7 @@ class JobBoardMonitor:
         keyword_scores: Dict,
         ai_scores: Optional[Dict]
     ) -> bool:
-        """Save job board signal to database"""
+        """Queue job board signal for a batched upsert (see flush_signals)"""
         try:
             # Calculate keyword total score
             keyword_total = sum(
@@ -298,8 +345,8 @@ class JobBoardMonitor:
                     'ai_confidence': ai_scores.get('confidence')
                 })
             
-            # Insert into database
-            self.supabase.table("job_board_signals").insert(signal_data).execute()
+            # Queued; written in bulk when the batch fills or on flush_signals()
+            self.writer.add(signal_data)
             
             return True
             
@@ -307,6 +354,111 @@ class JobBoardMonitor:
             logger.error(f"❌ Failed to save signal: {str(e)}")
             return False
     
+    @staticmethod
+    def query_key(platform: str, job_title: str, location: str = "United States") -> str:
+        """Checkpoint key for one search"""
+        return f"{platform}:{job_title}:{location}"
+    
+    async def collect_jobs(self, runtime: Optional[ScraperRuntime] = None) -> Dict[str, List[Dict]]:
+        """
+        Search every job title on every board concurrently
+        
+        Searches share the runtime's concurrency cap and each board's
+        per-host rate limit. Each search only returns postings newer than
+        its checkpoint; the checkpoints are advanced here and written by
+        run() once the jobs are saved.
+        
+        Args:
+            runtime: Shared runtime (a private one is created if omitted)
+            
+        Returns:
+            Jobs per platform
+        """
+        searches = {
+            'indeed': self.search_indeed,
+            'ziprecruiter': self.search_ziprecruiter
+        }
+        pairs = [(platform, title) for platform in searches for title in HVAC_JOB_TITLES]
+        since = {
+            (platform, title): self.checkpoints.since(self.query_key(platform, title))
+            for platform, title in pairs
+        }
+        
+        async def search_all(rt: ScraperRuntime) -> List[Optional[List[Dict]]]:
+            return await rt.gather(
+                (
+                    rt.run_blocking(
+                        urlparse(JOB_BOARDS[platform]).netloc,
+                        searches[platform],
+                        title,
+                        since=since[(platform, title)]
+                    )
+                    for platform, title in pairs
+                ),
+                label="job board search"
+            )
+        
+        if runtime is not None:
+            results = await search_all(runtime)
+        else:
+            async with ScraperRuntime() as rt:
+                results = await search_all(rt)
+        
+        jobs_by_platform = {platform: [] for platform in searches}
+        for (platform, title), jobs in zip(pairs, results):
+            cutoff = since[(platform, title)]
+            new_jobs = [
+                job for job in jobs or []
+                if cutoff is None or job['posted_date'] > cutoff
+            ]
+            jobs_by_platform[platform].extend(new_jobs)
+            
+            if new_jobs:
+                newest = max(new_jobs, key=lambda job: job['posted_date'])
+                self.checkpoints.advance(self.query_key(platform, title), newest['posted_date'], newest['job_id'])
+        
+        return jobs_by_platform
+    
+    def process_jobs(self, jobs: List[Dict], stats: Dict) -> None:
+        """Deduplicate, score and queue jobs, updating stats in place"""
+        # One bulk duplicate check for the whole batch
+        hashes = [self.generate_content_hash(job['job_id'], job['platform']) for job in jobs]
+        seen = self.find_duplicates(hashes)
+        
+        fresh = []
+        for job, content_hash in zip(jobs, hashes):
+            if content_hash in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add(content_hash)
+            fresh.append(job)
+        
+        scored = []
+        for job, keyword_scores in zip(fresh, self.score_jobs_keywords([(j['job_title'], j['job_description']) for j in fresh])):
+            keyword_total = sum(
+                keyword_scores.get(cat, 0) * 25 / 10
+                for cat in ['urgency', 'budget', 'authority', 'pain']
+            )
+            scored.append((job, keyword_scores, keyword_total))
+        
+        # AI scoring only for promising postings, all in one concurrent batch
+        promising = [job for job, _, keyword_total in scored if keyword_total >= 40]
+        ai_by_job = self.score_jobs_ai(promising)
+        stats['ai_scored'] += len(ai_by_job)
+        
+        for job, keyword_scores, keyword_total in scored:
+            ai_scores = ai_by_job.get(job['job_id'])
+            final_score = ai_scores.get('ai_total_score', keyword_total) if ai_scores else keyword_total
+            
+            if final_score >= MIN_SCORE_THRESHOLD:
+                self.save_signal(job, keyword_scores, ai_scores)
+            else:
+                stats['low_score'] += 1
+    
+    def flush_signals(self) -> int:
+        """Write any queued signals, returning how many were new"""
+        return self.writer.flush()
+    
     def run(self) -> Dict[str, any]:
         """Main execution"""
         logger.info("🚀 Starting job board monitor")
@@ -320,8 +472,21 @@ class JobBoardMonitor:
             'by_platform': {}
         }
         
-        # Note: In production, this would actually scrape job boards
-        # For now, it's a framework ready to be activated
+        # Note: the board searches are placeholders until API access is set up
+        jobs_by_platform = run_sync(self.collect_jobs())
+        
+        for platform, jobs in jobs_by_platform.items():
+            stats['by_platform'][platform] = len(jobs)
+            stats['total_jobs'] += len(jobs)
+            self.process_jobs(jobs, stats)
+        
+        self.flush_signals()
+        stats['saved'] = self.writer.written
+        self.deduper.persist()
+        
+        # Keep the old cursors if any posting failed to save, so it is retried
+        if not self.writer.failed:
+            self.checkpoints.save()
         
         logger.info("=" * 60)
         logger.info("📊 Job Board Monitor Summary")
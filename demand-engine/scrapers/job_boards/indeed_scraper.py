@@ -5,11 +5,22 @@ Monitors HVAC/Plumbing job postings for pain signals
 
 import os
 import requests
+import httpx
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
 import re
 
+from classifiers.keyword_scorer import KeywordScorer
+from scrapers.runtime import ScraperRuntime, run_sync
+
+# Pain signal keywords (points per match)
+PAIN_SIGNAL_SCORER = KeywordScorer({
+    "urgency": [(kw, 20) for kw in ["urgent", "immediate", "asap", "emergency", "critical"]],
+    "growth": [(kw, 15) for kw in ["expanding", "growing", "new location", "opening"]],
+    "volume": [(kw, 10) for kw in ["high volume", "busy", "fast-paced", "multiple"]],
+})
+
 class IndeedScraper:
     """
     Scrapes Indeed for HVAC/Plumbing job postings
@@ -59,7 +70,21 @@ class IndeedScraper:
             print("⚠️  Indeed API key not set. Using mock data for demo.")
             return self._get_mock_data(keyword, location)
         
-        params = {
+        params = self._search_params(keyword, location, days_back)
+        
+        try:
+            response = requests.get(self.base_url, params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            
+            return data.get("results", [])
+        
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Indeed API error: {e}")
+            return []
+    
+    def _search_params(self, keyword: str, location: str, days_back: int) -> Dict:
+        return {
             "publisher": self.api_key,
             "q": keyword,
             "l": location,
@@ -73,15 +98,30 @@ class IndeedScraper:
             "format": "json",
             "v": "2"
         }
+    
+    async def search_jobs_async(
+        self,
+        runtime: ScraperRuntime,
+        keyword: str,
+        location: str,
+        days_back: int = 7
+    ) -> List[Dict]:
+        """search_jobs over the shared runtime (pooled client, per-host rate limit)"""
+        if not self.api_key:
+            return self._get_mock_data(keyword, location)
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = await runtime.get(
+                self.base_url,
+                params=self._search_params(keyword, location, days_back),
+                timeout=10
+            )
             response.raise_for_status()
             data = response.json()
             
             return data.get("results", [])
         
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             print(f"❌ Indeed API error: {e}")
             return []
     
@@ -119,34 +159,45 @@ class IndeedScraper:
         Returns:
             Pain signal analysis
         """
-        snippet = (job.get("snippet", "") + " " + job.get("jobtitle", "")).lower()
-        
-        # Pain signal keywords
-        urgency_keywords = ["urgent", "immediate", "asap", "emergency", "critical"]
-        growth_keywords = ["expanding", "growing", "new location", "opening"]
-        volume_keywords = ["high volume", "busy", "fast-paced", "multiple"]
-        
-        urgency_score = sum(20 for kw in urgency_keywords if kw in snippet)
-        growth_score = sum(15 for kw in growth_keywords if kw in snippet)
-        volume_score = sum(10 for kw in volume_keywords if kw in snippet)
+        return self.analyze_pain_signals_batch([job])[0]
+    
+    def analyze_pain_signals_batch(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Analyze a batch of job postings for pain signals in one pass
         
-        # Base score for actively hiring
-        base_score = 40
+        Args:
+            jobs: Job posting data
+            
+        Returns:
+            Pain signal analysis per job, in order
+        """
+        snippets = [job.get("snippet", "") + " " + job.get("jobtitle", "") for job in jobs]
         
-        total_score = min(base_score + urgency_score + growth_score + volume_score, 100)
+        analyses = []
+        for scores in PAIN_SIGNAL_SCORER.score_batch(snippets):
+            urgency_score = scores["urgency"]
+            growth_score = scores["growth"]
+            volume_score = scores["volume"]
+            
+            # Base score for actively hiring
+            base_score = 40
+            
+            total_score = min(base_score + urgency_score + growth_score + volume_score, 100)
+            
+            analyses.append({
+                "urgency_score": min(urgency_score, 100),
+                "budget_score": min(growth_score + 30, 100),  # Hiring = budget available
+                "authority_score": 70,  # Company decision makers
+                "pain_score": min(volume_score + urgency_score, 100),
+                "total_score": total_score,
+                "signals": {
+                    "urgency_detected": urgency_score > 0,
+                    "growth_detected": growth_score > 0,
+                    "high_volume": volume_score > 0
+                }
+            })
         
-        return {
-            "urgency_score": min(urgency_score, 100),
-            "budget_score": min(growth_score + 30, 100),  # Hiring = budget available
-            "authority_score": 70,  # Company decision makers
-            "pain_score": min(volume_score + urgency_score, 100),
-            "total_score": total_score,
-            "signals": {
-                "urgency_detected": urgency_score > 0,
-                "growth_detected": growth_score > 0,
-                "high_volume": volume_score > 0
-            }
-        }
+        return analyses
     
     def scrape_all_locations(self, days_back: int = 7) -> List[Dict]:
         """
@@ -158,30 +209,65 @@ class IndeedScraper:
         Returns:
             List of all signals found
         """
+        return run_sync(self.scrape_all_locations_async(days_back))
+    
+    async def scrape_all_locations_async(
+        self,
+        days_back: int = 7,
+        runtime: Optional[ScraperRuntime] = None
+    ) -> List[Dict]:
+        """
+        Search every keyword×location pair concurrently
+        
+        Args:
+            days_back: How many days back to search
+            runtime: Shared runtime (a private one is created if omitted)
+        """
+        pairs = [
+            (keyword, location)
+            for keyword in self.target_keywords
+            for location in self.target_locations
+        ]
+        
+        if not self.api_key:
+            print("⚠️  Indeed API key not set. Using mock data for demo.")
+        
+        async def search_all(rt: ScraperRuntime) -> List[Optional[List[Dict]]]:
+            return await rt.gather(
+                (self.search_jobs_async(rt, keyword, location, days_back) for keyword, location in pairs),
+                label="indeed search"
+            )
+        
+        if runtime is not None:
+            results = await search_all(runtime)
+        else:
+            async with ScraperRuntime() as rt:
+                results = await search_all(rt)
+        
+        found = []
+        for (keyword, location), jobs in zip(pairs, results):
+            jobs = jobs or []
+            print(f"🔍 {keyword} in {location}: found {len(jobs)} jobs")
+            found.extend((keyword, job) for job in jobs)
+        
+        # Keyword analysis for every posting in one pass
+        analyses = self.analyze_pain_signals_batch([job for _, job in found])
+        
         all_signals = []
         
-        for keyword in self.target_keywords:
-            for location in self.target_locations:
-                print(f"🔍 Searching: {keyword} in {location}")
-                
-                jobs = self.search_jobs(keyword, location, days_back)
-                
-                for job in jobs:
-                    company_info = self.extract_company_info(job)
-                    pain_analysis = self.analyze_pain_signals(job)
-                    
-                    signal = {
-                        **company_info,
-                        **pain_analysis,
-                        "source_type": "job_board_indeed",
-                        "signal_type": "hiring_activity",
-                        "keywords": [keyword],
-                        "scraped_at": datetime.now().isoformat()
-                    }
-                    
-                    all_signals.append(signal)
-                
-                print(f"   Found {len(jobs)} jobs")
+        for (keyword, job), pain_analysis in zip(found, analyses):
+            company_info = self.extract_company_info(job)
+            
+            signal = {
+                **company_info,
+                **pain_analysis,
+                "source_type": "job_board_indeed",
+                "signal_type": "hiring_activity",
+                "keywords": [keyword],
+                "scraped_at": datetime.now().isoformat()
+            }
+            
+            all_signals.append(signal)
         
         return all_signals
     
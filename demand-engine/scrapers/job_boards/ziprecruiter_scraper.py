@@ -5,10 +5,21 @@ Monitors HVAC/Plumbing job postings for pain signals
 
 import os
 import requests
+import httpx
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
 
+from classifiers.keyword_scorer import KeywordScorer
+from scrapers.runtime import ScraperRuntime, run_sync
+
+# Pain signal keywords (points per match)
+PAIN_SIGNAL_SCORER = KeywordScorer({
+    "urgency": [(kw, 20) for kw in ["urgent", "immediate", "asap", "emergency", "now hiring"]],
+    "growth": [(kw, 15) for kw in ["expanding", "growing", "new branch", "opening"]],
+    "volume": [(kw, 10) for kw in ["high volume", "busy", "fast-paced", "multiple openings"]],
+})
+
 class ZipRecruiterScraper:
     """
     Scrapes ZipRecruiter for HVAC/Plumbing job postings
@@ -53,7 +64,21 @@ class ZipRecruiterScraper:
             print("⚠️  ZipRecruiter API key not set. Using mock data for demo.")
             return self._get_mock_data(keyword, location)
         
-        params = {
+        params = self._search_params(keyword, location, days_back)
+        
+        try:
+            response = requests.get(self.base_url, params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            
+            return data.get("jobs", [])
+        
+        except requests.exceptions.RequestException as e:
+            print(f"❌ ZipRecruiter API error: {e}")
+            return []
+    
+    def _search_params(self, keyword: str, location: str, days_back: int) -> Dict:
+        return {
             "api_key": self.api_key,
             "search": keyword,
             "location": location,
@@ -62,15 +87,30 @@ class ZipRecruiterScraper:
             "jobs_per_page": 20,
             "page": 1
         }
+    
+    async def search_jobs_async(
+        self,
+        runtime: ScraperRuntime,
+        keyword: str,
+        location: str,
+        days_back: int = 7
+    ) -> List[Dict]:
+        """search_jobs over the shared runtime (pooled client, per-host rate limit)"""
+        if not self.api_key:
+            return self._get_mock_data(keyword, location)
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = await runtime.get(
+                self.base_url,
+                params=self._search_params(keyword, location, days_back),
+                timeout=10
+            )
             response.raise_for_status()
             data = response.json()
             
             return data.get("jobs", [])
         
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             print(f"❌ ZipRecruiter API error: {e}")
             return []
     
@@ -91,59 +131,97 @@ class ZipRecruiterScraper:
     
     def analyze_pain_signals(self, job: Dict) -> Dict:
         """Analyze job posting for pain signals"""
-        snippet = (job.get("snippet", "") + " " + job.get("name", "")).lower()
-        
-        # Pain signal keywords
-        urgency_keywords = ["urgent", "immediate", "asap", "emergency", "now hiring"]
-        growth_keywords = ["expanding", "growing", "new branch", "opening"]
-        volume_keywords = ["high volume", "busy", "fast-paced", "multiple openings"]
-        
-        urgency_score = sum(20 for kw in urgency_keywords if kw in snippet)
-        growth_score = sum(15 for kw in growth_keywords if kw in snippet)
-        volume_score = sum(10 for kw in volume_keywords if kw in snippet)
+        return self.analyze_pain_signals_batch([job])[0]
+    
+    def analyze_pain_signals_batch(self, jobs: List[Dict]) -> List[Dict]:
+        """Analyze a batch of job postings for pain signals in one pass"""
+        snippets = [job.get("snippet", "") + " " + job.get("name", "") for job in jobs]
         
-        base_score = 40
-        total_score = min(base_score + urgency_score + growth_score + volume_score, 100)
+        analyses = []
+        for scores in PAIN_SIGNAL_SCORER.score_batch(snippets):
+            urgency_score = scores["urgency"]
+            growth_score = scores["growth"]
+            volume_score = scores["volume"]
+            
+            base_score = 40
+            total_score = min(base_score + urgency_score + growth_score + volume_score, 100)
+            
+            analyses.append({
+                "urgency_score": min(urgency_score, 100),
+                "budget_score": min(growth_score + 30, 100),
+                "authority_score": 70,
+                "pain_score": min(volume_score + urgency_score, 100),
+                "total_score": total_score,
+                "signals": {
+                    "urgency_detected": urgency_score > 0,
+                    "growth_detected": growth_score > 0,
+                    "high_volume": volume_score > 0
+                }
+            })
         
-        return {
-            "urgency_score": min(urgency_score, 100),
-            "budget_score": min(growth_score + 30, 100),
-            "authority_score": 70,
-            "pain_score": min(volume_score + urgency_score, 100),
-            "total_score": total_score,
-            "signals": {
-                "urgency_detected": urgency_score > 0,
-                "growth_detected": growth_score > 0,
-                "high_volume": volume_score > 0
-            }
-        }
+        return analyses
     
     def scrape_all_locations(self, days_back: int = 7) -> List[Dict]:
         """Scrape all target keywords across all locations"""
+        return run_sync(self.scrape_all_locations_async(days_back))
+    
+    async def scrape_all_locations_async(
+        self,
+        days_back: int = 7,
+        runtime: Optional[ScraperRuntime] = None
+    ) -> List[Dict]:
+        """
+        Search every keyword×location pair concurrently
+        
+        Args:
+            days_back: How many days back to search
+            runtime: Shared runtime (a private one is created if omitted)
+        """
+        pairs = [
+            (keyword, location)
+            for keyword in self.target_keywords
+            for location in self.target_locations
+        ]
+        
+        if not self.api_key:
+            print("⚠️  ZipRecruiter API key not set. Using mock data for demo.")
+        
+        async def search_all(rt: ScraperRuntime) -> List[Optional[List[Dict]]]:
+            return await rt.gather(
+                (self.search_jobs_async(rt, keyword, location, days_back) for keyword, location in pairs),
+                label="ziprecruiter search"
+            )
+        
+        if runtime is not None:
+            results = await search_all(runtime)
+        else:
+            async with ScraperRuntime() as rt:
+                results = await search_all(rt)
+        
+        found = []
+        for (keyword, location), jobs in zip(pairs, results):
+            jobs = jobs or []
+            print(f"🔍 {keyword} in {location}: found {len(jobs)} jobs")
+            found.extend((keyword, job) for job in jobs)
+        
+        # Keyword analysis for every posting in one pass
+        analyses = self.analyze_pain_signals_batch([job for _, job in found])
+        
         all_signals = []
         
-        for keyword in self.target_keywords:
-            for location in self.target_locations:
-                print(f"🔍 Searching: {keyword} in {location}")
-                
-                jobs = self.search_jobs(keyword, location, days_back)
-                
-                for job in jobs:
-                    company_info = self.extract_company_info(job)
-                    pain_analysis = self.analyze_pain_signals(job)
-                    
-                    signal = {
-                        **company_info,
-                        **pain_analysis,
-                        "source_type": "job_board_ziprecruiter",
-                        "signal_type": "hiring_activity",
-                        "keywords": [keyword],
-                        "scraped_at": datetime.now().isoformat()
-                    }
-                    
-                    all_signals.append(signal)
-                
-                print(f"   Found {len(jobs)} jobs")
+        for (keyword, job), pain_analysis in zip(found, analyses):
+            company_info = self.extract_company_info(job)
+            
+            signal = {
+                **company_info,
+                **pain_analysis,
+                "source_type": "job_board_ziprecruiter",
+                "signal_type": "hiring_activity",
+                "keywords": [keyword],
+                "scraped_at": datetime.now().isoformat()
+            }
+            
+            all_signals.append(signal)
         
         return all_signals
     
@@ -9,6 +9,9 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
 import re
+from urllib.parse import urlparse
+
+from scrapers.runtime import ScraperRuntime, run_sync
 
 class StateLicenseScraper:
     """
@@ -115,12 +118,42 @@ class StateLicenseScraper:
         Returns:
             List of all license signals
         """
+        return run_sync(self.scrape_all_states_async(days_back))
+    
+    async def scrape_all_states_async(
+        self,
+        days_back: int = 30,
+        runtime: Optional[ScraperRuntime] = None
+    ) -> List[Dict]:
+        """
+        Check every state board concurrently (each board has its own host limit)
+        
+        Args:
+            days_back: How many days back to check
+            runtime: Shared runtime (a private one is created if omitted)
+        """
+        states = list(self.states.items())
+        
+        async def scrape_all(rt: ScraperRuntime) -> List[Optional[List[Dict]]]:
+            return await rt.gather(
+                (
+                    rt.run_blocking(urlparse(state_config['url']).netloc, self.scrape_new_licenses, state_code, days_back)
+                    for state_code, state_config in states
+                ),
+                label="licensing boards"
+            )
+        
+        if runtime is not None:
+            results = await scrape_all(runtime)
+        else:
+            async with ScraperRuntime() as rt:
+                results = await scrape_all(rt)
+        
         all_signals = []
         
-        for state_code, state_config in self.states.items():
-            print(f"🔍 Checking {state_config['name']} licensing board...")
-            
-            licenses = self.scrape_new_licenses(state_code, days_back)
+        for (state_code, state_config), licenses in zip(states, results):
+            licenses = licenses or []
+            print(f"🔍 {state_config['name']} licensing board: found {len(licenses)} new licenses")
             
             for license_data in licenses:
                 pain_analysis = self.analyze_license_signal(license_data)
@@ -134,8 +167,6 @@ class StateLicenseScraper:
                 }
                 
                 all_signals.append(signal)
-            
-            print(f"   Found {len(licenses)} new licenses")
         
         return all_signals
     
@@ -8,11 +8,14 @@ import hashlib
 import re
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 import logging
-import httpx
 from bs4 import BeautifulSoup
 
 from config.supabase_config import get_supabase
+from scrapers.dedup import ContentHashDeduper
+from scrapers.signal_writer import SignalBatchWriter
+from scrapers.runtime import ScraperRuntime, run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -65,12 +68,11 @@ class LicensingMonitor:
     def __init__(self):
         """Initialize licensing monitor"""
         self.supabase = get_supabase()
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+        self.deduper = ContentHashDeduper(self.supabase, "licensing_signals")
+        self.writer = SignalBatchWriter(
+            self.supabase,
+            "licensing_signals",
+            on_written=lambda rows: self.deduper.add(row.get('content_hash') for row in rows)
         )
     
     def search_california_licenses(self) -> List[Dict]:
@@ -204,19 +206,14 @@ class LicensingMonitor:
     
     def check_duplicate(self, content_hash: str) -> bool:
         """Check if license already exists"""
-        try:
-            result = self.supabase.table("licensing_signals")\
-                .select("id")\
-                .eq("content_hash", content_hash)\
-                .execute()
-            
-            return len(result.data) > 0
-        except Exception as e:
-            logger.error(f"❌ Duplicate check failed: {str(e)}")
-            return False
+        return self.deduper.is_duplicate(content_hash)
+    
+    def find_duplicates(self, content_hashes: List[str]) -> set:
+        """Check a whole batch of hashes with one bulk lookup"""
+        return self.deduper.find_duplicates(content_hashes)
     
     def save_signal(self, license_data: Dict, score: int) -> bool:
-        """Save licensing signal to database"""
+        """Queue licensing signal for a batched upsert (see flush_signals)"""
         try:
             signal_data = {
                 'license_number': license_data['license_number'],
@@ -254,8 +251,8 @@ class LicensingMonitor:
                 'scoring_method': 'keywords'
             }
             
-            # Insert into database
-            self.supabase.table("licensing_signals").insert(signal_data).execute()
+            # Queued; written in bulk when the batch fills or on flush_signals()
+            self.writer.add(signal_data)
             
             return True
             
@@ -263,6 +260,70 @@ class LicensingMonitor:
             logger.error(f"❌ Failed to save signal: {str(e)}")
             return False
     
+    async def collect_licenses(self, runtime: Optional[ScraperRuntime] = None) -> Dict[str, List[Dict]]:
+        """
+        Query every state board concurrently
+        
+        Args:
+            runtime: Shared runtime (a private one is created if omitted)
+            
+        Returns:
+            Raw license records per state
+        """
+        searches = {
+            'CA': self.search_california_licenses,
+            'TX': self.search_texas_licenses,
+            'FL': self.search_florida_licenses
+        }
+        
+        async def search_all(rt: ScraperRuntime) -> List[Optional[List[Dict]]]:
+            return await rt.gather(
+                (
+                    rt.run_blocking(urlparse(STATE_LICENSING_BOARDS[state]['search_url']).netloc, search)
+                    for state, search in searches.items()
+                ),
+                label="licensing search"
+            )
+        
+        if runtime is not None:
+            results = await search_all(runtime)
+        else:
+            async with ScraperRuntime() as rt:
+                results = await search_all(rt)
+        
+        return {state: records or [] for state, records in zip(searches, results)}
+    
+    def process_licenses(self, state: str, records: List[Dict], stats: Dict) -> None:
+        """Parse, deduplicate, score and queue one state's licenses, updating stats in place"""
+        licenses = [
+            license_data for license_data in
+            (self.parse_license_data(raw, state) for raw in records)
+            if license_data and license_data.get('license_number')
+        ]
+        
+        # One bulk duplicate check per state
+        hashes = [
+            self.generate_content_hash(license_data['license_number'], license_data['state'])
+            for license_data in licenses
+        ]
+        seen = self.find_duplicates(hashes)
+        
+        for license_data, content_hash in zip(licenses, hashes):
+            if content_hash in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add(content_hash)
+            
+            score = self.score_license(license_data)
+            if score >= MIN_SCORE_THRESHOLD:
+                self.save_signal(license_data, score)
+            else:
+                stats['low_score'] += 1
+    
+    def flush_signals(self) -> int:
+        """Write any queued signals, returning how many were new"""
+        return self.writer.flush()
+    
     def run(self) -> Dict[str, any]:
         """Main execution"""
         logger.info("🚀 Starting licensing board monitor")
@@ -275,8 +336,17 @@ class LicensingMonitor:
             'by_state': {}
         }
         
-        # Note: In production, this would actually scrape licensing boards
-        # For now, it's a framework ready to be activated
+        # Note: the board searches are placeholders until API access is set up
+        records_by_state = run_sync(self.collect_licenses())
+        
+        for state, records in records_by_state.items():
+            stats['by_state'][state] = len(records)
+            stats['total_licenses'] += len(records)
+            self.process_licenses(state, records, stats)
+        
+        self.flush_signals()
+        stats['saved'] = self.writer.written
+        self.deduper.persist()
         
         logger.info("=" * 60)
         logger.info("📊 Licensing Monitor Summary")
@@ -6,7 +6,9 @@ Sources: BBB, Licensing Boards, Business Associations (no social media)
 
 import os
 import sys
+import re
 import asyncio
+import hashlib
 import httpx
 from datetime import datetime
 from typing import List, Dict, Any
@@ -19,6 +21,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from scrapers.signal_writer import SignalBatchWriter
+
 # Load environment variables
 load_dotenv()
 
@@ -261,15 +265,32 @@ class LocalBusinessScraper:
         
         return business
     
+    @staticmethod
+    def business_hash(biz: Dict[str, Any]) -> str:
+        """Stable key for a business (name + phone digits)"""
+        name = (biz.get('business_name') or '').strip().lower()
+        phone = re.sub(r'\D', '', biz.get('phone') or '')
+        return hashlib.md5(f"{name}|{phone}".encode('utf-8')).hexdigest()
+    
     async def save_to_supabase(self, businesses: List[Dict[str, Any]]):
-        """Save scraped businesses to Supabase"""
+        """Save scraped businesses to Supabase with batched upserts"""
         print(f"\n💾 Saving {len(businesses)} businesses to Supabase...")
         
-        saved_count = 0
-        updated_count = 0
+        # Signals are skipped when already present; contacts are refreshed,
+        # keyed on the table's UNIQUE(business_name, phone) like the old
+        # insert-then-update (rows from before migration 020 have no hash)
+        signal_writer = SignalBatchWriter(self.supabase, Tables.SIGNALS)
+        contact_writer = SignalBatchWriter(
+            self.supabase,
+            Tables.BUSINESS_CONTACTS,
+            on_conflict="business_name,phone",
+            ignore_duplicates=False
+        )
         
         for biz in businesses:
             try:
+                business_hash = self.business_hash(biz)
+                
                 # Create signal record
                 signal_data = {
                     "title": f"{biz['business_name']} - {biz.get('industry', 'business').upper()} Opportunity",
@@ -285,13 +306,12 @@ class LocalBusinessScraper:
                     "contact_phone": biz.get('phone'),
                     "location": f"{biz.get('city', '')}, {biz.get('state', '')}",
                     "industry": biz.get('industry'),
-                    "status": "new"
+                    "status": "new",
+                    "content_hash": hashlib.md5(
+                        f"{biz.get('source', 'unknown')}|{business_hash}".encode('utf-8')
+                    ).hexdigest()
                 }
                 
-                # Insert signal
-                self.supabase.table(Tables.SIGNALS).insert(signal_data).execute()
-                saved_count += 1
-                
                 # Create business contact record
                 contact_data = {
                     "business_name": biz.get('business_name'),
@@ -312,22 +332,23 @@ class LocalBusinessScraper:
                     "source_url": biz.get('source_url'),
                     "source_data": json.dumps(biz),
                     "data_quality_score": 80,
-                    "status": "new"
+                    "status": "new",
+                    "content_hash": business_hash
                 }
                 
-                # Try to insert, update if exists
-                try:
-                    self.supabase.table("business_contacts").insert(contact_data).execute()
-                except:
-                    # Update existing record
-                    self.supabase.table("business_contacts").update(contact_data).eq(
-                        "business_name", biz.get('business_name')
-                    ).eq("phone", biz.get('phone')).execute()
-                    updated_count += 1
+                signal_writer.add(signal_data)
+                contact_writer.add(contact_data)
                 
             except Exception as e:
                 print(f"❌ Error saving {biz.get('business_name')}: {e}")
         
+        signal_writer.flush()
+        contact_writer.flush()
+        
+        # Contacts without a new signal were already known and got refreshed
+        saved_count = signal_writer.written
+        updated_count = max(0, contact_writer.written - saved_count)
+        
         print(f"✅ Saved {saved_count} new businesses, updated {updated_count}")
         return saved_count, updated_count
     
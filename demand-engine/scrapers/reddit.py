@@ -10,12 +10,12 @@ from typing import List, Dict, Optional
 import modal
 from praw import Reddit
 from praw.models import Submission, Comment
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 # Import Modal config
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from config.modal_config import app, scraper_image, secrets
+from scrapers.signal_writer import SignalBatchWriter
 
 # Subreddit targets for HVAC/Plumbing businesses
 TARGET_SUBREDDITS = [
@@ -127,12 +127,8 @@ def submission_to_signal(submission: Submission) -> Dict:
     }
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def save_signal_to_db(signal: Dict) -> bool:
-    """Save signal to Supabase with retry logic"""
+def create_supabase_client():
+    """Create Supabase client (once per scrape, shared by all writes)"""
     from supabase import create_client
     
     supabase_url = os.getenv("SUPABASE_URL")
@@ -141,37 +137,39 @@ def save_signal_to_db(signal: Dict) -> bool:
     if not supabase_url or not supabase_key:
         raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
     
-    client = create_client(supabase_url, supabase_key)
+    return create_client(supabase_url, supabase_key)
+
+
+def save_signals_to_db(client, signals: List[Dict], module: str = "reddit_scraper") -> Dict[str, int]:
+    """
+    Save signals to Supabase with multi-row upserts
     
-    try:
-        # Check for duplicate by content_hash
-        existing = client.table("signals").select("id").eq(
-            "content_hash", signal["content_hash"]
-        ).execute()
-        
-        if existing.data:
-            print(f"⏭️  Duplicate signal skipped: {signal['source_id']}")
-            return False
-        
-        # Insert new signal
-        result = client.table("signals").insert(signal).execute()
-        print(f"✅ Signal saved: {signal['source_id']} (score: {signal['raw_score']})")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error saving signal: {e}")
+    Duplicates (same content_hash) are skipped by ON CONFLICT DO NOTHING
+    instead of a lookup per signal.
+    
+    Returns:
+        {"saved": new signals written, "failed": signals that couldn't be written}
+    """
+    writer = SignalBatchWriter(client, "signals", on_conflict="content_hash")
+    writer.extend(signals)
+    writer.flush()
+    
+    if writer.failed:
+        print(f"❌ Failed to save {writer.failed} signals")
         # Log error to database
         try:
             client.table("error_logs").insert({
                 "error_type": "signal_save_error",
-                "error_message": str(e),
-                "module": "reddit_scraper",
+                "error_message": f"{writer.failed} of {len(signals)} signals failed to save",
+                "module": module,
                 "severity": "error",
-                "context": {"signal_id": signal.get("source_id")}
+                "context": {"source_ids": [signal.get("source_id") for signal in signals]}
             }).execute()
         except:
             pass
-        raise
+    
+    print(f"✅ Saved {writer.written} new signals ({len(signals)} scored)")
+    return {"saved": writer.written, "failed": writer.failed}
 
 
 @app.function(
@@ -222,6 +220,7 @@ def scrape_subreddit(
         else:
             submissions = subreddit.hot(limit=limit)
         
+        signals = []
         for submission in submissions:
             stats["total_fetched"] += 1
             
@@ -234,17 +233,19 @@ def scrape_subreddit(
                 
                 # Only save if raw_score >= 20 (has some signals)
                 if signal["raw_score"] >= 20:
-                    saved = save_signal_to_db(signal)
-                    if saved:
-                        stats["signals_saved"] += 1
-                    else:
-                        stats["duplicates_skipped"] += 1
+                    signals.append(signal)
                         
             except Exception as e:
                 print(f"❌ Error processing submission {submission.id}: {e}")
                 stats["errors"] += 1
                 continue
         
+        if signals:
+            result = save_signals_to_db(create_supabase_client(), signals)
+            stats["signals_saved"] = result["saved"]
+            stats["duplicates_skipped"] = len(signals) - result["saved"] - result["failed"]
+            stats["errors"] += result["failed"]
+        
         print(f"✅ Completed r/{subreddit_name}: {stats}")
         return stats
         
@@ -10,8 +10,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import praw
-from supabase import create_client
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 # Import shared logic from reddit.py
 from scrapers.reddit import (
@@ -21,48 +19,10 @@ from scrapers.reddit import (
     calculate_raw_score,
     create_reddit_client,
     submission_to_signal,
+    create_supabase_client,
+    save_signals_to_db,
 )
-
-
-def save_signal_to_db_local(signal: Dict) -> bool:
-    """Save signal to Supabase (local execution)"""
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_KEY")
-    
-    if not supabase_url or not supabase_key:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
-    
-    client = create_client(supabase_url, supabase_key)
-    
-    try:
-        # Check for duplicate
-        existing = client.table("signals").select("id").eq(
-            "content_hash", signal["content_hash"]
-        ).execute()
-        
-        if existing.data:
-            print(f"⏭️  Duplicate signal skipped: {signal['source_id']}")
-            return False
-        
-        # Insert new signal
-        result = client.table("signals").insert(signal).execute()
-        print(f"✅ Signal saved: {signal['source_id']} (score: {signal['raw_score']})")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error saving signal: {e}")
-        # Log error
-        try:
-            client.table("error_logs").insert({
-                "error_type": "signal_save_error",
-                "error_message": str(e),
-                "module": "reddit_scraper_local",
-                "severity": "error",
-                "context": {"signal_id": signal.get("source_id")}
-            }).execute()
-        except:
-            pass
-        raise
+from scrapers.checkpoints import CheckpointStore
 
 
 def scrape_subreddit_local(
@@ -73,11 +33,18 @@ def scrape_subreddit_local(
 ) -> Dict[str, int]:
     """
     Scrape a subreddit locally (no Modal)
+    
+    With sort="new" only posts newer than the subreddit's checkpoint are
+    fetched and scored; other listings aren't chronological, so they are
+    always read in full and rely on content-hash dedup.
     """
     print(f"🔍 Scraping r/{subreddit_name} (limit={limit}, sort={sort})")
     
     reddit = create_reddit_client()
     subreddit = reddit.subreddit(subreddit_name)
+    client = create_supabase_client()
+    checkpoints = CheckpointStore(client, "reddit_local")
+    checkpoint = checkpoints.get(subreddit_name) if sort == "new" else None
     
     stats = {
         "total_fetched": 0,
@@ -99,7 +66,19 @@ def scrape_subreddit_local(
         else:
             submissions = subreddit.hot(limit=limit)
         
+        signals = []
+        newest = None
+        failed_writes = 0
         for submission in submissions:
+            # "new" is newest-first: stop at the last post handled previously
+            if checkpoint and (
+                submission.id == checkpoint["last_seen_id"]
+                or datetime.fromtimestamp(submission.created_utc, tz=timezone.utc) < checkpoint["last_seen_at"]
+            ):
+                break
+            
+            if newest is None:
+                newest = submission
             stats["total_fetched"] += 1
             
             # Skip if no text content
@@ -111,17 +90,29 @@ def scrape_subreddit_local(
                 
                 # Only save if raw_score >= 20
                 if signal["raw_score"] >= 20:
-                    saved = save_signal_to_db_local(signal)
-                    if saved:
-                        stats["signals_saved"] += 1
-                    else:
-                        stats["duplicates_skipped"] += 1
+                    signals.append(signal)
                         
             except Exception as e:
                 print(f"❌ Error processing submission {submission.id}: {e}")
                 stats["errors"] += 1
                 continue
         
+        if signals:
+            result = save_signals_to_db(client, signals, module="reddit_scraper_local")
+            stats["signals_saved"] = result["saved"]
+            stats["duplicates_skipped"] = len(signals) - result["saved"] - result["failed"]
+            failed_writes = result["failed"]
+            stats["errors"] += failed_writes
+        
+        # Move the cursor only once everything fetched has been written
+        if sort == "new" and newest is not None and not failed_writes:
+            checkpoints.advance(
+                subreddit_name,
+                datetime.fromtimestamp(newest.created_utc, tz=timezone.utc),
+                newest.id
+            )
+            checkpoints.save()
+        
         print(f"✅ Completed r/{subreddit_name}: {stats}")
         return stats
         
@@ -133,10 +124,14 @@ def scrape_subreddit_local(
 
 def scrape_all_subreddits_local(
     limit_per_subreddit: int = 50,
-    subreddits: Optional[List[str]] = None
+    subreddits: Optional[List[str]] = None,
+    sort: str = "new"
 ) -> Dict[str, Dict]:
     """
     Scrape all target subreddits locally
+    
+    Defaults to the "new" listing so repeated runs resume from each
+    subreddit's checkpoint.
     """
     target_subs = subreddits or TARGET_SUBREDDITS
     
@@ -149,7 +144,7 @@ def scrape_all_subreddits_local(
             stats = scrape_subreddit_local(
                 subreddit_name=subreddit_name,
                 limit=limit_per_subreddit,
-                sort="hot"
+                sort=sort
             )
             all_stats[subreddit_name] = stats
         except Exception as e:
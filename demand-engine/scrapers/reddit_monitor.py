@@ -7,11 +7,17 @@ import praw
 import os
 import hashlib
 import re
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 import logging
 
+from classifiers.keyword_scorer import KeywordScorer
 from config.supabase_config import get_supabase
+from scrapers.dedup import ContentHashDeduper
+from scrapers.signal_writer import SignalBatchWriter
+from scrapers.runtime import ScraperRuntime, run_sync
+from scrapers.checkpoints import CheckpointStore
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,8 @@ logger = logging.getLogger(__name__)
 SUBREDDITS = ['HVAC', 'homeowners', 'Plumbing', 'HomeImprovement', 'hvacadvice']
 LOOKBACK_HOURS = 24
 MIN_SCORE_THRESHOLD = 70
+DUPLICATE_LOOKBACK_DAYS = 7
+REDDIT_API_HOST = 'oauth.reddit.com'
 
 # Scoring weights (must sum to 100)
 SCORE_WEIGHTS = {
@@ -52,6 +60,7 @@ SIGNAL_KEYWORDS = {
         'missed calls', 'voicemail', 'can\'t reach', 'not answering'
     ]
 }
+QUICK_KEYWORD_SCORER = KeywordScorer(SIGNAL_KEYWORDS)
 
 
 class RedditMonitor:
@@ -59,16 +68,31 @@ class RedditMonitor:
     
     def __init__(self):
         """Initialize Reddit API client"""
-        self.reddit = praw.Reddit(
-            client_id=os.getenv('REDDIT_CLIENT_ID'),
-            client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
-            user_agent=os.getenv('REDDIT_USER_AGENT', 'PainSignalBot/1.0')
-        )
+        self._local = threading.local()
         self.supabase = get_supabase()
+        self.deduper = ContentHashDeduper(
+            self.supabase,
+            "reddit_signals",
+            lookback_days=DUPLICATE_LOOKBACK_DAYS
+        )
+        self.checkpoints = CheckpointStore(self.supabase, "reddit_monitor")
+    
+    @property
+    def reddit(self) -> praw.Reddit:
+        """Reddit client for the calling thread (PRAW instances aren't thread-safe)"""
+        client = getattr(self._local, 'reddit', None)
+        if client is None:
+            client = self._local.reddit = praw.Reddit(
+                client_id=os.getenv('REDDIT_CLIENT_ID'),
+                client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
+                user_agent=os.getenv('REDDIT_USER_AGENT', 'PainSignalBot/1.0')
+            )
+        return client
     
     def fetch_recent_posts(self, subreddit_name: str, hours: int = 24) -> List[Dict]:
         """
-        Fetch posts from last N hours
+        Fetch posts from last N hours that are newer than the subreddit's
+        checkpoint (posts handled by a previous run are not returned)
         
         Args:
             subreddit_name: Name of subreddit to monitor
@@ -81,13 +105,21 @@ class RedditMonitor:
             subreddit = self.reddit.subreddit(subreddit_name)
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
+            checkpoint = self.checkpoints.get(subreddit_name)
+            if checkpoint and checkpoint['last_seen_at'] > cutoff_time:
+                cutoff_time = checkpoint['last_seen_at']
+            last_seen_id = checkpoint['last_seen_id'] if checkpoint else None
+            
             posts = []
             
-            # Fetch from new posts (most recent)
+            # Fetch from new posts (most recent first), stopping at the cutoff
             for submission in subreddit.new(limit=100):
                 post_time = datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
                 
-                if post_time > cutoff_time:
+                if post_time < cutoff_time:
+                    break
+                
+                if submission.id != last_seen_id:
                     posts.append({
                         'id': submission.id,
                         'subreddit': subreddit_name,
@@ -124,7 +156,7 @@ class RedditMonitor:
         
         return hashlib.md5(normalized.encode()).hexdigest()
     
-    def is_duplicate(self, content_hash: str, lookback_days: int = 7) -> bool:
+    def is_duplicate(self, content_hash: str, lookback_days: int = DUPLICATE_LOOKBACK_DAYS) -> bool:
         """
         Check if similar content seen recently
         
@@ -135,6 +167,9 @@ class RedditMonitor:
         Returns:
             True if duplicate found
         """
+        if lookback_days == self.deduper.lookback_days:
+            return self.deduper.is_duplicate(content_hash)
+        
         try:
             cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
             
@@ -165,9 +200,25 @@ class RedditMonitor:
         if category not in SIGNAL_KEYWORDS:
             return 0
         
-        text_lower = text.lower()
-        matches = sum(1 for keyword in SIGNAL_KEYWORDS[category] if keyword in text_lower)
+        return self.quick_keyword_scores([text])[0][category]
+    
+    def quick_keyword_scores(self, texts: List[str]) -> List[Dict[str, int]]:
+        """
+        Fast keyword-based pre-scoring (0-10) of every category for a batch
         
+        Args:
+            texts: Texts to score
+            
+        Returns:
+            Category scores per text, in order
+        """
+        return [
+            {category: self._scale_matches(matches) for category, matches in counts.items()}
+            for counts in QUICK_KEYWORD_SCORER.score_batch(texts)
+        ]
+    
+    @staticmethod
+    def _scale_matches(matches: int) -> int:
         # Convert matches to 0-10 scale
         if matches == 0:
             return 0
@@ -274,12 +325,13 @@ class RedditMonitor:
         
         return entities
     
-    def score_post(self, post: Dict) -> Dict:
+    def score_post(self, post: Dict, quick_scores: Optional[Dict[str, int]] = None) -> Dict:
         """
         Score a single post using keyword matching
         
         Args:
             post: Post dictionary
+            quick_scores: Precomputed quick_keyword_scores() for the post
             
         Returns:
             Dictionary with scores and metadata
@@ -288,12 +340,8 @@ class RedditMonitor:
         full_text = f"{post['title']} {post['body']}"
         
         # Quick keyword scan
-        quick_scores = {
-            'urgency': self.quick_keyword_score(full_text, 'urgency'),
-            'budget': self.quick_keyword_score(full_text, 'budget'),
-            'authority': self.quick_keyword_score(full_text, 'authority'),
-            'pain': self.quick_keyword_score(full_text, 'pain')
-        }
+        if quick_scores is None:
+            quick_scores = self.quick_keyword_scores([full_text])[0]
         
         # For now, use keyword scores (AI scoring can be added later)
         final_scores = quick_scores
@@ -329,26 +377,47 @@ class RedditMonitor:
             'alerted': False
         }
     
-    def save_signal(self, signal: Dict) -> Optional[str]:
+    def signal_writer(self) -> SignalBatchWriter:
         """
-        Save signal to database
+        Batched writer for reddit_signals
+        
+        Conflicts on post_id (content hashes may repeat after the dedup
+        window); written hashes are added to the dedup filter.
+        """
+        return SignalBatchWriter(
+            self.supabase,
+            "reddit_signals",
+            on_conflict="post_id",
+            on_written=lambda rows: self.deduper.add(row.get('content_hash') for row in rows)
+        )
+    
+    def save_signal(self, signal: Dict, check_duplicate: bool = True) -> Optional[str]:
+        """
+        Save a single signal to database
+        
+        Batch callers should queue rows on signal_writer() instead.
         
         Args:
             signal: Signal dictionary
+            check_duplicate: Skip the duplicate check (caller already
+                deduplicated the batch)
             
         Returns:
             Signal ID if saved, None if duplicate or error
         """
         try:
             # Check for duplicate
-            if self.is_duplicate(signal['content_hash']):
+            if check_duplicate and self.is_duplicate(signal['content_hash']):
                 logger.info(f"Skipping duplicate post: {signal['post_id']}")
                 return None
             
-            # Insert into database
-            response = self.supabase.table("reddit_signals").insert(signal).execute()
+            # Upsert so a post saved by a concurrent run is skipped, not an error
+            response = self.supabase.table("reddit_signals").upsert(
+                signal, on_conflict="post_id", ignore_duplicates=True
+            ).execute()
             
             if response.data:
+                self.deduper.add([signal['content_hash']])
                 signal_id = response.data[0]['id']
                 logger.info(f"Saved signal {signal_id} with score {signal['total_score']}")
                 return signal_id
@@ -367,34 +436,67 @@ class RedditMonitor:
             subreddit_name: Subreddit to process
             hours: Lookback period
             
+        Returns:
+            Processing statistics
+        """
+        posts = self.fetch_recent_posts(subreddit_name, hours)
+        stats = self.process_posts(subreddit_name, posts)
+        self.checkpoints.save()
+        return stats
+    
+    async def fetch_all(self, subreddits: List[str], hours: int = 24) -> List[List[Dict]]:
+        """
+        Fetch several subreddits concurrently
+        
+        Each listing runs in a worker thread under the shared runtime's
+        concurrency cap and Reddit rate limit.
+        
+        Returns:
+            Posts per subreddit, in the same order
+        """
+        async with ScraperRuntime() as runtime:
+            results = await runtime.gather(
+                (
+                    runtime.run_blocking(REDDIT_API_HOST, self.fetch_recent_posts, name, hours)
+                    for name in subreddits
+                ),
+                label="reddit fetch"
+            )
+        return [posts or [] for posts in results]
+    
+    def process_posts(self, subreddit_name: str, posts: List[Dict]) -> Dict:
+        """
+        Score, deduplicate and save fetched posts
+        
+        Args:
+            subreddit_name: Subreddit the posts came from
+            posts: Posts from fetch_recent_posts
+            
         Returns:
             Processing statistics
         """
         stats = {
-            'fetched': 0,
+            'fetched': len(posts),
             'processed': 0,
             'skipped': 0,
             'high_score': 0,
             'saved': 0
         }
         
-        # Fetch posts
-        posts = self.fetch_recent_posts(subreddit_name, hours)
-        stats['fetched'] = len(posts)
+        # Keyword scan for the whole batch in one pass
+        quick_scores = self.quick_keyword_scores([f"{post['title']} {post['body']}" for post in posts])
         
-        # Process each post
-        for post in posts:
+        # Score each post
+        high_score_signals = []
+        for post, post_quick_scores in zip(posts, quick_scores):
             try:
-                # Score the post
-                signal = self.score_post(post)
+                signal = self.score_post(post, post_quick_scores)
                 stats['processed'] += 1
                 
                 # Only save if score meets threshold
                 if signal['total_score'] >= MIN_SCORE_THRESHOLD:
                     stats['high_score'] += 1
-                    signal_id = self.save_signal(signal)
-                    if signal_id:
-                        stats['saved'] += 1
+                    high_score_signals.append(signal)
                 else:
                     stats['skipped'] += 1
                     
@@ -402,6 +504,24 @@ class RedditMonitor:
                 logger.error(f"Error processing post {post['id']}: {str(e)}")
                 continue
         
+        # One bulk duplicate check and multi-row writes for the whole subreddit
+        seen = self.deduper.find_duplicates(s['content_hash'] for s in high_score_signals)
+        
+        with self.signal_writer() as writer:
+            for signal in high_score_signals:
+                if signal['content_hash'] in seen:
+                    logger.info(f"Skipping duplicate post: {signal['post_id']}")
+                    continue
+                seen.add(signal['content_hash'])
+                writer.add(signal)
+        
+        stats['saved'] = writer.written
+        
+        # Everything fetched is handled; only move the cursor if nothing failed to save
+        if posts and not writer.failed:
+            newest = max(posts, key=lambda p: p['created_utc'])
+            self.checkpoints.advance(subreddit_name, newest['created_utc'], newest['id'])
+        
         logger.info(f"r/{subreddit_name} stats: {stats}")
         return stats
     
@@ -423,11 +543,17 @@ class RedditMonitor:
             'saved': 0
         }
         
-        for subreddit in SUBREDDITS:
-            stats = self.process_subreddit(subreddit, LOOKBACK_HOURS)
+        # Fetch every subreddit in parallel, then score/save each in turn
+        all_posts = run_sync(self.fetch_all(SUBREDDITS, LOOKBACK_HOURS))
+        
+        for subreddit, posts in zip(SUBREDDITS, all_posts):
+            stats = self.process_posts(subreddit, posts)
             for key in combined_stats:
                 combined_stats[key] += stats[key]
         
+        self.deduper.persist()
+        self.checkpoints.save()
+        
         processing_time = (datetime.now() - start_time).total_seconds()
         combined_stats['processing_time_seconds'] = int(processing_time)
         
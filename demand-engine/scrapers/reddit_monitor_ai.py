@@ -14,6 +14,9 @@ import logging
 
 from config.supabase_config import get_supabase
 from classifiers.ai_scorer import AISignalScorer
+from classifiers.keyword_scorer import KeywordScorer
+from scrapers.dedup import ContentHashDeduper
+from scrapers.signal_writer import SignalBatchWriter
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,7 @@ SIGNAL_KEYWORDS = {
         'uncomfortable', 'unbearable', 'suffering', 'miserable'
     ]
 }
+KEYWORD_SCORER = KeywordScorer(SIGNAL_KEYWORDS)
 
 # Location patterns
 LOCATION_PATTERNS = [
@@ -70,6 +74,7 @@ class RedditMonitorAI:
         """Initialize Reddit client and AI scorer"""
         self.reddit = self._init_reddit()
         self.supabase = get_supabase()
+        self.deduper = ContentHashDeduper(self.supabase, "reddit_signals")
         
         # Initialize AI scorer if enabled
         self.ai_scorer = None
@@ -148,21 +153,18 @@ class RedditMonitorAI:
     
     def score_post_keywords(self, title: str, body: str) -> Dict[str, int]:
         """Score post using keyword matching (baseline)"""
-        text = f"{title} {body}".lower()
-        
-        scores = {}
-        for category, keywords in SIGNAL_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text:
-                    score += 1
-            
+        return self.score_posts_keywords([(title, body)])[0]
+    
+    def score_posts_keywords(self, posts: List[tuple]) -> List[Dict[str, int]]:
+        """Keyword-score a batch of (title, body) pairs in one pass"""
+        results = []
+        for counts in KEYWORD_SCORER.score_batch([f"{title} {body}" for title, body in posts]):
             # Normalize to 0-10 scale
-            max_possible = len(keywords)
-            normalized = min(10, int((score / max_possible) * 20))
-            scores[category] = normalized
-        
-        return scores
+            results.append({
+                category: min(10, int((counts[category] / len(keywords)) * 20))
+                for category, keywords in SIGNAL_KEYWORDS.items()
+            })
+        return results
     
     def score_post_ai(
         self,
@@ -185,6 +187,31 @@ class RedditMonitorAI:
             logger.error(f"❌ AI scoring failed: {str(e)}")
             return None
     
+    def score_posts_ai(self, posts: List[Dict]) -> Dict[str, Dict]:
+        """Score posts using AI in one concurrent batch, keyed by post id"""
+        if not self.ai_scorer or not posts:
+            return {}
+        
+        try:
+            results = self.ai_scorer.batch_score([
+                {
+                    'title': post['title'],
+                    'content': post['body'],
+                    'source': 'reddit',
+                    'metadata': {
+                        'subreddit': post['subreddit'],
+                        'author': post['author'],
+                        'upvotes': post['score']
+                    }
+                }
+                for post in posts
+            ])
+        except Exception as e:
+            logger.error(f"❌ AI batch scoring failed: {str(e)}")
+            return {}
+        
+        return {post['post_id']: result for post, result in zip(posts, results)}
+    
     def extract_location(self, text: str) -> Optional[str]:
         """Extract location from text"""
         for pattern in LOCATION_PATTERNS:
@@ -232,82 +259,88 @@ class RedditMonitorAI:
     
     def check_duplicate(self, content_hash: str) -> bool:
         """Check if signal already exists"""
-        try:
-            result = self.supabase.table("reddit_signals")\
-                .select("id")\
-                .eq("content_hash", content_hash)\
-                .execute()
+        return self.deduper.is_duplicate(content_hash)
+    
+    def build_signal_data(self, post: Dict, keyword_scores: Dict, ai_scores: Optional[Dict]) -> Dict:
+        """Build the reddit_signals row for a scored post"""
+        # Calculate keyword total score
+        keyword_total = sum(
+            keyword_scores.get(cat, 0) * (SCORE_WEIGHTS[cat] / 10)
+            for cat in SCORE_WEIGHTS.keys()
+        )
+        
+        # Prepare base data
+        signal_data = {
+            'post_id': post['post_id'],
+            'subreddit': post['subreddit'],
+            'author': post['author'],
+            'title': post['title'],
+            'body': post['body'],
+            'created_utc': post['created_utc'].isoformat(),
+            'url': post['url'],
+            'score': post['score'],
+            'num_comments': post['num_comments'],
             
-            return len(result.data) > 0
-        except Exception as e:
-            logger.error(f"❌ Duplicate check failed: {str(e)}")
-            return False
+            # Keyword scores
+            'urgency_score': keyword_scores.get('urgency', 0),
+            'budget_score': keyword_scores.get('budget', 0),
+            'authority_score': keyword_scores.get('authority', 0),
+            'pain_score': keyword_scores.get('pain', 0),
+            'total_score': int(keyword_total),
+            
+            # Extracted entities
+            'location': self.extract_location(f"{post['title']} {post['body']}"),
+            'company_mentioned': self.extract_company(f"{post['title']} {post['body']}"),
+            'problem_type': self.extract_problem_type(f"{post['title']} {post['body']}"),
+            
+            # Deduplication
+            'content_hash': self.generate_content_hash(post['title'], post['body']),
+            
+            # Processing metadata
+            'processed': True,
+            'scoring_method': 'ai' if ai_scores else 'keywords'
+        }
+        
+        # Add AI scores if available
+        if ai_scores:
+            signal_data.update({
+                'ai_urgency_score': ai_scores.get('ai_urgency_score', 0),
+                'ai_budget_score': ai_scores.get('ai_budget_score', 0),
+                'ai_authority_score': ai_scores.get('ai_authority_score', 0),
+                'ai_pain_score': ai_scores.get('ai_pain_score', 0),
+                'ai_total_score': ai_scores.get('ai_total_score', 0),
+                'ai_tier': ai_scores.get('ai_tier', 'cold'),
+                'sentiment': ai_scores.get('sentiment'),
+                'intent': ai_scores.get('intent'),
+                'lead_quality': ai_scores.get('lead_quality'),
+                'key_indicators': json.dumps(ai_scores.get('key_indicators', [])),
+                'recommended_action': ai_scores.get('recommended_action'),
+                'ai_reasoning': ai_scores.get('reasoning'),
+                'ai_confidence': ai_scores.get('confidence'),
+                'ai_analyzed_at': ai_scores.get('analyzed_at'),
+                'ai_model': ai_scores.get('model')
+            })
+        
+        return signal_data
+    
+    def signal_writer(self) -> SignalBatchWriter:
+        """Batched writer for reddit_signals (conflicts on post_id)"""
+        return SignalBatchWriter(
+            self.supabase,
+            "reddit_signals",
+            on_conflict="post_id",
+            on_written=lambda rows: self.deduper.add(row.get('content_hash') for row in rows)
+        )
     
     def save_signal(self, post: Dict, keyword_scores: Dict, ai_scores: Optional[Dict]) -> bool:
-        """Save signal to database"""
+        """Save a single signal to database"""
         try:
-            # Calculate keyword total score
-            keyword_total = sum(
-                keyword_scores.get(cat, 0) * (SCORE_WEIGHTS[cat] / 10)
-                for cat in SCORE_WEIGHTS.keys()
-            )
-            
-            # Prepare base data
-            signal_data = {
-                'post_id': post['post_id'],
-                'subreddit': post['subreddit'],
-                'author': post['author'],
-                'title': post['title'],
-                'body': post['body'],
-                'created_utc': post['created_utc'].isoformat(),
-                'url': post['url'],
-                'score': post['score'],
-                'num_comments': post['num_comments'],
-                
-                # Keyword scores
-                'urgency_score': keyword_scores.get('urgency', 0),
-                'budget_score': keyword_scores.get('budget', 0),
-                'authority_score': keyword_scores.get('authority', 0),
-                'pain_score': keyword_scores.get('pain', 0),
-                'total_score': int(keyword_total),
-                
-                # Extracted entities
-                'location': self.extract_location(f"{post['title']} {post['body']}"),
-                'company_mentioned': self.extract_company(f"{post['title']} {post['body']}"),
-                'problem_type': self.extract_problem_type(f"{post['title']} {post['body']}"),
-                
-                # Deduplication
-                'content_hash': self.generate_content_hash(post['title'], post['body']),
-                
-                # Processing metadata
-                'processed': True,
-                'scoring_method': 'ai' if ai_scores else 'keywords'
-            }
-            
-            # Add AI scores if available
-            if ai_scores:
-                signal_data.update({
-                    'ai_urgency_score': ai_scores.get('ai_urgency_score', 0),
-                    'ai_budget_score': ai_scores.get('ai_budget_score', 0),
-                    'ai_authority_score': ai_scores.get('ai_authority_score', 0),
-                    'ai_pain_score': ai_scores.get('ai_pain_score', 0),
-                    'ai_total_score': ai_scores.get('ai_total_score', 0),
-                    'ai_tier': ai_scores.get('ai_tier', 'cold'),
-                    'sentiment': ai_scores.get('sentiment'),
-                    'intent': ai_scores.get('intent'),
-                    'lead_quality': ai_scores.get('lead_quality'),
-                    'key_indicators': json.dumps(ai_scores.get('key_indicators', [])),
-                    'recommended_action': ai_scores.get('recommended_action'),
-                    'ai_reasoning': ai_scores.get('reasoning'),
-                    'ai_confidence': ai_scores.get('confidence'),
-                    'ai_analyzed_at': ai_scores.get('analyzed_at'),
-                    'ai_model': ai_scores.get('model')
-                })
+            signal_data = self.build_signal_data(post, keyword_scores, ai_scores)
             
-            # Insert into database
-            self.supabase.table("reddit_signals").insert(signal_data).execute()
+            with self.signal_writer() as writer:
+                writer.add(signal_data)
             
-            return True
+            return writer.written > 0
             
         except Exception as e:
             logger.error(f"❌ Failed to save signal: {str(e)}")
@@ -323,45 +356,50 @@ class RedditMonitorAI:
             'ai_scored': 0
         }
         
-        for post in posts:
+        # One bulk duplicate check for the whole batch
+        hashes = [self.generate_content_hash(post['title'], post['body']) for post in posts]
+        seen = self.deduper.find_duplicates(hashes)
+        writer = self.signal_writer()
+        
+        fresh = []
+        for post, content_hash in zip(posts, hashes):
             # Check for duplicates
-            content_hash = self.generate_content_hash(post['title'], post['body'])
-            if self.check_duplicate(content_hash):
+            if content_hash in seen:
                 stats['duplicates'] += 1
                 continue
-            
-            # Keyword scoring (always done)
-            keyword_scores = self.score_post_keywords(post['title'], post['body'])
+            seen.add(content_hash)
+            fresh.append(post)
+        
+        # Keyword scoring (always done), one pass for the batch
+        scored = []
+        for post, keyword_scores in zip(fresh, self.score_posts_keywords([(p['title'], p['body']) for p in fresh])):
             keyword_total = sum(
                 keyword_scores.get(cat, 0) * (SCORE_WEIGHTS[cat] / 10)
                 for cat in SCORE_WEIGHTS.keys()
             )
-            
-            # AI scoring (if enabled and keyword score is promising)
-            ai_scores = None
-            if self.ai_scorer and keyword_total >= 40:  # Only AI score promising signals
-                ai_scores = self.score_post_ai(
-                    title=post['title'],
-                    body=post['body'],
-                    metadata={
-                        'subreddit': post['subreddit'],
-                        'author': post['author'],
-                        'upvotes': post['score']
-                    }
-                )
-                if ai_scores:
-                    stats['ai_scored'] += 1
+            scored.append((post, keyword_scores, keyword_total))
+        
+        # AI scoring (if enabled) for promising signals, all in one concurrent batch
+        promising = [post for post, _, keyword_total in scored if keyword_total >= 40]
+        ai_by_post = self.score_posts_ai(promising)
+        stats['ai_scored'] = len(ai_by_post)
+        
+        for post, keyword_scores, keyword_total in scored:
+            ai_scores = ai_by_post.get(post['post_id'])
             
             # Determine if signal is worth saving
             final_score = ai_scores.get('ai_total_score', keyword_total) if ai_scores else keyword_total
             
             if final_score >= MIN_SCORE_THRESHOLD:
-                if self.save_signal(post, keyword_scores, ai_scores):
-                    stats['saved'] += 1
-                    logger.info(f"✅ Saved signal: {post['title'][:50]}... (Score: {final_score})")
+                writer.add(self.build_signal_data(post, keyword_scores, ai_scores))
+                logger.info(f"✅ Queued signal: {post['title'][:50]}... (Score: {final_score})")
             else:
                 stats['low_score'] += 1
         
+        # Multi-row upsert of everything queued above
+        writer.flush()
+        stats['saved'] = writer.written
+        
         return stats
     
     def run(self) -> Dict[str, any]:
@@ -388,6 +426,8 @@ class RedditMonitorAI:
             all_stats['total_ai_scored'] += stats['ai_scored']
             all_stats['by_subreddit'][subreddit] = stats
         
+        self.deduper.persist()
+        
         logger.info("=" * 60)
         logger.info("📊 Reddit Monitor Summary")
         logger.info("=" * 60)
@@ -0,0 +1,209 @@
+"""
+Concurrent Scraping Runtime
+Runs scraper requests in parallel with bounded concurrency, per-host token
+bucket rate limits and one pooled HTTP client
+
+Example:
+    async def fetch_all(pairs):
+        async with ScraperRuntime() as runtime:
+            return await runtime.gather(
+                runtime.get(url, params=params) for url, params in pairs
+            )
+
+    responses = run_sync(fetch_all(pairs))
+
+Blocking clients (PRAW, requests, mock/demo sources) go through
+run_blocking(), which applies the same limits and runs the call in a
+worker thread.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+SCRAPER_MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "8"))
+SCRAPER_DEFAULT_HOST_RATE = float(os.getenv("SCRAPER_DEFAULT_HOST_RATE", "2.0"))  # requests/second
+SCRAPER_HOST_BURST = int(os.getenv("SCRAPER_HOST_BURST", "2"))
+SCRAPER_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "30"))
+
+# Per-host request rates (requests/second), tighter than the sites' published limits
+HOST_RATE_LIMITS = {
+    "oauth.reddit.com": 1.5,
+    "www.reddit.com": 1.0,
+    "api.indeed.com": 2.0,
+    "api.ziprecruiter.com": 2.0,
+    "www.indeed.com": 0.5,
+    "www.ziprecruiter.com": 0.5,
+    "www.bbb.org": 0.5,
+}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, up to `capacity` banked"""
+
+    def __init__(self, rate: float, capacity: int = SCRAPER_HOST_BURST):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ScraperRuntime:
+    """
+    Shared runtime for one scraping run
+
+    Create it inside the event loop that uses it (buckets, semaphore and the
+    HTTP client are bound to that loop) and close it when done, preferably
+    with `async with`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = SCRAPER_MAX_CONCURRENCY,
+        host_rates: Optional[Dict[str, float]] = None,
+        default_rate: float = SCRAPER_DEFAULT_HOST_RATE,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = SCRAPER_TIMEOUT
+    ):
+        """
+        Args:
+            max_concurrency: Requests in flight across all hosts
+            host_rates: Per-host requests/second (merged over HOST_RATE_LIMITS)
+            default_rate: Requests/second for hosts without an entry
+            headers: Default headers for the pooled client
+            timeout: Request timeout in seconds
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.host_rates = {**HOST_RATE_LIMITS, **(host_rates or {})}
+        self.default_rate = default_rate
+        self.headers = headers or DEFAULT_HEADERS
+        self.timeout = timeout
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client (keep-alive connections reused across requests)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+        return self._client
+
+    def bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.host_rates.get(host, self.default_rate))
+        return self._buckets[host]
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        """Wait for the host's rate limit, then for a free concurrency slot"""
+        await self.bucket(host).acquire()
+        async with self._semaphore:
+            yield
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self.slot(urlparse(url).netloc):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def run_blocking(self, host: str, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call in a worker thread under the host's limits"""
+        async with self.slot(host):
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def gather(self, tasks: Iterable[Awaitable], label: str = "scrape") -> List[Any]:
+        """
+        Run tasks concurrently (limits are applied inside each task)
+
+        A failed task is logged and yields None so one bad source doesn't
+        sink the whole run.
+        """
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"{label} task {i} failed: {str(result)}")
+                results[i] = None
+
+        return results
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "ScraperRuntime":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """
+    Run a coroutine from sync code
+
+    Uses asyncio.run() normally; if the calling thread already has a running
+    loop (e.g. a sync helper called from an async route) the coroutine runs
+    on a fresh loop in a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result: Dict[str, Any] = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=runner, name="scraper-runtime")
+    thread.start()
+    thread.join()
+
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
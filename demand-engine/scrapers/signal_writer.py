@@ -0,0 +1,148 @@
+"""
+Batched Signal Writer
+Collects scraped signal rows and writes them with multi-row upserts
+(ON CONFLICT on the content hash or natural key) instead of one insert
+round trip per row
+"""
+
+import os
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_WRITE_BATCH_SIZE = int(os.getenv("SIGNAL_WRITE_BATCH_SIZE", "200"))
+
+
+class SignalBatchWriter:
+    """
+    Buffer rows for one table and flush them in bulk
+
+    With ignore_duplicates=True conflicting rows are skipped (ON CONFLICT DO
+    NOTHING) and `written` counts only new rows; with False they are merged
+    into the existing row. If a bulk write fails (e.g. the conflict
+    constraint isn't migrated yet) the batch is retried row by row with
+    plain inserts, like the old per-row writers.
+
+    Example:
+        with SignalBatchWriter(supabase, "signals") as writer:
+            for signal in signals:
+                writer.add(signal)
+        print(writer.written)
+    """
+
+    def __init__(
+        self,
+        supabase,
+        table: str,
+        on_conflict: str = "content_hash",
+        ignore_duplicates: bool = True,
+        batch_size: int = SIGNAL_WRITE_BATCH_SIZE,
+        on_written: Optional[Callable[[List[Dict]], None]] = None
+    ):
+        """
+        Args:
+            supabase: Supabase client
+            table: Target table
+            on_conflict: Unique column(s) to resolve conflicts on
+            ignore_duplicates: Skip (True) or merge (False) conflicting rows
+            batch_size: Rows per bulk request
+            on_written: Called with the rows each flush wrote
+        """
+        self.supabase = supabase
+        self.table = table
+        self.on_conflict = on_conflict
+        self.ignore_duplicates = ignore_duplicates
+        self.batch_size = max(1, batch_size)
+        self.on_written = on_written
+
+        self._pending: List[Dict] = []
+        self.queued = 0
+        self.written = 0
+        self.failed = 0
+
+    def add(self, row: Dict) -> None:
+        """Queue a row, flushing when the batch is full"""
+        self._pending.append(row)
+        self.queued += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, rows: List[Dict]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def flush(self) -> int:
+        """
+        Write all queued rows
+
+        Returns:
+            Number of rows written by this flush
+        """
+        if not self._pending:
+            return 0
+
+        rows = self._dedupe(self._pending)
+        self._pending = []
+
+        written_rows: List[Dict] = []
+        # Rows with the same columns go together so no column is forced to NULL
+        for group in self._group_by_columns(rows):
+            written_rows.extend(self._write_group(group))
+
+        self.written += len(written_rows)
+        if written_rows and self.on_written:
+            self.on_written(written_rows)
+
+        return len(written_rows)
+
+    def __enter__(self) -> "SignalBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+    def _dedupe(self, rows: List[Dict]) -> List[Dict]:
+        """Keep one row per conflict key (a batch can't touch a row twice)"""
+        keys = [column.strip() for column in self.on_conflict.split(",")]
+        unique: Dict[tuple, Dict] = {}
+        keyless = []
+
+        for row in rows:
+            key = tuple(row.get(column) for column in keys)
+            if any(part is None for part in key):
+                keyless.append(row)
+            elif self.ignore_duplicates:
+                unique.setdefault(key, row)
+            else:
+                unique[key] = row
+
+        return list(unique.values()) + keyless
+
+    @staticmethod
+    def _group_by_columns(rows: List[Dict]) -> List[List[Dict]]:
+        groups: Dict[frozenset, List[Dict]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row.keys()), []).append(row)
+        return list(groups.values())
+
+    def _write_group(self, rows: List[Dict]) -> List[Dict]:
+        try:
+            response = self.supabase.table(self.table).upsert(
+                rows,
+                on_conflict=self.on_conflict,
+                ignore_duplicates=self.ignore_duplicates
+            ).execute()
+            return response.data or []
+        except Exception as e:
+            logger.warning(f"Bulk upsert into {self.table} failed, writing {len(rows)} rows individually: {str(e)}")
+
+        written = []
+        for row in rows:
+            try:
+                response = self.supabase.table(self.table).insert(row).execute()
+                written.extend(response.data or [row])
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to write row to {self.table}: {str(e)}")
+        return written
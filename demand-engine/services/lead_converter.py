@@ -173,15 +173,21 @@ class LeadConverter:
                 "source": lead_data["source"],
                 "lead_quality": lead_data["lead_quality"],
                 "notes": lead_data["notes"],
+                "signal_source": signal["source"],
+                "signal_id": signal_id,
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "updated_at": datetime.now(timezone.utc).isoformat()
             }
             
-            # Insert lead
-            lead_response = self.supabase.table("calculator_submissions").insert(lead_record).execute()
+            # Insert lead (a concurrent conversion of the same signal wins the unique key)
+            lead_response = self.supabase.table("calculator_submissions").upsert(
+                lead_record,
+                on_conflict="signal_source,signal_id",
+                ignore_duplicates=True
+            ).execute()
             
             if not lead_response.data:
-                print(f"❌ Failed to create lead for signal: {signal_id}")
+                print(f"⚠️ Lead already exists for signal: {signal_id}")
                 return None
             
             created_lead = lead_response.data[0]
@@ -190,7 +196,8 @@ class LeadConverter:
             source_table = f"{signal['source']}_signals"
             self.supabase.table(source_table).update({
                 "converted_to_lead": True,
-                "lead_id": created_lead["id"]
+                "lead_id": created_lead["id"],
+                "conversion_date": datetime.now(timezone.utc).isoformat()
             }).eq("id", signal_id).execute()
             
             print(f"✅ Converted signal {signal_id} to lead {created_lead['id']}")
@@ -206,7 +213,11 @@ class LeadConverter:
         limit: int = 50
     ) -> List[Dict]:
         """
-        Automatically convert high-value unalerted signals to leads
+        Automatically convert high-value unconverted signals to leads
+        
+        Runs as one set-based database operation (convert_high_value_signals,
+        migration 022), so it is safe to overlap with scraper runs or
+        another conversion.
         
         Args:
             min_score: Minimum combined score threshold
@@ -214,41 +225,29 @@ class LeadConverter:
             
         Returns:
             List of created lead records
+            
+        Raises:
+            Exception: If the conversion RPC fails, so a broken function
+                isn't reported as "nothing to convert"
         """
         try:
-            print(f"🔍 Finding high-value signals (score >= {min_score})...")
+            print(f"🔄 Converting high-value signals (score >= {min_score})...")
             
-            # Get high-value pending signals
-            signals_response = self.supabase.rpc(
-                "get_high_value_pending_signals",
+            # One statement selects, inserts and marks everything; the unique
+            # (signal_source, signal_id) key makes overlapping runs harmless
+            leads_response = self.supabase.rpc(
+                "convert_high_value_signals",
                 {"min_score": min_score, "max_results": limit}
             ).execute()
             
-            if not signals_response.data:
-                print("ℹ️ No high-value signals found")
-                return []
-            
-            signals = signals_response.data
-            print(f"📊 Found {len(signals)} high-value signals")
-            
-            converted_leads = []
-            
-            for signal in signals:
-                # Skip if already converted
-                if signal.get("converted_to_lead"):
-                    continue
-                
-                # Convert to lead
-                lead = self.convert_signal_to_lead(signal["id"])
-                if lead:
-                    converted_leads.append(lead)
+            converted_leads = leads_response.data or []
             
             print(f"✅ Converted {len(converted_leads)} signals to leads")
             return converted_leads
             
         except Exception as e:
             print(f"❌ Error in auto-conversion: {str(e)}")
-            return []
+            raise
     
     def get_conversion_stats(self, days: int = 7) -> Dict:
         """
@@ -0,0 +1,107 @@
+"""
+Test script for the signal to lead converter - Local execution
+Checks that auto-conversion reports a failing conversion RPC instead of
+returning no leads, and that the migration treats key_indicators as JSONB
+"""
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.lead_converter import LeadConverter
+
+MIGRATION = Path(__file__).parent.parent.parent / "database" / "migrations" / "022_signal_lead_conversion.sql"
+
+
+class FakeRPC:
+    def __init__(self, data=None, error=None):
+        self.data, self.error = data, error
+        self.calls = []
+
+    def __call__(self, name, params):
+        self.calls.append((name, params))
+        return self
+
+    def execute(self):
+        if self.error:
+            raise self.error
+        return SimpleNamespace(data=self.data)
+
+
+def converter_with(rpc):
+    converter = LeadConverter.__new__(LeadConverter)  # no Supabase credentials needed
+    converter.supabase = SimpleNamespace(rpc=rpc)
+    return converter
+
+
+def test_auto_convert_returns_created_leads():
+    """The RPC's rows are the converted leads"""
+    print("\n" + "="*60)
+    print("TEST 1: Auto-Conversion Result")
+    print("="*60)
+
+    rpc = FakeRPC(data=[{"id": "lead-1", "signal_id": "sig-1"}])
+    leads = converter_with(rpc).auto_convert_high_value_signals(min_score=80, limit=5)
+
+    assert [lead["id"] for lead in leads] == ["lead-1"]
+    assert rpc.calls == [("convert_high_value_signals", {"min_score": 80, "max_results": 5})]
+
+    print("✅ Auto-conversion result passed")
+
+
+def test_auto_convert_surfaces_rpc_errors():
+    """A failing function must not look like "no signals to convert\""""
+    print("\n" + "="*60)
+    print("TEST 2: RPC Errors Are Raised")
+    print("="*60)
+
+    rpc = FakeRPC(error=RuntimeError("function cardinality(jsonb) does not exist"))
+    try:
+        converter_with(rpc).auto_convert_high_value_signals()
+    except RuntimeError as e:
+        print(f"Raised: {e}")
+    else:
+        raise AssertionError("auto-conversion swallowed the RPC error")
+
+    print("✅ RPC errors are raised")
+
+
+def test_migration_reads_key_indicators_as_jsonb():
+    """key_indicators is JSONB, so array-only functions fail at run time"""
+    print("\n" + "="*60)
+    print("TEST 3: key_indicators Is Read As JSONB")
+    print("="*60)
+
+    sql = MIGRATION.read_text()
+    array_only = re.findall(r"\b(CARDINALITY|ARRAY_TO_STRING|ARRAY_LENGTH)\s*\(\s*c\.key_indicators", sql, re.IGNORECASE)
+
+    assert not array_only, f"array functions on JSONB key_indicators: {array_only}"
+    assert "jsonb_array_elements_text(c.key_indicators)" in sql
+
+    print("✅ key_indicators is read as JSONB")
+
+
+def run_all_tests():
+    """Run all tests"""
+    try:
+        test_auto_convert_returns_created_leads()
+        test_auto_convert_surfaces_rpc_errors()
+        test_migration_reads_key_indicators_as_jsonb()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED!")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,296 @@
+"""
+Twilio Call Mirror
+Keeps a local copy of Twilio call records (twilio_call_records) so the
+insights dashboards query indexed rows instead of paging through
+client.calls.list on every request
+
+Sync is incremental: each run streams calls that started after the stored
+cursor (minus a small overlap) and upserts them on call_sid. The cursor
+never moves past a call that can still change - one still ringing or in
+progress, or a completed call Twilio hasn't priced yet - so those rows are
+re-fetched until they settle.
+
+Example:
+    mirror = TwilioCallMirror(twilio_client, supabase)
+    mirror.sync()                       # e.g. from a cron or POST /sync
+    stats = mirror.stats(start, end)    # cost / uptime aggregates
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from scrapers.checkpoints import CheckpointStore
+from scrapers.signal_writer import SignalBatchWriter
+
+logger = logging.getLogger(__name__)
+
+CALL_RECORDS_TABLE = "twilio_call_records"
+CHECKPOINT_SOURCE = "twilio_calls"
+
+# First sync (no cursor yet) backfills this far
+TWILIO_MIRROR_BACKFILL_DAYS = int(os.getenv("TWILIO_MIRROR_BACKFILL_DAYS", "90"))
+# Re-fetch window before the cursor (clock skew, same-second calls)
+TWILIO_MIRROR_OVERLAP_MINUTES = int(os.getenv("TWILIO_MIRROR_OVERLAP_MINUTES", "5"))
+# Completed calls without a price are re-fetched for this long
+TWILIO_MIRROR_PRICE_SETTLE_MINUTES = int(os.getenv("TWILIO_MIRROR_PRICE_SETTLE_MINUTES", "60"))
+# Requests trigger a background sync when the last one is older than this
+TWILIO_MIRROR_SYNC_INTERVAL = int(os.getenv("TWILIO_MIRROR_SYNC_INTERVAL", "60"))
+TWILIO_MIRROR_PAGE_SIZE = int(os.getenv("TWILIO_MIRROR_PAGE_SIZE", "1000"))
+
+# Statuses a call can still leave
+PENDING_STATUSES = {"queued", "initiated", "ringing", "in-progress"}
+OFFLINE_STATUSES = ["failed", "canceled", "no-answer"]
+
+
+def _parse_time(value) -> Optional[datetime]:
+    """ISO string from PostgREST -> aware datetime"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _price(value) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def call_to_row(call, synced_at: Optional[str] = None) -> Dict[str, Any]:
+    """Twilio CallInstance -> twilio_call_records row"""
+    return {
+        "call_sid": call.sid,
+        "parent_call_sid": call.parent_call_sid,
+        "from_number": call.from_,
+        "from_formatted": call.from_formatted,
+        "to_number": call.to,
+        "to_formatted": call.to_formatted,
+        "status": call.status,
+        "direction": call.direction,
+        "answered_by": call.answered_by,
+        "duration": int(call.duration) if call.duration else 0,
+        "price": _price(call.price),
+        "price_unit": call.price_unit,
+        "start_time": _iso(call.start_time),
+        "end_time": _iso(call.end_time),
+        "date_updated": _iso(call.date_updated),
+        "synced_at": synced_at or datetime.now(timezone.utc).isoformat()
+    }
+
+
+class TwilioCallMirror:
+    """Incremental Twilio -> Postgres call sync and the queries served from it"""
+
+    def __init__(self, twilio_client, supabase, cursor_key: str = "calls"):
+        """
+        Args:
+            twilio_client: twilio.rest.Client (or anything with calls.stream)
+            supabase: Supabase client
+            cursor_key: Checkpoint key (one per Twilio account)
+        """
+        self.twilio = twilio_client
+        self.supabase = supabase
+        self.cursor_key = cursor_key
+        self.checkpoints = CheckpointStore(supabase, CHECKPOINT_SOURCE)
+
+        self.last_synced: Optional[float] = None
+        self._sync_lock = threading.Lock()
+        self._background: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def sync(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Fetch calls newer than the cursor and upsert them
+
+        Concurrent calls wait for the running sync instead of duplicating it.
+
+        Returns:
+            {'fetched', 'written', 'failed', 'since', 'cursor'}
+        """
+        with self._sync_lock:
+            return self._sync(now or datetime.now(timezone.utc))
+
+    def _sync(self, now: datetime) -> Dict[str, Any]:
+        cursor = self.checkpoints.since(self.cursor_key)
+        if cursor:
+            since = cursor - timedelta(minutes=TWILIO_MIRROR_OVERLAP_MINUTES)
+        else:
+            since = now - timedelta(days=TWILIO_MIRROR_BACKFILL_DAYS)
+
+        synced_at = now.isoformat()
+        settle_after = now - timedelta(minutes=TWILIO_MIRROR_PRICE_SETTLE_MINUTES)
+        newest: Optional[datetime] = None
+        oldest_unsettled: Optional[datetime] = None
+        fetched = 0
+
+        writer = SignalBatchWriter(self.supabase, CALL_RECORDS_TABLE, on_conflict="call_sid", ignore_duplicates=False)
+        # Twilio pages newest first; stream() follows next_page_uri lazily
+        for call in self.twilio.calls.stream(start_time_after=since, page_size=TWILIO_MIRROR_PAGE_SIZE):
+            fetched += 1
+            writer.add(call_to_row(call, synced_at))
+
+            started = call.start_time or call.date_created
+            if not started:
+                continue
+            newest = max(newest, started) if newest else started
+
+            unpriced = call.status == "completed" and call.price is None \
+                and (call.end_time is None or call.end_time > settle_after)
+            if call.status in PENDING_STATUSES or unpriced:
+                oldest_unsettled = min(oldest_unsettled, started) if oldest_unsettled else started
+        writer.flush()
+
+        # Only move the cursor once every row is stored, and never past a
+        # call that can still change
+        if newest and not writer.failed:
+            self.checkpoints.advance(self.cursor_key, min(newest, oldest_unsettled) if oldest_unsettled else newest)
+            self.checkpoints.save()
+
+        self.last_synced = time.monotonic()
+        logger.info(f"Twilio mirror sync: {fetched} calls since {since.isoformat()}, {writer.written} written")
+
+        return {
+            "fetched": fetched,
+            "written": writer.written,
+            "failed": writer.failed,
+            "since": since,
+            "cursor": self.checkpoints.since(self.cursor_key)
+        }
+
+    def is_stale(self) -> bool:
+        return self.last_synced is None or time.monotonic() - self.last_synced > TWILIO_MIRROR_SYNC_INTERVAL
+
+    def refresh_in_background(self) -> None:
+        """
+        Start a sync on a worker thread if the mirror is stale
+
+        Requests never wait for it; they read whatever the mirror holds.
+        Must be called from the running event loop.
+        """
+        if not self.is_stale() or (self._background and not self._background.done()):
+            return
+        self._background = asyncio.get_running_loop().create_task(self._background_sync())
+
+    async def _background_sync(self) -> None:
+        try:
+            await asyncio.to_thread(self.sync)
+        except Exception as e:
+            # Retry on the next request rather than immediately
+            self.last_synced = time.monotonic()
+            logger.error(f"Twilio mirror sync failed: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _window(self, columns: str, start: datetime, end: Optional[datetime], phone_number: Optional[str]):
+        query = self.supabase.table(CALL_RECORDS_TABLE)\
+            .select(columns)\
+            .gte("start_time", start.isoformat())
+        if end:
+            query = query.lte("start_time", end.isoformat())
+        if phone_number:
+            query = query.eq("to_number", phone_number)
+        return query
+
+    def recent_calls(
+        self,
+        start: datetime,
+        phone_number: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Newest calls since `start`, optionally to one number"""
+        return self._window("*", start, None, phone_number)\
+            .order("start_time", desc=True)\
+            .limit(limit)\
+            .execute().data or []
+
+    def last_call_time(self, phone_number: str) -> Optional[datetime]:
+        response = self.supabase.table(CALL_RECORDS_TABLE)\
+            .select("start_time")\
+            .eq("to_number", phone_number)\
+            .order("start_time", desc=True)\
+            .limit(1)\
+            .execute()
+        return _parse_time(response.data[0]["start_time"]) if response.data else None
+
+    def offline_incidents(
+        self,
+        start: datetime,
+        end: datetime,
+        phone_number: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Newest failed / canceled / unanswered calls to a number"""
+        return self._window("start_time, status, from_number, from_formatted, duration", start, end, phone_number)\
+            .in_("status", OFFLINE_STATUSES)\
+            .order("start_time", desc=True)\
+            .limit(limit)\
+            .execute().data or []
+
+    def stats(self, start: datetime, end: datetime, phone_number: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Volume, cost and outcome counts for a window
+
+        Aggregated in Postgres by twilio_call_stats(); falls back to
+        aggregating the window's rows here if the function isn't migrated.
+        """
+        try:
+            rows = self.supabase.rpc("twilio_call_stats", {
+                "start_at": start.isoformat(),
+                "end_at": end.isoformat(),
+                "phone": phone_number
+            }).execute().data
+            if rows:
+                row = rows[0] if isinstance(rows, list) else rows
+                return {
+                    "total_calls": int(row["total_calls"] or 0),
+                    "total_duration": int(row["total_duration"] or 0),
+                    "total_cost": float(row["total_cost"] or 0),
+                    "currency": row.get("currency") or "USD",
+                    "completed_calls": int(row["completed_calls"] or 0),
+                    "failed_calls": int(row["failed_calls"] or 0),
+                    "busy_calls": int(row["busy_calls"] or 0),
+                    "no_answer_calls": int(row["no_answer_calls"] or 0),
+                    "average_completed_seconds": float(row["average_completed_seconds"] or 0)
+                }
+        except Exception as e:
+            logger.warning(f"RPC twilio_call_stats unavailable, falling back: {str(e)}")
+
+        calls = self._window("status, duration, price, price_unit, start_time, end_time", start, end, phone_number)\
+            .execute().data or []
+        return aggregate_calls(calls)
+
+
+def aggregate_calls(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Python equivalent of twilio_call_stats() over mirror rows"""
+    completed_seconds = []
+    for call in calls:
+        started = _parse_time(call.get("start_time"))
+        ended = _parse_time(call.get("end_time"))
+        if call.get("status") == "completed" and started and ended:
+            completed_seconds.append((ended - started).total_seconds())
+
+    return {
+        "total_calls": len(calls),
+        "total_duration": sum(int(call.get("duration") or 0) for call in calls),
+        "total_cost": sum(abs(float(call["price"])) for call in calls if call.get("price") is not None),
+        "currency": next((call["price_unit"] for call in calls if call.get("price_unit")), "USD"),
+        "completed_calls": sum(1 for call in calls if call.get("status") == "completed"),
+        "failed_calls": sum(1 for call in calls if call.get("status") in ("failed", "canceled")),
+        "busy_calls": sum(1 for call in calls if call.get("status") == "busy"),
+        "no_answer_calls": sum(1 for call in calls if call.get("status") == "no-answer"),
+        "average_completed_seconds": sum(completed_seconds) / len(completed_seconds) if completed_seconds else 0
+    }
@@ -0,0 +1,85 @@
+"""
+Weekly Analytics Rollup
+Keeps weekly_analytics current from call logs, appointments and pain
+signals, and reads report rows back for the weekly report and digests
+
+The aggregation runs in Postgres (refresh_weekly_analytics()); this job only
+passes the time of its previous run so each refresh recomputes the weeks
+with new activity instead of every week.
+
+Example:
+    refresh_weekly_analytics(supabase)              # hourly job
+    row = get_weekly_analytics(supabase, week_start)
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from scrapers.checkpoints import CheckpointStore
+
+logger = logging.getLogger(__name__)
+
+WEEKLY_ANALYTICS_TABLE = "weekly_analytics"
+CHECKPOINT_SOURCE = "weekly_analytics"
+CHECKPOINT_KEY = "rollup"
+
+
+def week_bounds(day: Optional[date] = None) -> Tuple[date, date]:
+    """Monday and Sunday of the week containing `day` (default: today, UTC)"""
+    day = day or datetime.now(timezone.utc).date()
+    week_start = day - timedelta(days=day.weekday())
+    return week_start, week_start + timedelta(days=6)
+
+
+def refresh_weekly_analytics(supabase, full: bool = False) -> int:
+    """
+    Recompute rollup rows for weeks with activity since the last refresh
+
+    Args:
+        supabase: Supabase client
+        full: Recompute every week (e.g. after a backfill)
+
+    Returns:
+        Number of rollup rows written
+    """
+    checkpoints = CheckpointStore(supabase, CHECKPOINT_SOURCE)
+    since = None if full else checkpoints.since(CHECKPOINT_KEY)
+    # Taken before the refresh so rows written while it runs are picked up next time
+    started_at = datetime.now(timezone.utc)
+
+    refreshed = supabase.rpc(
+        "refresh_weekly_analytics",
+        {"since": since.isoformat() if since else None}
+    ).execute().data or 0
+
+    checkpoints.advance(CHECKPOINT_KEY, started_at)
+    checkpoints.save()
+
+    logger.info(f"Refreshed {refreshed} weekly analytics rows (changes since {since.isoformat() if since else 'the beginning'})")
+    return refreshed
+
+
+def get_weekly_analytics(
+    supabase,
+    week_start: date,
+    tenant_id: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Rollup row for one week
+
+    Args:
+        supabase: Supabase client
+        week_start: Monday of the week
+        tenant_id: Tenant UUID, or None for the all-tenant totals
+
+    Returns:
+        The weekly_analytics row, or None if the week has no rollup yet
+    """
+    query = supabase.table(WEEKLY_ANALYTICS_TABLE)\
+        .select("*")\
+        .eq("week_start", week_start.isoformat())
+    query = query.eq("tenant_id", tenant_id) if tenant_id else query.is_("tenant_id", "null")
+
+    response = query.limit(1).execute()
+    return response.data[0] if response.data else None
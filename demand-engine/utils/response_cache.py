@@ -0,0 +1,98 @@
+"""
+Response Cache Utilities
+Short-TTL in-process cache for expensive read endpoints (dashboard stats)
+"""
+
+import asyncio
+import os
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+# Default TTL for admin/dashboard aggregates
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "30"))
+STATS_CACHE_MAX_ENTRIES = int(os.getenv("STATS_CACHE_MAX_ENTRIES", "256"))
+
+_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_lock = threading.Lock()
+
+
+def _make_key(func: Callable, args: tuple, kwargs: dict) -> Tuple:
+    return (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+
+def _get(key: Tuple) -> Tuple[bool, Any]:
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del _cache[key]
+            return False, None
+        return True, value
+
+
+def _set(key: Tuple, value: Any, ttl: float) -> None:
+    with _lock:
+        if len(_cache) >= STATS_CACHE_MAX_ENTRIES:
+            # Drop expired entries first, then the oldest
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in _cache.items() if exp <= now]:
+                del _cache[stale]
+            while len(_cache) >= STATS_CACHE_MAX_ENTRIES:
+                del _cache[next(iter(_cache))]
+        _cache[key] = (time.monotonic() + ttl, value)
+
+
+def ttl_cache(ttl: Optional[float] = None):
+    """
+    Decorator caching a function's result per arguments for `ttl` seconds
+
+    Works for sync and async functions. Exceptions are not cached.
+
+    Args:
+        ttl: Seconds to keep a result (defaults to STATS_CACHE_TTL)
+
+    Example:
+        @router.get("/stats")
+        @ttl_cache(ttl=30)
+        async def get_stats(days: int = 7):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        seconds = STATS_CACHE_TTL if ttl is None else ttl
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = _make_key(func, args, kwargs)
+                hit, value = _get(key)
+                if hit:
+                    return value
+                value = await func(*args, **kwargs)
+                _set(key, value, seconds)
+                return value
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(func, args, kwargs)
+            hit, value = _get(key)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            _set(key, value, seconds)
+            return value
+        return wrapper
+    return decorator
+
+
+def clear_cache() -> None:
+    """Drop every cached response (e.g. after bulk writes or in tests)"""
+    with _lock:
+        _cache.clear()
@@ -30,6 +30,8 @@ from app.routers import (
     audio_router,
     twilio_disclaimer_router,
 )
+from app.routers.twilio_realtime import get_realtime_pool
+from app.services.realtime_pool import POOL_ENABLED as REALTIME_POOL_ENABLED
 from app.utils.logging import get_logger
 from app.utils.error_handler import HVACAgentError
 from app.middleware.logging_middleware import log_requests
@@ -63,6 +65,9 @@ async def lifespan(app: FastAPI):
     # Verify OpenAI API key is configured
     if not os.getenv("OPENAI_API_KEY"):
         logger.warning("OPENAI_API_KEY not configured - agent will not function")
+    elif REALTIME_POOL_ENABLED:
+        # Pre-warm Realtime connections so Media Streams calls skip the handshake
+        await get_realtime_pool().start()
     
     logger.info("%s is ready to accept requests", APP_NAME)
     
@@ -70,6 +75,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down %s", APP_NAME)
+    if REALTIME_POOL_ENABLED:
+        await get_realtime_pool().close()
 
 
 # Create FastAPI application
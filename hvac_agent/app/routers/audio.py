@@ -2,41 +2,116 @@
 Audio Serving Endpoint.
 
 Serves generated TTS audio files for Twilio <Play>.
-Audio is cached in memory and served via public URLs.
+Audio is cached in memory, backed by a shared blob store so any container
+can serve a URL rendered by another, and served via public URLs.
+
+Audio keys are content-addressed (voice + model + text), so responses are
+immutable: long-lived Cache-Control, strong ETag and byte-range support
+let Twilio and intermediate caches reuse them.
 """
 
-from fastapi import APIRouter, HTTPException
+import re
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
 
 from app.services.tts.elevenlabs_tts import get_audio_by_hash, get_cache_stats
+from app.services.tts.audio_store import content_etag
 from app.utils.logging import get_logger
 
 logger = get_logger("audio")
 
 router = APIRouter(tags=["audio"])
 
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "Range: bytes=..." header.
+
+    Returns:
+        (start, end) inclusive, or None if the range is unsatisfiable
+    """
+    match = _RANGE_RE.match(range_header.strip())
+    if not match or size == 0:
+        return None
+    start_str, end_str = match.groups()
+
+    if start_str == "":
+        # Suffix range: last N bytes
+        if end_str == "":
+            return None
+        length = int(end_str)
+        if length == 0:
+            return None
+        return max(0, size - length), size - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
 
 @router.get("/audio/{hash_key}.mp3")
-async def serve_audio(hash_key: str):
+async def serve_audio(hash_key: str, request: Request):
     """
     Serve cached audio file by hash key.
-    
+
     Twilio <Play> will fetch audio from this endpoint.
+    Supports If-None-Match (304) and single byte ranges (206).
     """
     audio = get_audio_by_hash(hash_key)
-    
+
     if not audio:
         logger.warning("Audio not found: %s", hash_key)
         raise HTTPException(status_code=404, detail="Audio not found")
-    
-    logger.debug("Serving audio: %s (%d bytes)", hash_key, len(audio))
-    
+
+    etag = content_etag(audio)
+    headers = {
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    size = len(audio)
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == etag):
+        byte_range = parse_range(range_header, size)
+        if byte_range is None:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+        start, end = byte_range
+        logger.debug("Serving audio range: %s bytes %d-%d/%d", hash_key, start, end, size)
+        return Response(
+            content=audio[start:end + 1],
+            status_code=206,
+            media_type="audio/mpeg",
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1),
+            }
+        )
+
+    logger.debug("Serving audio: %s (%d bytes)", hash_key, size)
+
     return Response(
         content=audio,
         media_type="audio/mpeg",
         headers={
-            "Cache-Control": "public, max-age=3600",
-            "Content-Length": str(len(audio)),
+            **headers,
+            "Content-Length": str(size),
         }
     )
 
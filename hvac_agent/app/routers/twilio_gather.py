@@ -32,8 +32,9 @@ import json
 import hashlib
 import asyncio
 import random
+import time
 from enum import Enum
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Request, Form, HTTPException
@@ -45,7 +46,11 @@ from app.services.hvac_knowledge import (
     get_troubleshooting_tips,
     format_insight_for_voice
 )
-from app.services.tts.elevenlabs_tts import generate_audio_url, is_available as is_elevenlabs_available
+from app.services.tts.elevenlabs_tts import (
+    generate_audio_url,
+    is_available as is_elevenlabs_available,
+    prefetch_audio,
+)
 from app.services.session_store import (
     get_session as get_session_from_store,
     save_session,
@@ -55,6 +60,8 @@ from app.services.session_store import (
 from app.services.response_cache import get_faq_response, cache_response, get_cached_response
 from app.services.acknowledgments import get_acknowledgment, get_thinking_phrase
 from app.services.sentiment import analyze_sentiment, get_frustration_level, clear_analyzer
+from app.services.degradation import get_degradation
+from app.utils.human_tricks import get_personality, cleanup_personality, get_speech_timeout, estimate_speech_ms
 
 logger = get_logger("twilio.gather")
 
@@ -73,6 +80,9 @@ ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "DLsHlh26Ugcm6ELvS0qi")  # MS WALKER
 COMPANY_NAME = os.getenv("HVAC_COMPANY_NAME", "KC Comfort Air")
 
+# Preferred LLM for the gather path; degradation may route to a faster model
+GATHER_LLM_MODEL = os.getenv("GATHER_LLM_MODEL", "gpt-4o-mini")
+
 # Company information
 COMPANY_ADDRESS = "1111 Test Drive, Dallas, Texas"
 COMPANY_PHONE = "682-224-9904"
@@ -83,9 +93,15 @@ TRANSFER_PHONE = os.getenv("TRANSFER_PHONE", "+16822249904")    # Office/dispatc
 
 # Twilio Gather settings
 GATHER_TIMEOUT = 8  # Seconds to wait for speech to start
-GATHER_SPEECH_TIMEOUT = 3  # Seconds of silence to end speech (integer, not "auto")
+GATHER_SPEECH_TIMEOUT = 3  # Default seconds of silence to end speech (integer, not "auto")
 MAX_RETRIES = 3  # Max retries before escalation
 
+# Adaptive endpointing: speechTimeout follows the caller's observed pace
+ADAPTIVE_ENDPOINTING_ENABLED = os.getenv("ADAPTIVE_ENDPOINTING_ENABLED", "true").lower() == "true"
+
+# Pre-render the likely next prompt(s) while Twilio collects the caller's speech
+SPECULATIVE_TTS_ENABLED = os.getenv("SPECULATIVE_TTS_ENABLED", "true").lower() == "true"
+
 # Twilio SMS (stub - configure when ready)
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
@@ -539,6 +555,12 @@ async def smart_gpt_response(speech: str, current_state: str, session: Dict) ->
     if not OPENAI_API_KEY:
         return f"I'm here to help with HVAC services. Would you like to schedule an appointment?"
     
+    # Canned path when the LLM is over its latency budget or saturated
+    degradation = get_degradation()
+    if not degradation.should_use_llm(GATHER_LLM_MODEL):
+        return "I'm here to help with your HVAC needs. Would you like to schedule a service appointment?"
+    model = degradation.select_model(GATHER_LLM_MODEL)
+    
     try:
         import openai
         client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
@@ -566,15 +588,16 @@ Customer has said: "{speech}"
 
 Respond naturally and helpfully. If they're not talking about HVAC, acknowledge briefly then ask how you can help with their heating or cooling needs."""
 
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": speech}
-            ],
-            max_tokens=100,
-            temperature=0.7
-        )
+        async with degradation.track_llm_call(model):
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": speech}
+                ],
+                max_tokens=100,
+                temperature=0.7
+            )
         
         return response.choices[0].message.content.strip()
     except Exception as e:
@@ -746,6 +769,7 @@ def clear_session(call_sid: str):
     """Clear session after call ends."""
     clear_session_from_store(call_sid)
     clear_analyzer(call_sid)  # Clean up sentiment analyzer state
+    cleanup_personality(call_sid)  # Clean up pacing state
 
 
 # =============================================================================
@@ -867,6 +891,20 @@ async def analyze_speech(speech: str, current_state: ConversationState, session:
     """
     import openai
     
+    unclear = {
+        "intent": "unclear",
+        "slots": {},
+        "faq_topic": None,
+        "is_emergency": False,
+        "confidence": 0.0
+    }
+    
+    # Rule-based path when the LLM is over its latency budget or saturated
+    degradation = get_degradation()
+    if not degradation.should_use_llm(GATHER_LLM_MODEL):
+        return unclear
+    model = degradation.select_model(GATHER_LLM_MODEL)
+    
     client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
     
     system_prompt = """You are an HVAC call center assistant analyzing customer speech.
@@ -903,16 +941,17 @@ Customer said: "{speech}"
 Analyze and extract information."""
 
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=300,
-            temperature=0.1,
-        )
+        async with degradation.track_llm_call(model):
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=300,
+                temperature=0.1,
+            )
         
         result = json.loads(response.choices[0].message.content)
         logger.info("Speech analysis: %s -> %s", speech[:50], result.get("intent"))
@@ -920,13 +959,7 @@ Analyze and extract information."""
         
     except Exception as e:
         logger.error("Speech analysis error: %s", str(e))
-        return {
-            "intent": "unclear",
-            "slots": {},
-            "faq_topic": None,
-            "is_emergency": False,
-            "confidence": 0.0
-        }
+        return unclear
 
 
 # =============================================================================
@@ -997,6 +1030,35 @@ def quick_faq_check(speech: str) -> Optional[str]:
     return None
 
 
+# =============================================================================
+# DETERMINISTIC TRANSITION PROMPTS
+# Shared with speculative TTS so pre-rendered audio matches word for word
+# =============================================================================
+ASK_NAME_AFTER_YES = "Great! Let me get you scheduled. May I have your name please?"
+ASK_ADDRESS_AFTER_PHONE = "Great! What's the service address?"
+RETRY_AREA_CODE = "No problem. Let's start over. What's your area code?"
+ASK_ISSUE_AFTER_ADDRESS = "Perfect! What's going on with your system? Just a quick description."
+RETRY_ADDRESS = "Let me get that again. What's the service address?"
+ASK_DATE_AFTER_ISSUE = f"{PROGRESS_MESSAGES['issue_done']} When would you like us to come out? We're available Monday through Saturday."
+ASK_TIME_AFTER_DATE = f"{PROGRESS_MESSAGES['date_done']} Do you prefer morning or afternoon?"
+ASK_CORRECTION = "No problem! What would you like to change? You can say name, phone, address, issue, or appointment time."
+
+
+def build_confirm_summary(slots: Dict[str, Any]) -> str:
+    """Booking summary read back after the time slot is chosen."""
+    return f"Let me confirm: {slots.get('name')}, phone {slots.get('phone_spoken', slots.get('phone'))}, " \
+           f"at {slots.get('address')}, for {slots.get('issue')}, " \
+           f"{slots.get('date')} in the {slots.get('time')}. Is all that correct?"
+
+
+def build_complete_message(slots: Dict[str, Any]) -> str:
+    """Closing message once the caller confirms the booking."""
+    return f"Perfect! You're all set, {slots.get('name')}. " \
+           f"A technician will be at {slots.get('address')} on {slots.get('date')} in the {slots.get('time')}. " \
+           f"We'll call {slots.get('phone_spoken', slots.get('phone'))} if anything changes. " \
+           f"Thanks for choosing {COMPANY_NAME}!"
+
+
 # =============================================================================
 # STATE MACHINE TRANSITIONS
 # =============================================================================
@@ -1092,7 +1154,7 @@ async def process_state(
         
         # Handle yes/no responses to "Are you calling to schedule?"
         if any(word in speech_lower for word in YES_WORDS):
-            return ConversationState.COLLECT_NAME, "Great! Let me get you scheduled. May I have your name please?", slots
+            return ConversationState.COLLECT_NAME, ASK_NAME_AFTER_YES, slots
         
         if any(word in speech_lower for word in NO_WORDS):
             return current_state, "No problem! Do you have a question about your HVAC system, or is there something else I can help with?", slots
@@ -1226,13 +1288,13 @@ async def process_state(
     
     if current_state == ConversationState.VERIFY_PHONE:
         if any(word in speech_lower for word in YES_WORDS):
-            return ConversationState.COLLECT_ADDRESS, "Great! What's the service address?", slots
+            return ConversationState.COLLECT_ADDRESS, ASK_ADDRESS_AFTER_PHONE, slots
         elif any(word in speech_lower for word in NO_WORDS):
             slots["area_code"] = None
             slots["phone_prefix"] = None
             slots["phone_line"] = None
             slots["phone"] = None
-            return ConversationState.COLLECT_AREA_CODE, "No problem. Let's start over. What's your area code?", slots
+            return ConversationState.COLLECT_AREA_CODE, RETRY_AREA_CODE, slots
         return current_state, f"I have {slots.get('phone_spoken', 'your number')}. Is that correct? Yes or no?", slots
     
     if current_state == ConversationState.COLLECT_ADDRESS:
@@ -1247,10 +1309,10 @@ async def process_state(
     if current_state == ConversationState.VERIFY_ADDRESS:
         # Check yes/no for address verification
         if any(word in speech_lower for word in YES_WORDS):
-            return ConversationState.COLLECT_ISSUE, "Perfect! What's going on with your system? Just a quick description.", slots
+            return ConversationState.COLLECT_ISSUE, ASK_ISSUE_AFTER_ADDRESS, slots
         elif any(word in speech_lower for word in NO_WORDS):
             slots["address"] = None
-            return ConversationState.COLLECT_ADDRESS, "Let me get that again. What's the service address?", slots
+            return ConversationState.COLLECT_ADDRESS, RETRY_ADDRESS, slots
         return current_state, f"Is {slots.get('address', 'that address')} correct? Yes or no?", slots
     
     if current_state == ConversationState.COLLECT_ISSUE:
@@ -1261,7 +1323,7 @@ async def process_state(
         if "would you like to schedule" in smart_response.lower():
             # They described an issue, acknowledge it smartly and ask about scheduling
             return ConversationState.COLLECT_DATE, f"{smart_response.replace('Would you like to schedule a service appointment?', '')} {PROGRESS_MESSAGES['issue_done']} When would you like us to come out? We're available Monday through Saturday.", slots
-        return ConversationState.COLLECT_DATE, f"{PROGRESS_MESSAGES['issue_done']} When would you like us to come out? We're available Monday through Saturday.", slots
+        return ConversationState.COLLECT_DATE, ASK_DATE_AFTER_ISSUE, slots
     
     if current_state == ConversationState.COLLECT_DATE:
         # Parse and validate date
@@ -1272,7 +1334,7 @@ async def process_state(
             if not is_available:
                 return current_state, availability_msg, slots
             slots["date"] = spoken_date
-            return ConversationState.COLLECT_TIME, f"{PROGRESS_MESSAGES['date_done']} Do you prefer morning or afternoon?", slots
+            return ConversationState.COLLECT_TIME, ASK_TIME_AFTER_DATE, slots
         return current_state, "What day works for you? You can say tomorrow, Monday, Tuesday, or any day this week.", slots
     
     if current_state == ConversationState.COLLECT_TIME:
@@ -1294,10 +1356,7 @@ async def process_state(
             return current_state, availability_msg, slots
         
         # Build confirmation summary
-        summary = f"Let me confirm: {slots.get('name')}, phone {slots.get('phone_spoken', slots.get('phone'))}, " \
-                  f"at {slots.get('address')}, for {slots.get('issue')}, " \
-                  f"{slots.get('date')} in the {slots.get('time')}. Is all that correct?"
-        return ConversationState.CONFIRM, summary, slots
+        return ConversationState.CONFIRM, build_confirm_summary(slots), slots
     
     # SLOW PATH: Use GPT only for complex cases that weren't handled above
     # Skip GPT for states that have clear deterministic flows
@@ -1390,14 +1449,10 @@ async def process_state(
                 slots.get("address", "")
             )
             
-            complete_msg = f"Perfect! You're all set, {slots.get('name')}. " \
-                          f"A technician will be at {slots.get('address')} on {slots.get('date')} in the {slots.get('time')}. " \
-                          f"We'll call {slots.get('phone_spoken', slots.get('phone'))} if anything changes. " \
-                          f"Thanks for choosing {COMPANY_NAME}!"
-            return ConversationState.COMPLETE, complete_msg, slots
+            return ConversationState.COMPLETE, build_complete_message(slots), slots
         elif any(word in speech_lower for word in NO_WORDS):
             # Partial correction flow - ask what to change
-            return ConversationState.PARTIAL_CORRECTION, "No problem! What would you like to change? You can say name, phone, address, issue, or appointment time.", slots
+            return ConversationState.PARTIAL_CORRECTION, ASK_CORRECTION, slots
         elif "start over" in speech_lower:
             slots = {k: None for k in slots}
             return ConversationState.COLLECT_NAME, "Let's start fresh. What's your name?", slots
@@ -1452,6 +1507,166 @@ async def process_state(
     return current_state, get_prompt(current_state, slots) or "I'm sorry, could you repeat that?", slots
 
 
+# =============================================================================
+# SPECULATIVE NEXT-PROMPT TTS
+# While Twilio plays a prompt and collects speech, render the prompt(s) the
+# caller is most likely to hear next, so /gather/respond finds them cached.
+# =============================================================================
+SPECULATIVE_PROMPTS: Dict[ConversationState, Callable[[Dict[str, Any]], List[str]]] = {
+    ConversationState.GREETING: lambda slots: [ASK_NAME_AFTER_YES],
+    ConversationState.VERIFY_PHONE: lambda slots: [ASK_ADDRESS_AFTER_PHONE, RETRY_AREA_CODE],
+    ConversationState.VERIFY_ADDRESS: lambda slots: [ASK_ISSUE_AFTER_ADDRESS, RETRY_ADDRESS],
+    ConversationState.COLLECT_ISSUE: lambda slots: [ASK_DATE_AFTER_ISSUE],
+    ConversationState.COLLECT_DATE: lambda slots: [ASK_TIME_AFTER_DATE],
+    ConversationState.COLLECT_TIME: lambda slots: [
+        build_confirm_summary({**slots, "time": "morning"}),
+        build_confirm_summary({**slots, "time": "afternoon"}),
+    ],
+    ConversationState.CONFIRM: lambda slots: [build_complete_message(slots), ASK_CORRECTION],
+}
+
+
+def predict_next_prompts(state: ConversationState, slots: Dict[str, Any]) -> List[str]:
+    """
+    Predict the most likely one or two prompts after the caller answers in `state`.
+    
+    Only transitions whose text is fully determined by the current slots are
+    predicted; prompts that echo back what the caller is about to say
+    (names, digits) can't be rendered ahead of time.
+    """
+    builder = SPECULATIVE_PROMPTS.get(state)
+    if not builder:
+        return []
+    try:
+        return builder(slots or {})[:2]
+    except Exception as e:
+        logger.debug("Prompt prediction failed for %s: %s", state, str(e))
+        return []
+
+
+def prefetch_next_prompts(state: ConversationState, slots: Dict[str, Any]) -> None:
+    """Schedule background TTS for the predicted next prompts."""
+    if not SPECULATIVE_TTS_ENABLED:
+        return
+    predicted = predict_next_prompts(state, slots)
+    if predicted:
+        prefetch_audio(predicted)
+
+
+# =============================================================================
+# ADAPTIVE ENDPOINTING
+# Twilio posts back only after speechTimeout seconds of silence, so that
+# window is paid on every turn. Size it from the caller's observed pace and
+# bias recognition towards the answers each state expects.
+# =============================================================================
+SHORT_ANSWER_STATES = {
+    ConversationState.VERIFY_NAME,
+    ConversationState.COLLECT_AREA_CODE,
+    ConversationState.COLLECT_PHONE_PREFIX,
+    ConversationState.COLLECT_PHONE_LINE,
+    ConversationState.VERIFY_PHONE,
+    ConversationState.VERIFY_ADDRESS,
+    ConversationState.COLLECT_DATE,
+    ConversationState.COLLECT_TIME,
+    ConversationState.CONFIRM,
+    ConversationState.CALLBACK_CONFIRM,
+}
+
+_YES_NO_HINTS = "yes, no, correct, that's right, yeah, nope"
+_DIGIT_HINTS = "zero, one, two, three, four, five, six, seven, eight, nine, oh"
+
+GATHER_HINTS: Dict[ConversationState, str] = {
+    ConversationState.VERIFY_NAME: _YES_NO_HINTS,
+    ConversationState.COLLECT_AREA_CODE: _DIGIT_HINTS,
+    ConversationState.COLLECT_PHONE_PREFIX: _DIGIT_HINTS,
+    ConversationState.COLLECT_PHONE_LINE: _DIGIT_HINTS,
+    ConversationState.COLLECT_CALLBACK_NUMBER: _DIGIT_HINTS,
+    ConversationState.VERIFY_PHONE: _YES_NO_HINTS,
+    ConversationState.VERIFY_ADDRESS: _YES_NO_HINTS,
+    ConversationState.COLLECT_ADDRESS: "street, avenue, drive, road, lane, boulevard, court",
+    ConversationState.COLLECT_ISSUE: "AC, air conditioner, heater, furnace, thermostat, not cooling, not heating, noise, leak",
+    ConversationState.COLLECT_DATE: "today, tomorrow, Monday, Tuesday, Wednesday, Thursday, Friday, Saturday",
+    ConversationState.COLLECT_TIME: "morning, afternoon, either",
+    ConversationState.CONFIRM: _YES_NO_HINTS,
+    ConversationState.CALLBACK_CONFIRM: _YES_NO_HINTS,
+}
+
+
+def observe_caller_turn(call_sid: str, session: Dict[str, Any], speech: str) -> None:
+    """
+    Estimate how long the caller spoke this turn and update their pace.
+    
+    See estimate_speech_ms; turns where the caller barged in are skipped,
+    since their speech overlapped the prompt and can't be timed.
+    """
+    if not ADAPTIVE_ENDPOINTING_ENABLED:
+        return
+    pacing = session.get("pacing") or {}
+    sent_at = pacing.get("prompt_sent_at")
+    if not sent_at:
+        return
+    
+    word_count = len(speech.split())
+    speech_ms = estimate_speech_ms(
+        (time.time() - sent_at) * 1000,
+        pacing.get("prompt_words", 0),
+        pacing.get("speech_timeout", GATHER_SPEECH_TIMEOUT),
+        word_count,
+    )
+    if speech_ms is None:
+        return
+    
+    personality = get_personality(call_sid)
+    personality.load_pacing(pacing)
+    personality.record_turn(speech_ms, word_count)
+    session["pacing"] = {**pacing, **personality.to_pacing()}
+
+
+def record_endpoint_result(call_sid: str, session: Dict[str, Any], advanced: bool) -> None:
+    """Widen the silence window when a turn didn't move the conversation forward."""
+    if not ADAPTIVE_ENDPOINTING_ENABLED:
+        return
+    personality = get_personality(call_sid)
+    personality.load_pacing(session.get("pacing"))
+    personality.record_endpoint_result(advanced)
+    session["pacing"] = {**(session.get("pacing") or {}), **personality.to_pacing()}
+
+
+def get_gather_endpointing(
+    call_sid: str,
+    state: ConversationState,
+    prompt_text: str,
+    lead_in_text: str = "",
+) -> Tuple[int, str]:
+    """
+    Choose speechTimeout and hints for the next <Gather>, and note when the
+    prompt went out so the next turn can be timed.
+    
+    lead_in_text is anything played before the prompt (the thinking clip),
+    which delays the caller's turn just like the prompt does.
+    
+    Returns:
+        (speech_timeout_seconds, hints)
+    """
+    hints = GATHER_HINTS.get(state, "")
+    if not ADAPTIVE_ENDPOINTING_ENABLED:
+        return GATHER_SPEECH_TIMEOUT, hints
+    
+    session = get_session(call_sid)
+    personality = get_personality(call_sid)
+    personality.load_pacing(session.get("pacing"))
+    speech_timeout = get_speech_timeout(personality, short_answer=state in SHORT_ANSWER_STATES)
+    
+    session["pacing"] = {
+        **personality.to_pacing(),
+        "prompt_sent_at": time.time(),
+        "prompt_words": len(lead_in_text.split()) + len(prompt_text.split()),
+        "speech_timeout": speech_timeout,
+    }
+    save_session(call_sid, session)
+    return speech_timeout, hints
+
+
 # =============================================================================
 # TWIML GENERATION WITH ELEVENLABS <Play>
 # =============================================================================
@@ -1486,6 +1701,7 @@ async def generate_twiml(
     
     # Generate thinking/acknowledgment sound if requested
     thinking_element = ""
+    played_thinking_text = ""  # Timed as part of the prompt for endpointing
     if include_thinking_sound:
         thinking_phrases = ["Okay.", "Got it.", "Alright.", "Sure.", "Mm-hmm."]
         thinking_text = random.choice(thinking_phrases)
@@ -1493,6 +1709,7 @@ async def generate_twiml(
             thinking_audio = await generate_audio_url(thinking_text, host)
             if thinking_audio:
                 thinking_element = f'<Play>{thinking_audio}</Play>'
+                played_thinking_text = thinking_text
         except:
             pass
     
@@ -1566,16 +1783,20 @@ async def generate_twiml(
     <Hangup/>
 </Response>"""
     
+    # Per-call endpointing: silence window from caller pace, hints from state
+    speech_timeout, hints = get_gather_endpointing(call_sid, next_state, text, lead_in_text=played_thinking_text)
+    hints_attr = f' hints="{html.escape(hints)}"' if hints else ""
+    
     # Standard gather response with barge-in enabled
     # Include thinking sound before main response if provided
     return f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     {thinking_element}
-    <Gather input="speech dtmf" action="{action}" method="POST" timeout="{GATHER_TIMEOUT}" speechTimeout="{GATHER_SPEECH_TIMEOUT}" speechModel="phone_call" enhanced="true" language="en-US" bargeIn="true">
+    <Gather input="speech dtmf" action="{action}" method="POST" timeout="{GATHER_TIMEOUT}" speechTimeout="{speech_timeout}" speechModel="phone_call" enhanced="true" language="en-US" bargeIn="true"{hints_attr}>
         {voice_element}
     </Gather>
     {fallback_element1}
-    <Gather input="speech dtmf" action="{action}" method="POST" timeout="{GATHER_TIMEOUT}" speechTimeout="{GATHER_SPEECH_TIMEOUT}" speechModel="phone_call" enhanced="true" language="en-US" bargeIn="true">
+    <Gather input="speech dtmf" action="{action}" method="POST" timeout="{GATHER_TIMEOUT}" speechTimeout="{speech_timeout}" speechModel="phone_call" enhanced="true" language="en-US" bargeIn="true"{hints_attr}>
         {fallback_element2}
     </Gather>
     {fallback_element3}
@@ -1616,6 +1837,7 @@ async def gather_incoming(request: Request):
     # Generate TwiML with ElevenLabs
     host = request.headers.get("host", "")
     twiml = await generate_twiml(greeting, ConversationState.GREETING, call_sid, host)
+    prefetch_next_prompts(ConversationState.GREETING, session.get("slots", {}))
     
     return Response(content=twiml, media_type="application/xml")
 
@@ -1705,6 +1927,9 @@ async def gather_respond(request: Request):
         # Reset retries on successful speech
         session["retries"] = 0
         
+        # Time this turn to learn the caller's pace
+        observe_caller_turn(call_sid, session, speech_result)
+        
         # === LATENCY OPTIMIZATION: Sentiment analysis for frustration detection ===
         sentiment_result = analyze_sentiment(speech_result, call_sid)
         frustration_level = sentiment_result.frustration_score
@@ -1745,10 +1970,13 @@ async def gather_respond(request: Request):
         })
         
         # Process through state machine
+        previous_state = session.get("state")
         next_state, response_text, updated_slots = await process_state(call_sid, speech_result, session)
+        next_state_value = next_state.value if isinstance(next_state, ConversationState) else next_state
+        record_endpoint_result(call_sid, session, advanced=next_state_value != previous_state)
         
         # Update session
-        session["state"] = next_state.value if isinstance(next_state, ConversationState) else next_state
+        session["state"] = next_state_value
         session["slots"] = updated_slots
         session["history"].append({
             "role": "assistant",
@@ -1764,6 +1992,7 @@ async def gather_respond(request: Request):
         
         # Generate TwiML with ElevenLabs and thinking sound
         twiml = await generate_twiml(response_text, next_state, call_sid, host, action_url=action_url, include_thinking_sound=True)
+        prefetch_next_prompts(next_state, updated_slots)
         
         return Response(content=twiml, media_type="application/xml")
         
@@ -27,7 +27,7 @@ import struct
 import time
 import httpx
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Request
 from fastapi.responses import Response
 import websockets
@@ -35,6 +35,10 @@ from websockets.client import WebSocketClientProtocol
 
 from app.utils.logging import get_logger
 from app.services.transcript_collector import get_transcript_collector
+from app.services.realtime_pool import (
+    RealtimeConnectionPool,
+    POOL_ENABLED as REALTIME_POOL_ENABLED,
+)
 
 # Resend API configuration for lead notifications
 RESEND_API_KEY = os.getenv("RESEND_API_KEY")
@@ -235,6 +239,160 @@ TOOLS = [
 ]
 
 
+async def _websocket_connect(url: str, headers: list) -> WebSocketClientProtocol:
+    """
+    Open a websocket with auth headers.
+    
+    Uses 'additional_headers' for older websockets versions (Modal)
+    and 'extra_headers' for newer versions. Tries both for compatibility.
+    """
+    try:
+        return await websockets.connect(
+            url,
+            additional_headers=headers,
+            ping_interval=20,
+            ping_timeout=10
+        )
+    except TypeError:
+        return await websockets.connect(
+            url,
+            extra_headers=headers,
+            ping_interval=20,
+            ping_timeout=10
+        )
+
+
+async def open_realtime_connection() -> Optional[Tuple[WebSocketClientProtocol, bool]]:
+    """
+    Connect to the OpenAI Realtime API.
+    
+    Tries the PRIMARY model first, then the FALLBACK model, with exponential
+    backoff within each model attempt.
+    
+    Returns:
+        (websocket, using_fallback_model) or None if every attempt failed
+    """
+    headers = [
+        ("Authorization", f"Bearer {OPENAI_API_KEY}"),
+        ("OpenAI-Beta", "realtime=v1")
+    ]
+    
+    # Try PRIMARY model first, then FALLBACK
+    models_to_try = [
+        (OPENAI_REALTIME_URL_PRIMARY, "gpt-realtime-2025-08-28 (primary)"),
+        (OPENAI_REALTIME_URL_FALLBACK, "gpt-4o-realtime-preview (fallback)")
+    ]
+    
+    for model_url, model_name in models_to_try:
+        max_retries = 2  # Fewer retries per model since we have fallback
+        base_delay = 0.3
+        
+        for attempt in range(max_retries):
+            try:
+                ws = await _websocket_connect(model_url, headers)
+                logger.info("Connected to OpenAI Realtime API: %s", model_name)
+                return ws, model_url == OPENAI_REALTIME_URL_FALLBACK
+                
+            except Exception as e:
+                logger.warning("Failed to connect to %s (attempt %d/%d): %s", 
+                             model_name, attempt + 1, max_retries, str(e))
+                if attempt < max_retries - 1:
+                    delay = base_delay * (2 ** attempt)
+                    await asyncio.sleep(delay)
+        
+        # If primary failed, log and try fallback
+        if model_url == OPENAI_REALTIME_URL_PRIMARY:
+            logger.warning("Primary model failed, trying fallback model...")
+    
+    logger.error("All OpenAI connection attempts failed (both primary and fallback)")
+    return None
+
+
+def build_session_config(using_fallback_model: bool) -> dict:
+    """Build the session.update event for a Realtime connection."""
+    # Select voice based on model
+    # cedar = "natural and conversational" (only on gpt-realtime-2025-08-28)
+    # shimmer = "energetic and expressive" (fallback for older model)
+    voice = "cedar" if not using_fallback_model else "shimmer"
+    logger.info("Using voice: %s (fallback_model=%s)", voice, using_fallback_model)
+    
+    return {
+        "type": "session.update",
+        "session": {
+            "modalities": ["text", "audio"],
+            "instructions": SYSTEM_PROMPT,
+            "voice": voice,  # cedar for new model, shimmer for fallback
+            "input_audio_format": "pcm16",  # We'll convert from μ-law
+            "output_audio_format": "pcm16",  # We'll convert to μ-law
+            "input_audio_transcription": {
+                "model": "whisper-1"
+            },
+            "turn_detection": {
+                "type": "server_vad",  # Server-side voice activity detection
+                "threshold": 0.4,  # LOWERED from 0.5 - better barge-in detection when user speaks
+                "prefix_padding_ms": 300,  # REDUCED - faster response to user speech
+                "silence_duration_ms": 700  # REDUCED slightly - better turn-taking
+            },
+            "tools": TOOLS,
+            "tool_choice": "auto",
+            "temperature": 0.7,
+            "max_response_output_tokens": 1000  # INCREASED - 500 was cutting off 20-22 sec into greeting
+        }
+    }
+
+
+async def open_configured_connection() -> Optional[Tuple[WebSocketClientProtocol, bool]]:
+    """
+    Open a Realtime connection and apply session.update ahead of any call.
+    
+    Used by the connection pool: the connection is only handed out once
+    OpenAI has acknowledged the configuration with session.updated.
+    """
+    if not OPENAI_API_KEY:
+        return None
+    
+    result = await open_realtime_connection()
+    if not result:
+        return None
+    
+    ws, using_fallback = result
+    try:
+        await ws.send(json.dumps(build_session_config(using_fallback)))
+        
+        async def _wait_for_session_updated():
+            async for raw in ws:
+                event = json.loads(raw)
+                if event.get("type") == "session.updated":
+                    return True
+                if event.get("type") == "error":
+                    logger.warning("OpenAI rejected pooled session config: %s", event.get("error"))
+                    return False
+            return False
+        
+        if await asyncio.wait_for(_wait_for_session_updated(), timeout=5.0):
+            return ws, using_fallback
+    except Exception as e:
+        logger.warning("Failed to configure pooled Realtime connection: %s", str(e))
+    
+    try:
+        await ws.close()
+    except Exception:
+        pass
+    return None
+
+
+# Pre-warmed connections handed to RealtimeSession on Twilio "start"
+_realtime_pool: Optional[RealtimeConnectionPool] = None
+
+
+def get_realtime_pool() -> RealtimeConnectionPool:
+    """Get the global Realtime connection pool."""
+    global _realtime_pool
+    if _realtime_pool is None:
+        _realtime_pool = RealtimeConnectionPool(connector=open_configured_connection)
+    return _realtime_pool
+
+
 class RealtimeSession:
     """
     Manages a single call session bridging Twilio and OpenAI Realtime API.
@@ -347,103 +505,36 @@ class RealtimeSession:
         Establish WebSocket connection to OpenAI Realtime API.
         
         Strategy:
-        1. Try PRIMARY model (gpt-realtime-2025-08-28) first
-        2. If that fails, fallback to PREVIOUS model (gpt-4o-realtime-preview)
-        3. Uses exponential backoff within each model attempt
-        
-        Note: Uses 'additional_headers' for older websockets versions (Modal)
-        and 'extra_headers' for newer versions. Tries both for compatibility.
+        1. Take a pre-warmed, already-configured connection from the pool
+        2. Otherwise connect cold: PRIMARY model first, then FALLBACK model,
+           with exponential backoff within each model attempt
         """
-        headers = [
-            ("Authorization", f"Bearer {OPENAI_API_KEY}"),
-            ("OpenAI-Beta", "realtime=v1")
-        ]
+        pooled = await get_realtime_pool().acquire() if REALTIME_POOL_ENABLED else None
+        if pooled:
+            self.openai_ws = pooled.ws
+            self.using_fallback_model = pooled.using_fallback_model
+            # session.update was applied and acknowledged during warm-up
+            self.session_configured = True
+            self.session_ready = True
+            self.openai_connected = True
+            logger.info("Using pre-warmed OpenAI Realtime connection (fallback_model=%s)",
+                       self.using_fallback_model)
+            return True
         
-        # Try PRIMARY model first, then FALLBACK
-        models_to_try = [
-            (OPENAI_REALTIME_URL_PRIMARY, "gpt-realtime-2025-08-28 (primary)"),
-            (OPENAI_REALTIME_URL_FALLBACK, "gpt-4o-realtime-preview (fallback)")
-        ]
+        result = await open_realtime_connection()
+        if not result:
+            return False
         
-        for model_url, model_name in models_to_try:
-            max_retries = 2  # Fewer retries per model since we have fallback
-            base_delay = 0.3
-            
-            for attempt in range(max_retries):
-                try:
-                    # Try with additional_headers first (older websockets versions on Modal)
-                    try:
-                        self.openai_ws = await websockets.connect(
-                            model_url,
-                            additional_headers=headers,
-                            ping_interval=20,
-                            ping_timeout=10
-                        )
-                    except TypeError:
-                        # Fall back to extra_headers (newer websockets versions)
-                        self.openai_ws = await websockets.connect(
-                            model_url,
-                            extra_headers=headers,
-                            ping_interval=20,
-                            ping_timeout=10
-                        )
-                    
-                    self.using_fallback_model = (model_url == OPENAI_REALTIME_URL_FALLBACK)
-                    logger.info("Connected to OpenAI Realtime API: %s", model_name)
-                    self.openai_connected = True
-                    return True
-                    
-                except Exception as e:
-                    logger.warning("Failed to connect to %s (attempt %d/%d): %s", 
-                                 model_name, attempt + 1, max_retries, str(e))
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        await asyncio.sleep(delay)
-            
-            # If primary failed, log and try fallback
-            if model_url == OPENAI_REALTIME_URL_PRIMARY:
-                logger.warning("Primary model failed, trying fallback model...")
-        
-        logger.error("All OpenAI connection attempts failed (both primary and fallback)")
-        return False
+        self.openai_ws, self.using_fallback_model = result
+        self.openai_connected = True
+        return True
     
     async def configure_session(self):
         """Configure the OpenAI Realtime session."""
         if not self.openai_ws or self.session_configured:
             return
         
-        # Select voice based on model
-        # cedar = "natural and conversational" (only on gpt-realtime-2025-08-28)
-        # shimmer = "energetic and expressive" (fallback for older model)
-        voice = "cedar" if not self.using_fallback_model else "shimmer"
-        logger.info("Using voice: %s (fallback_model=%s)", voice, self.using_fallback_model)
-        
-        # Session configuration
-        config = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text", "audio"],
-                "instructions": SYSTEM_PROMPT,
-                "voice": voice,  # cedar for new model, shimmer for fallback
-                "input_audio_format": "pcm16",  # We'll convert from μ-law
-                "output_audio_format": "pcm16",  # We'll convert to μ-law
-                "input_audio_transcription": {
-                    "model": "whisper-1"
-                },
-                "turn_detection": {
-                    "type": "server_vad",  # Server-side voice activity detection
-                    "threshold": 0.4,  # LOWERED from 0.5 - better barge-in detection when user speaks
-                    "prefix_padding_ms": 300,  # REDUCED - faster response to user speech
-                    "silence_duration_ms": 700  # REDUCED slightly - better turn-taking
-                },
-                "tools": TOOLS,
-                "tool_choice": "auto",
-                "temperature": 0.7,
-                "max_response_output_tokens": 1000  # INCREASED - 500 was cutting off 20-22 sec into greeting
-            }
-        }
-        
-        await self.openai_ws.send(json.dumps(config))
+        await self.openai_ws.send(json.dumps(build_session_config(self.using_fallback_model)))
         self.session_configured = True
         logger.info("OpenAI session configured")
     
@@ -1520,6 +1611,7 @@ async def realtime_health():
         "version": _VERSION,
         "openai_configured": bool(OPENAI_API_KEY),
         "resend_configured": bool(RESEND_API_KEY),
+        "connection_pool": get_realtime_pool().get_stats() if REALTIME_POOL_ENABLED else None,
         "endpoint": "/twilio/realtime/incoming"
     }
 
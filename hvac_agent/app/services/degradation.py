@@ -12,6 +12,8 @@ Degradation Levels:
 
 Features:
 - Automatic level switching based on service health
+- Latency-aware model routing from rolling per-model p95
+- LLM load shedding when latency or in-flight depth exceeds budget
 - Manual override capability
 - Metrics tracking per level
 - Recovery detection
@@ -20,8 +22,10 @@ Features:
 import os
 import time
 import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
 from enum import IntEnum
-from typing import Dict, Any, Optional, Callable
+from typing import Deque, Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 
 from app.utils.logging import get_logger
@@ -29,6 +33,21 @@ from app.utils.circuit_breaker import CircuitBreakerManager
 
 logger = get_logger("degradation")
 
+# Latency routing configuration
+LATENCY_BUDGET_MS = float(os.getenv("LLM_LATENCY_BUDGET_MS", "2000"))  # p95 budget per model
+LATENCY_WINDOW_SECONDS = float(os.getenv("LLM_LATENCY_WINDOW", "120"))  # Rolling window
+LATENCY_MIN_SAMPLES = int(os.getenv("LLM_LATENCY_MIN_SAMPLES", "5"))  # Before judging a model
+LATENCY_PROBE_INTERVAL = float(os.getenv("LLM_LATENCY_PROBE_INTERVAL", "5"))  # Seconds between probes
+MAX_LLM_IN_FLIGHT = int(os.getenv("MAX_LLM_IN_FLIGHT", "20"))  # Queue depth before shedding to canned
+
+# Models from slowest/best to fastest; routing only ever moves down this list,
+# so every preferred model needs a faster rung below it to route to
+MODEL_LADDER: List[str] = [
+    model.strip()
+    for model in os.getenv("LLM_MODEL_LADDER", "gpt-4o,gpt-4o-mini,gpt-4.1-nano").split(",")
+    if model.strip()
+]
+
 
 class DegradationLevel(IntEnum):
     """Degradation levels from best to worst."""
@@ -99,6 +118,47 @@ class DegradationState:
     level_changes: int = 0
 
 
+class ModelLatencyTracker:
+    """
+    Rolling latency window for a single model.
+    
+    Samples older than the window expire, so a model that was slow during a
+    brownout becomes eligible again once it stops producing bad samples.
+    """
+    
+    def __init__(self, window_seconds: float = LATENCY_WINDOW_SECONDS, max_samples: int = 200):
+        self.window_seconds = window_seconds
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+    
+    def record(self, latency_ms: float) -> None:
+        self._samples.append((time.time(), latency_ms))
+    
+    def _recent(self) -> List[float]:
+        cutoff = time.time() - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        return [latency for _, latency in self._samples]
+    
+    @property
+    def sample_count(self) -> int:
+        return len(self._recent())
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get latency percentile (0-100) over the window, None without samples."""
+        values = sorted(self._recent())
+        if not values:
+            return None
+        index = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+        return values[index]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "samples": self.sample_count,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+        }
+
+
 class GracefulDegradation:
     """
     Manages graceful degradation across service levels.
@@ -119,6 +179,12 @@ class GracefulDegradation:
         degradation.record_success()
         # or
         degradation.record_failure("OpenAI timeout")
+    
+    Latency-aware routing:
+        if degradation.should_use_llm():
+            model = degradation.select_model("gpt-4o-mini")
+            async with degradation.track_llm_call(model):
+                response = await call_openai(model=model)
     """
     
     def __init__(self):
@@ -131,6 +197,12 @@ class GracefulDegradation:
         self._failure_threshold = 3  # Failures before degrading
         self._success_threshold = 5  # Successes before recovering
         self._check_interval = 30.0  # Seconds between recovery checks
+        
+        # Latency-aware routing
+        self._latency: Dict[str, ModelLatencyTracker] = {}
+        self._in_flight = 0
+        self._last_probe = 0.0
+        self._llm_shed_count = 0
     
     @property
     def current_level(self) -> DegradationLevel:
@@ -169,6 +241,121 @@ class GracefulDegradation:
         if self._failure_count >= self._failure_threshold:
             self._degrade(reason)
     
+    # ------------------------------------------------------------------
+    # Latency-aware routing
+    # ------------------------------------------------------------------
+    
+    def _tracker(self, model: str) -> ModelLatencyTracker:
+        if model not in self._latency:
+            self._latency[model] = ModelLatencyTracker()
+        return self._latency[model]
+    
+    def record_latency(self, model: str, latency_ms: float) -> None:
+        """Record an observed LLM response latency for a model."""
+        self._tracker(model).record(latency_ms)
+    
+    def model_p95(self, model: str) -> Optional[float]:
+        """Get rolling p95 for a model, None until it has enough samples."""
+        tracker = self._tracker(model)
+        if tracker.sample_count < LATENCY_MIN_SAMPLES:
+            return None
+        return tracker.percentile(95)
+    
+    def _within_budget(self, model: str) -> bool:
+        p95 = self.model_p95(model)
+        return p95 is None or p95 <= LATENCY_BUDGET_MS
+    
+    def select_model(self, preferred: Optional[str] = None) -> str:
+        """
+        Choose the model to call, starting from the preferred one.
+        
+        Walks MODEL_LADDER towards faster models while the current candidate's
+        rolling p95 is over budget. If every candidate is over budget, returns
+        the one with the lowest p95.
+        
+        Args:
+            preferred: Starting model (defaults to the current level's model)
+        """
+        preferred = preferred or self.get_config().openai_model
+        if not preferred:
+            return preferred
+        
+        candidates = [preferred]
+        if preferred in MODEL_LADDER:
+            candidates = MODEL_LADDER[MODEL_LADDER.index(preferred):]
+        
+        for model in candidates:
+            if self._within_budget(model):
+                if model != preferred:
+                    logger.info(
+                        "Latency routing: %s p95=%.0fms over budget, using %s",
+                        preferred, self.model_p95(preferred) or 0, model
+                    )
+                return model
+        
+        return min(candidates, key=lambda m: self.model_p95(m) or 0.0)
+    
+    def should_use_llm(self, preferred: Optional[str] = None) -> bool:
+        """
+        Decide between the LLM path and the canned/rule-based path.
+        
+        Sheds to canned responses when the level disallows LLM, when too many
+        LLM calls are already in flight, or when even the fastest candidate
+        model is over the latency budget. While shedding on latency, one probe
+        request is let through every LATENCY_PROBE_INTERVAL seconds so the
+        window keeps getting fresh samples.
+        """
+        if not self.get_config().use_llm:
+            return False
+        
+        if self._in_flight >= MAX_LLM_IN_FLIGHT:
+            self._llm_shed_count += 1
+            logger.warning("LLM shed: %d calls in flight", self._in_flight)
+            return False
+        
+        model = self.select_model(preferred)
+        if self._within_budget(model):
+            return True
+        
+        now = time.time()
+        if now - self._last_probe >= LATENCY_PROBE_INTERVAL:
+            self._last_probe = now
+            return True
+        
+        self._llm_shed_count += 1
+        logger.warning(
+            "LLM shed: %s p95=%.0fms over %.0fms budget",
+            model, self.model_p95(model) or 0, LATENCY_BUDGET_MS
+        )
+        return False
+    
+    @asynccontextmanager
+    async def track_llm_call(self, model: str):
+        """
+        Track in-flight depth and latency for one LLM call.
+        
+        Records latency and success on normal exit. Timeouts and errors are
+        recorded as failures and still add their elapsed time as a latency
+        sample, so a model that times out counts as slow rather than
+        disappearing from the window; so do cancelled calls.
+        """
+        self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            self.record_latency(model, (time.perf_counter() - start) * 1000)
+            raise
+        except Exception as e:
+            self.record_latency(model, (time.perf_counter() - start) * 1000)
+            self.record_failure(f"{model}: {e}")
+            raise
+        else:
+            self.record_latency(model, (time.perf_counter() - start) * 1000)
+            self.record_success()
+        finally:
+            self._in_flight -= 1
+    
     def _degrade(self, reason: str) -> None:
         """Move to next degradation level."""
         if self._state.manual_override:
@@ -272,6 +459,12 @@ class GracefulDegradation:
             "openai_model": config.openai_model,
             "tts_provider": config.tts_provider,
             "use_llm": config.use_llm,
+            "llm_in_flight": self._in_flight,
+            "llm_shed_count": self._llm_shed_count,
+            "latency_budget_ms": LATENCY_BUDGET_MS,
+            "model_latency": {
+                model: tracker.get_stats() for model, tracker in self._latency.items()
+            },
         }
 
 
@@ -302,14 +495,19 @@ def record_failure(reason: str = "Unknown") -> None:
     get_degradation().record_failure(reason)
 
 
-def should_use_llm() -> bool:
-    """Check if LLM should be used at current level."""
-    return get_degradation().get_config().use_llm
+def record_latency(model: str, latency_ms: float) -> None:
+    """Record an observed LLM latency."""
+    get_degradation().record_latency(model, latency_ms)
+
+
+def should_use_llm(preferred: Optional[str] = None) -> bool:
+    """Check if LLM should be used given level, latency and in-flight depth."""
+    return get_degradation().should_use_llm(preferred)
 
 
-def get_openai_model() -> str:
-    """Get OpenAI model for current level."""
-    return get_degradation().get_config().openai_model
+def get_openai_model(preferred: Optional[str] = None) -> str:
+    """Get OpenAI model for current level, routed around slow models."""
+    return get_degradation().select_model(preferred)
 
 
 def get_tts_provider() -> str:
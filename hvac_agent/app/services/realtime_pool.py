@@ -0,0 +1,279 @@
+"""
+Pre-warmed OpenAI Realtime connection pool.
+
+Opening a Realtime websocket, applying session.update and waiting for
+session.updated costs several hundred milliseconds (more when the primary
+model fails and we fall back). On the Media Streams path all of that is
+silence at call pickup. This pool keeps a few connections that are already
+connected and configured, so a Twilio "start" event can take one and go
+straight to the greeting.
+
+Features:
+- Traffic-sized: target size follows recent call arrivals, within
+  REALTIME_POOL_MIN_SIZE..REALTIME_POOL_MAX_SIZE
+- Idle connections are evicted after REALTIME_POOL_MAX_IDLE seconds
+- Background refill after every acquire, plus a periodic maintenance loop
+- Connector is injected, so a local stand-in websocket server can be used
+  for offline testing
+
+Usage:
+    pool = RealtimeConnectionPool(connector=open_configured_connection)
+    await pool.start()
+    conn = await pool.acquire()   # None if the pool is empty
+    ...
+    await pool.close()
+"""
+
+import os
+import time
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+from app.utils.logging import get_logger
+
+logger = get_logger("realtime_pool")
+
+# Configuration
+POOL_ENABLED = os.getenv("REALTIME_POOL_ENABLED", "true").lower() == "true"
+POOL_MIN_SIZE = int(os.getenv("REALTIME_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.getenv("REALTIME_POOL_MAX_SIZE", "4"))
+POOL_MAX_IDLE = float(os.getenv("REALTIME_POOL_MAX_IDLE", "600"))  # Realtime sessions expire after ~30 min
+POOL_TRAFFIC_WINDOW = float(os.getenv("REALTIME_POOL_TRAFFIC_WINDOW", "300"))  # 5 min of arrivals
+POOL_MAINTENANCE_INTERVAL = float(os.getenv("REALTIME_POOL_MAINTENANCE_INTERVAL", "30"))
+
+# Connector returns (websocket, using_fallback_model) with session.update
+# already applied and session.updated received, or None on failure.
+Connector = Callable[[], Awaitable[Optional[Tuple[Any, bool]]]]
+
+
+def is_ws_open(ws: Any) -> bool:
+    """Check whether a websocket connection is still open (legacy and new websockets APIs)."""
+    if ws is None:
+        return False
+    state = getattr(ws, "state", None)
+    if state is not None:
+        return getattr(state, "name", "") == "OPEN"
+    return not getattr(ws, "closed", True)
+
+
+@dataclass
+class PooledConnection:
+    """A connected and configured Realtime websocket waiting for a call."""
+    ws: Any
+    using_fallback_model: bool
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
+class RealtimeConnectionPool:
+    """
+    Pool of pre-warmed OpenAI Realtime websockets.
+
+    The pool never blocks a call: acquire() returns immediately with a warm
+    connection or None, and the caller falls back to a cold connect.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        min_size: int = POOL_MIN_SIZE,
+        max_size: int = POOL_MAX_SIZE,
+        max_idle: float = POOL_MAX_IDLE,
+        traffic_window: float = POOL_TRAFFIC_WINDOW,
+        maintenance_interval: float = POOL_MAINTENANCE_INTERVAL,
+    ):
+        self.connector = connector
+        self.min_size = max(0, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.max_idle = max_idle
+        self.traffic_window = traffic_window
+        self.maintenance_interval = maintenance_interval
+
+        self._idle: Deque[PooledConnection] = deque()
+        self._arrivals: Deque[float] = deque()
+        self._warming = 0
+        self._refill_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.warm_failures = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Warm the pool to its minimum size and start the maintenance loop."""
+        self._closed = False
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+        self._schedule_refill()
+        logger.info(
+            "Realtime pool started (min=%d, max=%d, max_idle=%.0fs)",
+            self.min_size, self.max_size, self.max_idle
+        )
+
+    async def close(self):
+        """Stop background work and close every idle connection."""
+        self._closed = True
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        for task in list(self._tasks):
+            task.cancel()
+        while self._idle:
+            await self._discard(self._idle.popleft())
+        logger.info("Realtime pool closed")
+
+    # ------------------------------------------------------------------
+    # Acquire
+    # ------------------------------------------------------------------
+
+    async def acquire(self) -> Optional[PooledConnection]:
+        """
+        Take a warm connection for a new call.
+
+        Returns None when no healthy connection is available; the caller
+        should open one itself. Always triggers a background refill.
+        """
+        now = time.monotonic()
+        self._arrivals.append(now)
+        self._trim_arrivals(now)
+
+        conn: Optional[PooledConnection] = None
+        while self._idle:
+            candidate = self._idle.popleft()
+            if self._is_healthy(candidate):
+                conn = candidate
+                break
+            self.evictions += 1
+            await self._discard(candidate)
+
+        if conn:
+            self.hits += 1
+            logger.info("Realtime pool hit (age=%.1fs, idle_left=%d)", conn.age, len(self._idle))
+        else:
+            self.misses += 1
+            logger.info("Realtime pool miss - cold connect required")
+
+        self._schedule_refill()
+        return conn
+
+    # ------------------------------------------------------------------
+    # Sizing and refill
+    # ------------------------------------------------------------------
+
+    def target_size(self) -> int:
+        """Number of warm connections to keep, based on recent call arrivals."""
+        self._trim_arrivals(time.monotonic())
+        return max(self.min_size, min(self.max_size, len(self._arrivals)))
+
+    def _trim_arrivals(self, now: float):
+        while self._arrivals and now - self._arrivals[0] > self.traffic_window:
+            self._arrivals.popleft()
+
+    def _schedule_refill(self):
+        if self._closed:
+            return
+        task = asyncio.create_task(self._refill())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self):
+        """Open connections until idle + warming reaches the target size."""
+        async with self._refill_lock:
+            deficit = self.target_size() - len(self._idle) - self._warming
+            if deficit <= 0 or self._closed:
+                return
+            self._warming += deficit
+            try:
+                results = await asyncio.gather(
+                    *(self._warm_one() for _ in range(deficit)),
+                    return_exceptions=True
+                )
+            finally:
+                self._warming -= deficit
+
+        added = sum(1 for r in results if r is True)
+        if added:
+            logger.info("Realtime pool warmed %d connection(s), idle=%d", added, len(self._idle))
+
+    async def _warm_one(self) -> bool:
+        try:
+            result = await self.connector()
+        except Exception as e:
+            logger.warning("Realtime pool warm-up failed: %s", str(e))
+            result = None
+
+        if not result:
+            self.warm_failures += 1
+            return False
+
+        ws, using_fallback = result
+        if self._closed:
+            await self._discard(PooledConnection(ws, using_fallback))
+            return False
+
+        self._idle.append(PooledConnection(ws, using_fallback))
+        return True
+
+    def _is_healthy(self, conn: PooledConnection) -> bool:
+        return is_ws_open(conn.ws) and conn.age < self.max_idle
+
+    async def _evict_stale(self):
+        # Filter in place before awaiting any close, so a concurrent acquire()
+        # still sees the healthy connections
+        stale = [conn for conn in self._idle if not self._is_healthy(conn)]
+        for conn in stale:
+            self._idle.remove(conn)
+        self.evictions += len(stale)
+        for conn in stale:
+            await self._discard(conn)
+
+    async def _maintenance_loop(self):
+        while not self._closed:
+            try:
+                await asyncio.sleep(self.maintenance_interval)
+                await self._evict_stale()
+                # Shrink when traffic drops off
+                while len(self._idle) > self.target_size():
+                    await self._discard(self._idle.popleft())
+                await self._refill()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Realtime pool maintenance error: %s", str(e))
+
+    async def _discard(self, conn: PooledConnection):
+        try:
+            await asyncio.wait_for(conn.ws.close(), timeout=2.0)
+        except Exception as e:
+            logger.debug("Error closing pooled websocket: %s", str(e))
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        total = self.hits + self.misses
+        return {
+            "idle": len(self._idle),
+            "warming": self._warming,
+            "target_size": self.target_size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "warm_failures": self.warm_failures,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,282 @@
+"""
+Shared blob tier for generated TTS audio.
+
+The in-memory AudioCache only lives in one container. Twilio fetches
+<Play> URLs over plain HTTP, so the fetch can land on a different
+container than the one that synthesized the audio. This store puts every
+rendered clip behind the same key in tiers that other containers can read:
+
+- Local disk: survives cache eviction within a container
+- Shared tier: Redis (binary values) if REDIS_URL is set, otherwise a
+  shared filesystem directory (e.g. a mounted Modal volume) if
+  AUDIO_SHARED_DIR is set
+
+Clips contain caller details, so no tier keeps them longer than
+AUDIO_BLOB_TTL: Redis expires them, and the directories are pruned of
+files older than the TTL (the local one is also capped at
+AUDIO_LOCAL_MAX_MB, oldest first).
+
+Keys are the AudioCache keys (hash of voice, model and normalized text),
+so a key always maps to the same bytes and can be served as immutable.
+
+Usage:
+    store = get_audio_store()
+    store.put(key, audio_bytes)
+    audio = store.get(key)   # None if no tier has it
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.utils.logging import get_logger
+
+logger = get_logger("tts.audio_store")
+
+# Try to import Redis, but make it optional
+try:
+    import redis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    RedisError = Exception  # Fallback for type hints
+
+# Configuration
+REDIS_URL = os.getenv("REDIS_URL")
+AUDIO_LOCAL_DIR = os.getenv("AUDIO_LOCAL_DIR", os.path.join(tempfile.gettempdir(), "hvac_audio"))
+AUDIO_SHARED_DIR = os.getenv("AUDIO_SHARED_DIR")  # Filesystem stand-in for Redis
+AUDIO_BLOB_TTL = int(os.getenv("AUDIO_BLOB_TTL", "86400"))  # 24 hours in every tier
+AUDIO_LOCAL_MAX_MB = int(os.getenv("AUDIO_LOCAL_MAX_MB", "256"))
+AUDIO_PRUNE_INTERVAL = int(os.getenv("AUDIO_PRUNE_INTERVAL", "300"))  # Seconds between directory sweeps
+AUDIO_REDIS_PREFIX = "audio_blob:"
+
+
+def content_etag(audio: bytes) -> str:
+    """Strong ETag for audio bytes."""
+    return '"' + hashlib.sha256(audio).hexdigest()[:32] + '"'
+
+
+def _valid_key(key: str) -> bool:
+    """Keys are hex digests; reject anything that could escape the directory."""
+    return bool(key) and all(c in "0123456789abcdef" for c in key)
+
+
+class AudioBlobStore:
+    """
+    Two-tier blob store for audio clips (local disk + shared tier).
+
+    Writes go to every tier; reads check local disk first and backfill it
+    from the shared tier on a hit. Files older than the TTL are treated as
+    missing and swept from both directories every AUDIO_PRUNE_INTERVAL.
+    """
+
+    def __init__(
+        self,
+        local_dir: Optional[str] = AUDIO_LOCAL_DIR,
+        shared_dir: Optional[str] = AUDIO_SHARED_DIR,
+        redis_url: Optional[str] = REDIS_URL,
+        ttl: int = AUDIO_BLOB_TTL,
+        local_max_bytes: int = AUDIO_LOCAL_MAX_MB * 1024 * 1024,
+    ):
+        self.local_dir = self._init_dir(local_dir)
+        self.shared_dir = self._init_dir(shared_dir)
+        self.ttl = ttl
+        self.local_max_bytes = local_max_bytes
+        self.redis_client = None
+        self._redis_healthy = False
+        self._last_prune = 0.0
+        self._prune_lock = threading.Lock()
+
+        # Stats
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.pruned = 0
+
+        if REDIS_AVAILABLE and redis_url:
+            try:
+                # Binary values - no decode_responses
+                self.redis_client = redis.from_url(
+                    redis_url,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                )
+                self.redis_client.ping()
+                self._redis_healthy = True
+                logger.info("Audio store using Redis shared tier")
+            except Exception as e:
+                logger.warning("Audio store Redis unavailable (%s)", str(e))
+                self.redis_client = None
+
+    @staticmethod
+    def _init_dir(path: Optional[str]) -> Optional[Path]:
+        if not path:
+            return None
+        try:
+            directory = Path(path)
+            directory.mkdir(parents=True, exist_ok=True)
+            return directory
+        except OSError as e:
+            logger.warning("Audio store directory %s unavailable: %s", path, str(e))
+            return None
+
+    # ------------------------------------------------------------------
+    # Filesystem helpers
+    # ------------------------------------------------------------------
+
+    def _read_file(self, directory: Optional[Path], key: str) -> Optional[bytes]:
+        if directory is None:
+            return None
+        path = directory / f"{key}.mp3"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug("Audio store read failed (%s): %s", directory, str(e))
+            return None
+
+    def _write_file(self, directory: Optional[Path], key: str, audio: bytes) -> None:
+        if directory is None:
+            return
+        path = directory / f"{key}.mp3"
+        try:
+            if time.time() - path.stat().st_mtime <= self.ttl:
+                return  # Content-addressed: same key, same bytes
+        except FileNotFoundError:
+            pass
+        try:
+            # Write then rename so readers never see a partial file
+            tmp = directory / f".{key}.{os.getpid()}.tmp"
+            tmp.write_bytes(audio)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("Audio store write failed (%s): %s", directory, str(e))
+
+    def _prune_dir(self, directory: Optional[Path], max_bytes: Optional[int] = None) -> None:
+        """Delete clips older than the TTL, then the oldest clips until under max_bytes."""
+        if directory is None:
+            return
+        cutoff = time.time() - self.ttl
+        kept = []
+        try:
+            for entry in os.scandir(directory):
+                # Leftover temp files from interrupted writes age out the same way
+                if not entry.is_file() or not (entry.name.endswith(".mp3") or entry.name.endswith(".tmp")):
+                    continue
+                try:
+                    stat = entry.stat()
+                    if stat.st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        self.pruned += 1
+                    else:
+                        kept.append((stat.st_mtime, stat.st_size, entry.path))
+                except FileNotFoundError:
+                    continue  # Removed by another container
+        except OSError as e:
+            logger.debug("Audio store prune failed (%s): %s", directory, str(e))
+            return
+
+        if max_bytes is None:
+            return
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in sorted(kept):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+                self.pruned += 1
+            except OSError:
+                pass
+            total -= size
+
+    def prune(self, force: bool = False) -> None:
+        """Sweep both directories, at most once per AUDIO_PRUNE_INTERVAL unless forced."""
+        now = time.monotonic()
+        if not force and now - self._last_prune < AUDIO_PRUNE_INTERVAL:
+            return
+        if not self._prune_lock.acquire(blocking=False):
+            return  # Another thread is already sweeping
+        try:
+            self._last_prune = now
+            self._prune_dir(self.local_dir, self.local_max_bytes)
+            self._prune_dir(self.shared_dir)
+        finally:
+            self._prune_lock.release()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Write audio to every tier."""
+        if not _valid_key(key) or not audio:
+            return
+        self._write_file(self.local_dir, key, audio)
+        self._write_file(self.shared_dir, key, audio)
+        self.prune()
+
+        if self.redis_client and self._redis_healthy:
+            try:
+                self.redis_client.set(AUDIO_REDIS_PREFIX + key, audio, ex=AUDIO_BLOB_TTL, nx=True)
+            except RedisError as e:
+                logger.error("Audio store Redis set failed: %s", str(e))
+                self._redis_healthy = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Read audio from the nearest tier that has it."""
+        if not _valid_key(key):
+            return None
+
+        audio = self._read_file(self.local_dir, key)
+        if audio:
+            self.local_hits += 1
+            return audio
+
+        audio = self._read_file(self.shared_dir, key)
+        if not audio and self.redis_client and self._redis_healthy:
+            try:
+                audio = self.redis_client.get(AUDIO_REDIS_PREFIX + key)
+            except RedisError as e:
+                logger.error("Audio store Redis get failed: %s", str(e))
+                self._redis_healthy = False
+
+        if audio:
+            self.shared_hits += 1
+            self._write_file(self.local_dir, key, audio)
+            return audio
+
+        self.misses += 1
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "local_dir": str(self.local_dir) if self.local_dir else None,
+            "shared_dir": str(self.shared_dir) if self.shared_dir else None,
+            "redis_healthy": self._redis_healthy,
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "pruned": self.pruned,
+        }
+
+
+# Global instance
+_audio_store: Optional[AudioBlobStore] = None
+
+
+def get_audio_store() -> AudioBlobStore:
+    """Get the global audio blob store."""
+    global _audio_store
+    if _audio_store is None:
+        _audio_store = AudioBlobStore()
+    return _audio_store
@@ -7,7 +7,8 @@ Used with Twilio <Play> for enterprise-stable voice calls.
 Architecture:
 - Generate MP3 audio from ElevenLabs API
 - Store in memory cache with hash-based keys
-- Serve via /audio/{hash}.mp3 endpoint
+- Write through to the shared blob store (disk + Redis/shared dir)
+- Serve via /audio/{hash}.mp3 endpoint from any container
 - Twilio <Play> fetches the audio URL
 
 Features:
@@ -16,17 +17,21 @@ Features:
 - Public URL generation for Twilio <Play>
 - Fallback to Polly on failure
 - Latency logging
+- In-flight dedup (concurrent requests for the same text share one render)
+- Speculative prefetch of likely next prompts into the cache
 """
 
 import os
 import hashlib
 import time
-from typing import Optional, Dict, Tuple
+import asyncio
+from typing import Optional, Dict, Iterable, Set, Tuple
 from datetime import datetime, timedelta
 
 import httpx
 
 from app.utils.logging import get_logger
+from app.services.tts.audio_store import get_audio_store
 
 logger = get_logger("tts.elevenlabs")
 
@@ -60,50 +65,65 @@ MAX_CACHE_SIZE = 500  # Max cached audio files
 # AUDIO CACHE
 # =============================================================================
 class AudioCache:
-    """Thread-safe in-memory audio cache."""
+    """
+    In-memory audio cache in front of the shared blob store.
+    
+    Keys cover voice, model and normalized text, so a key always maps to
+    the same audio and /audio URLs can be cached as immutable.
+    """
     
     def __init__(self):
         self._cache: Dict[str, Dict] = {}
     
+    def key_for(self, text: str) -> str:
+        """Get the cache key for a text (same key used in /audio URLs)."""
+        return self._hash_text(text)
+    
     def _hash_text(self, text: str) -> str:
-        """Generate deterministic hash from text."""
-        return hashlib.sha256(text.strip().lower().encode()).hexdigest()[:16]
+        """Generate deterministic hash from voice, model and text."""
+        material = f"{ELEVENLABS_VOICE_ID}|{ELEVENLABS_MODEL}|{OUTPUT_FORMAT}|{text.strip().lower()}"
+        return hashlib.sha256(material.encode()).hexdigest()[:16]
     
     def get(self, text: str) -> Optional[Tuple[str, bytes]]:
         """Get cached audio. Returns (hash, audio_bytes) or None."""
         key = self._hash_text(text)
-        if key in self._cache:
-            entry = self._cache[key]
-            if datetime.now() < entry["expires"]:
-                logger.debug("Cache HIT: %s", text[:30])
-                return (key, entry["audio"])
-            else:
-                del self._cache[key]
+        audio = self.get_by_hash(key)
+        if audio:
+            logger.debug("Cache HIT: %s", text[:30])
+            return (key, audio)
         return None
     
     def set(self, text: str, audio: bytes) -> str:
         """Cache audio. Returns the hash key."""
-        # Evict old entries if cache is full
-        if len(self._cache) >= MAX_CACHE_SIZE:
-            self._evict_oldest()
-        
         key = self._hash_text(text)
+        self._remember(key, audio, text)
+        get_audio_store().put(key, audio)
+        logger.debug("Cache SET: %s -> %s", text[:30], key)
+        return key
+    
+    def _remember(self, key: str, audio: bytes, text: Optional[str] = None) -> None:
+        if key not in self._cache and len(self._cache) >= MAX_CACHE_SIZE:
+            self._evict_oldest()
         self._cache[key] = {
             "audio": audio,
             "text": text,
             "expires": datetime.now() + timedelta(seconds=CACHE_TTL_SECONDS),
             "created": datetime.now()
         }
-        logger.debug("Cache SET: %s -> %s", text[:30], key)
-        return key
     
     def get_by_hash(self, hash_key: str) -> Optional[bytes]:
-        """Get audio by hash key (for serving endpoint)."""
+        """Get audio by hash key (for serving endpoint), falling back to the blob store."""
         if hash_key in self._cache:
             entry = self._cache[hash_key]
             if datetime.now() < entry["expires"]:
                 return entry["audio"]
-        return None
+            del self._cache[hash_key]
+        
+        # Rendered by another container (or evicted here)
+        audio = get_audio_store().get(hash_key)
+        if audio:
+            self._remember(hash_key, audio)
+        return audio
     
     def _evict_oldest(self):
         """Remove oldest cache entries."""
@@ -124,12 +144,20 @@ class AudioCache:
         return {
             "size": len(self._cache),
             "max_size": MAX_CACHE_SIZE,
+            "blob_store": get_audio_store().get_stats(),
         }
 
 
 # Global cache instance
 _audio_cache = AudioCache()
 
+# Renders in progress, keyed by cache key - concurrent callers share one request
+_inflight: Dict[str, asyncio.Task] = {}
+
+# Speculative prefetch bookkeeping
+_prefetched_keys: Set[str] = set()
+_prefetch_stats = {"scheduled": 0, "hits": 0}
+
 
 # =============================================================================
 # TTS GENERATION
@@ -150,8 +178,33 @@ async def generate_audio(text: str) -> Optional[Tuple[str, bytes]]:
     # Check cache first
     cached = _audio_cache.get(text)
     if cached:
+        if cached[0] in _prefetched_keys:
+            _prefetched_keys.discard(cached[0])
+            _prefetch_stats["hits"] += 1
         return cached
     
+    # Join a render already in flight (e.g. a speculative prefetch)
+    key = _audio_cache.key_for(text)
+    task = _inflight.get(key)
+    if task is None:
+        task = _start_render(key, text)
+    elif key in _prefetched_keys:
+        _prefetched_keys.discard(key)
+        _prefetch_stats["hits"] += 1
+    
+    return await asyncio.shield(task)
+
+
+def _start_render(key: str, text: str) -> asyncio.Task:
+    """Start a render and register it as in flight until it finishes."""
+    task = asyncio.create_task(_synthesize(text))
+    _inflight[key] = task
+    task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    return task
+
+
+async def _synthesize(text: str) -> Optional[Tuple[str, bytes]]:
+    """Call ElevenLabs and store the result in the cache."""
     if not ELEVENLABS_API_KEY:
         logger.warning("ElevenLabs API key not configured")
         return None
@@ -198,6 +251,38 @@ async def generate_audio(text: str) -> Optional[Tuple[str, bytes]]:
         return None
 
 
+def prefetch_audio(texts: Iterable[str]) -> int:
+    """
+    Render audio for likely upcoming prompts in the background.
+    
+    Fire-and-forget: results land in the audio cache, so a later
+    generate_audio() for the same text is a cache hit (or joins the
+    in-flight render). Returns the number of renders scheduled.
+    """
+    if not is_available():
+        return 0
+    
+    scheduled = 0
+    for text in texts:
+        if not text or not text.strip():
+            continue
+        key = _audio_cache.key_for(text)
+        if key in _inflight or _audio_cache.get_by_hash(key):
+            continue
+        _start_render(key, text)
+        _prefetched_keys.add(key)
+        scheduled += 1
+    
+    if scheduled:
+        _prefetch_stats["scheduled"] += scheduled
+        logger.debug("Prefetching %d prompt(s)", scheduled)
+    
+    # Keep bookkeeping bounded to what the cache can hold
+    if len(_prefetched_keys) > MAX_CACHE_SIZE:
+        _prefetched_keys.clear()
+    return scheduled
+
+
 def get_audio_by_hash(hash_key: str) -> Optional[bytes]:
     """Get cached audio by hash key. Used by serving endpoint."""
     return _audio_cache.get_by_hash(hash_key)
@@ -238,4 +323,9 @@ def is_available() -> bool:
 
 def get_cache_stats() -> Dict:
     """Get cache statistics for monitoring."""
-    return _audio_cache.stats()
+    return {
+        **_audio_cache.stats(),
+        "inflight": len(_inflight),
+        "prefetch_scheduled": _prefetch_stats["scheduled"],
+        "prefetch_hits": _prefetch_stats["hits"],
+    }
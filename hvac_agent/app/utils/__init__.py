@@ -32,6 +32,7 @@ from .human_tricks import (  # noqa: F401
     cleanup_personality,
     get_calibration_phrase,
     soften_certainty,
+    get_speech_timeout,
 )
 from .call_control import (  # noqa: F401
     is_speech_too_long,
@@ -9,7 +9,7 @@ Core principle: You don't need smarter AI, you need better illusion management.
 
 import random
 import time
-from typing import Optional, List, Dict, Set
+from typing import Any, Optional, List, Dict, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -39,6 +39,11 @@ class CallPersonality:
     turn_count: int = 0
     last_topic: Optional[str] = None
     
+    # Endpointing: observed speaking rate and silence-window backoff
+    avg_wpm: float = 0.0
+    pace_samples: int = 0
+    endpoint_backoff: int = 0           # Extra seconds after a turn looked cut off
+    
     def mark_filler_used(self, filler: str) -> None:
         """Mark a filler as used so we don't repeat it."""
         self.used_fillers.add(filler.lower())
@@ -60,6 +65,44 @@ class CallPersonality:
             self.imperfection_used = True
             return True
         return False
+    
+    def record_turn(self, speech_duration_ms: int, word_count: int) -> None:
+        """Update speaking rate (EMA) and caller_pace from one observed turn."""
+        if speech_duration_ms <= 0 or word_count < 2:
+            return
+        wpm = (word_count / speech_duration_ms) * 60000
+        wpm = max(60.0, min(260.0, wpm))  # Clamp barge-in and mis-timed outliers
+        if self.pace_samples == 0:
+            self.avg_wpm = wpm
+        else:
+            self.avg_wpm = 0.6 * self.avg_wpm + 0.4 * wpm
+        self.pace_samples += 1
+        self.caller_pace = detect_caller_pace(60000, int(round(self.avg_wpm)))
+    
+    def record_endpoint_result(self, advanced: bool) -> None:
+        """Widen the silence window after a turn that didn't advance, relax after one that did."""
+        if advanced:
+            self.endpoint_backoff = max(0, self.endpoint_backoff - 1)
+        else:
+            self.endpoint_backoff = min(MAX_ENDPOINT_BACKOFF, self.endpoint_backoff + 1)
+    
+    def to_pacing(self) -> Dict[str, Any]:
+        """Serializable pacing state (for sharing through the session store)."""
+        return {
+            "caller_pace": self.caller_pace,
+            "avg_wpm": self.avg_wpm,
+            "pace_samples": self.pace_samples,
+            "endpoint_backoff": self.endpoint_backoff,
+        }
+    
+    def load_pacing(self, pacing: Optional[Dict[str, Any]]) -> None:
+        """Restore pacing state saved by another container, if it has more samples."""
+        if not pacing or pacing.get("pace_samples", 0) < self.pace_samples:
+            return
+        self.caller_pace = pacing.get("caller_pace", self.caller_pace)
+        self.avg_wpm = pacing.get("avg_wpm", self.avg_wpm)
+        self.pace_samples = pacing.get("pace_samples", self.pace_samples)
+        self.endpoint_backoff = pacing.get("endpoint_backoff", self.endpoint_backoff)
 
 
 # Store per-call personality state
@@ -441,6 +484,68 @@ def detect_caller_pace(speech_duration_ms: int, word_count: int) -> str:
     return "medium"
 
 
+# Silence (seconds) before Twilio ends a speech turn, by caller pace.
+# Twilio's speechTimeout only takes whole seconds.
+SPEECH_TIMEOUT_BY_PACE = {
+    "fast": 1,
+    "medium": 2,
+    "slow": 3,
+}
+DEFAULT_SPEECH_TIMEOUT = 3
+MIN_PACE_SAMPLES = 2
+MAX_ENDPOINT_BACKOFF = 2
+
+# Timing a caller's turn from the Gather round trip
+PROMPT_WORDS_PER_SECOND = 2.5  # Approximate TTS playback rate
+RESPONSE_ONSET_MS = 500        # Typical pause before a caller starts answering
+MAX_SPEAKING_WPM = 260         # Faster than this, the caller talked over the prompt
+
+
+def estimate_speech_ms(
+    elapsed_ms: float,
+    prompt_words: int,
+    speech_timeout: int,
+    word_count: int,
+) -> Optional[int]:
+    """
+    Estimate how long the caller spoke in one Gather turn.
+    
+    The time from sending the prompt to Twilio's callback covers playback of
+    everything before and inside the Gather (prompt_words, including any
+    thinking clip), the caller's onset pause, their speech and the silence
+    window. Subtracting the rest leaves the speech.
+    
+    Returns None when the remainder is too short for the words spoken: the
+    caller barged in, so playback overlapped their speech and the turn
+    can't be timed.
+    """
+    prompt_ms = prompt_words / PROMPT_WORDS_PER_SECOND * 1000
+    speech_ms = int(elapsed_ms - prompt_ms - speech_timeout * 1000 - RESPONSE_ONSET_MS)
+    if speech_ms < word_count / MAX_SPEAKING_WPM * 60000:
+        return None
+    return speech_ms
+
+
+def get_speech_timeout(personality: "CallPersonality", short_answer: bool = False) -> int:
+    """
+    Get the Gather speechTimeout for the next turn.
+    
+    Short answers (yes/no, digits, morning/afternoon) end cleanly, so they
+    get the pace-based window. Open-ended answers (address, issue) have
+    natural mid-sentence pauses and get one extra second. Until the caller's
+    pace is known, short answers use the medium window and open-ended ones
+    keep the default. Backoff is added after a turn that looked cut off.
+    """
+    if personality.pace_samples >= MIN_PACE_SAMPLES:
+        base = SPEECH_TIMEOUT_BY_PACE.get(personality.caller_pace, DEFAULT_SPEECH_TIMEOUT)
+        if not short_answer:
+            base += 1
+    else:
+        base = SPEECH_TIMEOUT_BY_PACE["medium"] if short_answer else DEFAULT_SPEECH_TIMEOUT
+    
+    return max(1, min(5, base + personality.endpoint_backoff))
+
+
 def get_response_delay_ms(caller_pace: str) -> int:
     """
     Get appropriate response delay based on caller pace.
@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the `app` package importable from any cwd."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,137 @@
+"""Latency-aware model routing and LLM load shedding."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import degradation as degradation_module
+from app.services.degradation import (
+    LATENCY_BUDGET_MS,
+    LATENCY_MIN_SAMPLES,
+    MAX_LLM_IN_FLIGHT,
+    MODEL_LADDER,
+    DegradationLevel,
+    GracefulDegradation,
+)
+
+FAST_MS = LATENCY_BUDGET_MS / 4
+SLOW_MS = LATENCY_BUDGET_MS * 2
+
+
+def record(degradation: GracefulDegradation, model: str, latency_ms: float, count: int = LATENCY_MIN_SAMPLES) -> None:
+    for _ in range(count):
+        degradation.record_latency(model, latency_ms)
+
+
+@pytest.fixture
+def degradation() -> GracefulDegradation:
+    manager = GracefulDegradation()
+    # No probe due unless a test asks for one
+    manager._last_probe = time.time()
+    return manager
+
+
+def test_gather_default_model_has_a_faster_rung():
+    # GATHER_LLM_MODEL defaults to gpt-4o-mini; on the last rung it could never be routed
+    assert "gpt-4o-mini" in MODEL_LADDER
+    assert MODEL_LADDER.index("gpt-4o-mini") < len(MODEL_LADDER) - 1
+
+
+def test_select_model_keeps_preferred_without_enough_samples(degradation):
+    record(degradation, "gpt-4o-mini", SLOW_MS, count=LATENCY_MIN_SAMPLES - 1)
+
+    assert degradation.model_p95("gpt-4o-mini") is None
+    assert degradation.select_model("gpt-4o-mini") == "gpt-4o-mini"
+
+
+def test_select_model_walks_down_ladder_when_p95_over_budget(degradation):
+    record(degradation, "gpt-4o", SLOW_MS)
+    record(degradation, "gpt-4o-mini", FAST_MS)
+
+    assert degradation.select_model("gpt-4o") == "gpt-4o-mini"
+
+
+def test_select_model_uses_p95_not_average(degradation):
+    # Mostly fast with a slow tail: the mean is under budget but p95 is not
+    record(degradation, "gpt-4o", FAST_MS, count=19)
+    record(degradation, "gpt-4o", SLOW_MS, count=2)
+
+    assert degradation.model_p95("gpt-4o") == SLOW_MS
+    assert degradation.select_model("gpt-4o") == MODEL_LADDER[1]
+
+
+def test_select_model_never_moves_up_the_ladder(degradation):
+    record(degradation, "gpt-4o", FAST_MS)
+    for model in MODEL_LADDER[1:]:
+        record(degradation, model, SLOW_MS)
+    record(degradation, MODEL_LADDER[-1], SLOW_MS * 2)
+
+    # Every candidate from the preferred model down is slow: lowest p95 wins
+    assert degradation.select_model("gpt-4o-mini") == "gpt-4o-mini"
+
+
+def test_should_use_llm_when_a_candidate_is_within_budget(degradation):
+    record(degradation, "gpt-4o-mini", SLOW_MS)
+
+    assert degradation.should_use_llm("gpt-4o-mini")
+    assert degradation.get_stats()["llm_shed_count"] == 0
+
+
+def test_should_use_llm_sheds_when_every_candidate_is_slow(degradation):
+    for model in MODEL_LADDER:
+        record(degradation, model, SLOW_MS)
+
+    assert not degradation.should_use_llm("gpt-4o-mini")
+    assert degradation.get_stats()["llm_shed_count"] == 1
+
+
+def test_should_use_llm_lets_a_probe_through_while_shedding(degradation):
+    for model in MODEL_LADDER:
+        record(degradation, model, SLOW_MS)
+    degradation._last_probe = 0.0
+
+    assert degradation.should_use_llm("gpt-4o-mini")  # probe
+    assert not degradation.should_use_llm("gpt-4o-mini")  # next one waits
+
+
+def test_should_use_llm_sheds_at_in_flight_limit(degradation):
+    degradation._in_flight = MAX_LLM_IN_FLIGHT
+
+    assert not degradation.should_use_llm("gpt-4o-mini")
+    assert degradation.get_stats()["llm_shed_count"] == 1
+
+
+def test_should_use_llm_respects_rule_based_level(degradation):
+    degradation.set_level(DegradationLevel.RULE_BASED)
+
+    assert not degradation.should_use_llm("gpt-4o-mini")
+
+
+def test_track_llm_call_records_success_latency(degradation):
+    async def call():
+        async with degradation.track_llm_call("gpt-4o-mini"):
+            assert degradation.get_stats()["llm_in_flight"] == 1
+
+    asyncio.run(call())
+
+    stats = degradation.get_stats()
+    assert stats["llm_in_flight"] == 0
+    assert stats["model_latency"]["gpt-4o-mini"]["samples"] == 1
+
+
+def test_track_llm_call_records_timeout_as_a_slow_sample(degradation, monkeypatch):
+    clock = iter([100.0, 100.0 + SLOW_MS / 1000])
+    monkeypatch.setattr(degradation_module.time, "perf_counter", lambda: next(clock))
+
+    async def call():
+        async with degradation.track_llm_call("gpt-4o-mini"):
+            raise asyncio.TimeoutError()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(call())
+
+    stats = degradation.get_stats()
+    assert stats["llm_in_flight"] == 0
+    assert stats["failure_count"] == 1
+    assert stats["model_latency"]["gpt-4o-mini"]["p95_ms"] == pytest.approx(SLOW_MS)
@@ -0,0 +1,76 @@
+"""Caller pace estimation and the pace -> Gather speechTimeout mapping."""
+
+import pytest
+
+from app.utils.human_tricks import (
+    DEFAULT_SPEECH_TIMEOUT,
+    MAX_ENDPOINT_BACKOFF,
+    PROMPT_WORDS_PER_SECOND,
+    RESPONSE_ONSET_MS,
+    SPEECH_TIMEOUT_BY_PACE,
+    CallPersonality,
+    estimate_speech_ms,
+    get_speech_timeout,
+)
+
+
+def personality_at(wpm: float, turns: int = 2) -> CallPersonality:
+    personality = CallPersonality(call_sid="CA-test")
+    for _ in range(turns):
+        # 20 words at the given rate
+        personality.record_turn(int(20 / wpm * 60000), 20)
+    return personality
+
+
+@pytest.mark.parametrize("wpm, pace", [(200, "fast"), (140, "medium"), (90, "slow")])
+def test_pace_maps_to_speech_timeout(wpm, pace):
+    personality = personality_at(wpm)
+
+    assert personality.caller_pace == pace
+    assert get_speech_timeout(personality, short_answer=True) == SPEECH_TIMEOUT_BY_PACE[pace]
+    # Open-ended answers get one extra second for mid-sentence pauses
+    assert get_speech_timeout(personality, short_answer=False) == SPEECH_TIMEOUT_BY_PACE[pace] + 1
+
+
+def test_unknown_pace_uses_defaults():
+    personality = personality_at(200, turns=1)
+
+    assert get_speech_timeout(personality, short_answer=True) == SPEECH_TIMEOUT_BY_PACE["medium"]
+    assert get_speech_timeout(personality, short_answer=False) == DEFAULT_SPEECH_TIMEOUT
+
+
+def test_backoff_widens_window_within_bounds():
+    personality = personality_at(200)
+    for _ in range(MAX_ENDPOINT_BACKOFF + 3):
+        personality.record_endpoint_result(advanced=False)
+
+    assert personality.endpoint_backoff == MAX_ENDPOINT_BACKOFF
+    assert get_speech_timeout(personality, short_answer=True) == SPEECH_TIMEOUT_BY_PACE["fast"] + MAX_ENDPOINT_BACKOFF
+    assert get_speech_timeout(personality_at(90), short_answer=False) <= 5
+
+
+def turn_elapsed_ms(prompt_words: int, speech_ms: int, speech_timeout: int) -> float:
+    """Round trip for a caller who waits for the prompt to finish."""
+    return prompt_words / PROMPT_WORDS_PER_SECOND * 1000 + RESPONSE_ONSET_MS + speech_ms + speech_timeout * 1000
+
+
+def test_estimate_subtracts_playback_onset_and_window():
+    elapsed = turn_elapsed_ms(prompt_words=12, speech_ms=4000, speech_timeout=2)
+
+    assert estimate_speech_ms(elapsed, prompt_words=12, speech_timeout=2, word_count=10) == 4000
+
+
+def test_estimate_counts_thinking_clip_as_playback():
+    # "Got it." before a 12-word prompt: 14 words of playback
+    elapsed = turn_elapsed_ms(prompt_words=14, speech_ms=4000, speech_timeout=2)
+
+    assert estimate_speech_ms(elapsed, prompt_words=14, speech_timeout=2, word_count=10) == 4000
+    # Leaving the clip out would inflate the caller's speaking time
+    assert estimate_speech_ms(elapsed, prompt_words=12, speech_timeout=2, word_count=10) == 4800
+
+
+def test_estimate_skips_barge_in():
+    # Caller spoke 10 words over the prompt: the remainder is implausibly short
+    elapsed = turn_elapsed_ms(prompt_words=12, speech_ms=0, speech_timeout=2) - 2000
+
+    assert estimate_speech_ms(elapsed, prompt_words=12, speech_timeout=2, word_count=10) is None
@@ -0,0 +1,157 @@
+"""RealtimeConnectionPool against a local websockets server."""
+
+import asyncio
+import time
+
+import websockets
+
+from app.services.realtime_pool import PooledConnection, RealtimeConnectionPool, is_ws_open
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class LocalRealtimeServer:
+    """Stand-in for the Realtime endpoint: accepts sockets and holds them open."""
+
+    def __init__(self):
+        self.connections = 0
+        self._server = None
+
+    async def _handler(self, ws, *args):
+        self.connections += 1
+        await ws.wait_closed()
+
+    async def __aenter__(self):
+        self._server = await websockets.serve(self._handler, "127.0.0.1", 0)
+        port = next(iter(self._server.sockets)).getsockname()[1]
+        self.uri = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def connector(self):
+        return await websockets.connect(self.uri), False
+
+
+class SlowClosingSocket:
+    """A dead socket whose close() takes a while, to hold _evict_stale mid-await."""
+
+    closed = True
+
+    async def close(self):
+        await asyncio.sleep(0.2)
+
+
+def test_start_prewarms_to_min_size():
+    async def scenario():
+        async with LocalRealtimeServer() as server:
+            pool = RealtimeConnectionPool(server.connector, min_size=2, max_size=4, maintenance_interval=60)
+            await pool.start()
+            await wait_for(lambda: pool.get_stats()["idle"] == 2)
+
+            assert server.connections == 2
+            assert all(is_ws_open(conn.ws) for conn in pool._idle)
+            await pool.close()
+
+    asyncio.run(scenario())
+
+
+def test_acquire_hands_out_warm_connection_and_refills():
+    async def scenario():
+        async with LocalRealtimeServer() as server:
+            pool = RealtimeConnectionPool(server.connector, min_size=1, max_size=4, maintenance_interval=60)
+            await pool.start()
+            await wait_for(lambda: pool.get_stats()["idle"] == 1)
+
+            conn = await pool.acquire()
+            assert conn is not None and is_ws_open(conn.ws)
+            assert pool.get_stats()["hits"] == 1
+
+            # The call's arrival raises the target, and the taken slot is refilled
+            await wait_for(lambda: pool.get_stats()["idle"] == pool.target_size())
+            assert pool._idle[0].ws is not conn.ws
+
+            await conn.ws.close()
+            await pool.close()
+
+    asyncio.run(scenario())
+
+
+def test_stale_connections_are_evicted():
+    async def scenario():
+        async with LocalRealtimeServer() as server:
+            pool = RealtimeConnectionPool(server.connector, min_size=1, max_idle=0.05, maintenance_interval=60)
+            await pool.start()
+            await wait_for(lambda: pool.get_stats()["idle"] == 1)
+            stale = pool._idle[0]
+
+            await asyncio.sleep(0.1)
+            await pool._evict_stale()
+
+            assert pool.get_stats()["evictions"] == 1
+            assert stale not in pool._idle
+            assert not is_ws_open(stale.ws)
+            await pool.close()
+
+    asyncio.run(scenario())
+
+
+def test_acquire_skips_closed_connection():
+    async def scenario():
+        async with LocalRealtimeServer() as server:
+            pool = RealtimeConnectionPool(server.connector, min_size=1, maintenance_interval=60)
+            await pool.start()
+            await wait_for(lambda: pool.get_stats()["idle"] == 1)
+            await pool._idle[0].ws.close()
+
+            assert await pool.acquire() is None
+            stats = pool.get_stats()
+            assert stats["misses"] == 1 and stats["evictions"] == 1
+            await pool.close()
+
+    asyncio.run(scenario())
+
+
+def test_acquire_returns_none_when_pool_is_empty():
+    async def scenario():
+        async def unreachable():
+            raise OSError("connection refused")
+
+        pool = RealtimeConnectionPool(unreachable, min_size=1, maintenance_interval=60)
+        await pool.start()
+        await wait_for(lambda: pool.get_stats()["warm_failures"] >= 1)
+
+        # Never blocks the call: the caller falls back to a cold connect
+        assert await pool.acquire() is None
+        assert pool.get_stats()["misses"] == 1
+        await pool.close()
+
+    asyncio.run(scenario())
+
+
+def test_acquire_during_eviction_still_sees_healthy_connections():
+    async def scenario():
+        async with LocalRealtimeServer() as server:
+            pool = RealtimeConnectionPool(server.connector, min_size=0, maintenance_interval=60)
+            ws, _ = await server.connector()
+            pool._idle.extend([PooledConnection(ws, False), PooledConnection(SlowClosingSocket(), False)])
+
+            eviction = asyncio.create_task(pool._evict_stale())
+            await asyncio.sleep(0.05)  # eviction is now awaiting the slow close
+
+            conn = await pool.acquire()
+            assert conn is not None and conn.ws is ws
+
+            await eviction
+            assert pool.get_stats()["evictions"] == 1
+            await ws.close()
+            await pool.close()
+
+    asyncio.run(scenario())